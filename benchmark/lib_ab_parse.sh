@@ -4,6 +4,46 @@ clean_num() {
     printf "%s" "$1" | sed 's/[^0-9.]//g'
 }
 
+# ab_percentile OUTPUT N: the "N%" rung of ab's percentile table; blank without one
+ab_percentile() {
+    printf "%s\n" "$1" | awk -v rung="$2%" '$1 == rung {print $2; exit}'
+}
+
+# ab_connection_times OUTPUT ROW: "min,mean,sd,median,max" of one row (Connect,
+# Processing, Waiting or Total) of ab's "Connection Times (ms)" table; ",,,," without it
+ab_connection_times() {
+    times=$(printf "%s\n" "$1" | awk -v row="$2:" '$1 == row && NF >= 6 {printf "%s,%s,%s,%s,%s", $2, $3, $4, $5, $6; exit}')
+    printf "%s" "${times:-,,,,}"
+}
+
+# parse_ab_errors OUTPUT: ab's request accounting. "Failed requests" is split into
+# its (Connect, Receive, Length, Exceptions) classes; ab prints "Non-2xx
+# responses" and "Write errors" only when non-zero, so they are 0 whenever the
+# summary is there. Everything stays blank for output cut off before the summary,
+# and the failure classes stay blank when the split is missing (the python engine)
+parse_ab_errors() {
+    PARSED_COMPLETE=$(clean_num "$(printf "%s\n" "$1" | awk '/^Complete requests:/ {print $3; exit}')")
+    PARSED_FAILED=""
+    PARSED_FAILED_BREAKDOWN=",,,"
+    PARSED_NON_2XX=""
+    PARSED_WRITE_ERRORS=""
+    if [ -z "$PARSED_COMPLETE" ]; then
+        return 0
+    fi
+    PARSED_FAILED=$(clean_num "$(printf "%s\n" "$1" | awk '/^Failed requests:/ {print $3; exit}')")
+    PARSED_FAILED="${PARSED_FAILED:-0}"
+    if [ "$PARSED_FAILED" = "0" ]; then
+        PARSED_FAILED_BREAKDOWN="0,0,0,0"
+    else
+        breakdown=$(printf "%s\n" "$1" | sed -n 's/.*(Connect: \([0-9]*\), Receive: \([0-9]*\), Length: \([0-9]*\), Exceptions: \([0-9]*\)).*/\1,\2,\3,\4/p' | head -n 1)
+        PARSED_FAILED_BREAKDOWN="${breakdown:-,,,}"
+    fi
+    PARSED_NON_2XX=$(clean_num "$(printf "%s\n" "$1" | awk '/^Non-2xx responses:/ {print $3; exit}')")
+    PARSED_NON_2XX="${PARSED_NON_2XX:-0}"
+    PARSED_WRITE_ERRORS=$(clean_num "$(printf "%s\n" "$1" | awk '/^Write errors:/ {print $3; exit}')")
+    PARSED_WRITE_ERRORS="${PARSED_WRITE_ERRORS:-0}"
+}
+
 parse_ab_output() {
     ab_output="$1"
     test_duration="$2"
@@ -100,4 +140,15 @@ parse_ab_output() {
     PARSED_P90="$p90"
     PARSED_P99="$p99"
     PARSED_TRANSFER_SEC="$transfer_sec"
+    # Measured only: unlike p50-p99 above, these stay blank when ab did not print them
+    PARSED_P66=$(ab_percentile "$ab_output" 66)
+    PARSED_P80=$(ab_percentile "$ab_output" 80)
+    PARSED_P95=$(ab_percentile "$ab_output" 95)
+    PARSED_P98=$(ab_percentile "$ab_output" 98)
+    PARSED_P100=$(ab_percentile "$ab_output" 100)
+    PARSED_CONNECT_TIMES=$(ab_connection_times "$ab_output" Connect)
+    PARSED_PROCESSING_TIMES=$(ab_connection_times "$ab_output" Processing)
+    PARSED_WAITING_TIMES=$(ab_connection_times "$ab_output" Waiting)
+    PARSED_TOTAL_TIMES=$(ab_connection_times "$ab_output" Total)
+    parse_ab_errors "$ab_output"
 }
@@ -0,0 +1,19 @@
+#!/bin/sh
+# SERVER_PIN_CMD for ENDPOINT_SCHEDULE=packed when run_ab.sh runs on the host:
+#   pin_server.sh CORES SERVICE [CPUS]
+# pins the compose SERVICE's container to CORES and, when given, sets its cpus limit.
+
+set -eu
+
+cores="$1"
+service="$2"
+container=$(docker-compose ps -q "$service")
+if [ -z "$container" ]; then
+    echo "Error: no running container for ${service}" >&2
+    exit 1
+fi
+if [ $# -ge 3 ]; then
+    docker update --cpuset-cpus "$cores" --cpus "$3" "$container" >/dev/null
+else
+    docker update --cpuset-cpus "$cores" "$container" >/dev/null
+fi
@@ -6,6 +6,70 @@ LIB_AB_PARSE=${LIB_AB_PARSE:-/usr/local/bin/lib_ab_parse.sh}
 
 AB_CMD=${AB_CMD:-ab}
 AB_MAX_RETRY=${AB_MAX_RETRY:-2}
+# LOAD_ENGINE=python drives the endpoints with tools/run_loadgen.py (asyncio,
+# keep-alive, sub-millisecond percentiles) and takes its results.csv row as-is.
+LOAD_ENGINE=${LOAD_ENGINE:-ab}
+LOADGEN_CMD=${LOADGEN_CMD:-python3 /opt/loadgen/run_loadgen.py}
+# Client processes for LOAD_ENGINE=python, each pinned to a core (0 = one per core)
+LOADGEN_WORKERS=${LOADGEN_WORKERS:-1}
+# Connection mode of the matrix: 1 reuses connections (ab -k, python default),
+# 0 opens one per request (ab default, python --no-keepalive). Blank keeps
+# the engine's default. Recorded in config.json and results.json.
+KEEPALIVE=${KEEPALIVE:-}
+# KEEPALIVE_COMPARE=1 re-runs every server/endpoint cell in the other mode after
+# the matrix; both modes go to keepalive.csv for the report's keep-alive speedup.
+KEEPALIVE_COMPARE=${KEEPALIVE_COMPARE:-0}
+# Open-loop rates (req/s, space separated) swept per server/endpoint after the
+# closed-loop runs; needs LOAD_ENGINE=python. Results go to rate_sweep.csv.
+RATE_SWEEP=${RATE_SWEEP:-}
+# Connection range START:MAX swept per server/endpoint to find the highest
+# req/s whose p99 stays within SLO_P99_MS (python engine); concurrency_sweep.csv.
+CONCURRENCY_SWEEP=${CONCURRENCY_SWEEP:-}
+SLO_P99_MS=${SLO_P99_MS:-100}
+# Server resource sampling during each cell (either engine), space separated
+# SERVER=SOURCE pairs with SOURCE cgroup:PATH, docker:CONTAINER_ID or proc:REGEX,
+# e.g. "xampp=docker:3f2a9c nginx_multi=docker:81b0e4". Written to resources/.
+RESOURCE_SOURCES=${RESOURCE_SOURCES:-}
+RESOURCE_INTERVAL=${RESOURCE_INTERVAL:-1}
+# Where docker:ID sources look for container cgroups; mount the host's
+# /sys/fs/cgroup here when running inside the benchmark container
+RESOURCE_CGROUP_ROOT=${RESOURCE_CGROUP_ROOT:-/sys/fs/cgroup}
+# SERVER_STATUS=1 polls nginx-multi's stub_status and php-fpm status page
+# (docker/nginx-multi.conf) during its cells, with either engine; written to
+# server_status/.
+SERVER_STATUS=${SERVER_STATUS:-0}
+STATUS_INTERVAL=${STATUS_INTERVAL:-0.25}
+# Keep every Nth response body (python engine) and record its PHP elapsed_ms
+# and pid next to the client latency; written to body_samples/. 0 = off.
+BODY_SAMPLE_EVERY=${BODY_SAMPLE_EVERY:-0}
+# Weighted mixed workload run per server after the matrix (python engine):
+# space separated ENDPOINT=WEIGHT, e.g. "cpu.php=3 json.php=1 io.php=1", each
+# endpoint with its usual parameters. Results go to mixed_workload.csv.
+MIX_WEIGHTS=${MIX_WEIGHTS:-}
+# Work-size parameter sweep per server after the matrix (python engine): space
+# separated ENDPOINT:PARAM=V1,V2,..., e.g. "cpu.php:n=1000,10000,100000
+# io.php:size=1024,8192,65536"; the endpoint's other parameters are kept.
+# Results go to param_sweep.csv and feed the report's fixed/per-unit cost fit.
+PARAM_SWEEP=${PARAM_SWEEP:-}
+# ENDPOINT_SCHEDULE=packed: plan_cells.py packs server/endpoint cells onto
+# disjoint cores from each server's cpus limit (SERVER_CPUS mirrors
+# docker-compose.yml; blank = unlimited, budgeted UNLIMITED_SERVER_CORES
+# cores per cell) plus the client's worker count.
+SCHEDULER_CMD=${SCHEDULER_CMD:-python3 /opt/loadgen/plan_cells.py}
+# Converts the per-request file of `ab -g` into timeline/<server>/<endpoint>.csv,
+# the per-second series the Python engine writes itself
+AB_TIMELINE_CMD=${AB_TIMELINE_CMD:-python3 /opt/loadgen/ab_timeline.py}
+# Samples RESOURCE_SOURCES and SERVER_STATUS in a separate process around each cell, stopped
+# with SIGTERM when the cell is done, so it works the same for both engines
+SAMPLER_CMD=${SAMPLER_CMD:-python3 /opt/loadgen/sample_server.py}
+SERVER_CPUS=${SERVER_CPUS:-"xampp=1.0 nginx_multi="}
+UNLIMITED_SERVER_CORES=${UNLIMITED_SERVER_CORES:-2}
+# Hook run as `$SERVER_PIN_CMD CORES SERVICE [CPUS]` for each service of a packed
+# wave before its cells start: CORES is the union of the service's cells' cores
+# and CPUS the sum of their cpus limits (omitted when unlimited), e.g. a wrapper
+# around `docker update --cpuset-cpus CORES --cpus CPUS` when run from the host.
+# Packed mode needs it; without it the servers are not held to their cores.
+SERVER_PIN_CMD=${SERVER_PIN_CMD:-}
 
 DURATION=${DURATION:-10}
 PER_ENDPOINT_DURATION=${PER_ENDPOINT_DURATION:-$DURATION}
@@ -25,6 +89,33 @@ IO_DURATION=${IO_DURATION:-$DURATION}
 CPU_CONNECTIONS=${CPU_CONNECTIONS:-$CONNECTIONS}
 JSON_CONNECTIONS=${JSON_CONNECTIONS:-$CONNECTIONS}
 IO_CONNECTIONS=${IO_CONNECTIONS:-$CONNECTIONS}
+RATE_SWEEP_DURATION=${RATE_SWEEP_DURATION:-$DURATION}
+CONCURRENCY_SWEEP_DURATION=${CONCURRENCY_SWEEP_DURATION:-$DURATION}
+MIX_DURATION=${MIX_DURATION:-$DURATION}
+MIX_CONNECTIONS=${MIX_CONNECTIONS:-$CONNECTIONS}
+PARAM_SWEEP_DURATION=${PARAM_SWEEP_DURATION:-$DURATION}
+
+if [ -z "$KEEPALIVE" ]; then
+    if [ "$LOAD_ENGINE" = "python" ]; then
+        KEEPALIVE=1
+    else
+        KEEPALIVE=0
+    fi
+fi
+# The connection mode KEEPALIVE_COMPARE re-runs the matrix in
+case "$KEEPALIVE" in
+    0) OTHER_KEEPALIVE=1 ;;
+    1) OTHER_KEEPALIVE=0 ;;
+    *)
+        echo "Error: KEEPALIVE must be 0 or 1 (or blank for the engine's default), got '${KEEPALIVE}'" >&2
+        exit 1
+        ;;
+esac
+
+if [ "$ENDPOINT_SCHEDULE" = "packed" ] && [ -z "$SERVER_PIN_CMD" ]; then
+    echo "[WARN] ENDPOINT_SCHEDULE=packed needs SERVER_PIN_CMD to hold each server to its planned cores; running sequential" >&2
+    ENDPOINT_SCHEDULE=sequential
+fi
 
 # Normalize any accidental CPU_/JSON_/IO_ prefixes in connection envs
 CPU_CONNECTIONS=${CPU_CONNECTIONS#CPU_}
@@ -40,9 +131,24 @@ RUN_ID=$(date +%Y%m%d_%H%M%S)
 OUT_DIR="${RESULTS_DIR%/}/${RUN_ID}"
 CSV_FILE="${OUT_DIR}/results.csv"
 JSON_FILE="${OUT_DIR}/results.json"
+SWEEP_FILE="${OUT_DIR}/rate_sweep.csv"
+CAPACITY_FILE="${OUT_DIR}/concurrency_sweep.csv"
+MIX_FILE="${OUT_DIR}/mixed_workload.csv"
+KEEPALIVE_FILE="${OUT_DIR}/keepalive.csv"
+PARAM_FILE="${OUT_DIR}/param_sweep.csv"
 
 mkdir -p "$OUT_DIR"
-echo "timestamp,server,endpoint,requests_sec,latency_avg,latency_p50,latency_p75,latency_p90,latency_p99,transfer_sec" > "$CSV_FILE"
+# ab's full percentile ladder and "Connection Times (ms)" table follow the
+# original columns; the python engine fills the ladder from its ab-style
+# summary and leaves the connection times blank. The request
+# accounting comes last; the python engine has no failed_* classes
+echo "timestamp,server,endpoint,requests_sec,latency_avg,latency_p50,latency_p75,latency_p90,latency_p99,transfer_sec,\
+latency_p66,latency_p80,latency_p95,latency_p98,latency_p100,\
+connect_min,connect_mean,connect_sd,connect_median,connect_max,\
+processing_min,processing_mean,processing_sd,processing_median,processing_max,\
+waiting_min,waiting_mean,waiting_sd,waiting_median,waiting_max,\
+total_min,total_mean,total_sd,total_median,total_max,\
+complete_requests,failed_requests,failed_connect,failed_receive,failed_length,failed_exceptions,non_2xx,write_errors" > "$CSV_FILE"
 echo "[" > "$JSON_FILE"
 JSON_FIRST=1
 
@@ -53,6 +159,8 @@ cat > "$CONFIG_FILE" <<'CONFIGEOF'
     "duration": TOTAL_DURATION_VAL,
     "per_endpoint_duration": PER_ENDPOINT_DURATION_VAL,
     "endpoint_schedule": "ENDPOINT_SCHEDULE_VAL",
+    "load_engine": "LOAD_ENGINE_VAL",
+    "keepalive": KEEPALIVE_VAL,
   "connections": CONNECTIONS_VAL,
   "endpoints": [
     "cpu.php",
@@ -86,6 +194,12 @@ CONFIGEOF
 sed -i "s/PER_ENDPOINT_DURATION_VAL/$PER_ENDPOINT_DURATION/g" "$CONFIG_FILE"
 sed -i "s/TOTAL_DURATION_VAL/$TOTAL_DURATION/g" "$CONFIG_FILE"
 sed -i "s/ENDPOINT_SCHEDULE_VAL/$ENDPOINT_SCHEDULE/g" "$CONFIG_FILE"
+sed -i "s/LOAD_ENGINE_VAL/$LOAD_ENGINE/g" "$CONFIG_FILE"
+if [ "$KEEPALIVE" = "1" ]; then
+    sed -i "s/KEEPALIVE_VAL/true/g" "$CONFIG_FILE"
+else
+    sed -i "s/KEEPALIVE_VAL/false/g" "$CONFIG_FILE"
+fi
 sed -i "s/CONNECTIONS_VAL/$CONNECTIONS/g" "$CONFIG_FILE"
 sed -i "s/CPU_DURATION_VAL/$CPU_DURATION/g" "$CONFIG_FILE"
 sed -i "s/JSON_DURATION_VAL/$JSON_DURATION/g" "$CONFIG_FILE"
@@ -149,6 +263,64 @@ endpoint_url() {
     esac
 }
 
+# endpoint_url_with ENDPOINT PARAM VALUE: endpoint_url with PARAM set to VALUE
+endpoint_url_with() {
+    path=$(endpoint_url "$1")
+    case "$path" in
+        *"?$2="*|*"&$2="*)
+            echo "$path" | sed "s/\([?&]$2=\)[^&]*/\1$3/"
+            ;;
+        *\?*)
+            echo "${path}&$2=$3"
+            ;;
+        *)
+            echo "${path}?$2=$3"
+            ;;
+    esac
+}
+
+resource_source_for() {
+    for resource_spec in $RESOURCE_SOURCES; do
+        case "$resource_spec" in
+            "$1="*)
+                echo "${resource_spec#*=}"
+                return 0
+                ;;
+        esac
+    done
+}
+
+# start_server_sampler READY_FILE ARGS...: run SAMPLER_CMD ARGS in the background
+# and wait until it has created READY_FILE (its output, after the first sample).
+# SAMPLER_PID is left blank when it does not come up.
+start_server_sampler() {
+    ready_file="$1"
+    shift
+    rm -f "$ready_file"
+    $SAMPLER_CMD "$@" &
+    SAMPLER_PID=$!
+    waited=0
+    while [ ! -e "$ready_file" ]; do
+        if ! kill -0 "$SAMPLER_PID" 2>/dev/null || [ "$waited" -ge 100 ]; then
+            echo "[WARN] Server sampler did not start for ${server}/${endpoint}; nothing sampled for this cell." >&2
+            kill "$SAMPLER_PID" 2>/dev/null || true
+            wait "$SAMPLER_PID" 2>/dev/null || true
+            SAMPLER_PID=""
+            return 0
+        fi
+        sleep 0.1
+        waited=$((waited + 1))
+    done
+}
+
+# stop_server_sampler: SIGTERM the sampler so it writes its samples, and wait for it
+stop_server_sampler() {
+    [ -n "$SAMPLER_PID" ] || return 0
+    kill "$SAMPLER_PID" 2>/dev/null || true
+    wait "$SAMPLER_PID" || echo "[WARN] Server sampler failed for ${server}/${endpoint}; samples may be missing." >&2
+    SAMPLER_PID=""
+}
+
 endpoint_duration_for() {
     endpoint="$1"
     case "$endpoint" in
@@ -273,16 +445,83 @@ run_ab_for_server() {
     endpoint_connections="$5"
     temp_csv="$6"
     temp_json="$7"
+    keepalive="${8:-$KEEPALIVE}"
 
     log_file="${OUT_DIR}/${server}_${endpoint}.log"
+    resource_source=$(resource_source_for "$server")
+    sample_every=""
+    if [ "$BODY_SAMPLE_EVERY" != "0" ]; then
+        sample_every="$BODY_SAMPLE_EVERY"
+    fi
+    status_base=""
+    if [ "$SERVER_STATUS" = "1" ] && [ "$server" = "nginx_multi" ]; then
+        status_base="${URL_NGINX_MULTI%/}"
+    fi
+    timeline_out="${OUT_DIR}/timeline/${server}/${endpoint}.csv"
+    if [ "$keepalive" != "$KEEPALIVE" ]; then
+        # KEEPALIVE_COMPARE cell: the matrix cell already wrote the per-cell series
+        log_file="${OUT_DIR}/${server}_${endpoint}_keepalive${keepalive}.log"
+        resource_source=""
+        sample_every=""
+        status_base=""
+        timeline_out=""
+    fi
+    ab_keepalive=""
+    loadgen_close=""
+    keepalive_json=true
+    if [ "$keepalive" = "1" ]; then
+        ab_keepalive="-k"
+    else
+        loadgen_close="--no-keepalive"
+        keepalive_json=false
+    fi
+
+    resource_out="${OUT_DIR}/resources/${server}/${endpoint}.csv"
+    status_out="${OUT_DIR}/server_status/${server}/${endpoint}.csv"
+    # The sampler creates both of its CSVs once it is running; wait on either
+    sampler_ready="$status_out"
+    if [ -n "$resource_source" ]; then
+        sampler_ready="$resource_out"
+    fi
 
     attempt=1
     while [ $attempt -le $AB_MAX_RETRY ]; do
         ab_exit=0
+        SAMPLER_PID=""
+        if [ -n "$resource_source" ] || [ -n "$status_base" ]; then
+            start_server_sampler "$sampler_ready" \
+                ${resource_source:+--resource "$resource_source" --resource-interval "$RESOURCE_INTERVAL"} \
+                ${resource_source:+--resource-out "$resource_out" --cgroup-root "$RESOURCE_CGROUP_ROOT"} \
+                ${status_base:+--nginx-status "${status_base}/nginx_status" --fpm-status "${status_base}/php-fpm-status?json"} \
+                ${status_base:+--status-out "$status_out" --status-interval "$STATUS_INTERVAL"}
+        fi
         start_ts=$(date +%s)
-        output=$($AB_CMD -l -t "$endpoint_duration" -n "$MAX_REQUESTS" -c "$endpoint_connections" -q "$url" 2>&1) || ab_exit=$?
+        row_file="${temp_csv}.row"
+        rm -f "$row_file"
+        if [ "$LOAD_ENGINE" = "python" ]; then
+            output=$($LOADGEN_CMD -l -t "$endpoint_duration" -n "$MAX_REQUESTS" -c "$endpoint_connections" -q \
+                $loadgen_close --workers "$LOADGEN_WORKERS" ${CELL_CPUS:+--cpus "$CELL_CPUS"} \
+                ${sample_every:+--sample-bodies "$sample_every" --samples-out "${OUT_DIR}/body_samples/${server}/${endpoint}.csv"} \
+                ${timeline_out:+--timeline-out "$timeline_out"} \
+                --csv-out "$row_file" --server "$server" --endpoint "$endpoint" "$url" 2>&1) || ab_exit=$?
+        else
+            gnuplot_file=""
+            if [ -n "$timeline_out" ]; then
+                gnuplot_file="${timeline_out%.csv}.tsv"
+                mkdir -p "$(dirname "$timeline_out")"
+            fi
+            output=$($CELL_TASKSET $AB_CMD $ab_keepalive -l -t "$endpoint_duration" -n "$MAX_REQUESTS" -c "$endpoint_connections" -q \
+                ${gnuplot_file:+-g "$gnuplot_file"} "$url" 2>&1) || ab_exit=$?
+            if [ -n "$gnuplot_file" ]; then
+                if [ -s "$gnuplot_file" ] && ! $AB_TIMELINE_CMD "$gnuplot_file" --out "$timeline_out" >/dev/null 2>&1; then
+                    echo "[WARN] Could not convert ab's per-request file for ${server}/${endpoint}; no timeline recorded." >&2
+                fi
+                rm -f "$gnuplot_file"
+            fi
+        fi
         end_ts=$(date +%s)
         elapsed=$((end_ts - start_ts))
+        stop_server_sampler
 
         if [ "$attempt" -eq 1 ]; then
             echo "$output" > "$log_file"
@@ -297,7 +536,7 @@ run_ab_for_server() {
             echo "$warn_msg" >> "$log_file"
         fi
         if [ "$elapsed" -lt $((endpoint_duration * 9 / 10)) ]; then
-            warn_msg="[WARN] ${server}/${endpoint} finished in ${elapsed}s (<${endpoint_duration}s). See ${OUT_DIR}/${server}_${endpoint}.log"
+            warn_msg="[WARN] ${server}/${endpoint} finished in ${elapsed}s (<${endpoint_duration}s). See ${log_file}"
             echo "$warn_msg" >&2
             echo "$warn_msg" >> "$log_file"
         fi
@@ -307,14 +546,29 @@ run_ab_for_server() {
             effective_duration="$endpoint_duration"
         fi
 
-        parse_ab_output "$output" "$effective_duration" "$endpoint_connections"
-        requests_sec="$PARSED_REQUESTS_SEC"
-        latency_avg="$PARSED_LATENCY_AVG"
-        p50="$PARSED_P50"
-        p75="$PARSED_P75"
-        p90="$PARSED_P90"
-        p99="$PARSED_P99"
-        transfer_sec="$PARSED_TRANSFER_SEC"
+        if [ -s "$row_file" ]; then
+            # The Python engine already wrote the row in results.csv format
+            IFS=, read -r _ _ _ requests_sec latency_avg p50 p75 p90 p99 transfer_sec < "$row_file"
+            rm -f "$row_file"
+            # Its ab-style summary still carries the percentile ladder and the
+            # request accounting; it has no "Connection Times (ms)" table
+            ladder="$(ab_percentile "$output" 66),$(ab_percentile "$output" 80),$(ab_percentile "$output" 95)"
+            ladder="${ladder},$(ab_percentile "$output" 98),$(ab_percentile "$output" 100)"
+            connection_times=",,,,,,,,,,,,,,,,,,,"
+            parse_ab_errors "$output"
+        else
+            parse_ab_output "$output" "$effective_duration" "$endpoint_connections"
+            requests_sec="$PARSED_REQUESTS_SEC"
+            latency_avg="$PARSED_LATENCY_AVG"
+            p50="$PARSED_P50"
+            p75="$PARSED_P75"
+            p90="$PARSED_P90"
+            p99="$PARSED_P99"
+            transfer_sec="$PARSED_TRANSFER_SEC"
+            ladder="${PARSED_P66},${PARSED_P80},${PARSED_P95},${PARSED_P98},${PARSED_P100}"
+            connection_times="${PARSED_CONNECT_TIMES},${PARSED_PROCESSING_TIMES},${PARSED_WAITING_TIMES},${PARSED_TOTAL_TIMES}"
+        fi
+        error_counts="${PARSED_COMPLETE},${PARSED_FAILED},${PARSED_FAILED_BREAKDOWN},${PARSED_NON_2XX},${PARSED_WRITE_ERRORS}"
 
         # 若 ab 非零或 throughput 為 0，最多重試一次
         numeric_reqs=$(printf "%.0f" "$requests_sec" 2>/dev/null || echo "0")
@@ -328,9 +582,9 @@ run_ab_for_server() {
         fi
 
         timestamp=$(date -u +%Y-%m-%dT%H:%M:%SZ)
-        echo "${timestamp},${server},${endpoint},${requests_sec},${latency_avg},${p50},${p75},${p90},${p99},${transfer_sec}" > "$temp_csv"
-        printf "  {\"timestamp\":\"%s\",\"server\":\"%s\",\"endpoint\":\"%s\",\"requests_sec\":%s,\"latency_avg\":\"%s\",\"latency_p50\":\"%s\",\"latency_p75\":\"%s\",\"latency_p90\":\"%s\",\"latency_p99\":\"%s\",\"transfer_sec\":\"%s\"}" \
-            "$timestamp" "$server" "$endpoint" "$requests_sec" "$latency_avg" "$p50" "$p75" "$p90" "$p99" "$transfer_sec" > "$temp_json"
+        echo "${timestamp},${server},${endpoint},${requests_sec},${latency_avg},${p50},${p75},${p90},${p99},${transfer_sec},${ladder},${connection_times},${error_counts}" > "$temp_csv"
+        printf "  {\"timestamp\":\"%s\",\"server\":\"%s\",\"endpoint\":\"%s\",\"requests_sec\":%s,\"latency_avg\":\"%s\",\"latency_p50\":\"%s\",\"latency_p75\":\"%s\",\"latency_p90\":\"%s\",\"latency_p99\":\"%s\",\"transfer_sec\":\"%s\",\"keepalive\":%s}" \
+            "$timestamp" "$server" "$endpoint" "$requests_sec" "$latency_avg" "$p50" "$p75" "$p90" "$p99" "$transfer_sec" "$keepalive_json" > "$temp_json"
         break
     done
 }
@@ -375,9 +629,196 @@ run_endpoint_pair() {
     echo ""
 }
 
+# Client cores of the cell being run (packed schedule only)
+CELL_CPUS=""
+CELL_TASKSET=""
+
+server_url() {
+    case "$1" in
+        xampp) echo "$URL_XAMPP" ;;
+        nginx) echo "$URL_NGINX" ;;
+        *) echo "$URL_NGINX_MULTI" ;;
+    esac
+}
+
+# Runs the cells wave by wave as planned by plan_cells.py: each wave's server
+# containers are pinned to their cores first, then its cells run together,
+# each client pinned to its own cores; waves run in turn. A wave whose pinning
+# fails runs its cells one at a time instead.
+run_packed_schedule() {
+    plan_file="${OUT_DIR}/schedule.txt"
+    client_cpus=1
+    if [ "$LOAD_ENGINE" = "python" ] && [ "$LOADGEN_WORKERS" -gt 1 ]; then
+        client_cpus="$LOADGEN_WORKERS"
+    fi
+    set --
+    for endpoint in $ENDPOINTS; do
+        endpoint_duration=$(endpoint_duration_for "$endpoint")
+        set -- "$@" --cell "xampp:${endpoint}:${endpoint_duration}" --cell "nginx_multi:${endpoint}:${endpoint_duration}"
+    done
+    set -- --server-cpus "$SERVER_CPUS" --unlimited-cores "$UNLIMITED_SERVER_CORES" --client-cpus "$client_cpus" "$@"
+    $SCHEDULER_CMD --format text "$@" || true
+    if ! $SCHEDULER_CMD "$@" > "$plan_file" \
+        || [ ! -s "$plan_file" ]; then
+        echo "[WARN] plan_cells.py failed; running cells one at a time" >&2
+        : > "$plan_file"
+        wave=0
+        for endpoint in $ENDPOINTS; do
+            for server in xampp nginx_multi; do
+                echo "$wave $server $endpoint - - $(echo "$server" | tr '_' '-') -" >> "$plan_file"
+                wave=$((wave + 1))
+            done
+        done
+    fi
+
+    for wave in $(awk '{print $1}' "$plan_file" | sort -n | uniq); do
+        echo "  [$(date +'%H:%M:%S')] Wave ${wave}"
+        pinned=""
+        wave_serial=0
+        while read -r cell_wave server endpoint client_cores server_cores service server_quota; do
+            [ "$cell_wave" = "$wave" ] && [ "$server_cores" != "-" ] || continue
+            case " $pinned " in *" $service "*) continue ;; esac
+            pinned="$pinned $service"
+            if [ "$server_quota" = "-" ]; then
+                $SERVER_PIN_CMD "$server_cores" "$service" < /dev/null && continue
+            else
+                $SERVER_PIN_CMD "$server_cores" "$service" "$server_quota" < /dev/null && continue
+            fi
+            echo "[WARN] could not pin ${service} to cores ${server_cores}; running wave ${wave} one cell at a time" >&2
+            wave_serial=1
+        done < "$plan_file"
+
+        cell_pids=""
+        while read -r cell_wave server endpoint client_cores server_cores service server_quota; do
+            [ "$cell_wave" = "$wave" ] || continue
+            endpoint_duration=$(endpoint_duration_for "$endpoint")
+            endpoint_connections=$(endpoint_connections_for "$endpoint")
+            url="$(server_url "$server" | sed 's:/*$::')/$(endpoint_url "$endpoint")"
+            echo "    ${server} :: ${endpoint} (client cores ${client_cores}, server cores ${server_cores})"
+            (
+                if [ "$client_cores" != "-" ]; then
+                    CELL_CPUS="$client_cores"
+                    if command -v taskset >/dev/null 2>&1; then
+                        CELL_TASKSET="taskset -c $client_cores"
+                    fi
+                fi
+                run_ab_for_server "$server" "$endpoint" "$url" "$endpoint_duration" "$endpoint_connections" \
+                    "${TEMP_DIR}/${endpoint}_${server}.csv" "${TEMP_DIR}/${endpoint}_${server}.json"
+            ) &
+            if [ "$wave_serial" -eq 1 ]; then
+                wait "$!" || echo "[WARN] a cell of wave ${wave} returned non-zero" >&2
+            else
+                cell_pids="$cell_pids $!"
+            fi
+        done < "$plan_file"
+        for pid in $cell_pids; do
+            wait "$pid" || echo "[WARN] a cell of wave ${wave} returned non-zero" >&2
+        done
+    done
+
+    for endpoint in $ENDPOINTS; do
+        merge_endpoint_results "$endpoint"
+    done
+}
+
+# run_sweep_matrix NAME OUT_FILE LOADGEN_ARGS...
+# Runs one loadgen sweep per server/endpoint and appends its rows to OUT_FILE.
+# One server at a time, so neither skews the other's tail near saturation.
+run_sweep_matrix() {
+    sweep_name="$1"
+    sweep_file="$2"
+    shift 2
+    for endpoint in $ENDPOINTS; do
+        path=$(endpoint_url "$endpoint")
+        endpoint_connections=$(endpoint_connections_for "$endpoint")
+        for server in xampp nginx_multi; do
+            if [ "$server" = "xampp" ]; then
+                url="${URL_XAMPP%/}/$path"
+            else
+                url="${URL_NGINX_MULTI%/}/$path"
+            fi
+            sweep_log="${OUT_DIR}/${server}_${endpoint}_${sweep_name}.log"
+            echo "  [$(date +'%H:%M:%S')] ${sweep_name} ${server} :: ${endpoint}"
+            $LOADGEN_CMD "$@" -c "$endpoint_connections" --workers "$LOADGEN_WORKERS" \
+                --sweep-out "$sweep_file" --server "$server" --endpoint "$endpoint" \
+                "$url" > "$sweep_log" 2>&1 \
+                || echo "[WARN] ${sweep_name} did not complete cleanly on ${server}/${endpoint}; see ${sweep_log}" >&2
+        done
+    done
+}
+
+# run_mixed_workload: one --mix run per server drawing from MIX_WEIGHTS
+run_mixed_workload() {
+    set --
+    for mix_spec in $MIX_WEIGHTS; do
+        set -- "$@" --mix "${mix_spec#*=}:$(endpoint_url "${mix_spec%%=*}")"
+    done
+    for server in xampp nginx_multi; do
+        mix_log="${OUT_DIR}/${server}_mixed_workload.log"
+        echo "  [$(date +'%H:%M:%S')] mixed workload ${server}"
+        $LOADGEN_CMD -t "$MIX_DURATION" -n "$MAX_REQUESTS" -c "$MIX_CONNECTIONS" --workers "$LOADGEN_WORKERS" \
+            "$@" --mix-out "$MIX_FILE" --server "$server" "$(server_url "$server" | sed 's:/*$::')/" > "$mix_log" 2>&1 \
+            || echo "[WARN] mixed workload did not complete cleanly on ${server}; see ${mix_log}" >&2
+    done
+}
+
+# run_keepalive_compare: every matrix cell again in the other connection mode;
+# keepalive.csv holds the matrix rows and the re-runs, prefixed with their mode
+run_keepalive_compare() {
+    other_mode="$OTHER_KEEPALIVE"
+    echo "keepalive,$(head -n 1 "$CSV_FILE")" > "$KEEPALIVE_FILE"
+    tail -n +2 "$CSV_FILE" | sed "s/^/${KEEPALIVE},/" >> "$KEEPALIVE_FILE"
+    for endpoint in $ENDPOINTS; do
+        endpoint_duration=$(endpoint_duration_for "$endpoint")
+        endpoint_connections=$(endpoint_connections_for "$endpoint")
+        for server in xampp nginx_multi; do
+            temp_csv="${TEMP_DIR}/keepalive_${server}_${endpoint}.csv"
+            echo "  [$(date +'%H:%M:%S')] keepalive=${other_mode} ${server} :: ${endpoint}"
+            run_ab_for_server "$server" "$endpoint" "$(server_url "$server" | sed 's:/*$::')/$(endpoint_url "$endpoint")" \
+                "$endpoint_duration" "$endpoint_connections" "$temp_csv" "${temp_csv%.csv}.json" "$other_mode"
+            [ -f "$temp_csv" ] && sed "s/^/${other_mode},/" "$temp_csv" >> "$KEEPALIVE_FILE"
+            rm -f "$temp_csv" "${temp_csv%.csv}.json"
+        done
+    done
+}
+
+# run_param_sweep: one closed-loop run per PARAM_SWEEP value and server, rows
+# prefixed with the parameter and its value
+run_param_sweep() {
+    if [ ! -f "$PARAM_FILE" ]; then
+        echo "param,value,timestamp,server,endpoint,requests_sec,latency_avg,latency_p50,latency_p75,latency_p90,latency_p99,transfer_sec" > "$PARAM_FILE"
+    fi
+    for param_spec in $PARAM_SWEEP; do
+        endpoint="${param_spec%%:*}"
+        param_setting="${param_spec#*:}"
+        param="${param_setting%%=*}"
+        endpoint_connections=$(endpoint_connections_for "$endpoint")
+        for value in $(echo "${param_setting#*=}" | tr ',' ' '); do
+            path=$(endpoint_url_with "$endpoint" "$param" "$value")
+            for server in xampp nginx_multi; do
+                param_log="${OUT_DIR}/${server}_${endpoint}_${param}_${value}.log"
+                row_file="${TEMP_DIR}/param_${server}_${endpoint}.csv"
+                echo "  [$(date +'%H:%M:%S')] param sweep ${server} :: ${endpoint} ${param}=${value}"
+                if $LOADGEN_CMD -t "$PARAM_SWEEP_DURATION" -n "$MAX_REQUESTS" -c "$endpoint_connections" \
+                    --workers "$LOADGEN_WORKERS" --csv-out "$row_file" --server "$server" --endpoint "$endpoint" \
+                    "$(server_url "$server" | sed 's:/*$::')/${path}" > "$param_log" 2>&1; then
+                    echo "${param},${value},$(cat "$row_file")" >> "$PARAM_FILE"
+                else
+                    echo "[WARN] param sweep did not complete cleanly on ${server}/${endpoint} ${param}=${value}; see ${param_log}" >&2
+                fi
+                rm -f "$row_file"
+            done
+        done
+    done
+}
+
+if [ "$BODY_SAMPLE_EVERY" != "0" ] && [ "$LOAD_ENGINE" != "python" ]; then
+    echo "[WARN] BODY_SAMPLE_EVERY needs LOAD_ENGINE=python; ab discards response bodies" >&2
+fi
+
 echo ""
 echo "=========================================="
-echo "Running benchmark"
+echo "Running benchmark (keepalive=${KEEPALIVE})"
 echo "=========================================="
 if [ "$ENDPOINT_SCHEDULE" = "parallel" ]; then
     echo "Endpoint schedule: parallel (all endpoints run concurrently)"
@@ -390,6 +831,8 @@ if [ "$ENDPOINT_SCHEDULE" = "parallel" ]; then
         fi
     done
     echo "Total expected time: ~${total_expected} seconds"
+elif [ "$ENDPOINT_SCHEDULE" = "packed" ]; then
+    echo "Endpoint schedule: packed (cells bin-packed onto disjoint cores, see schedule.txt)"
 else
     echo "Endpoint schedule: sequential (endpoints run one by one)"
     echo "Each endpoint test pair runs in parallel"
@@ -429,6 +872,8 @@ if [ "$ENDPOINT_SCHEDULE" = "parallel" ]; then
     for endpoint in $ENDPOINTS; do
         merge_endpoint_results "$endpoint"
     done
+elif [ "$ENDPOINT_SCHEDULE" = "packed" ]; then
+    run_packed_schedule
 else
     for endpoint in $ENDPOINTS; do
         endpoint_duration=$(endpoint_duration_for "$endpoint")
@@ -438,6 +883,54 @@ else
     done
 fi
 
+if [ -n "$RATE_SWEEP" ]; then
+    if [ "$LOAD_ENGINE" = "python" ]; then
+        echo ""
+        echo "Open-loop rate sweep: ${RATE_SWEEP} req/s, ${RATE_SWEEP_DURATION}s per step"
+        run_sweep_matrix rate_sweep "$SWEEP_FILE" \
+            -t "$RATE_SWEEP_DURATION" --rate-sweep "$(echo "$RATE_SWEEP" | tr -s ' ' ',')"
+    else
+        echo "[WARN] RATE_SWEEP needs LOAD_ENGINE=python (ab is closed-loop only); skipping sweep" >&2
+    fi
+fi
+
+if [ -n "$CONCURRENCY_SWEEP" ]; then
+    if [ "$LOAD_ENGINE" = "python" ]; then
+        echo ""
+        echo "Concurrency sweep: ${CONCURRENCY_SWEEP} connections, p99 SLO ${SLO_P99_MS} ms, ${CONCURRENCY_SWEEP_DURATION}s per level"
+        run_sweep_matrix concurrency_sweep "$CAPACITY_FILE" \
+            -t "$CONCURRENCY_SWEEP_DURATION" --concurrency-sweep "$CONCURRENCY_SWEEP" --slo-p99 "$SLO_P99_MS"
+    else
+        echo "[WARN] CONCURRENCY_SWEEP needs LOAD_ENGINE=python; skipping sweep" >&2
+    fi
+fi
+
+if [ -n "$MIX_WEIGHTS" ]; then
+    if [ "$LOAD_ENGINE" = "python" ]; then
+        echo ""
+        echo "Mixed workload: ${MIX_WEIGHTS}, ${MIX_CONNECTIONS} connections, ${MIX_DURATION}s per server"
+        run_mixed_workload
+    else
+        echo "[WARN] MIX_WEIGHTS needs LOAD_ENGINE=python; skipping mixed workload" >&2
+    fi
+fi
+
+if [ "$KEEPALIVE_COMPARE" = "1" ]; then
+    echo ""
+    echo "Keep-alive comparison: re-running every cell with keepalive=${OTHER_KEEPALIVE}"
+    run_keepalive_compare
+fi
+
+if [ -n "$PARAM_SWEEP" ]; then
+    if [ "$LOAD_ENGINE" = "python" ]; then
+        echo ""
+        echo "Parameter sweep: ${PARAM_SWEEP}, ${PARAM_SWEEP_DURATION}s per value"
+        run_param_sweep
+    else
+        echo "[WARN] PARAM_SWEEP needs LOAD_ENGINE=python; skipping parameter sweep" >&2
+    fi
+fi
+
 # Remove trailing comma from JSON
 sed -i '$ s/,$//' "$JSON_FILE"
 # Clean up temp directory
@@ -9,5 +9,8 @@ sh "$SCRIPT_DIR/test_endpoint_schedule_modes.sh"
 sh "$SCRIPT_DIR/test_high_concurrency_tuning.sh"
 sh "$SCRIPT_DIR/test_start_benchmark_presets.sh"
 sh "$SCRIPT_DIR/test_integration_no_empty_nginx.sh"
+sh "$SCRIPT_DIR/test_load_engine_python.sh"
+sh "$SCRIPT_DIR/test_packed_schedule.sh"
+sh "$SCRIPT_DIR/test_ab_keepalive.sh"
 
 echo "[PASS] all benchmark tests"
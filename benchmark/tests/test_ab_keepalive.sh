@@ -0,0 +1,99 @@
+#!/bin/sh
+set -eu
+
+ROOT_DIR="$(cd "$(dirname "$0")/.." && pwd)"
+RUN_SH="$ROOT_DIR/run_ab.sh"
+
+# Fake ab: twice the throughput when asked to reuse connections (-k); writes
+# its per-request file when given -g
+FAKE_AB="$ROOT_DIR/tmp_fake_ab_keepalive.sh"
+cat > "$FAKE_AB" <<'EOF'
+#!/bin/sh
+rps="1000.00"
+gnuplot=""
+while [ $# -gt 0 ]; do
+  case "$1" in
+    -k) rps="2000.00"; shift ;;
+    -g) gnuplot="$2"; shift 2 ;;
+    *) shift ;;
+  esac
+done
+if [ -n "$gnuplot" ]; then
+  printf 'starttime\tseconds\tctime\tdtime\tttime\twait\n' > "$gnuplot"
+  printf 'Thu Jan  1 00:00:00 2026\t1767225600\t0\t4\t4\t4\n' >> "$gnuplot"
+  printf 'Thu Jan  1 00:00:01 2026\t1767225601\t0\t6\t6\t6\n' >> "$gnuplot"
+fi
+cat <<OUT
+This is ApacheBench, Version 2.3 <\$Revision: 1923142 \$>
+Time taken for tests:   1.000 seconds
+Complete requests:      1000
+Failed requests:        0
+Total transferred:      102400 bytes
+Requests per second:    ${rps} [#/sec] (mean)
+Time per request:       1.000 [ms] (mean)
+Transfer rate:          100.00 [Kbytes/sec] received
+OUT
+EOF
+chmod +x "$FAKE_AB"
+
+tmp_dir="$ROOT_DIR/tmp_results_test/ab_keepalive"
+rm -rf "$tmp_dir"
+mkdir -p "$tmp_dir"
+
+AB_CMD="$FAKE_AB" \
+AB_TIMELINE_CMD="python3 $ROOT_DIR/../tools/ab_timeline.py" \
+RESOURCE_SOURCES="nginx_multi=proc:nginx" \
+SERVER_STATUS=1 \
+SAMPLER_CMD="python3 $ROOT_DIR/../tools/sample_server.py" \
+KEEPALIVE_COMPARE=1 \
+LIB_AB_PARSE="$ROOT_DIR/lib_ab_parse.sh" \
+RESULTS_DIR="$tmp_dir" \
+ENDPOINTS="cpu.php" \
+URL_XAMPP="http://localhost" \
+URL_NGINX_MULTI="http://localhost" \
+WAIT_FOR_SKIP=1 \
+ENDPOINT_SCHEDULE=sequential \
+CPU_DURATION=0 \
+CPU_CONNECTIONS=1 \
+DURATION=0 \
+/bin/sh "$RUN_SH" >/dev/null 2>&1 || true
+
+latest_dir=$(ls -1t "$tmp_dir" 2>/dev/null | head -n1 || true)
+csv="$tmp_dir/$latest_dir/results.csv"
+keepalive="$tmp_dir/$latest_dir/keepalive.csv"
+
+fail() {
+  echo "[FAIL] test_ab_keepalive.sh: $1" >&2
+  rm -rf "$tmp_dir" "$FAKE_AB"
+  exit 1
+}
+
+[ -f "$csv" ] || fail "no results.csv written"
+grep -q '"keepalive": false' "$tmp_dir/$latest_dir/config.json" || fail "ab's default (no -k) not recorded in config.json"
+grep -q ',xampp,cpu.php,1000.00,' "$csv" || fail "matrix did not run ab without -k"
+[ -f "$keepalive" ] || fail "no keepalive.csv written"
+grep -q '^0,[^,]*,xampp,cpu.php,1000.00,' "$keepalive" || fail "matrix row not recorded as close mode"
+grep -q '^1,[^,]*,xampp,cpu.php,2000.00,' "$keepalive" || fail "xampp not re-run with ab -k"
+grep -q '^1,[^,]*,nginx_multi,cpu.php,2000.00,' "$keepalive" || fail "nginx_multi not re-run with ab -k"
+timeline="$tmp_dir/$latest_dir/timeline/xampp/cpu.php.csv"
+[ -s "$timeline" ] || fail "no per-second timeline converted from ab -g"
+grep -q '^1,1,0,' "$timeline" || fail "ab timeline not bucketed by second"
+[ -s "$tmp_dir/$latest_dir/timeline/nginx_multi/cpu.php.csv" ] || fail "no per-second timeline for nginx_multi"
+[ -z "$(find "$tmp_dir/$latest_dir/timeline" -name '*.tsv')" ] || fail "ab -g files left behind"
+grep -q '^elapsed_s,cpu_s,' "$tmp_dir/$latest_dir/resources/nginx_multi/cpu.php.csv" || fail "resources not sampled around the ab cell"
+[ ! -e "$tmp_dir/$latest_dir/resources/xampp" ] || fail "resources sampled for a server without a source"
+grep -q '^elapsed_s,nginx_active,' "$tmp_dir/$latest_dir/server_status/nginx_multi/cpu.php.csv" || fail "status not polled around the ab cell"
+
+# Anything but 0, 1 or blank is rejected before a run directory is created
+rm -rf "$tmp_dir"
+mkdir -p "$tmp_dir"
+if KEEPALIVE=yes LIB_AB_PARSE="$ROOT_DIR/lib_ab_parse.sh" RESULTS_DIR="$tmp_dir" WAIT_FOR_SKIP=1 /bin/sh "$RUN_SH" > "$tmp_dir.log" 2>&1; then
+  rm -f "$tmp_dir.log"
+  fail "KEEPALIVE=yes accepted"
+fi
+grep -q "KEEPALIVE must be 0 or 1" "$tmp_dir.log" || { rm -f "$tmp_dir.log"; fail "no KEEPALIVE error message"; }
+rm -f "$tmp_dir.log"
+[ -z "$(ls -A "$tmp_dir")" ] || fail "run directory created for an invalid KEEPALIVE"
+
+rm -rf "$tmp_dir" "$FAKE_AB"
+echo "[PASS] test_ab_keepalive.sh"
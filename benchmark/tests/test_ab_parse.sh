@@ -39,6 +39,79 @@ assert_eq "130.028ms" "$PARSED_LATENCY_AVG" "full parse latency"
 assert_eq "115" "$PARSED_P50" "full parse p50"
 assert_eq "312" "$PARSED_P99" "full parse p99"
 
+assert_eq "" "$PARSED_P95" "p95 left blank when ab did not print it"
+assert_eq ",,,," "$PARSED_CONNECT_TIMES" "connection times blank without the table"
+
+ladder_output='Requests per second:    1538.13 [#/sec] (mean)
+Time per request:       130.028 [ms] (mean)
+
+Connection Times (ms)
+              min  mean[+/-sd] median   max
+Connect:        0   31 112.4      1    1031
+Processing:     4   98  41.7     95     612
+Waiting:        3   97  41.6     94     611
+Total:          5  129 121.9    101    1187
+
+Percentage of the requests served within a certain time (ms)
+  50%    101
+  66%    112
+  75%    121
+  80%    128
+  90%    150
+  95%    180
+  98%   1020
+  99%   1060
+ 100%   1187 (longest request)'
+
+parse_ab_output "$ladder_output" 40 200
+assert_eq "101" "$PARSED_P50" "ladder p50"
+assert_eq "112" "$PARSED_P66" "ladder p66"
+assert_eq "128" "$PARSED_P80" "ladder p80"
+assert_eq "180" "$PARSED_P95" "ladder p95"
+assert_eq "1020" "$PARSED_P98" "ladder p98"
+assert_eq "1060" "$PARSED_P99" "ladder p99 not taken from the 100% rung"
+assert_eq "1187" "$PARSED_P100" "ladder p100"
+assert_eq "0,31,112.4,1,1031" "$PARSED_CONNECT_TIMES" "connect times"
+assert_eq "4,98,41.7,95,612" "$PARSED_PROCESSING_TIMES" "processing times"
+assert_eq "3,97,41.6,94,611" "$PARSED_WAITING_TIMES" "waiting times"
+assert_eq "5,129,121.9,101,1187" "$PARSED_TOTAL_TIMES" "total times"
+
+errors_output='Complete requests:      52000
+Failed requests:        1210
+   (Connect: 0, Receive: 10, Length: 1180, Exceptions: 20)
+Write errors:           5
+Non-2xx responses:      3400
+Requests per second:    1733.33 [#/sec] (mean)'
+
+parse_ab_output "$errors_output" 30 200
+assert_eq "52000" "$PARSED_COMPLETE" "complete requests"
+assert_eq "1210" "$PARSED_FAILED" "failed requests"
+assert_eq "0,10,1180,20" "$PARSED_FAILED_BREAKDOWN" "failed requests by class"
+assert_eq "3400" "$PARSED_NON_2XX" "non-2xx responses"
+assert_eq "5" "$PARSED_WRITE_ERRORS" "write errors"
+
+parse_ab_errors "$ladder_output"
+assert_eq "" "$PARSED_FAILED" "failures blank without the summary"
+
+clean_output='Complete requests:      1000
+Failed requests:        0
+Requests per second:    100.00 [#/sec] (mean)'
+
+parse_ab_errors "$clean_output"
+assert_eq "0" "$PARSED_FAILED" "clean run has no failures"
+assert_eq "0,0,0,0" "$PARSED_FAILED_BREAKDOWN" "clean run failure classes"
+assert_eq "0" "$PARSED_NON_2XX" "non-2xx omitted by ab means none"
+assert_eq "0" "$PARSED_WRITE_ERRORS" "write errors omitted by ab means none"
+
+loadgen_output='Complete requests:      900
+Failed requests:        40
+Non-2xx responses:      7'
+
+parse_ab_errors "$loadgen_output"
+assert_eq "40" "$PARSED_FAILED" "python engine failures"
+assert_eq ",,," "$PARSED_FAILED_BREAKDOWN" "python engine prints no failure classes"
+assert_eq "7" "$PARSED_NON_2XX" "python engine non-2xx"
+
 partial_output='Benchmarking nginx-multi (be patient)...apr_socket_recv: Connection reset by peer (104)
 Total of 43300 requests completed'
 
@@ -85,5 +85,17 @@ if ! awk -F, 'NR==2 {exit ($4 > 0 ? 0 : 1)}' "$csv"; then
   exit 1
 fi
 
+if ! grep -q ',0,0,0.0,0,0,0,20,0.0,20,20,0,20,0.0,20,20,0,20,0.0,20,20,' "$csv"; then
+  echo "Connection Times table not recorded" >&2
+  rm -rf "$tmp_dir" "$STATE_FILE" "$FAKE_AB"
+  exit 1
+fi
+
+if ! grep -q ',100,0,0,0,0,0,0,0$' "$csv"; then
+  echo "Request accounting not recorded" >&2
+  rm -rf "$tmp_dir" "$STATE_FILE" "$FAKE_AB"
+  exit 1
+fi
+
 rm -rf "$tmp_dir" "$STATE_FILE" "$FAKE_AB"
 echo "PASS"
@@ -0,0 +1,161 @@
+#!/bin/sh
+set -eu
+
+ROOT_DIR="$(cd "$(dirname "$0")/.." && pwd)"
+RUN_SH="$ROOT_DIR/run_ab.sh"
+
+FAKE_LOADGEN="$ROOT_DIR/tmp_fake_loadgen.sh"
+cat > "$FAKE_LOADGEN" <<'EOF_FAKE'
+#!/bin/sh
+# Minimal stand-in for tools/run_loadgen.py: honour --csv-out/--sweep-out/--server/--endpoint
+csv_out=""
+timeline_out=""
+samples_out=""
+mix_out=""
+mixes=""
+sweep_out=""
+rates=""
+levels=""
+server=""
+endpoint=""
+rps="1234.56"
+while [ $# -gt 0 ]; do
+  case "$1" in
+    --csv-out) csv_out="$2"; shift 2 ;;
+    --sweep-out) sweep_out="$2"; shift 2 ;;
+    --timeline-out) timeline_out="$2"; shift 2 ;;
+    --samples-out) samples_out="$2"; shift 2 ;;
+    --mix) mixes="$mixes $2"; shift 2 ;;
+    --mix-out) mix_out="$2"; shift 2 ;;
+    --rate-sweep) rates="$2"; shift 2 ;;
+    --concurrency-sweep) levels="$2"; shift 2 ;;
+    --server) server="$2"; shift 2 ;;
+    --endpoint) endpoint="$2"; shift 2 ;;
+    --no-keepalive) rps="617.28"; shift ;;
+    *) shift ;;
+  esac
+done
+if [ -n "$sweep_out" ] && [ -n "$levels" ]; then
+  [ -s "$sweep_out" ] || echo "timestamp,server,endpoint,connections,requests_sec,latency_avg,latency_p50,latency_p90,latency_p99,latency_max,failed,slo_p99_ms,within_slo" > "$sweep_out"
+  echo "2026-01-01T00:00:00Z,${server},${endpoint},${levels%%:*},500.00,1.0,0.9,1.5,3.0,5.0,0,100,1" >> "$sweep_out"
+  exit 0
+fi
+if [ -n "$sweep_out" ]; then
+  [ -s "$sweep_out" ] || echo "timestamp,server,endpoint,offered_rps,requests_sec,latency_avg,latency_p50,latency_p90,latency_p99,latency_p999,latency_max,failed" > "$sweep_out"
+  for rate in $(echo "$rates" | tr ',' ' '); do
+    echo "2026-01-01T00:00:00Z,${server},${endpoint},${rate},${rate},1.000,0.900,1.500,3.000,4.000,5.000,0" >> "$sweep_out"
+  done
+  exit 0
+fi
+if [ -n "$mix_out" ]; then
+  [ -s "$mix_out" ] || echo "timestamp,server,endpoint,weight,share,requests_sec,latency_avg,latency_p50,latency_p90,latency_p99,latency_max,failed" > "$mix_out"
+  for mix in $mixes; do
+    echo "2026-01-01T00:00:00Z,${server},${mix#*:},0.5,0.5,100.00,1.0,0.9,1.5,3.0,5.0,0" >> "$mix_out"
+  done
+  echo "2026-01-01T00:00:00Z,${server},all,1.0,1.0,200.00,1.0,0.9,1.5,3.0,5.0,0" >> "$mix_out"
+  exit 0
+fi
+echo "2026-01-01T00:00:00Z,${server},${endpoint},${rps},0.812ms,0.734,0.901,1.250,3.475,456.78" > "$csv_out"
+if [ -n "$timeline_out" ]; then
+  mkdir -p "$(dirname "$timeline_out")"
+  printf 'second,completed,failed,latency_p50,latency_p90,latency_p99,latency_max\n0,1234,0,0.7,0.9,3.4,9.1\n' > "$timeline_out"
+fi
+if [ -n "$samples_out" ]; then
+  mkdir -p "$(dirname "$samples_out")"
+  printf 'elapsed_s,latency_ms,server_ms,pid\n0.120,0.812,0.301,41\n' > "$samples_out"
+fi
+echo "Complete requests:      2469"
+echo "Percentage of the requests served within a certain time (ms)"
+echo "  50%   0.734"
+echo "  66%   0.810"
+echo "  80%   0.950"
+echo "  95%   2.100"
+echo "  98%   3.000"
+echo "  100%  9.125 (longest request)"
+echo "Failed requests:        12"
+echo "Non-2xx responses:      30"
+EOF_FAKE
+chmod +x "$FAKE_LOADGEN"
+
+tmp_dir="$ROOT_DIR/tmp_results_test/load_engine_python"
+rm -rf "$tmp_dir"
+mkdir -p "$tmp_dir"
+
+LOAD_ENGINE=python \
+LOADGEN_CMD="$FAKE_LOADGEN" \
+RATE_SWEEP="100 200" \
+CONCURRENCY_SWEEP="4:64" \
+RESOURCE_SOURCES="xampp=proc:httpd" \
+SAMPLER_CMD="python3 $ROOT_DIR/../tools/sample_server.py" \
+SERVER_STATUS=1 \
+BODY_SAMPLE_EVERY=50 \
+MIX_WEIGHTS="cpu.php=3 io.php=1" \
+PARAM_SWEEP="cpu.php:n=100,1000 io.php:size=64" \
+KEEPALIVE_COMPARE=1 \
+AB_CMD=false \
+LIB_AB_PARSE="$ROOT_DIR/lib_ab_parse.sh" \
+RESULTS_DIR="$tmp_dir" \
+ENDPOINTS="cpu.php" \
+URL_XAMPP="http://localhost" \
+URL_NGINX_MULTI="http://localhost" \
+WAIT_FOR_SKIP=1 \
+ENDPOINT_SCHEDULE=sequential \
+CPU_DURATION=0 \
+CPU_CONNECTIONS=1 \
+DURATION=0 \
+/bin/sh "$RUN_SH" >/dev/null 2>&1 || true
+
+latest_dir=$(ls -1t "$tmp_dir" 2>/dev/null | head -n1 || true)
+csv="$tmp_dir/$latest_dir/results.csv"
+config="$tmp_dir/$latest_dir/config.json"
+
+fail() {
+  echo "[FAIL] test_load_engine_python.sh: $1" >&2
+  rm -rf "$tmp_dir" "$FAKE_LOADGEN"
+  exit 1
+}
+
+[ -f "$csv" ] || fail "no results.csv written"
+grep -q '^[^,]*,xampp,cpu.php,1234.56,0.812ms,0.734,0.901,1.250,3.475,456.78,0.810,0.950,2.100,3.000,9.125,,*2469,12,,,,,30,0$' "$csv" || fail "xampp row not taken from loadgen"
+[ "$(awk -F, 'NR > 1 && NF != 43' "$csv" | wc -l)" -eq 0 ] || fail "rows do not match the 43-column header"
+grep -q '^[^,]*,nginx_multi,cpu.php,1234.56,' "$csv" || fail "nginx_multi row not taken from loadgen"
+grep -q '"load_engine": "python"' "$config" || fail "load_engine not recorded in config.json"
+grep -q '"keepalive": true' "$config" || fail "python engine's keep-alive mode not recorded in config.json"
+! grep -q ',617.28,' "$csv" || fail "keep-alive comparison rows leaked into results.csv"
+grep -q '"keepalive":true' "$tmp_dir/$latest_dir/results.json" || fail "keepalive not recorded in results.json"
+keepalive="$tmp_dir/$latest_dir/keepalive.csv"
+[ -f "$keepalive" ] || fail "no keepalive.csv written"
+grep -q '^1,[^,]*,xampp,cpu.php,1234.56,' "$keepalive" || fail "matrix row not recorded as keep-alive"
+grep -q '^0,[^,]*,xampp,cpu.php,617.28,' "$keepalive" || fail "xampp not re-run without keep-alive"
+grep -q '^0,[^,]*,nginx_multi,cpu.php,617.28,' "$keepalive" || fail "nginx_multi not re-run without keep-alive"
+[ -s "$tmp_dir/$latest_dir/xampp_cpu.php_keepalive0.log" ] || fail "no log for the close-mode re-run"
+[ -s "$tmp_dir/$latest_dir/timeline/xampp/cpu.php.csv" ] || fail "no per-second timeline for xampp/cpu.php"
+[ -s "$tmp_dir/$latest_dir/timeline/nginx_multi/cpu.php.csv" ] || fail "no per-second timeline for nginx_multi/cpu.php"
+grep -q '^elapsed_s,cpu_s,' "$tmp_dir/$latest_dir/resources/xampp/cpu.php.csv" || fail "no resource samples for xampp/cpu.php"
+[ ! -e "$tmp_dir/$latest_dir/resources/nginx_multi" ] || fail "resources sampled for a server without a source"
+grep -q '^elapsed_s,nginx_active,' "$tmp_dir/$latest_dir/server_status/nginx_multi/cpu.php.csv" || fail "no server status for nginx_multi/cpu.php"
+[ ! -e "$tmp_dir/$latest_dir/server_status/xampp" ] || fail "status polled for xampp (no stub_status/php-fpm)"
+[ -s "$tmp_dir/$latest_dir/body_samples/xampp/cpu.php.csv" ] || fail "no body samples for xampp/cpu.php"
+[ -s "$tmp_dir/$latest_dir/body_samples/nginx_multi/cpu.php.csv" ] || fail "no body samples for nginx_multi/cpu.php"
+mixed="$tmp_dir/$latest_dir/mixed_workload.csv"
+[ -f "$mixed" ] || fail "no mixed_workload.csv written"
+[ "$(grep -c ',all,' "$mixed")" -eq 2 ] || fail "expected one aggregate mixed row per server"
+grep -q ',xampp,cpu.php?n=[0-9]*,' "$mixed" || fail "cpu.php not mixed in with its ITER parameter"
+grep -q ',nginx_multi,io.php?size=[0-9]*&iter=[0-9]*&mode=memory,' "$mixed" || fail "io.php not mixed in with its parameters"
+params="$tmp_dir/$latest_dir/param_sweep.csv"
+[ -f "$params" ] || fail "no param_sweep.csv written"
+[ "$(grep -c '^param,value,timestamp,' "$params")" -eq 1 ] || fail "param_sweep.csv header missing or repeated"
+grep -q '^n,100,[^,]*,xampp,cpu.php,1234.56,' "$params" || fail "xampp cpu.php n=100 sweep row missing"
+grep -q '^n,1000,[^,]*,nginx_multi,cpu.php,1234.56,' "$params" || fail "nginx_multi cpu.php n=1000 sweep row missing"
+[ "$(grep -c '^size,64,' "$params")" -eq 2 ] || fail "expected one io.php size=64 row per server"
+sweep="$tmp_dir/$latest_dir/rate_sweep.csv"
+[ -f "$sweep" ] || fail "no rate_sweep.csv written"
+[ "$(grep -c ',cpu.php,' "$sweep")" -eq 4 ] || fail "expected 2 rates x 2 servers in rate_sweep.csv"
+[ "$(grep -c '^timestamp,' "$sweep")" -eq 1 ] || fail "rate_sweep.csv header repeated"
+capacity="$tmp_dir/$latest_dir/concurrency_sweep.csv"
+[ -f "$capacity" ] || fail "no concurrency_sweep.csv written"
+grep -q '^[^,]*,xampp,cpu.php,4,' "$capacity" || fail "xampp concurrency sweep row missing"
+grep -q '^[^,]*,nginx_multi,cpu.php,4,' "$capacity" || fail "nginx_multi concurrency sweep row missing"
+
+rm -rf "$tmp_dir" "$FAKE_LOADGEN"
+echo "[PASS] test_load_engine_python.sh"
@@ -0,0 +1,109 @@
+#!/bin/sh
+set -eu
+
+ROOT_DIR="$(cd "$(dirname "$0")/.." && pwd)"
+RUN_SH="$ROOT_DIR/run_ab.sh"
+PLAN_CELLS="$ROOT_DIR/../tools/plan_cells.py"
+
+FAKE_LOADGEN="$ROOT_DIR/tmp_fake_loadgen_packed.sh"
+cat > "$FAKE_LOADGEN" <<'EOF_FAKE'
+#!/bin/sh
+# Stand-in for tools/run_loadgen.py that records the --cpus it was given
+csv_out=""
+cpus="none"
+server=""
+endpoint=""
+while [ $# -gt 0 ]; do
+  case "$1" in
+    --csv-out) csv_out="$2"; shift 2 ;;
+    --cpus) cpus="$2"; shift 2 ;;
+    --server) server="$2"; shift 2 ;;
+    --endpoint) endpoint="$2"; shift 2 ;;
+    *) shift ;;
+  esac
+done
+echo "2026-01-01T00:00:00Z,${server},${endpoint},1234.56,0.812ms,0.734,0.901,1.250,3.475,456.78" > "$csv_out"
+echo "cpus=${cpus}"
+EOF_FAKE
+chmod +x "$FAKE_LOADGEN"
+
+FAKE_PIN="$ROOT_DIR/tmp_fake_pin_packed.sh"
+PIN_LOG="$ROOT_DIR/tmp_fake_pin_packed.log"
+cat > "$FAKE_PIN" <<EOF_PIN
+#!/bin/sh
+# Stand-in for a docker update wrapper that records CORES SERVICE [CPUS]
+echo "\$*" >> "$PIN_LOG"
+EOF_PIN
+chmod +x "$FAKE_PIN"
+rm -f "$PIN_LOG"
+
+tmp_dir="$ROOT_DIR/tmp_results_test/packed_schedule"
+rm -rf "$tmp_dir"
+mkdir -p "$tmp_dir"
+
+LOAD_ENGINE=python \
+LOADGEN_CMD="$FAKE_LOADGEN" \
+SCHEDULER_CMD="python3 $PLAN_CELLS --cpus 0-7" \
+SERVER_CPUS="xampp=1.0 nginx_multi=4" \
+AB_CMD=false \
+LIB_AB_PARSE="$ROOT_DIR/lib_ab_parse.sh" \
+RESULTS_DIR="$tmp_dir" \
+ENDPOINTS="cpu.php json.php" \
+URL_XAMPP="http://localhost" \
+URL_NGINX_MULTI="http://localhost" \
+WAIT_FOR_SKIP=1 \
+ENDPOINT_SCHEDULE=packed \
+SERVER_PIN_CMD="$FAKE_PIN" \
+CPU_DURATION=0 \
+JSON_DURATION=0 \
+CPU_CONNECTIONS=1 \
+JSON_CONNECTIONS=1 \
+DURATION=0 \
+/bin/sh "$RUN_SH" >/dev/null 2>&1 || true
+
+latest_dir=$(ls -1t "$tmp_dir" 2>/dev/null | head -n1 || true)
+out="$tmp_dir/$latest_dir"
+
+fail() {
+  echo "[FAIL] test_packed_schedule.sh: $1" >&2
+  rm -rf "$tmp_dir" "$FAKE_LOADGEN" "$FAKE_PIN" "$PIN_LOG"
+  exit 1
+}
+
+[ -s "$out/schedule.txt" ] || fail "no schedule.txt written"
+# nginx_multi (4 cores + 1 client) and xampp (1 + 1) fit side by side on 8 cores
+[ "$(awk '{print $1}' "$out/schedule.txt" | sort -u | wc -l)" -eq 2 ] || fail "expected 2 waves of 2 cells"
+grep -q '^0 nginx_multi [a-z]*.php 4 0-3 nginx-multi 4$' "$out/schedule.txt" || fail "nginx_multi cores not planned"
+[ "$(grep -c '^[^,]*,[a-z_]*,[a-z]*.php,1234.56,' "$out/results.csv")" -eq 4 ] || fail "expected 4 result rows"
+grep -q 'cpus=4' "$out/nginx_multi_cpu.php.log" || fail "nginx_multi client not pinned to its planned core"
+grep -q 'cpus=6' "$out/xampp_json.php.log" || fail "xampp client not pinned to its planned core"
+# Each wave pins both containers once, before its cells start
+[ "$(wc -l < "$PIN_LOG")" -eq 4 ] || fail "expected one pin per service per wave"
+grep -q '^0-3 nginx-multi 4$' "$PIN_LOG" || fail "nginx-multi not pinned to its planned cores"
+grep -q '^5 xampp 1$' "$PIN_LOG" || fail "xampp not pinned to its planned core with its cpus limit"
+
+# Without a pin hook the servers could spread over every cell's cores: refuse packed mode
+rm -rf "$tmp_dir"
+mkdir -p "$tmp_dir"
+LOAD_ENGINE=python \
+LOADGEN_CMD="$FAKE_LOADGEN" \
+SCHEDULER_CMD="python3 $PLAN_CELLS --cpus 0-7" \
+AB_CMD=false \
+LIB_AB_PARSE="$ROOT_DIR/lib_ab_parse.sh" \
+RESULTS_DIR="$tmp_dir" \
+ENDPOINTS="cpu.php" \
+URL_XAMPP="http://localhost" \
+URL_NGINX_MULTI="http://localhost" \
+WAIT_FOR_SKIP=1 \
+ENDPOINT_SCHEDULE=packed \
+CPU_DURATION=0 \
+CPU_CONNECTIONS=1 \
+DURATION=0 \
+/bin/sh "$RUN_SH" > "$tmp_dir/run.log" 2>&1 || true
+out="$tmp_dir/$(ls -1t "$tmp_dir" | grep -v run.log | head -n1)"
+grep -q 'packed needs SERVER_PIN_CMD' "$tmp_dir/run.log" || fail "packed mode without SERVER_PIN_CMD not refused"
+[ ! -e "$out/schedule.txt" ] || fail "packed schedule planned without SERVER_PIN_CMD"
+[ "$(grep -c ',cpu.php,1234.56,' "$out/results.csv")" -eq 2 ] || fail "sequential fallback did not run the pair"
+
+rm -rf "$tmp_dir" "$FAKE_LOADGEN" "$FAKE_PIN" "$PIN_LOG"
+echo "[PASS] test_packed_schedule.sh"
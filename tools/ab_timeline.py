@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Turn ApacheBench's `-g` per-request file into a per-second timeline CSV.
+
+run_ab.sh runs ab with -g and converts the file here, so ab cells get the
+same timeline/<server>/<endpoint>.csv as the Python engine writes with
+--timeline-out. ab records only completed requests, so `failed` is 0 in
+every second; the run's failure total is still in results.csv.
+
+Usage:
+  python tools/ab_timeline.py gnuplot.tsv --out results/RUN/timeline/xampp/cpu.php.csv
+  python tools/ab_timeline.py gnuplot.tsv            # CSV to stdout
+"""
+
+from pathlib import Path
+import argparse
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Convert ab -g output to a per-second timeline CSV.")
+    parser.add_argument("gnuplot", type=Path, help="file written by ab -g")
+    parser.add_argument("--out", type=Path, default=None,
+                        help="timeline CSV to write (default: stdout)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Main entry point for the timeline converter."""
+    args = parse_args(argv)
+    from loadgen.ab_gnuplot import read_ab_gnuplot
+    from loadgen.output import format_timeline
+
+    try:
+        with args.gnuplot.open(encoding="utf-8", errors="replace") as f:
+            result = read_ab_gnuplot(f)
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    text = format_timeline(result)
+    if args.out:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(text, encoding="utf-8")
+    else:
+        sys.stdout.write(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark the report pipeline on synthetic fixtures and track regressions.
+
+Generates results.csv/config.json fixtures from 10^2 to 10^5 rows for 2 and
+10 servers, times every pipeline stage (plus sidecar encoding) and records
+tracemalloc peaks.
+
+Usage:
+  python tools/benchmark_pipeline.py                         # run, compare with tools/perf/baseline.json
+  python tools/benchmark_pipeline.py --save                  # run and overwrite the baseline
+  python tools/benchmark_pipeline.py --sizes 100 10000 --servers 2 --repeat 3
+  python tools/benchmark_pipeline.py --sizes 1000000 --servers 2 --no-memory   # 10^6 rows, no tracemalloc
+  python tools/benchmark_pipeline.py --output reports/perf.json --threshold 0.3
+"""
+
+from pathlib import Path
+import argparse
+import json
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+DEFAULT_BASELINE = Path(__file__).parent / "perf" / "baseline.json"
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    from perf.defaults import DEFAULT_SERVERS, DEFAULT_SIZES
+
+    parser = argparse.ArgumentParser(description="Benchmark report generation on synthetic fixtures.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="row counts to generate (default: 100 ... 100000)")
+    parser.add_argument("--servers", type=int, nargs="+", default=DEFAULT_SERVERS,
+                        help="server counts to generate (default: 2 10)")
+    parser.add_argument("--repeat", type=int, default=1,
+                        help="timed runs per case; the fastest is kept (default: 1)")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="skip the tracemalloc pass (faster, no peak_kb)")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE,
+                        help=f"baseline JSON (default: {DEFAULT_BASELINE.relative_to(Path(__file__).parent.parent)})")
+    parser.add_argument("--save", action="store_true",
+                        help="write this run as the new baseline instead of comparing")
+    parser.add_argument("--output", type=Path, default=None,
+                        help="also write this run's results to a JSON file")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="relative slowdown that counts as a regression (default: 0.2)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Main entry point for the pipeline benchmark."""
+    args = parse_args(argv)
+    from perf.pipeline_bench import compare, format_case, format_regressions, load_baseline, run_suite, save_baseline
+
+    results = run_suite(args.sizes, args.servers, repeat=args.repeat, trace_memory=not args.no_memory,
+                        progress=lambda result: print(format_case(result), flush=True))
+
+    if args.output:
+        save_baseline(results, args.output)
+        print(f"Results written: {args.output}")
+
+    if args.save:
+        save_baseline(results, args.baseline)
+        print(f"Baseline written: {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --save to create one.")
+        return 0
+    try:
+        baseline = load_baseline(args.baseline)
+    except (ValueError, json.JSONDecodeError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    print(f"Baseline: {args.baseline} (commit {baseline['meta'].get('commit') or 'unknown'})")
+    regressions = compare(results, baseline, threshold=args.threshold)
+    print(format_regressions(regressions))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
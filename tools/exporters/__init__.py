@@ -0,0 +1 @@
+"""Report data exporters module."""
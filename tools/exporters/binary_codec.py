@@ -0,0 +1,168 @@
+"""Compact binary encoding of the report sidecar.
+
+Layout (little-endian):
+    b"PHPB" | u16 schema version | value
+
+Each value starts with a one-byte tag:
+    N None, T True, F False,
+    i int64, d float64,
+    s str    (u32 byte length + UTF-8),
+    l list   (u32 count + values),
+    m map    (u32 count + (u32 key length + UTF-8 key, value) pairs),
+    D float64 array (u32 count + raw doubles),
+    Q int64 array   (u32 count + raw int64s).
+
+Lists whose items are all floats or all ints are written as typed arrays,
+so chart series and metric columns are stored as raw doubles/int64s.
+"""
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Tuple
+
+
+MAGIC = b"PHPB"
+_HEADER = struct.Struct("<4sH")
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+_SWAP = sys.byteorder != "little"
+
+
+class BinaryCodecError(ValueError):
+    """Raised when a buffer is not a valid encoded report."""
+
+
+def _typed_array(items: list):
+    if not items:
+        return None
+    if all(type(v) is float for v in items):
+        return b"D", array("d", items)
+    if all(type(v) is int and _INT64_MIN <= v <= _INT64_MAX for v in items):
+        return b"Q", array("q", items)
+    return None
+
+
+def _encode_value(value: Any, out: bytearray) -> None:
+    if value is None:
+        out += b"N"
+    elif value is True:
+        out += b"T"
+    elif value is False:
+        out += b"F"
+    elif isinstance(value, int):
+        out += b"i"
+        out += _I64.pack(value)
+    elif isinstance(value, float):
+        out += b"d"
+        out += _F64.pack(value)
+    elif isinstance(value, str):
+        raw = value.encode("utf-8")
+        out += b"s"
+        out += _U32.pack(len(raw))
+        out += raw
+    elif isinstance(value, (list, tuple)):
+        typed = _typed_array(list(value))
+        if typed is not None:
+            tag, values = typed
+            if _SWAP:
+                values.byteswap()
+            out += tag
+            out += _U32.pack(len(values))
+            out += values.tobytes()
+        else:
+            out += b"l"
+            out += _U32.pack(len(value))
+            for item in value:
+                _encode_value(item, out)
+    elif isinstance(value, dict):
+        out += b"m"
+        out += _U32.pack(len(value))
+        for key, item in value.items():
+            raw = str(key).encode("utf-8")
+            out += _U32.pack(len(raw))
+            out += raw
+            _encode_value(item, out)
+    else:
+        raise TypeError(f"Cannot encode {type(value).__name__} in report binary")
+
+
+def encode(data: Any, schema_version: int) -> bytes:
+    """Encode a JSON-compatible value (as produced by json.loads) to bytes."""
+    out = bytearray(_HEADER.pack(MAGIC, schema_version))
+    _encode_value(data, out)
+    return bytes(out)
+
+
+def _decode_value(buf: memoryview, pos: int) -> Tuple[Any, int]:
+    tag = bytes(buf[pos:pos + 1])
+    pos += 1
+    if tag == b"N":
+        return None, pos
+    if tag == b"T":
+        return True, pos
+    if tag == b"F":
+        return False, pos
+    if tag == b"i":
+        return _I64.unpack_from(buf, pos)[0], pos + _I64.size
+    if tag == b"d":
+        return _F64.unpack_from(buf, pos)[0], pos + _F64.size
+    if tag == b"s":
+        (length,) = _U32.unpack_from(buf, pos)
+        pos += _U32.size
+        return str(buf[pos:pos + length], "utf-8"), pos + length
+    if tag in (b"D", b"Q"):
+        (count,) = _U32.unpack_from(buf, pos)
+        pos += _U32.size
+        values = array("d" if tag == b"D" else "q")
+        end = pos + count * values.itemsize
+        if end > len(buf):
+            raise BinaryCodecError(f"Array at offset {pos} runs past end of buffer")
+        values.frombytes(buf[pos:end])
+        if _SWAP:
+            values.byteswap()
+        return values.tolist(), end
+    if tag == b"l":
+        (count,) = _U32.unpack_from(buf, pos)
+        pos += _U32.size
+        items = []
+        for _ in range(count):
+            item, pos = _decode_value(buf, pos)
+            items.append(item)
+        return items, pos
+    if tag == b"m":
+        (count,) = _U32.unpack_from(buf, pos)
+        pos += _U32.size
+        mapping = {}
+        for _ in range(count):
+            (length,) = _U32.unpack_from(buf, pos)
+            pos += _U32.size
+            key = str(buf[pos:pos + length], "utf-8")
+            mapping[key], pos = _decode_value(buf, pos + length)
+        return mapping, pos
+    raise BinaryCodecError(f"Unknown tag {tag!r} at offset {pos - 1}")
+
+
+def decode(data: bytes) -> Tuple[int, Any]:
+    """Decode bytes produced by encode(); returns (schema_version, value)."""
+    buf = memoryview(data)
+    if len(buf) < _HEADER.size:
+        raise BinaryCodecError("Buffer too short for report header")
+    magic, version = _HEADER.unpack_from(buf, 0)
+    if magic != MAGIC:
+        raise BinaryCodecError("Not a report binary (bad magic)")
+    try:
+        value, pos = _decode_value(buf, _HEADER.size)
+    except (struct.error, UnicodeDecodeError) as e:
+        raise BinaryCodecError(f"Truncated report binary: {e}") from e
+    if pos != len(buf):
+        raise BinaryCodecError(f"{len(buf) - pos} trailing bytes after report value")
+    return version, value
+
+
+def read(path: Path) -> Tuple[int, Any]:
+    """Read and decode a .bin report file."""
+    return decode(path.read_bytes())
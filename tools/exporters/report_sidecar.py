@@ -0,0 +1,120 @@
+"""Structured sidecar (JSON + compact binary) written next to each HTML report.
+
+Schema history (bumped only when a released format changes):
+    1  meta, config, peak concurrency, endpoints, metrics cube, insights and the
+       full computed payload: charts, hist_requests, interpretations (en/zh),
+       has_pctl and rows (with the full percentile ladder, connection times and
+       request accounting where recorded), plus one key per optional analysis,
+       null when the run has none: rate_sweep, timeline, concurrency_sweep,
+       resources, server_status, latency_breakdown, worker_distribution,
+       mixed_workload, param_sweep, keepalive, connection_times and
+       error_accounting
+"""
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+from models.benchmark import BenchmarkRow, RenderedReport
+from exporters import binary_codec
+
+
+SIDECAR_SCHEMA_VERSION = 1
+
+
+def check_schema_version(version: Any) -> None:
+    """Raise ValueError unless a sidecar's schema_version is one this code reads."""
+    if version != SIDECAR_SCHEMA_VERSION:
+        raise ValueError(f"Unsupported sidecar schema_version {version!r} (expected {SIDECAR_SCHEMA_VERSION}); "
+                         "regenerate the report with generate_report.py")
+
+
+class ReportSidecarBuilder:
+    """Builds the machine-readable form of a report: summary plus full payload."""
+
+    METRIC_FIELDS = (
+        "requests_sec",
+        "latency_ms",
+        "latency_p50_ms",
+        "latency_p75_ms",
+        "latency_p90_ms",
+        "latency_p99_ms",
+        "transfer_kb_sec",
+    )
+
+    @staticmethod
+    def build(report: RenderedReport) -> Dict[str, Any]:
+        """Build the sidecar dictionary for a rendered report."""
+        return {
+            "schema_version": SIDECAR_SCHEMA_VERSION,
+            "meta": {
+                **report.payload["meta"],
+                "run_id": report.csv_path.parent.name,
+            },
+            "config": report.config,
+            "peak_client_concurrency": ReportSidecarBuilder.peak_client_concurrency(report.config),
+            "endpoints": report.payload["endpoints"],
+            "metrics": ReportSidecarBuilder.build_metrics_cube(report.rows),
+            "insights": report.payload["insights"],
+            "charts": report.payload["charts"],
+            "hist_requests": report.payload["hist_requests"],
+            "interpretations": report.payload["interpretations"],
+            "has_pctl": report.payload["has_pctl"],
+            "rows": report.payload["rows"],
+            "rate_sweep": report.payload.get("rate_sweep"),
+            "timeline": report.payload.get("timeline"),
+            "concurrency_sweep": report.payload.get("concurrency_sweep"),
+            "resources": report.payload.get("resources"),
+            "server_status": report.payload.get("server_status"),
+            "latency_breakdown": report.payload.get("latency_breakdown"),
+            "worker_distribution": report.payload.get("worker_distribution"),
+            "mixed_workload": report.payload.get("mixed_workload"),
+            "param_sweep": report.payload.get("param_sweep"),
+            "keepalive": report.payload.get("keepalive"),
+            "connection_times": report.payload.get("connection_times"),
+            "error_accounting": report.payload.get("error_accounting"),
+        }
+
+    @staticmethod
+    def build_metrics_cube(rows: List[BenchmarkRow]) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Index metrics as cube[server][endpoint][metric]."""
+        cube: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for row in rows:
+            cube.setdefault(row.server, {})[row.endpoint] = {
+                name: getattr(row, name) for name in ReportSidecarBuilder.METRIC_FIELDS
+            }
+        return cube
+
+    @staticmethod
+    def peak_client_concurrency(config: Dict[str, Any]) -> int:
+        """Client connections open at once across XAMPP + NGINX-Multi.
+
+        Mirrors start_benchmark.ps1: both servers are driven together, and
+        endpoint stages add up only when the schedule is parallel.
+        """
+        default_connections = config.get("connections", 0)
+        endpoint_params = config.get("endpoint_params", {})
+        connections = []
+        for endpoint in config.get("endpoints", []):
+            params = endpoint_params.get(endpoint.replace(".php", ""), {})
+            try:
+                connections.append(int(params.get("connections", default_connections)))
+            except (TypeError, ValueError):
+                continue
+        if not connections:
+            try:
+                connections = [int(default_connections)]
+            except (TypeError, ValueError):
+                return 0
+
+        if config.get("endpoint_schedule") == "parallel":
+            return sum(connections) * 2
+        return max(connections) * 2
+
+    @staticmethod
+    def write(report: RenderedReport, path: Path) -> Path:
+        """Write the sidecar JSON to path and its binary twin to path.with_suffix('.bin')."""
+        text = json.dumps(ReportSidecarBuilder.build(report), indent=2, default=str)
+        path.write_text(text, encoding="utf-8")
+        # Encode what the JSON reader sees, so both files decode to the same value
+        path.with_suffix(".bin").write_bytes(binary_codec.encode(json.loads(text), SIDECAR_SCHEMA_VERSION))
+        return path
@@ -10,21 +10,81 @@ following SOLID design principles:
 - Liskov Substitution: Components are easily substitutable
 - Interface Segregation: Clean, focused interfaces
 - Dependency Inversion: Depends on abstractions, not concrete implementations
+
+Usage:
+  python tools/generate_report.py                 # latest run -> reports/report.html
+  python tools/generate_report.py --all           # every run -> reports/runs/ + reports/index.html
+  python tools/generate_report.py --all --workers 8
+  python tools/generate_report.py --watch          # refresh reports/report.html as rows arrive
+  python tools/generate_report.py --profile        # also write reports/profile.json + print stage table
 """
 
 from pathlib import Path
+import argparse
 import sys
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
 from config.settings import RESULTS_DIR, REPORTS_DIR
-from generators.report_generator import ReportGenerator
+
+# Generator subsystems are imported inside main() so that --help and argument
+# errors return without loading the rendering pipeline.
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Generate benchmark HTML reports.")
+    parser.add_argument("--all", action="store_true",
+                        help="render a report for every run directory and write reports/index.html")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes for --all (default: CPU count)")
+    parser.add_argument("--watch", action="store_true",
+                        help="watch the newest run and refresh reports/report.html on every new row")
+    parser.add_argument("--interval", type=float, default=0.25,
+                        help="polling interval in seconds for --watch (default: 0.25)")
+    parser.add_argument("--profile", nargs="?", const="", default=None, metavar="JSON_PATH",
+                        help="record per-stage wall/CPU time and peak allocations; "
+                             "writes JSON (default: reports/profile.json) and prints a summary table")
+    return parser.parse_args(argv)
 
 
-def main():
+def main(argv=None):
     """Main entry point for report generation."""
+    args = parse_args(argv)
     try:
+        from generators.report_generator import ReportGenerator
+
+        if args.all:
+            from generators.batch_generator import BatchReportGenerator
+            index_path = BatchReportGenerator(RESULTS_DIR, REPORTS_DIR, workers=args.workers).generate_all()
+            print(f"Report index generated: {index_path}")
+            return 0
+
+        if args.watch:
+            from generators.report_watcher import ReportWatcher
+            print(f"Watching {RESULTS_DIR} (Ctrl+C to stop)")
+            try:
+                ReportWatcher(RESULTS_DIR, REPORTS_DIR, interval=args.interval).watch()
+            except KeyboardInterrupt:
+                pass
+            return 0
+
+        if args.profile is not None:
+            from utils.stage_profiler import StageProfiler
+            profiler = StageProfiler()
+            profiler.start()
+            try:
+                generator = ReportGenerator(RESULTS_DIR, REPORTS_DIR, profiler=profiler)
+                output_path = generator.generate()
+            finally:
+                profiler.stop()
+            profile_path = profiler.write_json(Path(args.profile) if args.profile else REPORTS_DIR / "profile.json")
+            print(profiler.format_table())
+            print(f"Report generated: {output_path}")
+            print(f"Profile written: {profile_path}")
+            return 0
+
         generator = ReportGenerator(RESULTS_DIR, REPORTS_DIR)
         output_path = generator.generate()
         print(f"Report generated: {output_path}")
@@ -1,102 +1,79 @@
 #!/usr/bin/env python3
 """
 Generate a Word (.docx) management-friendly deployment recommendation report
-based on an existing HTML benchmark report (reports/report_*.html).
+from the structured sidecar (report_*.json) that generate_report.py writes
+next to every HTML report.
 
 Usage:
-  python tools/generate_word_report.py [path/to/report.html]
+  python tools/generate_word_report.py [path/to/report.json | path/to/report.html ...]
+  python tools/generate_word_report.py --all [--workers N]
 
-If no path is provided, the script uses the latest report_*.html under reports/.
+If no path is provided, the script uses the latest report_*.json under reports/.
+Passing an HTML report uses its sibling .json sidecar. --all converts every
+sidecar under reports/ and reports/runs/ in parallel.
 
-Requires: python-docx, beautifulsoup4
+Requires: python-docx
 """
+import argparse
+import importlib.util
+import json
+import os
 import sys
 from pathlib import Path
-import re
 
-try:
-    from bs4 import BeautifulSoup
-    from docx import Document
-    from docx.shared import Pt
-except Exception as e:
-    print("Missing Python dependencies: bs4 or python-docx.\nInstall with: pip install python-docx beautifulsoup4", file=sys.stderr)
-    raise
 
+SERVER_LABELS = {'xampp': 'XAMPP', 'nginx_multi': 'NGINX'}
 
-def find_latest_report(reports_dir: Path) -> Path:
-    files = sorted(reports_dir.glob('report_*.html'), key=lambda p: p.stat().st_mtime, reverse=True)
+
+def find_latest_sidecar(reports_dir: Path) -> Path:
+    files = sorted(reports_dir.glob('report_*.json'), key=lambda p: p.stat().st_mtime, reverse=True)
     if not files:
-        raise FileNotFoundError('No report_*.html found in reports/')
+        raise FileNotFoundError('No report_*.json found in reports/ (run generate_report.py first)')
     return files[0]
 
 
-def extract_text_from_html(html_path: Path) -> dict:
-    html = html_path.read_text(encoding='utf-8')
-    soup = BeautifulSoup(html, 'html.parser')
+def find_all_sidecars(reports_dir: Path) -> list:
+    return sorted(list(reports_dir.glob('report_*.json')) + list((reports_dir / 'runs').glob('*.json')))
 
-    data = {}
-    # Title
-    h1 = soup.find('h1')
-    data['title'] = h1.get_text(strip=True) if h1 else 'Benchmark Report'
 
-    # Meta: generated at / source
-    meta_area = html
-    m = re.search(r'generated_at["\']?:\s*"([0-9\- :]+)"', html)
-    if m:
-        data['generated_at'] = m.group(1)
-    else:
-        data['generated_at'] = None
-
-    # Try to find summary section content: look for headings containing 'Summary' or '摘要'
-    summary_text = ''
-    for header in soup.find_all(['h2','h3','h4']):
-        if re.search(r'Summary|摘要|Configuration Summary|Configuration', header.get_text(), re.I):
-            # collect sibling paragraphs
-            sibs = []
-            for sib in header.find_next_siblings():
-                if sib.name and sib.name.startswith('h'):
-                    break
-                sibs.append(sib.get_text(separator=' ', strip=True))
-            summary_text = '\n'.join([s for s in sibs if s.strip()])
-            if summary_text:
-                break
-
-    data['summary'] = summary_text or 'No explicit summary section found in HTML. See source report.'
-
-    # Extract Peak Client Concurrency if present in text
-    peak = None
-    m2 = re.search(r'Peak Client Concurrency[^\d]*(\d{1,6})', html)
-    if m2:
-        peak = int(m2.group(1))
-    else:
-        # fallback: find numbers near 'Peak'
-        m3 = re.search(r'Peak[^\d]{0,60}(\d{3,6})', html)
-        if m3:
-            peak = int(m3.group(1))
-
-    data['peak_concurrency'] = peak
+def sidecar_for(path: Path) -> Path:
+    sidecar_path = path.with_suffix('.json')
+    if not sidecar_path.exists():
+        raise FileNotFoundError(f'No sidecar found for {path}; regenerate the report with generate_report.py')
+    return sidecar_path
 
-    # Collect notable metrics: Request/sec and p99 from any table or text
-    # Grep for 'Requests per second' lines
-    reqs = re.findall(r'Requests per second:\s*([0-9]+\.?[0-9]*)', html)
-    data['requests_per_sec_samples'] = reqs
 
-    p99s = re.findall(r'99%\s*[<>=]*\s*(\d+)', html)
-    data['p99_samples'] = p99s
+def load_sidecar(path: Path) -> dict:
+    from exporters.report_sidecar import check_schema_version
 
+    sidecar_path = sidecar_for(path)
+    data = json.loads(sidecar_path.read_text(encoding='utf-8'))
+    check_schema_version(data.get('schema_version'))
+    data['sidecar_path'] = str(sidecar_path)
     return data
 
 
+def endpoint_label(endpoint: str) -> str:
+    name = endpoint.replace('.php', '').lower()
+    return {'cpu': 'CPU', 'io': 'I/O', 'json': 'JSON'}.get(name, name.upper())
+
+
+def fmt(value, suffix: str = '') -> str:
+    if value is None:
+        return 'N/A'
+    return f'{value:,.2f}{suffix}'
+
+
 def make_recommendation(data: dict) -> str:
-    peak = data.get('peak_concurrency')
+    peak = data.get('peak_client_concurrency')
     lines = []
     lines.append('Recommendation overview:')
-    if peak is not None:
-        lines.append(f'- Observed peak client concurrency (approx): {peak}')
+    if peak:
+        lines.append(f'- Peak client concurrency (XAMPP + NGINX-Multi): {peak}')
 
     # Simple decision logic
-    if peak is None:
-        lines.append('- Unable to detect a clear peak concurrency value from the source report; recommend conservative, horizontally scalable deployment (Kubernetes) for production.)')
+    if not peak:
+        lines.append('- No connection count recorded in the benchmark configuration; recommend conservative, horizontally scalable deployment (Kubernetes) for production.')
         rec = 'Kubernetes (managed)'
     elif peak < 200:
         lines.append('- Low concurrency observed -> Docker Compose or single-node Docker + nginx is sufficient for this scale. Consider using Docker Compose or Nomad for simple orchestration.')
@@ -110,6 +87,18 @@ def make_recommendation(data: dict) -> str:
 
     lines.append(f'Primary recommendation: {rec}')
 
+    # Web stack choice per endpoint, straight from the computed insights
+    insights = data.get('insights', [])
+    if insights:
+        lines.append('\nWeb stack by workload:')
+        for insight in insights:
+            req_winner = SERVER_LABELS.get(insight['req_winner'], insight['req_winner'])
+            lat_winner = SERVER_LABELS.get(insight['lat_winner'], insight['lat_winner'])
+            if req_winner == lat_winner:
+                lines.append(f'- {endpoint_label(insight["endpoint"])}: {req_winner} (wins throughput and latency)')
+            else:
+                lines.append(f'- {endpoint_label(insight["endpoint"])}: throughput favors {req_winner}, latency favors {lat_winner}')
+
     # Add specific software choices
     lines.append('\nSuggested stack:')
     lines.append('- Reverse proxy / load balancer: NGINX or Traefik (NGINX for stability/perf; Traefik for dynamic config)')
@@ -127,28 +116,175 @@ def make_recommendation(data: dict) -> str:
     return '\n'.join(lines)
 
 
-def build_docx(data: dict, recommendation: str, html_path: Path, out_path: Path) -> None:
+def add_table(doc, header: list, rows: list) -> None:
+    table = doc.add_table(rows=1, cols=len(header))
+    table.style = 'Table Grid'
+    for cell, text in zip(table.rows[0].cells, header):
+        cell.text = text
+    for values in rows:
+        for cell, text in zip(table.add_row().cells, values):
+            cell.text = str(text)
+
+
+def build_docx(data: dict, recommendation: str, out_path: Path) -> None:
+    # python-docx is imported here so that --help and sidecar errors do not pay for it
+    from docx import Document
+    from docx.shared import Pt
+
     doc = Document()
     style = doc.styles['Normal']
     font = style.font
     font.name = 'Noto Sans'
     font.size = Pt(11)
 
-    doc.add_heading('Deployment Recommendation Report', level=1)
-    doc.add_paragraph(f'Source report: {html_path}')
-    if data.get('generated_at'):
-        doc.add_paragraph(f'Report generated at: {data.get("generated_at")}')
+    meta = data.get('meta', {})
+    config = data.get('config', {})
 
-    doc.add_heading('Executive Summary', level=2)
-    doc.add_paragraph(data.get('summary', ''))
-
-    doc.add_heading('Key Metrics Extracted', level=2)
-    if data.get('peak_concurrency'):
-        doc.add_paragraph(f'Peak Client Concurrency: {data.get("peak_concurrency")}')
-    if data.get('requests_per_sec_samples'):
-        doc.add_paragraph('Requests per second samples: ' + ', '.join(data.get('requests_per_sec_samples')))
-    if data.get('p99_samples'):
-        doc.add_paragraph('p99 latency samples (ms): ' + ', '.join(data.get('p99_samples')))
+    doc.add_heading('Deployment Recommendation Report', level=1)
+    doc.add_paragraph(f'Source data: {meta.get("source", data.get("sidecar_path"))}')
+    if meta.get('generated_at'):
+        doc.add_paragraph(f'Report generated at: {meta.get("generated_at")}')
+
+    doc.add_heading('Benchmark Configuration', level=2)
+    add_table(doc, ['Parameter', 'Value'], [
+        ['Test time', config.get('test_time', 'N/A')],
+        ['Duration (s)', config.get('duration', 'N/A')],
+        ['Connections', config.get('connections', 'N/A')],
+        ['Endpoint schedule', config.get('endpoint_schedule', 'sequential')],
+        ['Endpoints', ', '.join(endpoint_label(e) for e in data.get('endpoints', []))],
+        ['Peak client concurrency', data.get('peak_client_concurrency', 'N/A')],
+    ])
+
+    doc.add_heading('Key Metrics', level=2)
+    metrics = data.get('metrics', {})
+    xampp = metrics.get('xampp', {})
+    nginx = metrics.get('nginx_multi', {})
+    metric_rows = []
+    for endpoint in data.get('endpoints', []):
+        x = xampp.get(endpoint, {})
+        n = nginx.get(endpoint, {})
+        metric_rows.append([
+            endpoint_label(endpoint),
+            fmt(x.get('requests_sec')), fmt(n.get('requests_sec')),
+            fmt(x.get('latency_ms')), fmt(n.get('latency_ms')),
+            fmt(x.get('latency_p99_ms')), fmt(n.get('latency_p99_ms')),
+        ])
+    add_table(doc, ['Endpoint', 'XAMPP req/s', 'NGINX req/s', 'XAMPP avg ms', 'NGINX avg ms',
+                    'XAMPP p99 ms', 'NGINX p99 ms'], metric_rows)
+
+    capacity = data.get('concurrency_sweep')
+    if capacity:
+        doc.add_heading('Capacity under p99 SLO', level=2)
+        add_table(doc, ['Endpoint', 'Stack', 'p99 SLO (ms)', 'Max req/s', 'At connections'], [
+            [endpoint_label(c['endpoint']), SERVER_LABELS.get(c['server'], c['server']), f"{c['slo_p99_ms']:g}",
+             fmt(c['max_rps']) if c['max_rps'] is not None else 'SLO not met',
+             c['max_rps_connections'] if c['max_rps_connections'] is not None else 'N/A']
+            for c in capacity['series']
+        ])
+
+    error_accounting = data.get('error_accounting')
+    if error_accounting:
+        doc.add_heading('Errors and Goodput', level=2)
+
+        def count(value):
+            return value if value is not None else 'N/A'
+
+        add_table(doc, ['Endpoint', 'Stack', 'Raw req/s', 'Goodput req/s', 'Error rate', 'Non-2xx',
+                        'Connect', 'Receive', 'Exceptions', 'Write errors', 'Length (not counted)'], [
+            [endpoint_label(c['endpoint']), SERVER_LABELS.get(c['server'], c['server']), fmt(c['requests_sec']),
+             fmt(c['goodput_rps']), fmt(c['error_rate'] * 100, '%'), count(c['non_2xx']), count(c['failed_connect']),
+             count(c['failed_receive']), count(c['failed_exceptions']), count(c['write_errors']), count(c['failed_length'])]
+            for c in error_accounting['cells']
+        ])
+
+    mixed_workload = data.get('mixed_workload')
+    if mixed_workload:
+        doc.add_heading('Mixed Workload', level=2)
+        mixed_rows = [['All (mixed)', SERVER_LABELS.get(a['server'], a['server']), '100%', fmt(a['requests_sec']),
+                       fmt(a['p99']), 'N/A', 'N/A'] for a in mixed_workload['aggregate']]
+        mixed_rows += [
+            [endpoint_label(e['endpoint']), SERVER_LABELS.get(e['server'], e['server']), f"{e['weight'] * 100:.0f}%",
+             fmt(e['requests_sec']), fmt(e['p99']), fmt(e['isolated_p99']), fmt(e['p99_ratio'], 'x')]
+            for e in mixed_workload['endpoints']
+        ]
+        add_table(doc, ['Endpoint', 'Stack', 'Weight', 'Req/s', 'p99 in mix (ms)', 'p99 isolated (ms)',
+                        'p99 mix / isolated'], mixed_rows)
+
+    keepalive = data.get('keepalive')
+    if keepalive:
+        doc.add_heading('Keep-Alive vs Connection per Request', level=2)
+        add_table(doc, ['Endpoint', 'Stack', 'Req/s (new connection)', 'Req/s (keep-alive)', 'Speedup',
+                        'p99 new connection (ms)', 'p99 keep-alive (ms)'], [
+            [endpoint_label(c['endpoint']), SERVER_LABELS.get(c['server'], c['server']), fmt(c['close_rps']),
+             fmt(c['keepalive_rps']), fmt(c['speedup'], 'x'), fmt(c['close_p99']), fmt(c['keepalive_p99'])]
+            for c in keepalive['cells']
+        ])
+
+    param_sweep = data.get('param_sweep')
+    if param_sweep:
+        doc.add_heading('Cost Model (Work-Size Sweep)', level=2)
+        add_table(doc, ['Endpoint', 'Parameter', 'Stack', 'Fixed overhead (ms)', 'Cost per 1,000 units (ms)', 'R²',
+                        'Fixed cost dominates below'], [
+            [endpoint_label(s['endpoint']), s['param'], SERVER_LABELS.get(s['server'], s['server']),
+             fmt(s['latency_fit']['fixed']) if s['latency_fit'] else 'N/A',
+             fmt(s['latency_fit']['per_unit'] * 1000) if s['latency_fit'] else 'N/A',
+             f"{s['latency_fit']['r2']:.3f}" if s['latency_fit'] else 'N/A',
+             f"{s['crossover']:,.0f}" if s['crossover'] is not None else 'N/A']
+            for s in param_sweep['series']
+        ])
+
+    resources = data.get('resources')
+    if resources:
+        doc.add_heading('Resource Efficiency', level=2)
+        add_table(doc, ['Endpoint', 'Stack', 'Req/s', 'Avg CPU (cores)', 'Req per CPU-second',
+                        'Peak memory (MB)', 'Req/s per MB'], [
+            [endpoint_label(e['endpoint']), SERVER_LABELS.get(e['server'], e['server']), fmt(e['requests_sec']),
+             fmt(e['avg_cores']), fmt(e['req_per_cpu_s']), fmt(e['peak_memory_mb']), fmt(e['rps_per_mb'])]
+            for e in resources['efficiency']
+        ])
+
+    server_status = data.get('server_status')
+    if server_status:
+        doc.add_heading('nginx / php-fpm Saturation', level=2)
+        add_table(doc, ['Endpoint', 'Stack', 'Peak active children', 'Peak listen queue',
+                        'max_children reached', 'Causes'], [
+            [endpoint_label(s['endpoint']), SERVER_LABELS.get(s['server'], s['server']),
+             s['peak_fpm_active'] if s['peak_fpm_active'] is not None else 'N/A',
+             s['peak_listen_queue'] if s['peak_listen_queue'] is not None else 'N/A',
+             s['max_children_reached'] if s['max_children_reached'] is not None else 'N/A',
+             ', '.join(s['causes']) or 'none']
+            for s in server_status['summary']
+        ])
+
+    latency_breakdown = data.get('latency_breakdown')
+    if latency_breakdown:
+        doc.add_heading('PHP Time vs Queueing and Transport', level=2)
+        add_table(doc, ['Endpoint', 'Stack', 'Samples', 'Client latency (ms)', 'PHP elapsed_ms',
+                        'Queueing + transport (ms)', 'PHP share'], [
+            [endpoint_label(c['endpoint']), SERVER_LABELS.get(c['server'], c['server']), c['samples'],
+             fmt(c['latency_ms']), fmt(c['server_ms']), fmt(c['overhead_ms']), fmt(c['server_share'], '%')]
+            for c in latency_breakdown['cells']
+        ])
+
+    connection_times = data.get('connection_times')
+    if connection_times and connection_times['cells']:
+        doc.add_heading('Connection Times (ab)', level=2)
+        add_table(doc, ['Endpoint', 'Stack', 'Connect (ms)', 'Connect max (ms)', 'Waiting (ms)', 'Receive (ms)',
+                        'Total (ms)', 'Largest phase'], [
+            [endpoint_label(c['endpoint']), SERVER_LABELS.get(c['server'], c['server']), fmt(c['connect_ms']),
+             fmt(c['connect_max_ms']), fmt(c['waiting_ms']), fmt(c['receive_ms']), fmt(c['total_ms']), c['dominant']]
+            for c in connection_times['cells']
+        ])
+
+    worker_distribution = data.get('worker_distribution')
+    if worker_distribution:
+        doc.add_heading('Load Across Workers', level=2)
+        add_table(doc, ['Endpoint', 'Stack', 'Samples', 'Workers seen', 'Gini', 'Busiest worker share',
+                        'New workers during run'], [
+            [endpoint_label(c['endpoint']), SERVER_LABELS.get(c['server'], c['server']), c['samples'],
+             c['workers'], f"{c['gini']:.2f}", fmt(c['busiest_share'], '%'), c['new_workers']]
+            for c in worker_distribution['cells']
+        ])
 
     doc.add_heading('Recommendation', level=2)
     for line in recommendation.splitlines():
@@ -168,21 +304,77 @@ def build_docx(data: dict, recommendation: str, html_path: Path, out_path: Path)
     doc.save(str(out_path))
 
 
-def main():
-    reports_dir = Path('reports')
-    if len(sys.argv) > 1:
-        html_path = Path(sys.argv[1])
-    else:
-        html_path = find_latest_report(reports_dir)
+def generate_one(source_path: Path) -> dict:
+    """Convert one sidecar; failures are returned as {'source', 'error'} so a batch keeps going."""
+    try:
+        data = load_sidecar(source_path)
+        recommendation = make_recommendation(data)
+
+        sidecar_path = Path(data['sidecar_path'])
+        out_path = sidecar_path.parent / f"deployment_recommendation_{sidecar_path.stem}.docx"
+        build_docx(data, recommendation, out_path)
+    except Exception as e:
+        return {'source': str(source_path), 'error': f'{type(e).__name__}: {e}'}
+    return {'source': str(source_path), 'output': str(out_path)}
+
 
-    data = extract_text_from_html(html_path)
-    recommendation = make_recommendation(data)
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Generate Word deployment recommendations from report sidecars.')
+    parser.add_argument('paths', nargs='*', type=Path, help='report .json sidecars (or .html reports with a sidecar)')
+    parser.add_argument('--all', action='store_true', help='convert every sidecar under reports/ and reports/runs/')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes for batch mode (default: CPU count)')
+    return parser.parse_args(argv)
 
-    out_name = f"deployment_recommendation_{html_path.stem}.docx"
-    out_path = Path('reports') / out_name
-    build_docx(data, recommendation, html_path, out_path)
-    print(f'Generated Word report: {out_path}')
+
+def main(argv=None):
+    args = parse_args(argv)
+    reports_dir = Path('reports')
+    if args.all:
+        sources = find_all_sidecars(reports_dir)
+    elif args.paths:
+        sources = args.paths
+    else:
+        try:
+            sources = [find_latest_sidecar(reports_dir)]
+        except FileNotFoundError as e:
+            print(f'Error: {e}', file=sys.stderr)
+            return 1
+    if not sources:
+        print('No report sidecars found under reports/ (run generate_report.py first)', file=sys.stderr)
+        return 1
+
+    # Sources without a sidecar are reported without needing python-docx
+    results, pending = [], []
+    for source in sources:
+        try:
+            sidecar_for(source)
+            pending.append(source)
+        except FileNotFoundError as e:
+            results.append({'source': str(source), 'error': f'{type(e).__name__}: {e}'})
+
+    if pending and importlib.util.find_spec('docx') is None:
+        print("Missing Python dependency: python-docx.\nInstall with: pip install python-docx", file=sys.stderr)
+        return 1
+
+    if len(pending) == 1:
+        results.append(generate_one(pending[0]))
+    elif pending:
+        from concurrent.futures import ProcessPoolExecutor
+        workers = min(args.workers or os.cpu_count() or 1, len(pending)) or 1
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results.extend(pool.map(generate_one, pending))
+
+    failed = [r for r in results if r.get('error')]
+    for result in results:
+        if result.get('error'):
+            print(f"Error: {result['source']}: {result['error']}", file=sys.stderr)
+        else:
+            print(f"Generated Word report: {result['output']}")
+    if failed:
+        print(f'{len(failed)} of {len(results)} report(s) failed', file=sys.stderr)
+        return 1
+    return 0
 
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
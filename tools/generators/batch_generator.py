@@ -0,0 +1,86 @@
+"""Batch report generation for every run directory under results/."""
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+import os
+
+from loaders.csv_loader import CSVFinder
+from processors.data_processor import RunSummaryBuilder
+from generators.report_generator import ReportGenerator
+from generators.index_builder import RunIndexBuilder
+from exporters.report_sidecar import ReportSidecarBuilder
+
+
+# Per-process generator, created once by the pool initializer
+_worker_generator: Optional[ReportGenerator] = None
+_worker_runs_dir: Optional[Path] = None
+
+
+def _init_worker(results_dir: Path, runs_dir: Path, static_assets: Dict[str, str]) -> None:
+    """Create one ReportGenerator per worker process, sharing precomputed static assets."""
+    global _worker_generator, _worker_runs_dir
+    _worker_generator = ReportGenerator(results_dir, runs_dir, static_assets=static_assets)
+    _worker_runs_dir = runs_dir
+
+
+def _render_run(csv_path: Path) -> Dict[str, Any]:
+    """Render one run's report and return its index summary."""
+    run_id = csv_path.parent.name
+    try:
+        report = _worker_generator.render(csv_path)
+        output_path = _worker_runs_dir / f"{run_id}.html"
+        output_path.write_text(report.html, encoding="utf-8")
+        ReportSidecarBuilder.write(report, output_path.with_suffix(".json"))
+        summary = RunSummaryBuilder.build(report.rows, report.config)
+    except Exception as e:
+        return {"run_id": run_id, "error": f"{type(e).__name__}: {e}"}
+
+    summary["run_id"] = run_id
+    summary["report"] = f"{_worker_runs_dir.name}/{output_path.name}"
+    return summary
+
+
+class BatchReportGenerator:
+    """Renders reports for all runs in a process pool and writes an index page."""
+
+    RUNS_SUBDIR = "runs"
+
+    def __init__(self, results_dir: Path, reports_dir: Path, workers: Optional[int] = None):
+        self.results_dir = results_dir
+        self.reports_dir = reports_dir
+        self.runs_dir = reports_dir / self.RUNS_SUBDIR
+        self.workers = workers or os.cpu_count() or 1
+        self.csv_finder = CSVFinder(results_dir)
+
+    def generate_all(self) -> Path:
+        """Render every run and return the path of the written index.html."""
+        csv_paths = self.csv_finder.find_all()
+        if not csv_paths:
+            raise FileNotFoundError("No results.csv found under results/")
+
+        self.runs_dir.mkdir(parents=True, exist_ok=True)
+        static_assets = ReportGenerator.build_static_assets()
+
+        if self.workers <= 1 or len(csv_paths) == 1:
+            _init_worker(self.results_dir, self.runs_dir, static_assets)
+            summaries = [_render_run(p) for p in csv_paths]
+        else:
+            workers = min(self.workers, len(csv_paths))
+            chunksize = max(1, len(csv_paths) // (workers * 4))
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(self.results_dir, self.runs_dir, static_assets),
+            ) as pool:
+                summaries = list(pool.map(_render_run, csv_paths, chunksize=chunksize))
+
+        return self.write_index(summaries)
+
+    def write_index(self, summaries: List[Dict[str, Any]]) -> Path:
+        """Write reports/index.html for the given run summaries."""
+        utc_plus_8 = timezone(timedelta(hours=8))
+        generated_at = datetime.now(timezone.utc).astimezone(utc_plus_8).strftime("%Y-%m-%d %H:%M:%S")
+        index_path = self.reports_dir / "index.html"
+        index_path.write_text(RunIndexBuilder.build(summaries, generated_at), encoding="utf-8")
+        return index_path
@@ -287,6 +287,42 @@ class CSSGenerator:
     table.table-resizable td {
       user-select: none;
     }
+    .raw-table-controls {
+      display: flex;
+      gap: 8px;
+      align-items: center;
+      margin-bottom: 12px;
+    }
+    .raw-table-controls select {
+      background: var(--panel);
+      color: var(--text);
+      border: 1px solid #1f3c3f;
+      border-radius: 6px;
+      padding: 4px 8px;
+    }
+    .raw-table-viewport {
+      height: 480px;
+      overflow-y: auto;
+    }
+    .raw-virtual-table thead th {
+      position: sticky;
+      top: 0;
+      z-index: 1;
+      background: var(--panel);
+    }
+    .raw-virtual-table tbody tr {
+      height: 36px;
+    }
+    .raw-virtual-table tbody tr.raw-spacer td {
+      padding: 0;
+      border: 0;
+    }
+    .raw-virtual-table th[data-sort-dir="asc"]::after {
+      content: " ▲";
+    }
+    .raw-virtual-table th[data-sort-dir="desc"]::after {
+      content: " ▼";
+    }
     @media (max-width: 900px) {
       table {
         font-size: 13px;
@@ -1,9 +1,37 @@
 """HTML content builders for different report sections."""
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from models.benchmark import BenchmarkRow, Insight
-from processors.data_processor import format_endpoint_label
+from processors.data_processor import ErrorAccountingProcessor, format_endpoint_label
 from utils.duration_formatter import format_duration_display
+from generate_word_report import SERVER_LABELS
+
+
+def server_label(name: str) -> str:
+    """Display name of a results.csv server id (e.g. 'nginx_multi' -> 'NGINX')."""
+    return SERVER_LABELS.get(name, name)
+
+
+def bilingual(zh: str, en: str) -> str:
+    """Chinese and English variants of a text, toggled by the language switch."""
+    return f"<span class=\"lang-zh\">{zh}</span><span class=\"lang-en\" style=\"display:none;\">{en}</span>"
+
+
+def count(value: Optional[int]) -> str:
+    return f"{value:,}" if value is not None else "-"
+
+
+def ms(value: Optional[float]) -> str:
+    return f"{value:.3f}" if value is not None else "-"
+
+
+def collapse_button(target: str = ".card-content") -> str:
+    """Card header button that shows/hides the card's `target` element."""
+    toggle = f"this.parentElement.parentElement.querySelector('{target}').style.display"
+    return (f"<button class=\"collapse-btn\" onclick=\"{toggle} = {toggle} === 'none' ? 'block' : 'none'; "
+            "this.textContent = this.textContent === '▼' ? '▶' : '▼';\" "
+            "style=\"background: none; border: none; color: var(--muted); cursor: pointer; "
+            "font-size: 12px; padding: 4px 8px;\">▼</button>")
 
 
 class ParametersSection:
@@ -21,14 +49,17 @@ class ParametersSection:
         io_size = endpoint_params.get("io", {}).get("size", "N/A")
         io_iter = endpoint_params.get("io", {}).get("iterations", "N/A")
         io_mode = endpoint_params.get("io", {}).get("mode", "N/A")
+        keepalive = "N/A"
+        if config.get("keepalive") is not None:
+            keepalive = f'<span data-i18n="summary_keepalive_{"on" if config["keepalive"] else "off"}"></span>'
         
         return f"""    <div class="card" style="margin-bottom: 16px; background: rgba(109, 211, 182, 0.1); border-color: rgba(109, 211, 182, 0.3);">
       <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 12px;">
         <h2 data-i18n="params_title" style="margin: 0;"></h2>
-        <button class="collapse-btn" onclick="this.parentElement.parentElement.querySelector('.card-content').style.display = this.parentElement.parentElement.querySelector('.card-content').style.display === 'none' ? 'block' : 'none'; this.textContent = this.textContent === '▼' ? '▶' : '▼';" style="background: none; border: none; color: var(--muted); cursor: pointer; font-size: 12px; padding: 4px 8px;">▼</button>
+        {collapse_button()}
       </div>
       <div class="card-content">
-        <div style="margin-top: 16px; display: grid; grid-template-columns: repeat(7, 1fr); gap: 16px;">
+        <div style="margin-top: 16px; display: grid; grid-template-columns: repeat(8, 1fr); gap: 16px;">
           <div style="text-align: center;">
             <div style="font-weight: 500; color: var(--muted); font-size: 12px; margin-bottom: 6px;" data-i18n="summary_duration"></div>
             <div style="font-size: 18px; font-weight: bold; color: var(--text);"><strong>{duration}</strong></div>
@@ -59,6 +90,10 @@ class ParametersSection:
             <div style="font-weight: 500; color: var(--muted); font-size: 12px; margin-bottom: 6px;" data-i18n="summary_io_mode"></div>
             <div style="font-size: 18px; font-weight: bold; color: var(--text);"><strong>{io_mode}</strong></div>
           </div>
+          <div style="text-align: center;">
+            <div style="font-weight: 500; color: var(--muted); font-size: 12px; margin-bottom: 6px;" data-i18n="summary_keepalive"></div>
+            <div style="font-size: 18px; font-weight: bold; color: var(--text);"><strong>{keepalive}</strong></div>
+          </div>
         </div>
       </div>
     </div>"""
@@ -83,7 +118,7 @@ class SummarySection:
         return f"""    <div class="card" style="margin-bottom: 16px; background: rgba(109, 211, 182, 0.1); border-color: rgba(109, 211, 182, 0.3);">
       <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 12px;">
         <h2 data-i18n="summary_title" style="margin: 0;"></h2>
-        <button class="collapse-btn" onclick="this.parentElement.parentElement.querySelector('.card-content').style.display = this.parentElement.parentElement.querySelector('.card-content').style.display === 'none' ? 'block' : 'none'; this.textContent = this.textContent === '▼' ? '▶' : '▼';" style="background: none; border: none; color: var(--muted); cursor: pointer; font-size: 12px; padding: 4px 8px;">▼</button>
+        {collapse_button()}
       </div>
       <div class="card-content">
         <p class="desc" data-i18n="summary_intro"></p>
@@ -149,28 +184,36 @@ class WarningsSection:
             zh_parts = []
             en_parts = []
 
-            if endpoint_type == "cpu":
-                zh_parts.append(f"{server} 的 {endpoint} 在 {connections} 連線下吞吐歸零，代表計算 worker 已飽和或單核已達極限。")
-                en_parts.append(f"{server} {endpoint} hit zero throughput at {connections} connections, indicating compute workers saturated or single-core ceiling reached.")
-            elif endpoint_type == "json":
-                zh_parts.append(f"{server} 的 {endpoint} 在 {connections} 連線下吞吐歸零，顯示序列化/解序列化管線阻塞或 request queue 滿載。")
-                en_parts.append(f"{server} {endpoint} hit zero throughput at {connections} connections, showing JSON serialization pipeline stalled or the request queue is overwhelmed.")
-            elif "i/o" in endpoint_type or "io" == endpoint_type:
-                zh_parts.append(f"{server} 的 {endpoint} 在 {connections} 連線下吞吐歸零，顯示 I/O 路徑（磁碟或網路）被壓垮或連線大量重試。")
-                en_parts.append(f"{server} {endpoint} hit zero throughput at {connections} connections, indicating the I/O path (disk/network) collapsed or is retrying heavily.")
-            else:
-                zh_parts.append(f"{server} 的 {endpoint} 在 {connections} 連線下吞吐歸零，顯示伺服器軟體已達併發極限。")
-                en_parts.append(f"{server} {endpoint} hit zero throughput at {connections} connections, indicating the server software reached its concurrency limit.")
-
-            if xfer_zero and not req_zero:
-                zh_parts.append("傳輸量為 0 代表回應輸出被阻斷或連線提早終止，需檢視輸出管線與 keep-alive 設定。")
-                en_parts.append("Transfer at 0 implies the response path was blocked or connections terminated early; review output pipeline and keep-alive settings.")
-            elif req_zero and not xfer_zero:
-                zh_parts.append("請求吞吐為 0 但仍有輸出，可能是極端排程延遲或少量回補，建議分流併發或降低 connection 數。")
-                en_parts.append("Requests/sec at 0 with some transfer suggests extreme scheduling stalls with minimal completions; consider splitting traffic or reducing connections.")
-            else:
-                zh_parts.append("建議將該端點流量分流至較穩定的伺服器、降低併發或調整 worker/pool 設定以避開此極限。")
-                en_parts.append("Route this endpoint to a more stable server, lower concurrency, or tune worker/pool settings to avoid this limit.")
+            if req_zero or xfer_zero:
+                if endpoint_type == "cpu":
+                    zh_parts.append(f"{server} 的 {endpoint} 在 {connections} 連線下吞吐歸零，代表計算 worker 已飽和或單核已達極限。")
+                    en_parts.append(f"{server} {endpoint} hit zero throughput at {connections} connections, indicating compute workers saturated or single-core ceiling reached.")
+                elif endpoint_type == "json":
+                    zh_parts.append(f"{server} 的 {endpoint} 在 {connections} 連線下吞吐歸零，顯示序列化/解序列化管線阻塞或 request queue 滿載。")
+                    en_parts.append(f"{server} {endpoint} hit zero throughput at {connections} connections, showing JSON serialization pipeline stalled or the request queue is overwhelmed.")
+                elif "i/o" in endpoint_type or "io" == endpoint_type:
+                    zh_parts.append(f"{server} 的 {endpoint} 在 {connections} 連線下吞吐歸零，顯示 I/O 路徑（磁碟或網路）被壓垮或連線大量重試。")
+                    en_parts.append(f"{server} {endpoint} hit zero throughput at {connections} connections, indicating the I/O path (disk/network) collapsed or is retrying heavily.")
+                else:
+                    zh_parts.append(f"{server} 的 {endpoint} 在 {connections} 連線下吞吐歸零，顯示伺服器軟體已達併發極限。")
+                    en_parts.append(f"{server} {endpoint} hit zero throughput at {connections} connections, indicating the server software reached its concurrency limit.")
+
+                if xfer_zero and not req_zero:
+                    zh_parts.append("傳輸量為 0 代表回應輸出被阻斷或連線提早終止，需檢視輸出管線與 keep-alive 設定。")
+                    en_parts.append("Transfer at 0 implies the response path was blocked or connections terminated early; review output pipeline and keep-alive settings.")
+                elif req_zero and not xfer_zero:
+                    zh_parts.append("請求吞吐為 0 但仍有輸出，可能是極端排程延遲或少量回補，建議分流併發或降低 connection 數。")
+                    en_parts.append("Requests/sec at 0 with some transfer suggests extreme scheduling stalls with minimal completions; consider splitting traffic or reducing connections.")
+                else:
+                    zh_parts.append("建議將該端點流量分流至較穩定的伺服器、降低併發或調整 worker/pool 設定以避開此極限。")
+                    en_parts.append("Route this endpoint to a more stable server, lower concurrency, or tune worker/pool settings to avoid this limit.")
+
+            if item.get("errors_high"):
+                rate = item["error_rate"] * 100
+                goodput = item.get("goodput_rps") or 0.0
+                raw = item.get("requests_sec") or 0.0
+                zh_parts.append(f"{server} 的 {endpoint} 有 {rate:.1f}% 請求失敗（非 2xx、連線或讀取錯誤），有效吞吐僅 {goodput:.2f} req/s（原始 {raw:.2f} req/s）；快速回傳的錯誤會墊高原始吞吐，比較時請以有效吞吐為準。")
+                en_parts.append(f"{server} {endpoint} failed {rate:.1f}% of requests (non-2xx, connect or receive errors); goodput is {goodput:.2f} req/s against {raw:.2f} req/s raw. Fast error responses inflate raw throughput, so compare goodput instead.")
 
             zh = " ".join(zh_parts)
             en = " ".join(en_parts)
@@ -185,6 +228,8 @@ class WarningsSection:
             chips.append("<span class=\"metric-chip metric-warning\">Req/sec = 0</span>")
           if item.get("transfer_zero"):
             chips.append("<span class=\"metric-chip metric-warning\">Transfer/sec = 0</span>")
+          if item.get("errors_high"):
+            chips.append(f"<span class=\"metric-chip metric-warning\">Errors = {item['error_rate'] * 100:.1f}%</span>")
 
           bilingual_note = build_bilingual_note(item)
 
@@ -197,7 +242,7 @@ class WarningsSection:
         return f"""    <div class=\"card\" style=\"margin-bottom: 16px; background: rgba(242, 92, 84, 0.08); border-color: rgba(242, 92, 84, 0.4);\">
       <div style=\"display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 12px;\">
         <h2 data-i18n=\"warnings_title\" style=\"margin: 0; color: #f25c54;\"></h2>
-        <button class=\"collapse-btn\" onclick=\"this.parentElement.parentElement.querySelector('.card-content').style.display = this.parentElement.parentElement.querySelector('.card-content').style.display === 'none' ? 'block' : 'none'; this.textContent = this.textContent === '▼' ? '▶' : '▼';\" style=\"background: none; border: none; color: var(--muted); cursor: pointer; font-size: 12px; padding: 4px 8px;\">▼</button>
+        {collapse_button()}
       </div>
       <div class=\"card-content\">
         <p class=\"desc\" data-i18n=\"warnings_intro\" style=\"margin-top: 0; margin-bottom: 12px;\"></p>
@@ -217,16 +262,599 @@ class WarningsSection:
     </div>"""
 
 
+class CapacitySection:
+    """Builds the concurrency-sweep capacity section (max RPS within the p99 SLO)."""
+
+    @staticmethod
+    def build(capacity: Optional[Dict[str, Any]]) -> str:
+        """Build capacity section HTML. Returns empty string when the run has no concurrency sweep."""
+        if not capacity:
+            return ""
+
+        rows = []
+        for s in capacity["series"]:
+            slo = f"{s['slo_p99_ms']:g}"
+            if s["max_rps"] is None:
+                result = bilingual(f"沒有任何連線數能達成 p99 ≤ {slo} ms",
+                                   f"No connection level met p99 ≤ {slo} ms")
+                chip = "<span class=\"metric-chip metric-warning\">SLO</span>"
+                connections = p99 = "-"
+            else:
+                result = bilingual(f"p99 ≤ {slo} ms 下最高 <strong>{s['max_rps']:,.0f} req/s</strong>",
+                                   f"max RPS at p99 ≤ {slo} ms: <strong>{s['max_rps']:,.0f} req/s</strong>")
+                chip = ""
+                connections = str(s["max_rps_connections"])
+                p99 = f"{s['max_rps_p99']:.2f} ms" if s["max_rps_p99"] is not None else "-"
+            rows.append(
+                f"<tr><td>{s['label']}</td><td>{server_label(s['server'])}</td>"
+                f"<td>{chip}{result}</td><td>{connections}</td><td>{p99}</td></tr>"
+            )
+
+        return f"""    <div class="card" style="margin-bottom: 16px;">
+      <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 12px;">
+        <h2 data-i18n="capacity_title" style="margin: 0;"></h2>
+        {collapse_button()}
+      </div>
+      <div class="card-content">
+        <p class="desc" data-i18n="capacity_intro" style="margin-top: 0; margin-bottom: 12px;"></p>
+        <table style="width: 100%; border-collapse: collapse;">
+          <thead>
+            <tr>
+              <th data-i18n="capacity_col_endpoint"></th>
+              <th data-i18n="capacity_col_server"></th>
+              <th data-i18n="capacity_col_result"></th>
+              <th data-i18n="capacity_col_connections"></th>
+              <th data-i18n="capacity_col_p99"></th>
+            </tr>
+          </thead>
+          <tbody>
+            {"".join(rows)}
+          </tbody>
+        </table>
+        <div id="chart-concurrency-sweep" class="plot" style="margin-top: 16px;"></div>
+      </div>
+    </div>"""
+
+
+class ErrorAccountingSection:
+    """Builds the error-accounting section: failed requests by class and goodput against raw req/s."""
+
+    @staticmethod
+    def build(error_accounting: Optional[Dict[str, Any]]) -> str:
+        """Build error accounting section HTML. Returns empty string when no row has request accounting."""
+        if not error_accounting:
+            return ""
+
+        rows = []
+        for c in error_accounting["cells"]:
+            rate = f"{c['error_rate'] * 100:.2f}%"
+            if c["error_rate"] >= ErrorAccountingProcessor.WARN_ERROR_RATE:
+                rate = f"<span class=\"metric-chip metric-warning\">{rate}</span>"
+            rows.append(
+                f"<tr><td>{c['label']}</td><td>{server_label(c['server'])}</td>"
+                f"<td>{c['requests_sec']:,.2f}</td><td><strong>{c['goodput_rps']:,.2f}</strong></td><td>{rate}</td>"
+                f"<td>{count(c['non_2xx'])}</td><td>{count(c['failed_connect'])}</td><td>{count(c['failed_receive'])}</td>"
+                f"<td>{count(c['failed_exceptions'])}</td><td>{count(c['write_errors'])}</td><td>{count(c['failed_length'])}</td></tr>"
+            )
+
+        return f"""    <div class="card" style="margin-bottom: 16px;">
+      <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 12px;">
+        <h2 data-i18n="errors_title" style="margin: 0;"></h2>
+        {collapse_button()}
+      </div>
+      <div class="card-content">
+        <p class="desc" data-i18n="errors_intro" style="margin-top: 0; margin-bottom: 12px;"></p>
+        <table style="width: 100%; border-collapse: collapse;">
+          <thead>
+            <tr>
+              <th data-i18n="errors_col_endpoint"></th>
+              <th data-i18n="errors_col_server"></th>
+              <th data-i18n="errors_col_raw"></th>
+              <th data-i18n="errors_col_goodput"></th>
+              <th data-i18n="errors_col_rate"></th>
+              <th data-i18n="errors_col_non_2xx"></th>
+              <th data-i18n="errors_col_connect"></th>
+              <th data-i18n="errors_col_receive"></th>
+              <th data-i18n="errors_col_exceptions"></th>
+              <th data-i18n="errors_col_write"></th>
+              <th data-i18n="errors_col_length"></th>
+            </tr>
+          </thead>
+          <tbody>
+            {"".join(rows)}
+          </tbody>
+        </table>
+        <div id="chart-goodput" class="plot" style="margin-top: 16px;"></div>
+      </div>
+    </div>"""
+
+
+class MixedWorkloadSection:
+    """Builds the mixed-workload section: each endpoint's latency in the mix against its isolated cell."""
+
+    # p99 at least this many times the isolated cell's is flagged
+    SLOWDOWN_WARN = 2.0
+
+    @staticmethod
+    def build(mixed_workload: Optional[Dict[str, Any]]) -> str:
+        """Build mixed workload section HTML. Returns empty string when no mixed run was made."""
+        if not mixed_workload:
+            return ""
+
+        rows = []
+        for a in mixed_workload["aggregate"]:
+            rows.append(
+                f"<tr><td><strong data-i18n=\"mixed_all\"></strong></td><td>{server_label(a['server'])}</td>"
+                f"<td>100%</td><td><strong>{a['requests_sec']:,.0f}</strong></td><td>{ms(a['p50'])}</td>"
+                f"<td>{ms(a['p99'])}</td><td>-</td><td>-</td><td>{a['failed']:,}</td></tr>"
+            )
+        for e in mixed_workload["endpoints"]:
+            ratio = "-"
+            if e["p99_ratio"] is not None:
+                ratio = f"{e['p99_ratio']:.2f}x"
+                if e["p99_ratio"] >= MixedWorkloadSection.SLOWDOWN_WARN:
+                    ratio = f"<span class=\"metric-chip metric-warning\">{ratio}</span>"
+            rows.append(
+                f"<tr><td>{e['label']}</td><td>{server_label(e['server'])}</td>"
+                f"<td>{e['weight'] * 100:.0f}% / {e['share'] * 100:.1f}%</td><td>{e['requests_sec']:,.0f}</td>"
+                f"<td>{ms(e['p50'])}</td><td>{ms(e['p99'])}</td><td>{ms(e['isolated_p99'])}</td>"
+                f"<td>{ratio}</td><td>{e['failed']:,}</td></tr>"
+            )
+
+        return f"""    <div class="card" style="margin-bottom: 16px;">
+      <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 12px;">
+        <h2 data-i18n="mixed_title" style="margin: 0;"></h2>
+        {collapse_button()}
+      </div>
+      <div class="card-content">
+        <p class="desc" data-i18n="mixed_intro" style="margin-top: 0; margin-bottom: 12px;"></p>
+        <table style="width: 100%; border-collapse: collapse;">
+          <thead>
+            <tr>
+              <th data-i18n="mixed_col_endpoint"></th>
+              <th data-i18n="mixed_col_server"></th>
+              <th data-i18n="mixed_col_share"></th>
+              <th data-i18n="mixed_col_rps"></th>
+              <th data-i18n="mixed_col_p50"></th>
+              <th data-i18n="mixed_col_p99"></th>
+              <th data-i18n="mixed_col_isolated_p99"></th>
+              <th data-i18n="mixed_col_ratio"></th>
+              <th data-i18n="mixed_col_failed"></th>
+            </tr>
+          </thead>
+          <tbody>
+            {"".join(rows)}
+          </tbody>
+        </table>
+        <div id="chart-mixed-workload" class="plot" style="margin-top: 16px;"></div>
+      </div>
+    </div>"""
+
+
+class KeepAliveSection:
+    """Builds the keep-alive section: each cell's throughput with reused connections against one per request."""
+
+    @staticmethod
+    def build(keepalive: Optional[Dict[str, Any]]) -> str:
+        """Build keep-alive section HTML. Returns empty string when no comparison was run."""
+        if not keepalive:
+            return ""
+
+        rows = []
+        for c in keepalive["cells"]:
+            speedup = f"{c['speedup']:.2f}x"
+            if c["speedup"] < 1.0:
+                # Reusing connections made it slower, e.g. workers held by idle connections
+                speedup = f"<span class=\"metric-chip metric-warning\">{speedup}</span>"
+            rows.append(
+                f"<tr><td>{c['label']}</td><td>{server_label(c['server'])}</td>"
+                f"<td>{c['close_rps']:,.0f}</td><td>{c['keepalive_rps']:,.0f}</td><td><strong>{speedup}</strong></td>"
+                f"<td>{ms(c['close_latency_ms'])}</td><td>{ms(c['keepalive_latency_ms'])}</td>"
+                f"<td>{ms(c['close_p99'])}</td><td>{ms(c['keepalive_p99'])}</td></tr>"
+            )
+        servers = " · ".join(
+            f"{server_label(s['server'])} <strong>{s['speedup']:.2f}x</strong>" for s in keepalive["servers"]
+        )
+
+        return f"""    <div class="card" style="margin-bottom: 16px;">
+      <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 12px;">
+        <h2 data-i18n="keepalive_title" style="margin: 0;"></h2>
+        {collapse_button()}
+      </div>
+      <div class="card-content">
+        <p class="desc" data-i18n="keepalive_intro" style="margin-top: 0; margin-bottom: 12px;"></p>
+        <p style="margin-top: 0; margin-bottom: 12px;"><span data-i18n="keepalive_overall"></span> {servers}</p>
+        <table style="width: 100%; border-collapse: collapse;">
+          <thead>
+            <tr>
+              <th data-i18n="keepalive_col_endpoint"></th>
+              <th data-i18n="keepalive_col_server"></th>
+              <th data-i18n="keepalive_col_close_rps"></th>
+              <th data-i18n="keepalive_col_keepalive_rps"></th>
+              <th data-i18n="keepalive_col_speedup"></th>
+              <th data-i18n="keepalive_col_close_latency"></th>
+              <th data-i18n="keepalive_col_keepalive_latency"></th>
+              <th data-i18n="keepalive_col_close_p99"></th>
+              <th data-i18n="keepalive_col_keepalive_p99"></th>
+            </tr>
+          </thead>
+          <tbody>
+            {"".join(rows)}
+          </tbody>
+        </table>
+        <div id="chart-keepalive" class="plot" style="margin-top: 16px;"></div>
+      </div>
+    </div>"""
+
+
+class CostModelSection:
+    """Builds the cost-model section: fixed per-request overhead and cost per unit of work from parameter sweeps."""
+
+    # A fit explaining less of the variance than this is not a straight line; flagged
+    LOW_R2 = 0.9
+
+    @staticmethod
+    def build(param_sweep: Optional[Dict[str, Any]]) -> str:
+        """Build cost model section HTML. Returns empty string when no parameter sweep was run."""
+        if not param_sweep:
+            return ""
+
+        def value_label(value: float) -> str:
+            return f"{value:,.0f}" if value == int(value) else f"{value:,.3g}"
+
+        rows = []
+        for s in param_sweep["series"]:
+            fit = s["latency_fit"]
+            cost = s["cost_fit"]
+            if fit:
+                fixed = f"{fit['fixed']:.3f}"
+                per_unit = f"{fit['per_unit'] * 1000:.4f}"
+                r2 = f"{fit['r2']:.3f}"
+                if fit["r2"] < CostModelSection.LOW_R2:
+                    r2 = f"<span class=\"metric-chip metric-warning\">{r2}</span>"
+            else:
+                fixed = per_unit = r2 = "-"
+            crossover = f"{s['param']} &lt; {value_label(s['crossover'])}" if s["crossover"] is not None else "-"
+            capacity = f"{cost['fixed']:.3f} + {cost['per_unit'] * 1000:.4f}" if cost else "-"
+            values = ", ".join(value_label(v) for v in s["values"])
+            rows.append(
+                f"<tr><td>{s['label']}</td><td>{s['param']} = {values}</td><td>{server_label(s['server'])}</td>"
+                f"<td>{fixed}</td><td>{per_unit}</td><td>{r2}</td><td>{crossover}</td><td>{capacity}</td></tr>"
+            )
+
+        comparison = []
+        for c in param_sweep["comparison"]:
+            ratios = " · ".join(
+                f"{c['param']}={value_label(v)}: <strong>{ratio:.2f}x</strong>"
+                for v, ratio in zip(c["values"], c["rps_ratio"])
+            )
+            comparison.append(f"<tr><td>{c['label']}</td><td>{ratios}</td></tr>")
+        comparison_html = ""
+        if comparison:
+            comparison_html = f"""
+        <table style="width: 100%; border-collapse: collapse; margin-top: 16px;">
+          <thead>
+            <tr>
+              <th data-i18n="cost_col_endpoint"></th>
+              <th data-i18n="cost_col_ratio"></th>
+            </tr>
+          </thead>
+          <tbody>
+            {"".join(comparison)}
+          </tbody>
+        </table>"""
+
+        return f"""    <div class="card" style="margin-bottom: 16px;">
+      <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 12px;">
+        <h2 data-i18n="cost_title" style="margin: 0;"></h2>
+        {collapse_button()}
+      </div>
+      <div class="card-content">
+        <p class="desc" data-i18n="cost_intro" style="margin-top: 0; margin-bottom: 12px;"></p>
+        <table style="width: 100%; border-collapse: collapse;">
+          <thead>
+            <tr>
+              <th data-i18n="cost_col_endpoint"></th>
+              <th data-i18n="cost_col_values"></th>
+              <th data-i18n="cost_col_server"></th>
+              <th data-i18n="cost_col_fixed"></th>
+              <th data-i18n="cost_col_per_unit"></th>
+              <th data-i18n="cost_col_r2"></th>
+              <th data-i18n="cost_col_crossover"></th>
+              <th data-i18n="cost_col_capacity"></th>
+            </tr>
+          </thead>
+          <tbody>
+            {"".join(rows)}
+          </tbody>
+        </table>{comparison_html}
+        <div id="chart-cost-model" class="plot" style="margin-top: 16px;"></div>
+      </div>
+    </div>"""
+
+
+class EfficiencySection:
+    """Builds the resource-efficiency section (throughput per CPU-second and per MB of memory)."""
+
+    @staticmethod
+    def build(resources: Optional[Dict[str, Any]]) -> str:
+        """Build efficiency section HTML. Returns empty string when no resources were sampled."""
+        if not resources:
+            return ""
+
+        def number(value: Optional[float], spec: str) -> str:
+            return format(value, spec) if value is not None else "-"
+
+        rows = []
+        for e in resources["efficiency"]:
+            throttled = (f"<span class=\"metric-chip metric-warning\">{e['throttled_ms']:,.0f} ms</span>"
+                         if e["throttled_ms"] > 0 else "0")
+            rows.append(
+                f"<tr><td>{e['label']}</td><td>{server_label(e['server'])}</td>"
+                f"<td>{number(e['requests_sec'], ',.0f')}</td><td>{e['avg_cores']:.2f}</td>"
+                f"<td><strong>{number(e['req_per_cpu_s'], ',.0f')}</strong></td>"
+                f"<td>{e['peak_memory_mb']:,.1f}</td><td><strong>{number(e['rps_per_mb'], ',.2f')}</strong></td>"
+                f"<td>{throttled}</td></tr>"
+            )
+
+        return f"""    <div class="card" style="margin-bottom: 16px;">
+      <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 12px;">
+        <h2 data-i18n="efficiency_title" style="margin: 0;"></h2>
+        {collapse_button()}
+      </div>
+      <div class="card-content">
+        <p class="desc" data-i18n="efficiency_intro" style="margin-top: 0; margin-bottom: 12px;"></p>
+        <table style="width: 100%; border-collapse: collapse;">
+          <thead>
+            <tr>
+              <th data-i18n="efficiency_col_endpoint"></th>
+              <th data-i18n="efficiency_col_server"></th>
+              <th data-i18n="efficiency_col_rps"></th>
+              <th data-i18n="efficiency_col_cores"></th>
+              <th data-i18n="efficiency_col_req_per_cpu"></th>
+              <th data-i18n="efficiency_col_memory"></th>
+              <th data-i18n="efficiency_col_rps_per_mb"></th>
+              <th data-i18n="efficiency_col_throttled"></th>
+            </tr>
+          </thead>
+          <tbody>
+            {"".join(rows)}
+          </tbody>
+        </table>
+        <div id="chart-resource-cpu" class="plot" style="margin-top: 16px;"></div>
+      </div>
+    </div>"""
+
+
+class SaturationSection:
+    """Builds the nginx/php-fpm saturation section from status polls taken during the run."""
+
+    CAUSES = {
+        "max_children": ("php-fpm 達到 pm.max_children，新請求只能排隊",
+                         "php-fpm hit pm.max_children; new requests had to queue"),
+        "listen_queue": ("php-fpm listen queue 有積壓，請求在等待空閒子進程",
+                         "php-fpm listen queue backed up; requests waited for a free child"),
+        "no_idle": ("某些時刻所有 php-fpm 子進程皆忙碌，動態擴充跟不上",
+                    "at times every php-fpm child was busy; dynamic spawning lagged behind"),
+    }
+
+    @staticmethod
+    def build(server_status: Optional[Dict[str, Any]]) -> str:
+        """Build saturation section HTML. Returns empty string when no status was polled."""
+        if not server_status:
+            return ""
+
+        rows = []
+        for s in server_status["summary"]:
+            if s["causes"]:
+                diagnosis = "<br>".join(
+                    f"<span class=\"metric-chip metric-warning\">!</span>{bilingual(*SaturationSection.CAUSES[c])}"
+                    for c in s["causes"])
+            else:
+                diagnosis = bilingual("未見 php-fpm 飽和", "no php-fpm saturation seen")
+            fpm = f"{count(s['peak_fpm_active'])} / {count(s['fpm_total'])}"
+            queue = f"{count(s['peak_listen_queue'])} / {count(s['listen_queue_len'])}"
+            rows.append(
+                f"<tr><td>{s['label']}</td><td>{server_label(s['server'])}</td>"
+                f"<td>{fpm}</td><td>{count(s['min_fpm_idle'])}</td><td>{queue}</td>"
+                f"<td>{count(s['max_children_reached'])}</td><td>{count(s['peak_nginx_active'])}</td>"
+                f"<td>{diagnosis}</td></tr>"
+            )
+
+        return f"""    <div class="card" style="margin-bottom: 16px;">
+      <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 12px;">
+        <h2 data-i18n="saturation_title" style="margin: 0;"></h2>
+        {collapse_button()}
+      </div>
+      <div class="card-content">
+        <p class="desc" data-i18n="saturation_intro" style="margin-top: 0; margin-bottom: 12px;"></p>
+        <table style="width: 100%; border-collapse: collapse;">
+          <thead>
+            <tr>
+              <th data-i18n="saturation_col_endpoint"></th>
+              <th data-i18n="saturation_col_server"></th>
+              <th data-i18n="saturation_col_fpm_active"></th>
+              <th data-i18n="saturation_col_fpm_idle"></th>
+              <th data-i18n="saturation_col_listen_queue"></th>
+              <th data-i18n="saturation_col_max_children"></th>
+              <th data-i18n="saturation_col_nginx_active"></th>
+              <th data-i18n="saturation_col_diagnosis"></th>
+            </tr>
+          </thead>
+          <tbody>
+            {"".join(rows)}
+          </tbody>
+        </table>
+        <div id="chart-server-status" class="plot" style="margin-top: 16px;"></div>
+      </div>
+    </div>"""
+
+
+class LatencyBreakdownSection:
+    """Builds the server-time vs client-latency section from sampled response bodies."""
+
+    @staticmethod
+    def build(latency_breakdown: Optional[Dict[str, Any]]) -> str:
+        """Build latency breakdown section HTML. Returns empty string when no bodies were sampled."""
+        if not latency_breakdown:
+            return ""
+
+        rows = []
+        for c in latency_breakdown["cells"]:
+            share = f"{c['server_share']:.0f}%" if c["server_share"] is not None else "-"
+            rows.append(
+                f"<tr><td>{c['label']}</td><td>{server_label(c['server'])}</td><td>{c['samples']:,}</td>"
+                f"<td>{c['latency_ms']:.3f}</td><td>{c['server_ms']:.3f}</td>"
+                f"<td><strong>{c['overhead_ms']:.3f}</strong></td><td>{share}</td>"
+                f"<td>{c['overhead_p50_ms']:.3f} / {c['overhead_p99_ms']:.3f}</td></tr>"
+            )
+
+        return f"""    <div class="card" style="margin-bottom: 16px;">
+      <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 12px;">
+        <h2 data-i18n="breakdown_title" style="margin: 0;"></h2>
+        {collapse_button()}
+      </div>
+      <div class="card-content">
+        <p class="desc" data-i18n="breakdown_intro" style="margin-top: 0; margin-bottom: 12px;"></p>
+        <table style="width: 100%; border-collapse: collapse;">
+          <thead>
+            <tr>
+              <th data-i18n="breakdown_col_endpoint"></th>
+              <th data-i18n="breakdown_col_server"></th>
+              <th data-i18n="breakdown_col_samples"></th>
+              <th data-i18n="breakdown_col_latency"></th>
+              <th data-i18n="breakdown_col_php"></th>
+              <th data-i18n="breakdown_col_overhead"></th>
+              <th data-i18n="breakdown_col_share"></th>
+              <th data-i18n="breakdown_col_overhead_pctl"></th>
+            </tr>
+          </thead>
+          <tbody>
+            {"".join(rows)}
+          </tbody>
+        </table>
+        <div id="chart-latency-breakdown" class="plot" style="margin-top: 16px;"></div>
+      </div>
+    </div>"""
+
+
+class ConnectionTimesSection:
+    """Builds the connection-times section: ab's connect / waiting / receive split and percentile ladder."""
+
+    @staticmethod
+    def build(connection_times: Optional[Dict[str, Any]]) -> str:
+        """Build connection times section HTML. Returns empty string when ab printed neither table."""
+        if not connection_times:
+            return ""
+
+        rows = []
+        for c in connection_times["cells"]:
+            dominant = f"<span data-i18n=\"conn_phase_{c['dominant']}\"></span>"
+            if c["dominant"] == "connect":
+                # Requests waited to be accepted longer than they were served
+                dominant = f"<span class=\"metric-chip metric-warning\" data-i18n=\"conn_phase_connect\"></span>"
+            rows.append(
+                f"<tr><td>{c['label']}</td><td>{server_label(c['server'])}</td>"
+                f"<td>{c['connect_ms']:.0f} ({c['connect_median_ms']:.0f} / {c['connect_max_ms']:.0f})</td>"
+                f"<td>{c['connect_sd_ms']:.1f}</td><td>{c['waiting_ms']:.0f} ({c['waiting_median_ms']:.0f})</td>"
+                f"<td>{c['receive_ms']:.0f}</td><td><strong>{c['total_ms']:.0f}</strong> ({c['total_median_ms']:.0f})</td>"
+                f"<td>{dominant}</td></tr>"
+            )
+        table_html = ""
+        if rows:
+            table_html = f"""
+        <table style="width: 100%; border-collapse: collapse;">
+          <thead>
+            <tr>
+              <th data-i18n="conn_col_endpoint"></th>
+              <th data-i18n="conn_col_server"></th>
+              <th data-i18n="conn_col_connect"></th>
+              <th data-i18n="conn_col_connect_sd"></th>
+              <th data-i18n="conn_col_waiting"></th>
+              <th data-i18n="conn_col_receive"></th>
+              <th data-i18n="conn_col_total"></th>
+              <th data-i18n="conn_col_dominant"></th>
+            </tr>
+          </thead>
+          <tbody>
+            {"".join(rows)}
+          </tbody>
+        </table>
+        <div id="chart-connection-times" class="plot" style="margin-top: 16px;"></div>"""
+
+        return f"""    <div class="card" style="margin-bottom: 16px;">
+      <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 12px;">
+        <h2 data-i18n="conn_title" style="margin: 0;"></h2>
+        {collapse_button()}
+      </div>
+      <div class="card-content">
+        <p class="desc" data-i18n="conn_intro" style="margin-top: 0; margin-bottom: 12px;"></p>{table_html}
+        <div id="chart-percentile-ladder" class="plot" style="margin-top: 16px;"></div>
+      </div>
+    </div>"""
+
+
+class WorkerDistributionSection:
+    """Builds the worker load-distribution section from the PIDs in sampled response bodies."""
+
+    # Gini at or above this marks dispatch as uneven
+    UNEVEN_GINI = 0.3
+
+    @staticmethod
+    def build(worker_distribution: Optional[Dict[str, Any]]) -> str:
+        """Build worker distribution section HTML. Returns empty string when no PIDs were sampled."""
+        if not worker_distribution:
+            return ""
+
+        rows = []
+        for c in worker_distribution["cells"]:
+            gini = f"{c['gini']:.2f}"
+            if c["gini"] >= WorkerDistributionSection.UNEVEN_GINI:
+                gini = f"<span class=\"metric-chip metric-warning\">{gini}</span>"
+            rows.append(
+                f"<tr><td>{c['label']}</td><td>{server_label(c['server'])}</td><td>{c['samples']:,}</td>"
+                f"<td>{c['workers']:,}</td><td>{gini}</td><td>{c['busiest_share']:.1f}%</td>"
+                f"<td>{c['new_workers']:,}</td></tr>"
+            )
+
+        return f"""    <div class="card" style="margin-bottom: 16px;">
+      <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 12px;">
+        <h2 data-i18n="workers_title" style="margin: 0;"></h2>
+        {collapse_button()}
+      </div>
+      <div class="card-content">
+        <p class="desc" data-i18n="workers_intro" style="margin-top: 0; margin-bottom: 12px;"></p>
+        <table style="width: 100%; border-collapse: collapse;">
+          <thead>
+            <tr>
+              <th data-i18n="workers_col_endpoint"></th>
+              <th data-i18n="workers_col_server"></th>
+              <th data-i18n="workers_col_samples"></th>
+              <th data-i18n="workers_col_workers"></th>
+              <th data-i18n="workers_col_gini"></th>
+              <th data-i18n="workers_col_busiest"></th>
+              <th data-i18n="workers_col_new"></th>
+            </tr>
+          </thead>
+          <tbody>
+            {"".join(rows)}
+          </tbody>
+        </table>
+        <div id="chart-worker-churn" class="plot" style="margin-top: 16px;"></div>
+      </div>
+    </div>"""
+
+
 class EndpointsSection:
     """Builds the endpoints explanation section."""
     
     @staticmethod
     def build() -> str:
         """Build endpoints section HTML with table format."""
-        return """    <div class="card" style="margin-bottom: 16px;">
+        return f"""    <div class="card" style="margin-bottom: 16px;">
       <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 12px;">
         <h2 data-i18n="endpoints_title" style="margin: 0;"></h2>
-        <button class="collapse-btn" onclick="this.parentElement.parentElement.querySelector('.card-content').style.display = this.parentElement.parentElement.querySelector('.card-content').style.display === 'none' ? 'block' : 'none'; this.textContent = this.textContent === '▼' ? '▶' : '▼';" style="background: none; border: none; color: var(--muted); cursor: pointer; font-size: 12px; padding: 4px 8px;">▼</button>
+        {collapse_button()}
       </div>
       <div class="card-content">
         <table style="margin-top: 16px; width: 100%; border-collapse: collapse; table-layout: fixed;">
@@ -280,10 +908,10 @@ class FormulasSection:
     @staticmethod
     def build() -> str:
         """Build formulas section HTML."""
-        return """    <div class="card" style="margin-bottom: 16px;">
+        return f"""    <div class="card" style="margin-bottom: 16px;">
       <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 12px;">
         <h2 data-i18n="formulas_title" style="margin: 0;"></h2>
-        <button class="collapse-btn" onclick="this.parentElement.parentElement.querySelector('.card-content').style.display = this.parentElement.parentElement.querySelector('.card-content').style.display === 'none' ? 'block' : 'none'; this.textContent = this.textContent === '▼' ? '▶' : '▼';" style="background: none; border: none; color: var(--muted); cursor: pointer; font-size: 12px; padding: 4px 8px;">▼</button>
+        {collapse_button()}
       </div>
       <div class="card-content">
         <ul class="formula">
@@ -301,10 +929,10 @@ class ChartsGridSection:
     @staticmethod
     def build() -> str:
         """Build charts grid HTML with professional wrapper."""
-        return """    <div id="charts-section" class="card" style="margin-top: 24px;">
+        return f"""    <div id="charts-section" class="card" style="margin-top: 24px;">
       <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 12px;">
         <h2 data-i18n="performance_analysis_section" style="margin: 0;"></h2>
-        <button class="collapse-btn" onclick="this.parentElement.parentElement.querySelector('.charts-grid-content').style.display = this.parentElement.parentElement.querySelector('.charts-grid-content').style.display === 'none' ? 'block' : 'none'; this.textContent = this.textContent === '▼' ? '▶' : '▼';" style="background: none; border: none; color: var(--muted); cursor: pointer; font-size: 12px; padding: 4px 8px;">▼</button>
+        {collapse_button('.charts-grid-content')}
       </div>
       <div class="charts-grid-content">
         <div class="grid">
@@ -314,7 +942,7 @@ class ChartsGridSection:
             <h2 data-i18n="chart_requests" style="margin: 0;"></h2>
             <span class="metric-chip metric-high" data-i18n="metric_high"></span>
           </div>
-          <button class="collapse-btn" onclick="this.parentElement.parentElement.querySelector('.card-content').style.display = this.parentElement.parentElement.querySelector('.card-content').style.display === 'none' ? 'block' : 'none'; this.textContent = this.textContent === '▼' ? '▶' : '▼';" style="background: none; border: none; color: var(--muted); cursor: pointer; font-size: 12px; padding: 4px 8px;">▼</button>
+          {collapse_button()}
         </div>
         <p class="desc" data-i18n="desc_requests" style="margin-bottom: 12px; margin-top: 0;"></p>
         <div class="card-content">
@@ -327,7 +955,7 @@ class ChartsGridSection:
             <h2 data-i18n="chart_latency" style="margin: 0;"></h2>
             <span class="metric-chip metric-low" data-i18n="metric_low"></span>
           </div>
-          <button class="collapse-btn" onclick="this.parentElement.parentElement.querySelector('.card-content').style.display = this.parentElement.parentElement.querySelector('.card-content').style.display === 'none' ? 'block' : 'none'; this.textContent = this.textContent === '▼' ? '▶' : '▼';" style="background: none; border: none; color: var(--muted); cursor: pointer; font-size: 12px; padding: 4px 8px;">▼</button>
+          {collapse_button()}
         </div>
         <p class="desc" data-i18n="desc_latency" style="margin-bottom: 12px; margin-top: 0;"></p>
         <div class="card-content">
@@ -340,7 +968,7 @@ class ChartsGridSection:
             <h2 data-i18n="chart_transfer" style="margin: 0;"></h2>
             <span class="metric-chip metric-high" data-i18n="metric_high"></span>
           </div>
-          <button class="collapse-btn" onclick="this.parentElement.parentElement.querySelector('.card-content').style.display = this.parentElement.parentElement.querySelector('.card-content').style.display === 'none' ? 'block' : 'none'; this.textContent = this.textContent === '▼' ? '▶' : '▼';" style="background: none; border: none; color: var(--muted); cursor: pointer; font-size: 12px; padding: 4px 8px;">▼</button>
+          {collapse_button()}
         </div>
         <p class="desc" data-i18n="desc_transfer" style="margin-bottom: 12px; margin-top: 0;"></p>
         <div class="card-content">
@@ -353,7 +981,7 @@ class ChartsGridSection:
             <h2 data-i18n="chart_pctl" style="margin: 0;"></h2>
             <span class="metric-chip metric-low" data-i18n="metric_low"></span>
           </div>
-          <button class="collapse-btn" onclick="this.parentElement.parentElement.querySelector('.card-content').style.display = this.parentElement.parentElement.querySelector('.card-content').style.display === 'none' ? 'block' : 'none'; this.textContent = this.textContent === '▼' ? '▶' : '▼';" style="background: none; border: none; color: var(--muted); cursor: pointer; font-size: 12px; padding: 4px 8px;">▼</button>
+          {collapse_button()}
         </div>
         <p class="desc" data-i18n="desc_pctl" style="margin-bottom: 12px; margin-top: 0;"></p>
         <div class="card-content">
@@ -367,7 +995,7 @@ class ChartsGridSection:
             <h2 data-i18n="chart_dist" style="margin: 0;"></h2>
             <span class="metric-chip metric-compare" data-i18n="metric_compare"></span>
           </div>
-          <button class="collapse-btn" onclick="this.parentElement.parentElement.querySelector('.card-content').style.display = this.parentElement.parentElement.querySelector('.card-content').style.display === 'none' ? 'block' : 'none'; this.textContent = this.textContent === '▼' ? '▶' : '▼';" style="background: none; border: none; color: var(--muted); cursor: pointer; font-size: 12px; padding: 4px 8px;">▼</button>
+          {collapse_button()}
         </div>
         <p class="desc" data-i18n="desc_dist" style="margin-bottom: 12px; margin-top: 0;"></p>
         <div class="card-content">
@@ -380,12 +1008,54 @@ class ChartsGridSection:
             <h2 data-i18n="chart_delta" style="margin: 0;"></h2>
             <span class="metric-chip metric-compare" data-i18n="metric_compare"></span>
           </div>
-          <button class="collapse-btn" onclick="this.parentElement.parentElement.querySelector('.card-content').style.display = this.parentElement.parentElement.querySelector('.card-content').style.display === 'none' ? 'block' : 'none'; this.textContent = this.textContent === '▼' ? '▶' : '▼';" style="background: none; border: none; color: var(--muted); cursor: pointer; font-size: 12px; padding: 4px 8px;">▼</button>
+          {collapse_button()}
         </div>
         <p class="desc" data-i18n="desc_delta" style="margin-bottom: 12px; margin-top: 0;"></p>
         <div class="card-content">
           <div id="chart-delta" class="plot"></div>
         </div>
+      </div>
+      <div class="card">
+        <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 12px;">
+          <div style="display: flex; align-items: center; gap: 8px; flex-wrap: wrap;">
+            <h2 data-i18n="chart_rate_sweep" style="margin: 0;"></h2>
+            <span class="metric-chip metric-low" data-i18n="metric_low"></span>
+          </div>
+          {collapse_button()}
+        </div>
+        <p class="desc" data-i18n="desc_rate_sweep" style="margin-bottom: 12px; margin-top: 0;"></p>
+        <div class="card-content">
+          <div id="chart-rate-sweep" class="plot"></div>
+          <p class="desc" id="rate-sweep-note" style="margin-top: 8px; margin-bottom: 0;"></p>
+        </div>
+      </div>
+      <div class="card">
+        <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 12px;">
+          <div style="display: flex; align-items: center; gap: 8px; flex-wrap: wrap;">
+            <h2 data-i18n="chart_timeline_rps" style="margin: 0;"></h2>
+            <span class="metric-chip metric-high" data-i18n="metric_high"></span>
+          </div>
+          {collapse_button()}
+        </div>
+        <p class="desc" data-i18n="desc_timeline_rps" style="margin-bottom: 12px; margin-top: 0;"></p>
+        <div class="card-content">
+          <div id="chart-timeline-rps" class="plot"></div>
+          <p class="desc" id="timeline-rps-note" style="margin-top: 8px; margin-bottom: 0;"></p>
+        </div>
+      </div>
+      <div class="card">
+        <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 12px;">
+          <div style="display: flex; align-items: center; gap: 8px; flex-wrap: wrap;">
+            <h2 data-i18n="chart_timeline_lat" style="margin: 0;"></h2>
+            <span class="metric-chip metric-low" data-i18n="metric_low"></span>
+          </div>
+          {collapse_button()}
+        </div>
+        <p class="desc" data-i18n="desc_timeline_lat" style="margin-bottom: 12px; margin-top: 0;"></p>
+        <div class="card-content">
+          <div id="chart-timeline-lat" class="plot"></div>
+          <p class="desc" id="timeline-lat-note" style="margin-top: 8px; margin-bottom: 0;"></p>
+        </div>
       </div>
         </div>
       </div>
@@ -414,7 +1084,7 @@ class InsightsTable:
         return f"""    <div class="card" style="margin-top: 16px;">
       <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 12px;">
         <h2 data-i18n="insights_title" style="margin: 0;"></h2>
-        <button class="collapse-btn" onclick="this.parentElement.parentElement.querySelector('.card-content').style.display = this.parentElement.parentElement.querySelector('.card-content').style.display === 'none' ? 'block' : 'none'; this.textContent = this.textContent === '▼' ? '▶' : '▼';" style="background: none; border: none; color: var(--muted); cursor: pointer; font-size: 12px; padding: 4px 8px;">▼</button>
+        {collapse_button()}
       </div>
       <div class="card-content">
         <table>
@@ -800,7 +1470,7 @@ class BenchmarkReportSection:
         return f"""    <div class="card" style="margin-top: 16px;">
       <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 12px;">
         <h2 data-i18n="benchmark_report_title" style="margin: 0;"></h2>
-        <button class="collapse-btn" onclick="this.parentElement.parentElement.querySelector('.card-content').style.display = this.parentElement.parentElement.querySelector('.card-content').style.display === 'none' ? 'block' : 'none'; this.textContent = this.textContent === '▼' ? '▶' : '▼';" style="background: none; border: none; color: var(--muted); cursor: pointer; font-size: 12px; padding: 4px 8px;">▼</button>
+        {collapse_button()}
       </div>
       <div class="card-content">
         <p class="desc" data-i18n="benchmark_report_intro" style="margin: 8px 0 20px 0;"></p>
@@ -903,14 +1573,14 @@ class InterpretationSection:
     @staticmethod
     def build() -> str:
         """Build interpretation section HTML with table format."""
-        return """    <div class="card" style="margin-top: 16px; background: rgba(242, 178, 100, 0.15); border-color: rgba(242, 178, 100, 0.3);">
+        return f"""    <div class="card" style="margin-top: 16px; background: rgba(242, 178, 100, 0.15); border-color: rgba(242, 178, 100, 0.3);">
       <p style="color: var(--accent); margin: 0; line-height: 1.6;"><strong data-i18n="interp_intro"></strong></p>
     </div>
 
     <div class="card" style="margin-top: 16px;">
       <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 12px;">
         <h2 data-i18n="indicators_title" style="margin: 0;"></h2>
-        <button class="collapse-btn" onclick="this.parentElement.parentElement.querySelector('.card-content').style.display = this.parentElement.parentElement.querySelector('.card-content').style.display === 'none' ? 'block' : 'none'; this.textContent = this.textContent === '▼' ? '▶' : '▼';" style="background: none; border: none; color: var(--muted); cursor: pointer; font-size: 12px; padding: 4px 8px;">▼</button>
+        {collapse_button()}
       </div>
       <div class="card-content">
         <table style="width: 100%; border-collapse: collapse; margin-bottom: 16px;">
@@ -959,10 +1629,10 @@ class EndpointAnalysisSection:
     @staticmethod
     def build() -> str:
         """Build endpoint analysis section HTML."""
-        return """    <div class="card" style="margin-top: 16px;">
+        return f"""    <div class="card" style="margin-top: 16px;">
       <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 12px;">
         <h2 data-i18n="endpoint_analysis_title" style="margin: 0;"></h2>
-        <button class="collapse-btn" onclick="this.parentElement.parentElement.querySelector('.card-content').style.display = this.parentElement.parentElement.querySelector('.card-content').style.display === 'none' ? 'block' : 'none'; this.textContent = this.textContent === '▼' ? '▶' : '▼';" style="background: none; border: none; color: var(--muted); cursor: pointer; font-size: 12px; padding: 4px 8px;">▼</button>
+        {collapse_button()}
       </div>
       <div class="card-content">
         <table id="interpretation-table" style="width: 100%; border-collapse: collapse;">
@@ -981,11 +1651,50 @@ class EndpointAnalysisSection:
 
 
 class RawResultsSection:
-    """Builds the raw results section."""
+    """Builds the raw results section.
+
+    Up to VIRTUAL_ROW_THRESHOLD rows are rendered as static per-server tables.
+    Larger runs ship their rows as compact columns (build_payload) and the page
+    renders only the visible window of one sortable, filterable table.
+    """
+    
+    VIRTUAL_ROW_THRESHOLD = 500
+    
+    @staticmethod
+    def is_virtualized(rows: List[BenchmarkRow]) -> bool:
+        """Whether rows are too many for static tables."""
+        return len(rows) > RawResultsSection.VIRTUAL_ROW_THRESHOLD
+    
+    @staticmethod
+    def build_payload(rows: List[BenchmarkRow]) -> Dict[str, Any]:
+        """Columnar rows for the virtualized table; servers/endpoints are indexed."""
+        servers: Dict[str, int] = {}
+        endpoints: Dict[str, int] = {}
+        columns: Dict[str, list] = {
+            "server": [], "endpoint": [], "requests_sec": [], "latency_ms": [],
+            "latency_p50_ms": [], "latency_p90_ms": [], "latency_p99_ms": [], "transfer_kb_sec": [],
+        }
+        for r in rows:
+            columns["server"].append(servers.setdefault(r.server, len(servers)))
+            columns["endpoint"].append(endpoints.setdefault(format_endpoint_label(r.endpoint), len(endpoints)))
+            columns["requests_sec"].append(r.requests_sec)
+            columns["latency_ms"].append(r.latency_ms)
+            columns["latency_p50_ms"].append(r.latency_p50_ms)
+            columns["latency_p90_ms"].append(r.latency_p90_ms)
+            columns["latency_p99_ms"].append(r.latency_p99_ms)
+            columns["transfer_kb_sec"].append(r.transfer_kb_sec)
+        return {
+            "servers": [server_label(name) for name in servers],
+            "endpoints": list(endpoints),
+            "columns": columns,
+        }
     
     @staticmethod
     def build(rows: List[BenchmarkRow]) -> str:
         """Build raw results section HTML."""
+        if RawResultsSection.is_virtualized(rows):
+            return RawResultsSection._build_virtual(rows)
+
         def metric_cell(display: str, is_zero: bool) -> str:
           if is_zero:
             return "<span class=\"metric-chip metric-warning\">0</span>"
@@ -1016,7 +1725,7 @@ class RawResultsSection:
         return f"""    <div class="card" style="margin-top: 16px; margin-bottom: 24px;">
       <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 12px;">
         <h2 data-i18n="test_values_title" style="margin: 0;"></h2>
-        <button class="collapse-btn" onclick="this.parentElement.parentElement.querySelector('.card-content').style.display = this.parentElement.parentElement.querySelector('.card-content').style.display === 'none' ? 'block' : 'none'; this.textContent = this.textContent === '▼' ? '▶' : '▼';" style="background: none; border: none; color: var(--muted); cursor: pointer; font-size: 12px; padding: 4px 8px;">▼</button>
+        {collapse_button()}
       </div>
       
       <div class="card-content">
@@ -1061,3 +1770,42 @@ class RawResultsSection:
         </div>
       </div>
     </div>"""
+    
+    @staticmethod
+    def _build_virtual(rows: List[BenchmarkRow]) -> str:
+        """Build the shell of the virtualized table; rows come from payload.raw_table."""
+        servers = sorted({server_label(r.server) for r in rows})
+        endpoints = sorted({format_endpoint_label(r.endpoint) for r in rows})
+        server_options = "".join(f'<option value="{name}">{name}</option>' for name in servers)
+        endpoint_options = "".join(f'<option value="{name}">{name}</option>' for name in endpoints)
+        headers = "".join(
+            f'<th data-sort="{key}" data-i18n="{label}" style="cursor: pointer;"></th>'
+            for key, label in (
+                ("server", "th_server"), ("endpoint", "th_endpoint"), ("requests_sec", "th_req"),
+                ("latency_ms", "th_latency"), ("latency_p50_ms", "th_p50"), ("latency_p90_ms", "th_p90"),
+                ("latency_p99_ms", "th_p99"), ("transfer_kb_sec", "th_transfer"),
+            )
+        )
+        
+        return f"""    <div class="card" style="margin-top: 16px; margin-bottom: 24px;">
+      <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 12px;">
+        <h2 data-i18n="test_values_title" style="margin: 0;"></h2>
+        {collapse_button()}
+      </div>
+      
+      <div class="card-content">
+        <div class="raw-table-controls">
+          <select id="raw-filter-server"><option value="" data-i18n="raw_filter_all_servers"></option>{server_options}</select>
+          <select id="raw-filter-endpoint"><option value="" data-i18n="raw_filter_all_endpoints"></option>{endpoint_options}</select>
+          <span id="raw-table-count" class="desc"></span>
+        </div>
+        <div id="raw-table-viewport" class="raw-table-viewport">
+          <table class="raw-virtual-table" data-virtual="1">
+            <thead>
+              <tr>{headers}</tr>
+            </thead>
+            <tbody id="raw-table-body"></tbody>
+          </table>
+        </div>
+      </div>
+    </div>"""
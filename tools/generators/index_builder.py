@@ -0,0 +1,88 @@
+"""Lightweight HTML index listing every generated run report."""
+from html import escape
+from typing import List, Dict, Any
+
+from processors.data_processor import format_endpoint_label
+from generators.html_sections import server_label
+
+
+class RunIndexBuilder:
+    """Builds the reports/index.html page linking to each run's report."""
+
+    @staticmethod
+    def build(entries: List[Dict[str, Any]], generated_at: str) -> str:
+        """Build index HTML. Entries are run summaries, newest first."""
+        def metric(server: Dict[str, Any], key: str, fmt: str) -> str:
+            if not server:
+                return "-"
+            return fmt.format(server[key])
+
+        rows_html = []
+        for entry in entries:
+            run_id = escape(entry["run_id"])
+            if entry.get("error"):
+                rows_html.append(
+                    f'<tr><td>{run_id}</td>'
+                    f'<td colspan="7" class="error">{escape(entry["error"])}</td></tr>'
+                )
+                continue
+
+            servers = entry.get("servers", {})
+            xampp = servers.get("xampp")
+            nginx = servers.get("nginx_multi")
+            endpoints = ", ".join(format_endpoint_label(e) for e in entry.get("endpoints", []))
+            rows_html.append(
+                f'<tr><td><a href="{escape(entry["report"])}">{run_id}</a></td>'
+                f'<td>{escape(str(entry.get("test_time", "N/A")))}</td>'
+                f'<td>{escape(str(entry.get("connections", "N/A")))}</td>'
+                f'<td>{escape(endpoints)}</td>'
+                f'<td>{metric(xampp, "requests_sec", "{:.2f}")}</td>'
+                f'<td>{metric(nginx, "requests_sec", "{:.2f}")}</td>'
+                f'<td>{metric(xampp, "latency_ms", "{:.2f}")} / {metric(nginx, "latency_ms", "{:.2f}")}</td>'
+                f'<td>{escape(server_label(entry.get("winner", "N/A")))}</td></tr>'
+            )
+
+        body = "\n        ".join(rows_html) or '<tr><td colspan="8">No runs found.</td></tr>'
+
+        return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="utf-8" />
+  <meta name="viewport" content="width=device-width, initial-scale=1" />
+  <title>PHP Benchmark Runs</title>
+  <style>
+    body {{ margin: 0; font-family: "Noto Serif TC", "Source Han Serif TC", serif; background: #0f1b1e; color: #e7f4f2; }}
+    .container {{ max-width: 1100px; margin: 0 auto; padding: 24px; }}
+    h1 {{ font-size: 24px; margin: 0 0 4px 0; }}
+    .meta {{ color: #a7c8c2; font-size: 13px; margin-bottom: 16px; }}
+    table {{ width: 100%; border-collapse: collapse; font-size: 14px; }}
+    th, td {{ border-bottom: 1px solid #1f3c3f; padding: 8px; text-align: left; }}
+    th {{ color: #a7c8c2; font-weight: 600; }}
+    a {{ color: #f2b264; }}
+    .error {{ color: #f25c54; }}
+  </style>
+</head>
+<body>
+  <div class="container">
+    <h1>PHP Benchmark Runs</h1>
+    <div class="meta">Generated: {escape(generated_at)} &middot; {len(entries)} runs</div>
+    <table>
+      <thead>
+        <tr>
+          <th>Run</th>
+          <th>Test Time</th>
+          <th>Connections</th>
+          <th>Endpoints</th>
+          <th>XAMPP Req/sec</th>
+          <th>NGINX Req/sec</th>
+          <th>Latency ms (XAMPP / NGINX)</th>
+          <th>Throughput Winner</th>
+        </tr>
+      </thead>
+      <tbody>
+        {body}
+      </tbody>
+    </table>
+  </div>
+</body>
+</html>"""
@@ -9,14 +9,27 @@ class JavaScriptGenerator:
     @staticmethod
     def generate_payload_and_texts(payload: Dict[str, Any], texts: Dict[str, dict]) -> str:
         """Generate JavaScript payload and texts."""
+        return JavaScriptGenerator.generate_payload(payload) + "\n" + JavaScriptGenerator.generate_texts(texts)
+    
+    @staticmethod
+    def generate_payload(payload: Dict[str, Any]) -> str:
+        """Generate the JavaScript payload declaration."""
         payload_json = json.dumps(payload, default=str)
+        return f"""    const payload = {payload_json};"""
+    
+    @staticmethod
+    def generate_texts(texts: Dict[str, dict]) -> str:
+        """Generate the JavaScript i18n texts declaration."""
         texts_json = json.dumps(texts, default=str)
-        return f"""    const payload = {payload_json};
-    const TEXTS = {texts_json};"""
+        return f"""    const TEXTS = {texts_json};"""
     
     @staticmethod
     def generate_chart_code() -> str:
-        """Generate Plotly chart initialization code."""
+        """Generate lazy Plotly chart registration code.
+
+        Charts are registered as render callbacks and only drawn once their
+        container scrolls into view or its collapsed card is expanded.
+        """
         return """
     // Format numbers with 'k' suffix (thousand) to 1 decimal place
     const kFormatter = (v) => {
@@ -26,112 +39,543 @@ class JavaScriptGenerator:
       return v.toFixed(1);
     };
 
-    const reqData = [
-      { type: 'bar', name: 'XAMPP', x: payload.charts.requests_sec.labels, y: payload.charts.requests_sec.xampp, marker: { color: '#f2b264' } },
-      { type: 'bar', name: 'NGINX', x: payload.charts.requests_sec.labels, y: payload.charts.requests_sec.nginx_multi, marker: { color: '#64b5f6' } },
-    ];
-    Plotly.newPlot('chart-req', reqData, { barmode: 'group', paper_bgcolor: 'rgba(0,0,0,0)', plot_bgcolor: 'rgba(0,0,0,0)', font: { color: '#e7f4f2' }, xaxis: { tickangle: -45, automargin: true, tickfont: { size: 12 } }, yaxis: { tickformat: '.1f', ticksuffix: 'k' }, margin: { b: 80 } });
-
-    const latData = [
-      { type: 'bar', name: 'XAMPP', x: payload.charts.latency_ms.labels, y: payload.charts.latency_ms.xampp, marker: { color: '#f2b264' } },
-      { type: 'bar', name: 'NGINX', x: payload.charts.latency_ms.labels, y: payload.charts.latency_ms.nginx_multi, marker: { color: '#64b5f6' } },
-    ];
-    Plotly.newPlot('chart-lat', latData, { barmode: 'group', paper_bgcolor: 'rgba(0,0,0,0)', plot_bgcolor: 'rgba(0,0,0,0)', font: { color: '#e7f4f2' }, xaxis: { tickangle: -45, automargin: true, tickfont: { size: 12 } }, yaxis: { tickformat: '.1f', ticksuffix: 'k' }, margin: { b: 80 } });
-
-    const xferData = [
-      { type: 'bar', name: 'XAMPP', x: payload.charts.transfer_kb_sec.labels, y: payload.charts.transfer_kb_sec.xampp, marker: { color: '#f2b264' } },
-      { type: 'bar', name: 'NGINX', x: payload.charts.transfer_kb_sec.labels, y: payload.charts.transfer_kb_sec.nginx_multi, marker: { color: '#64b5f6' } },
-    ];
-    Plotly.newPlot('chart-xfer', xferData, { barmode: 'group', paper_bgcolor: 'rgba(0,0,0,0)', plot_bgcolor: 'rgba(0,0,0,0)', font: { color: '#e7f4f2' }, xaxis: { tickangle: -45, automargin: true, tickfont: { size: 12 } }, yaxis: { tickformat: '.1f', ticksuffix: 'k' }, margin: { b: 80 } });
-
-    const pctlData = [
-      { type: 'bar', name: 'XAMPP p50', x: payload.charts.latency_pctl.labels, y: payload.charts.latency_pctl.xampp.p50, marker: { color: 'rgba(242,178,100,0.65)' } },
-      { type: 'bar', name: 'XAMPP p90', x: payload.charts.latency_pctl.labels, y: payload.charts.latency_pctl.xampp.p90, marker: { color: 'rgba(242,178,100,0.85)' } },
-      { type: 'bar', name: 'XAMPP p99', x: payload.charts.latency_pctl.labels, y: payload.charts.latency_pctl.xampp.p99, marker: { color: 'rgba(242,178,100,1.0)' } },
-      { type: 'bar', name: 'NGINX p50', x: payload.charts.latency_pctl.labels, y: payload.charts.latency_pctl.nginx_multi.p50, marker: { color: 'rgba(100,181,246,0.65)' } },
-      { type: 'bar', name: 'NGINX p90', x: payload.charts.latency_pctl.labels, y: payload.charts.latency_pctl.nginx_multi.p90, marker: { color: 'rgba(100,181,246,0.85)' } },
-      { type: 'bar', name: 'NGINX p99', x: payload.charts.latency_pctl.labels, y: payload.charts.latency_pctl.nginx_multi.p99, marker: { color: 'rgba(100,181,246,1.0)' } },
-    ];
-    if (payload.has_pctl) {
-      Plotly.newPlot('chart-pctl', pctlData, { barmode: 'group', paper_bgcolor: 'rgba(0,0,0,0)', plot_bgcolor: 'rgba(0,0,0,0)', font: { color: '#e7f4f2' }, xaxis: { tickangle: -45, automargin: true, tickfont: { size: 12 }, standoff: 10 }, yaxis: { tickformat: '.1f', ticksuffix: 'ms' }, margin: { b: 120, l: 60, r: 40, t: 40 } });
-    } else {
-      const el = document.getElementById('chart-pctl');
-      if (el) {
+    // Series longer than this are drawn with WebGL traces
+    const WEBGL_POINT_THRESHOLD = 1000;
+    const lineTraceType = (points) => ((points || []).length > WEBGL_POINT_THRESHOLD ? 'scattergl' : 'scatter');
+
+    const DEFAULT_CHART_FONT_COLOR = '#e7f4f2';
+    let chartFontColor = DEFAULT_CHART_FONT_COLOR;
+    const chartRenderers = {};
+    const renderedCharts = new Set();
+    let chartObserver = null;
+
+    function chartThemeLayout(fontColor) {
+      return {
+        font: { color: fontColor },
+        xaxis: { tickfont: { color: fontColor }, titlefont: { color: fontColor } },
+        yaxis: { tickfont: { color: fontColor }, titlefont: { color: fontColor } }
+      };
+    }
+
+    function registerChart(id, render) {
+      chartRenderers[id] = render;
+    }
+
+    function renderChart(id) {
+      if (renderedCharts.has(id) || !chartRenderers[id]) {
+        return;
+      }
+      const el = document.getElementById(id);
+      // Skip containers that are hidden inside a collapsed card
+      if (!el || el.offsetParent === null) {
+        return;
+      }
+      renderedCharts.add(id);
+      chartRenderers[id](el);
+      if (chartFontColor !== DEFAULT_CHART_FONT_COLOR && el.data && el.data.length > 0) {
+        Plotly.relayout(id, chartThemeLayout(chartFontColor));
+      }
+      if (chartObserver) {
+        chartObserver.unobserve(el);
+      }
+    }
+
+    function renderChartsWithin(root) {
+      if (!root) {
+        return;
+      }
+      Object.keys(chartRenderers).forEach((id) => {
+        const el = document.getElementById(id);
+        if (el && root.contains(el) && isChartInViewport(el)) {
+          renderChart(id);
+        }
+      });
+    }
+
+    function isChartInViewport(el) {
+      const rect = el.getBoundingClientRect();
+      return rect.bottom >= -200 && rect.top <= (window.innerHeight || document.documentElement.clientHeight) + 200;
+    }
+
+    function initializeLazyCharts() {
+      if (!('IntersectionObserver' in window)) {
+        Object.keys(chartRenderers).forEach(renderChart);
+        return;
+      }
+
+      chartObserver = new IntersectionObserver((entries) => {
+        entries.forEach((entry) => {
+          if (entry.isIntersecting) {
+            renderChart(entry.target.id);
+          }
+        });
+      }, { rootMargin: '200px 0px' });
+
+      Object.keys(chartRenderers).forEach((id) => {
+        const el = document.getElementById(id);
+        if (el) {
+          chartObserver.observe(el);
+        }
+      });
+
+      // Expanding a collapsed card reveals charts that were skipped while hidden
+      document.addEventListener('click', (event) => {
+        const btn = event.target.closest('.collapse-btn');
+        if (!btn) {
+          return;
+        }
+        window.requestAnimationFrame(() => renderChartsWithin(btn.closest('.card')));
+      });
+    }
+
+    registerChart('chart-req', (el) => {
+      const reqData = [
+        { type: 'bar', name: 'XAMPP', x: payload.charts.requests_sec.labels, y: payload.charts.requests_sec.xampp, marker: { color: '#f2b264' } },
+        { type: 'bar', name: 'NGINX', x: payload.charts.requests_sec.labels, y: payload.charts.requests_sec.nginx_multi, marker: { color: '#64b5f6' } },
+      ];
+      Plotly.newPlot(el, reqData, { barmode: 'group', paper_bgcolor: 'rgba(0,0,0,0)', plot_bgcolor: 'rgba(0,0,0,0)', font: { color: '#e7f4f2' }, xaxis: { tickangle: -45, automargin: true, tickfont: { size: 12 } }, yaxis: { tickformat: '.1f', ticksuffix: 'k' }, margin: { b: 80 } });
+    });
+
+    registerChart('chart-lat', (el) => {
+      const latData = [
+        { type: 'bar', name: 'XAMPP', x: payload.charts.latency_ms.labels, y: payload.charts.latency_ms.xampp, marker: { color: '#f2b264' } },
+        { type: 'bar', name: 'NGINX', x: payload.charts.latency_ms.labels, y: payload.charts.latency_ms.nginx_multi, marker: { color: '#64b5f6' } },
+      ];
+      Plotly.newPlot(el, latData, { barmode: 'group', paper_bgcolor: 'rgba(0,0,0,0)', plot_bgcolor: 'rgba(0,0,0,0)', font: { color: '#e7f4f2' }, xaxis: { tickangle: -45, automargin: true, tickfont: { size: 12 } }, yaxis: { tickformat: '.1f', ticksuffix: 'k' }, margin: { b: 80 } });
+    });
+
+    registerChart('chart-xfer', (el) => {
+      const xferData = [
+        { type: 'bar', name: 'XAMPP', x: payload.charts.transfer_kb_sec.labels, y: payload.charts.transfer_kb_sec.xampp, marker: { color: '#f2b264' } },
+        { type: 'bar', name: 'NGINX', x: payload.charts.transfer_kb_sec.labels, y: payload.charts.transfer_kb_sec.nginx_multi, marker: { color: '#64b5f6' } },
+      ];
+      Plotly.newPlot(el, xferData, { barmode: 'group', paper_bgcolor: 'rgba(0,0,0,0)', plot_bgcolor: 'rgba(0,0,0,0)', font: { color: '#e7f4f2' }, xaxis: { tickangle: -45, automargin: true, tickfont: { size: 12 } }, yaxis: { tickformat: '.1f', ticksuffix: 'k' }, margin: { b: 80 } });
+    });
+
+    registerChart('chart-pctl', (el) => {
+      if (!payload.has_pctl) {
         el.innerHTML = '<div class="desc">No percentile series available.</div>';
+        return;
+      }
+      const pctlData = [
+        { type: 'bar', name: 'XAMPP p50', x: payload.charts.latency_pctl.labels, y: payload.charts.latency_pctl.xampp.p50, marker: { color: 'rgba(242,178,100,0.65)' } },
+        { type: 'bar', name: 'XAMPP p90', x: payload.charts.latency_pctl.labels, y: payload.charts.latency_pctl.xampp.p90, marker: { color: 'rgba(242,178,100,0.85)' } },
+        { type: 'bar', name: 'XAMPP p99', x: payload.charts.latency_pctl.labels, y: payload.charts.latency_pctl.xampp.p99, marker: { color: 'rgba(242,178,100,1.0)' } },
+        { type: 'bar', name: 'NGINX p50', x: payload.charts.latency_pctl.labels, y: payload.charts.latency_pctl.nginx_multi.p50, marker: { color: 'rgba(100,181,246,0.65)' } },
+        { type: 'bar', name: 'NGINX p90', x: payload.charts.latency_pctl.labels, y: payload.charts.latency_pctl.nginx_multi.p90, marker: { color: 'rgba(100,181,246,0.85)' } },
+        { type: 'bar', name: 'NGINX p99', x: payload.charts.latency_pctl.labels, y: payload.charts.latency_pctl.nginx_multi.p99, marker: { color: 'rgba(100,181,246,1.0)' } },
+      ];
+      Plotly.newPlot(el, pctlData, { barmode: 'group', paper_bgcolor: 'rgba(0,0,0,0)', plot_bgcolor: 'rgba(0,0,0,0)', font: { color: '#e7f4f2' }, xaxis: { tickangle: -45, automargin: true, tickfont: { size: 12 }, standoff: 10 }, yaxis: { tickformat: '.1f', ticksuffix: 'ms' }, margin: { b: 120, l: 60, r: 40, t: 40 } });
+    });
+
+    registerChart('chart-hist', (el) => {
+      const histData = [
+        {
+          type: 'violin',
+          name: 'XAMPP',
+          y: payload.hist_requests.xampp,
+          box: { visible: true },
+          meanline: { visible: true },
+          fillcolor: 'rgba(242, 178, 100, 0.45)',
+          line: { color: '#f2b264' },
+        },
+        {
+          type: 'violin',
+          name: 'NGINX',
+          y: payload.hist_requests.nginx_multi,
+          box: { visible: true },
+          meanline: { visible: true },
+          fillcolor: 'rgba(100, 181, 246, 0.45)',
+          line: { color: '#64b5f6' },
+        },
+      ];
+      Plotly.newPlot(el, histData, {
+        paper_bgcolor: 'rgba(0,0,0,0)',
+        plot_bgcolor: 'rgba(0,0,0,0)',
+        font: { color: '#e7f4f2' },
+        xaxis: { tickangle: -45, automargin: true, tickfont: { size: 12 } },
+        yaxis: { title: 'Req/sec', tickformat: '.1f', ticksuffix: 'k' },
+        margin: { b: 80 }
+      });
+    });
+
+    registerChart('chart-delta', (el) => {
+      const deltaData = [
+        {
+          type: lineTraceType(payload.charts.requests_sec.labels),
+          mode: 'lines+markers',
+          name: 'XAMPP',
+          x: payload.charts.requests_sec.labels,
+          y: payload.charts.requests_sec.xampp,
+          line: { color: '#f2b264', width: 3 },
+          marker: { size: 8 }
+        },
+        {
+          type: lineTraceType(payload.charts.requests_sec.labels),
+          mode: 'lines+markers',
+          name: 'NGINX',
+          x: payload.charts.requests_sec.labels,
+          y: payload.charts.requests_sec.nginx_multi,
+          line: { color: '#64b5f6', width: 3 },
+          marker: { size: 8 }
+        }
+      ];
+      Plotly.newPlot(el, deltaData, {
+        paper_bgcolor: 'rgba(0,0,0,0)',
+        plot_bgcolor: 'rgba(0,0,0,0)',
+        font: { color: '#e7f4f2' },
+        xaxis: { tickangle: -45, automargin: true, tickfont: { size: 12 } },
+        yaxis: { title: 'Requests/sec', tickformat: '.1f', ticksuffix: 'k' },
+        margin: { b: 80 },
+        hovermode: 'x unified'
+      });
+    });
+
+    const SERVER_COLORS = { xampp: '242,178,100', nginx_multi: '100,181,246' };
+    const ENDPOINT_DASHES = ['solid', 'dash', 'dot', 'dashdot'];
+
+    registerChart('chart-rate-sweep', (el) => {
+      if (!payload.rate_sweep) {
+        el.style.display = 'none';
+        return;
       }
+      const endpointOrder = [...new Set(payload.rate_sweep.series.map((s) => s.endpoint))];
+      const sweepData = [];
+      payload.rate_sweep.series.forEach((s) => {
+        const rgb = SERVER_COLORS[s.server] || '180,180,180';
+        const name = `${s.server === 'xampp' ? 'XAMPP' : s.server === 'nginx_multi' ? 'NGINX' : s.server} ${s.label}`;
+        const dash = ENDPOINT_DASHES[endpointOrder.indexOf(s.endpoint) % ENDPOINT_DASHES.length];
+        const hover = s.offered.map((rate, i) => `offered ${rate.toFixed(0)} req/s<br>achieved ${s.achieved[i].toFixed(0)} req/s<br>failed ${s.failed[i]}`);
+        sweepData.push({
+          type: 'scatter', mode: 'lines+markers', name: `${name} p99`, legendgroup: name,
+          x: s.offered, y: s.p99, text: hover, hovertemplate: '%{text}<br>p99 %{y:.2f} ms<extra>%{fullData.name}</extra>',
+          line: { color: `rgb(${rgb})`, width: 3, dash: dash }, marker: { size: 7 }
+        });
+        sweepData.push({
+          type: 'scatter', mode: 'lines', name: `${name} p50`, legendgroup: name, showlegend: false,
+          x: s.offered, y: s.p50, hovertemplate: 'p50 %{y:.2f} ms<extra>%{fullData.name}</extra>',
+          line: { color: `rgba(${rgb},0.6)`, width: 1.5, dash: 'dot' }
+        });
+      });
+      Plotly.newPlot(el, sweepData, {
+        paper_bgcolor: 'rgba(0,0,0,0)',
+        plot_bgcolor: 'rgba(0,0,0,0)',
+        font: { color: '#e7f4f2' },
+        xaxis: { title: 'Offered load (req/s)', automargin: true },
+        yaxis: { title: 'Latency (ms)', type: 'log', automargin: true },
+        margin: { b: 60 },
+        hovermode: 'closest'
+      });
+    });
+
+    function timelineTraces(valueKey) {
+      const endpointOrder = [...new Set(payload.timeline.series.map((s) => s.endpoint))];
+      return payload.timeline.series.map((s) => ({
+        type: lineTraceType(s.t),
+        mode: 'lines',
+        name: `${s.server === 'xampp' ? 'XAMPP' : s.server === 'nginx_multi' ? 'NGINX' : s.server} ${s.label}`,
+        x: s.t,
+        y: s[valueKey],
+        connectgaps: false,
+        line: { color: `rgb(${SERVER_COLORS[s.server] || '180,180,180'})`, width: 2, dash: ENDPOINT_DASHES[endpointOrder.indexOf(s.endpoint) % ENDPOINT_DASHES.length] }
+      }));
+    }
+
+    function timelineLayout(yTitle, yType) {
+      return {
+        paper_bgcolor: 'rgba(0,0,0,0)',
+        plot_bgcolor: 'rgba(0,0,0,0)',
+        font: { color: '#e7f4f2' },
+        xaxis: { title: 'Elapsed (s)', automargin: true },
+        yaxis: { title: yTitle, type: yType, automargin: true },
+        margin: { b: 60 },
+        hovermode: 'x unified'
+      };
     }
 
-    const histData = [
-      {
-        type: 'violin',
-        name: 'XAMPP',
-        y: payload.hist_requests.xampp,
-        box: { visible: true },
-        meanline: { visible: true },
-        fillcolor: 'rgba(242, 178, 100, 0.45)',
-        line: { color: '#f2b264' },
-      },
-      {
-        type: 'violin',
-        name: 'NGINX',
-        y: payload.hist_requests.nginx_multi,
-        box: { visible: true },
-        meanline: { visible: true },
-        fillcolor: 'rgba(100, 181, 246, 0.45)',
-        line: { color: '#64b5f6' },
-      },
-    ];
-    Plotly.newPlot('chart-hist', histData, {
-      paper_bgcolor: 'rgba(0,0,0,0)',
-      plot_bgcolor: 'rgba(0,0,0,0)',
-      font: { color: '#e7f4f2' },
-      xaxis: { tickangle: -45, automargin: true, tickfont: { size: 12 } },
-      yaxis: { title: 'Req/sec', tickformat: '.1f', ticksuffix: 'k' },
-      margin: { b: 80 }
+    registerChart('chart-timeline-rps', (el) => {
+      if (!payload.timeline) {
+        el.style.display = 'none';
+        return;
+      }
+      Plotly.newPlot(el, timelineTraces('requests'), timelineLayout('Requests/sec', 'linear'));
+    });
+
+    registerChart('chart-timeline-lat', (el) => {
+      if (!payload.timeline) {
+        el.style.display = 'none';
+        return;
+      }
+      Plotly.newPlot(el, timelineTraces('p99'), timelineLayout('p99 (ms)', 'log'));
     });
 
-    const deltaData = [
-      {
+    registerChart('chart-concurrency-sweep', (el) => {
+      if (!payload.concurrency_sweep) {
+        return;
+      }
+      const endpointOrder = [...new Set(payload.concurrency_sweep.series.map((s) => s.endpoint))];
+      const capacityData = payload.concurrency_sweep.series.map((s) => ({
         type: 'scatter',
         mode: 'lines+markers',
-        name: 'XAMPP',
-        x: payload.charts.requests_sec.labels,
-        y: payload.charts.requests_sec.xampp,
-        line: { color: '#f2b264', width: 3 },
-        marker: { size: 8 }
-      },
-      {
+        name: `${s.server === 'xampp' ? 'XAMPP' : s.server === 'nginx_multi' ? 'NGINX' : s.server} ${s.label}`,
+        x: s.connections,
+        y: s.requests_sec,
+        text: s.p99.map((p99, i) => `p99 ${p99 === null ? '-' : p99.toFixed(2)} ms${s.within_slo[i] ? '' : ' (over SLO)'}`),
+        hovertemplate: 'c=%{x}<br>%{y:.0f} req/s<br>%{text}<extra>%{fullData.name}</extra>',
+        line: { color: `rgb(${SERVER_COLORS[s.server] || '180,180,180'})`, width: 2, dash: ENDPOINT_DASHES[endpointOrder.indexOf(s.endpoint) % ENDPOINT_DASHES.length] },
+        // Hollow markers for levels that missed the SLO or fell off
+        marker: { size: 9, symbol: s.within_slo.map((ok) => (ok ? 'circle' : 'circle-open')) }
+      }));
+      Plotly.newPlot(el, capacityData, {
+        paper_bgcolor: 'rgba(0,0,0,0)',
+        plot_bgcolor: 'rgba(0,0,0,0)',
+        font: { color: '#e7f4f2' },
+        xaxis: { title: 'Connections', type: 'log', automargin: true },
+        yaxis: { title: 'Requests/sec', automargin: true },
+        margin: { b: 60 },
+        hovermode: 'closest'
+      });
+    });
+
+    registerChart('chart-mixed-workload', (el) => {
+      if (!payload.mixed_workload) {
+        return;
+      }
+      const cells = payload.mixed_workload.endpoints;
+      const x = cells.map((c) => `${c.label} ${c.server === 'xampp' ? 'XAMPP' : c.server === 'nginx_multi' ? 'NGINX' : c.server}`);
+      const colors = (alpha) => cells.map((c) => `rgba(${SERVER_COLORS[c.server] || '180,180,180'},${alpha})`);
+      const mixedData = [
+        { type: 'bar', name: 'p99 isolated', x: x, y: cells.map((c) => c.isolated_p99), marker: { color: colors(0.4) } },
+        { type: 'bar', name: 'p99 in mix', x: x, y: cells.map((c) => c.p99), marker: { color: colors(1.0) } },
+      ];
+      Plotly.newPlot(el, mixedData, { barmode: 'group', paper_bgcolor: 'rgba(0,0,0,0)', plot_bgcolor: 'rgba(0,0,0,0)', font: { color: '#e7f4f2' }, xaxis: { tickangle: -45, automargin: true, tickfont: { size: 12 } }, yaxis: { title: 'p99 latency (ms)', tickformat: '.2f' }, margin: { b: 80 } });
+    });
+
+    registerChart('chart-keepalive', (el) => {
+      if (!payload.keepalive) {
+        return;
+      }
+      const servers = [...new Set(payload.keepalive.cells.map((c) => c.server))];
+      const keepaliveData = servers.map((server) => {
+        const cells = payload.keepalive.cells.filter((c) => c.server === server);
+        return {
+          type: 'bar',
+          name: server === 'xampp' ? 'XAMPP' : server === 'nginx_multi' ? 'NGINX' : server,
+          x: cells.map((c) => c.label),
+          y: cells.map((c) => c.speedup),
+          text: cells.map((c) => `${c.close_rps.toFixed(0)} → ${c.keepalive_rps.toFixed(0)} req/s`),
+          hovertemplate: '%{y:.2f}x<br>%{text}<extra>%{fullData.name}</extra>',
+          marker: { color: `rgb(${SERVER_COLORS[server] || '180,180,180'})` }
+        };
+      });
+      Plotly.newPlot(el, keepaliveData, {
+        barmode: 'group',
+        paper_bgcolor: 'rgba(0,0,0,0)',
+        plot_bgcolor: 'rgba(0,0,0,0)',
+        font: { color: '#e7f4f2' },
+        xaxis: { automargin: true },
+        yaxis: { title: 'Keep-alive speedup (x)', automargin: true },
+        // No-change line: bars below it lost throughput with keep-alive
+        shapes: [{ type: 'line', xref: 'paper', x0: 0, x1: 1, y0: 1, y1: 1, line: { color: '#e7f4f2', width: 1, dash: 'dot' } }],
+        margin: { b: 60 }
+      });
+    });
+
+    registerChart('chart-cost-model', (el) => {
+      if (!payload.param_sweep) {
+        return;
+      }
+      const endpointOrder = [...new Set(payload.param_sweep.series.map((s) => s.endpoint))];
+      const costData = [];
+      payload.param_sweep.series.forEach((s) => {
+        const name = `${s.server === 'xampp' ? 'XAMPP' : s.server === 'nginx_multi' ? 'NGINX' : s.server} ${s.label}`;
+        const color = `rgb(${SERVER_COLORS[s.server] || '180,180,180'})`;
+        costData.push({
+          type: 'scatter', mode: 'markers', name: name, legendgroup: name,
+          x: s.values, y: s.latency_ms,
+          hovertemplate: `${s.param}=%{x}<br>%{y:.3f} ms<extra>%{fullData.name}</extra>`,
+          marker: { size: 9, color: color }
+        });
+        if (s.latency_fit) {
+          // Fitted fixed + per-unit line over the swept range
+          const xs = [s.values[0], s.values[s.values.length - 1]];
+          costData.push({
+            type: 'scatter', mode: 'lines', name: `${name} fit`, legendgroup: name, showlegend: false,
+            x: xs, y: xs.map((x) => s.latency_fit.fixed + s.latency_fit.per_unit * x),
+            hoverinfo: 'skip',
+            line: { color: color, width: 1.5, dash: ENDPOINT_DASHES[endpointOrder.indexOf(s.endpoint) % ENDPOINT_DASHES.length] }
+          });
+        }
+      });
+      Plotly.newPlot(el, costData, {
+        paper_bgcolor: 'rgba(0,0,0,0)',
+        plot_bgcolor: 'rgba(0,0,0,0)',
+        font: { color: '#e7f4f2' },
+        xaxis: { title: 'Parameter value', type: 'log', automargin: true },
+        yaxis: { title: 'Mean latency (ms)', automargin: true },
+        margin: { b: 60 },
+        hovermode: 'closest'
+      });
+    });
+
+    registerChart('chart-resource-cpu', (el) => {
+      if (!payload.resources) {
+        return;
+      }
+      const endpointOrder = [...new Set(payload.resources.series.map((s) => s.endpoint))];
+      const resourceData = payload.resources.series.map((s) => ({
+        type: lineTraceType(s.t),
+        mode: 'lines',
+        name: `${s.server === 'xampp' ? 'XAMPP' : s.server === 'nginx_multi' ? 'NGINX' : s.server} ${s.label}`,
+        x: s.t,
+        y: s.cpu_cores,
+        text: s.memory_mb.map((mb, i) => `${mb.toFixed(1)} MB, throttled ${s.throttled_ms[i].toFixed(0)} ms`),
+        hovertemplate: '%{y:.2f} cores<br>%{text}<extra>%{fullData.name}</extra>',
+        line: { color: `rgb(${SERVER_COLORS[s.server] || '180,180,180'})`, width: 2, dash: ENDPOINT_DASHES[endpointOrder.indexOf(s.endpoint) % ENDPOINT_DASHES.length] }
+      }));
+      Plotly.newPlot(el, resourceData, timelineLayout('CPU (cores)', 'linear'));
+    });
+
+    registerChart('chart-server-status', (el) => {
+      if (!payload.server_status) {
+        return;
+      }
+      const endpointOrder = [...new Set(payload.server_status.series.map((s) => s.endpoint))];
+      const statusData = [];
+      payload.server_status.series.forEach((s) => {
+        const rgb = SERVER_COLORS[s.server] || '180,180,180';
+        const name = `${s.server === 'xampp' ? 'XAMPP' : s.server === 'nginx_multi' ? 'NGINX' : s.server} ${s.label}`;
+        const dash = ENDPOINT_DASHES[endpointOrder.indexOf(s.endpoint) % ENDPOINT_DASHES.length];
+        statusData.push({
+          type: lineTraceType(s.t), mode: 'lines', name: `${name} php-fpm active`, legendgroup: name,
+          x: s.t, y: s.fpm_active, connectgaps: false,
+          line: { color: `rgb(${rgb})`, width: 2, dash: dash }
+        });
+        statusData.push({
+          type: lineTraceType(s.t), mode: 'lines', name: `${name} listen queue`, legendgroup: name,
+          x: s.t, y: s.fpm_listen_queue, connectgaps: false, yaxis: 'y2',
+          line: { color: 'rgb(239,83,80)', width: 2, dash: dash }
+        });
+        statusData.push({
+          type: lineTraceType(s.t), mode: 'lines', name: `${name} nginx writing`, legendgroup: name,
+          x: s.t, y: s.nginx_writing, connectgaps: false,
+          line: { color: `rgba(${rgb},0.5)`, width: 1.5, dash: 'dot' }
+        });
+      });
+      const statusLayout = timelineLayout('Processes / connections', 'linear');
+      statusLayout.yaxis2 = { title: 'Listen queue', overlaying: 'y', side: 'right', rangemode: 'tozero' };
+      Plotly.newPlot(el, statusData, statusLayout);
+    });
+
+    registerChart('chart-latency-breakdown', (el) => {
+      if (!payload.latency_breakdown) {
+        return;
+      }
+      const cells = payload.latency_breakdown.cells;
+      const x = cells.map((c) => `${c.label} ${c.server === 'xampp' ? 'XAMPP' : c.server === 'nginx_multi' ? 'NGINX' : c.server}`);
+      const colors = (alpha) => cells.map((c) => `rgba(${SERVER_COLORS[c.server] || '180,180,180'},${alpha})`);
+      const breakdownData = [
+        { type: 'bar', name: 'PHP (elapsed_ms)', x: x, y: cells.map((c) => c.server_ms), marker: { color: colors(1.0) },
+          hovertemplate: '%{y:.3f} ms<extra>PHP</extra>' },
+        { type: 'bar', name: 'Queueing + transport', x: x, y: cells.map((c) => c.overhead_ms), marker: { color: colors(0.4) },
+          hovertemplate: '%{y:.3f} ms<extra>Queueing + transport</extra>' },
+      ];
+      Plotly.newPlot(el, breakdownData, { barmode: 'stack', paper_bgcolor: 'rgba(0,0,0,0)', plot_bgcolor: 'rgba(0,0,0,0)', font: { color: '#e7f4f2' }, xaxis: { tickangle: -45, automargin: true, tickfont: { size: 12 } }, yaxis: { title: 'Mean latency (ms)', tickformat: '.2f' }, margin: { b: 80 } });
+    });
+
+    registerChart('chart-connection-times', (el) => {
+      if (!payload.connection_times || !payload.connection_times.cells.length) {
+        return;
+      }
+      const cells = payload.connection_times.cells;
+      const x = cells.map((c) => `${c.label} ${c.server === 'xampp' ? 'XAMPP' : c.server === 'nginx_multi' ? 'NGINX' : c.server}`);
+      const colors = (alpha) => cells.map((c) => `rgba(${SERVER_COLORS[c.server] || '180,180,180'},${alpha})`);
+      const phaseData = [
+        { type: 'bar', name: 'Connect', x: x, y: cells.map((c) => c.connect_ms), marker: { color: colors(0.3) },
+          hovertemplate: '%{y:.0f} ms<extra>Connect</extra>' },
+        { type: 'bar', name: 'Waiting', x: x, y: cells.map((c) => c.waiting_ms), marker: { color: colors(1.0) },
+          hovertemplate: '%{y:.0f} ms<extra>Waiting</extra>' },
+        { type: 'bar', name: 'Receive', x: x, y: cells.map((c) => c.receive_ms), marker: { color: colors(0.6) },
+          hovertemplate: '%{y:.0f} ms<extra>Receive</extra>' },
+      ];
+      Plotly.newPlot(el, phaseData, { barmode: 'stack', paper_bgcolor: 'rgba(0,0,0,0)', plot_bgcolor: 'rgba(0,0,0,0)', font: { color: '#e7f4f2' }, xaxis: { tickangle: -45, automargin: true, tickfont: { size: 12 } }, yaxis: { title: 'Mean time per request (ms)' }, margin: { b: 80 } });
+    });
+
+    registerChart('chart-percentile-ladder', (el) => {
+      if (!payload.connection_times || !payload.connection_times.ladder.length) {
+        el.style.display = 'none';
+        return;
+      }
+      const endpointOrder = [...new Set(payload.connection_times.ladder.map((s) => s.endpoint))];
+      const ladderData = payload.connection_times.ladder.map((s) => ({
         type: 'scatter',
         mode: 'lines+markers',
-        name: 'NGINX',
-        x: payload.charts.requests_sec.labels,
-        y: payload.charts.requests_sec.nginx_multi,
-        line: { color: '#64b5f6', width: 3 },
-        marker: { size: 8 }
-      }
-    ];
-    Plotly.newPlot('chart-delta', deltaData, {
-      paper_bgcolor: 'rgba(0,0,0,0)',
-      plot_bgcolor: 'rgba(0,0,0,0)',
-      font: { color: '#e7f4f2' },
-      xaxis: { tickangle: -45, automargin: true, tickfont: { size: 12 } },
-      yaxis: { title: 'Requests/sec', tickformat: '.1f', ticksuffix: 'k' },
-      margin: { b: 80 },
-      hovermode: 'x unified'
-    });"""
+        name: `${s.server === 'xampp' ? 'XAMPP' : s.server === 'nginx_multi' ? 'NGINX' : s.server} ${s.label}`,
+        x: s.percentiles.map((p) => `p${p}`),
+        y: s.latency_ms,
+        hovertemplate: '%{x}: %{y} ms<extra>%{fullData.name}</extra>',
+        line: { color: `rgb(${SERVER_COLORS[s.server] || '180,180,180'})`, width: 2, dash: ENDPOINT_DASHES[endpointOrder.indexOf(s.endpoint) % ENDPOINT_DASHES.length] }
+      }));
+      Plotly.newPlot(el, ladderData, {
+        paper_bgcolor: 'rgba(0,0,0,0)',
+        plot_bgcolor: 'rgba(0,0,0,0)',
+        font: { color: '#e7f4f2' },
+        xaxis: { title: 'Percentile', type: 'category', automargin: true },
+        yaxis: { title: 'Latency (ms)', type: 'log', automargin: true },
+        margin: { b: 60 },
+        hovermode: 'closest'
+      });
+    });
+
+    registerChart('chart-goodput', (el) => {
+      if (!payload.error_accounting) {
+        return;
+      }
+      const cells = payload.error_accounting.cells;
+      const x = cells.map((c) => `${c.label} ${c.server === 'xampp' ? 'XAMPP' : c.server === 'nginx_multi' ? 'NGINX' : c.server}`);
+      const colors = (alpha) => cells.map((c) => `rgba(${SERVER_COLORS[c.server] || '180,180,180'},${alpha})`);
+      const goodputData = [
+        { type: 'bar', name: 'Raw req/s', x: x, y: cells.map((c) => c.requests_sec), marker: { color: colors(0.3) },
+          hovertemplate: '%{y:,.2f} req/s<extra>Raw</extra>' },
+        { type: 'bar', name: 'Goodput', x: x, y: cells.map((c) => c.goodput_rps), marker: { color: colors(1.0) },
+          customdata: cells.map((c) => c.error_rate * 100),
+          hovertemplate: '%{y:,.2f} req/s, %{customdata:.2f}% errors<extra>Goodput</extra>' },
+      ];
+      Plotly.newPlot(el, goodputData, { barmode: 'group', paper_bgcolor: 'rgba(0,0,0,0)', plot_bgcolor: 'rgba(0,0,0,0)', font: { color: '#e7f4f2' }, xaxis: { tickangle: -45, automargin: true, tickfont: { size: 12 } }, yaxis: { title: 'Requests/sec' }, margin: { b: 80 } });
+    });
+
+    registerChart('chart-worker-churn', (el) => {
+      if (!payload.worker_distribution) {
+        return;
+      }
+      const endpointOrder = [...new Set(payload.worker_distribution.cells.map((c) => c.endpoint))];
+      const churnData = [];
+      payload.worker_distribution.cells.forEach((c) => {
+        const rgb = SERVER_COLORS[c.server] || '180,180,180';
+        const name = `${c.server === 'xampp' ? 'XAMPP' : c.server === 'nginx_multi' ? 'NGINX' : c.server} ${c.label}`;
+        churnData.push({
+          type: lineTraceType(c.t), mode: 'lines', name: `${name} workers seen`, legendgroup: name,
+          x: c.t, y: c.active_workers,
+          line: { color: `rgb(${rgb})`, width: 2, dash: ENDPOINT_DASHES[endpointOrder.indexOf(c.endpoint) % ENDPOINT_DASHES.length] }
+        });
+        churnData.push({
+          type: 'bar', name: `${name} new workers`, legendgroup: name, x: c.t, y: c.new_per_second,
+          marker: { color: `rgba(${rgb},0.45)` }
+        });
+      });
+      Plotly.newPlot(el, churnData, timelineLayout('Workers', 'linear'));
+    });
+
+    initializeLazyCharts();"""
     
     @staticmethod
     def generate_interaction_code() -> str:
         """Generate theme and language interaction code."""
         return """
     function updateChartsTheme(fontColor) {
-      const chartIds = ['chart-req', 'chart-lat', 'chart-xfer', 'chart-pctl', 'chart-hist', 'chart-delta'];
-      const layoutUpdate = {
-        font: { color: fontColor },
-        xaxis: { tickfont: { color: fontColor }, titlefont: { color: fontColor } },
-        yaxis: { tickfont: { color: fontColor }, titlefont: { color: fontColor } }
-      };
-      chartIds.forEach(id => {
+      chartFontColor = fontColor;
+      const layoutUpdate = chartThemeLayout(fontColor);
+      renderedCharts.forEach(id => {
         const elem = document.getElementById(id);
         if (elem && elem.data && elem.data.length > 0) {
           Plotly.relayout(id, layoutUpdate);
@@ -141,7 +585,7 @@ class JavaScriptGenerator:
 
     function wrapResponsiveTables() {
       document.querySelectorAll('table').forEach((table) => {
-        if (table.closest('td, th')) {
+        if (table.closest('td, th') || table.dataset.virtual === '1') {
           return;
         }
 
@@ -276,6 +720,165 @@ class JavaScriptGenerator:
       });
     }
 
+    // Virtualized raw results: rows live in payload.raw_table columns and only
+    // the visible window (plus overscan) is turned into <tr> elements.
+    const RAW_ROW_HEIGHT = 36;
+    const RAW_OVERSCAN = 10;
+    let rawTable = null;
+    let rawTableLang = 'en';
+
+    function formatRawNumber(value) {
+      return (value === null || value === undefined) ? '' : value.toFixed(2);
+    }
+
+    function rawMetricCell(value) {
+      if (value !== null && value <= 0) {
+        return '<span class="metric-chip metric-warning">0</span>';
+      }
+      return formatRawNumber(value);
+    }
+
+    function rawSpacerRow(height) {
+      return `<tr class="raw-spacer" style="height: ${height}px;"><td colspan="8"></td></tr>`;
+    }
+
+    function renderRawTableWindow() {
+      if (!rawTable) {
+        return;
+      }
+      const { viewport, body, order, cols, servers, endpoints } = rawTable;
+      const total = order.length;
+      const visible = Math.ceil(viewport.clientHeight / RAW_ROW_HEIGHT) + RAW_OVERSCAN * 2;
+      const start = Math.max(0, Math.floor(viewport.scrollTop / RAW_ROW_HEIGHT) - RAW_OVERSCAN);
+      const end = Math.min(total, start + visible);
+      const parts = [];
+      if (start > 0) {
+        parts.push(rawSpacerRow(start * RAW_ROW_HEIGHT));
+      }
+      for (let i = start; i < end; i++) {
+        const r = order[i];
+        parts.push(
+          '<tr><td>' + servers[cols.server[r]] + '</td>' +
+          '<td>' + endpoints[cols.endpoint[r]] + '</td>' +
+          '<td>' + rawMetricCell(cols.requests_sec[r]) + '</td>' +
+          '<td>' + formatRawNumber(cols.latency_ms[r]) + '</td>' +
+          '<td>' + formatRawNumber(cols.latency_p50_ms[r]) + '</td>' +
+          '<td>' + formatRawNumber(cols.latency_p90_ms[r]) + '</td>' +
+          '<td>' + formatRawNumber(cols.latency_p99_ms[r]) + '</td>' +
+          '<td>' + rawMetricCell(cols.transfer_kb_sec[r]) + '</td></tr>'
+        );
+      }
+      if (end < total) {
+        parts.push(rawSpacerRow((total - end) * RAW_ROW_HEIGHT));
+      }
+      body.innerHTML = parts.join('');
+    }
+
+    function updateRawTableCount() {
+      if (!rawTable) {
+        return;
+      }
+      const t = TEXTS[rawTableLang] || {};
+      const shown = rawTable.order.length.toLocaleString();
+      const total = rawTable.cols.server.length.toLocaleString();
+      document.getElementById('raw-table-count').textContent = `${shown} / ${total} ${t.raw_rows_shown || ''}`;
+    }
+
+    function applyRawTableView() {
+      const { cols, filter, sort } = rawTable;
+      const matches = [];
+      for (let r = 0; r < cols.server.length; r++) {
+        if (filter.server >= 0 && cols.server[r] !== filter.server) {
+          continue;
+        }
+        if (filter.endpoint >= 0 && cols.endpoint[r] !== filter.endpoint) {
+          continue;
+        }
+        matches.push(r);
+      }
+      const order = Uint32Array.from(matches);
+      if (sort.key) {
+        const values = cols[sort.key];
+        const labels = sort.key === 'server' ? rawTable.servers : (sort.key === 'endpoint' ? rawTable.endpoints : null);
+        const dir = sort.dir === 'desc' ? -1 : 1;
+        order.sort((a, b) => {
+          const va = labels ? labels[values[a]] : values[a];
+          const vb = labels ? labels[values[b]] : values[b];
+          if (va === vb) {
+            return a - b;
+          }
+          if (va === null) {
+            return 1;
+          }
+          if (vb === null) {
+            return -1;
+          }
+          return (va < vb ? -1 : 1) * dir;
+        });
+      }
+      rawTable.order = order;
+      rawTable.viewport.scrollTop = 0;
+      updateRawTableCount();
+      renderRawTableWindow();
+    }
+
+    function initializeRawTable() {
+      const viewport = document.getElementById('raw-table-viewport');
+      if (!viewport || !payload.raw_table) {
+        return;
+      }
+      rawTable = {
+        viewport,
+        body: document.getElementById('raw-table-body'),
+        servers: payload.raw_table.servers,
+        endpoints: payload.raw_table.endpoints,
+        cols: payload.raw_table.columns,
+        filter: { server: -1, endpoint: -1 },
+        sort: { key: null, dir: 'asc' },
+        order: new Uint32Array(0),
+      };
+
+      let scheduled = false;
+      viewport.addEventListener('scroll', () => {
+        if (scheduled) {
+          return;
+        }
+        scheduled = true;
+        requestAnimationFrame(() => {
+          scheduled = false;
+          renderRawTableWindow();
+        });
+      });
+
+      document.getElementById('raw-filter-server').addEventListener('change', (event) => {
+        rawTable.filter.server = rawTable.servers.indexOf(event.target.value);
+        applyRawTableView();
+      });
+      document.getElementById('raw-filter-endpoint').addEventListener('change', (event) => {
+        rawTable.filter.endpoint = rawTable.endpoints.indexOf(event.target.value);
+        applyRawTableView();
+      });
+
+      const headers = viewport.querySelectorAll('th[data-sort]');
+      headers.forEach((th) => {
+        th.addEventListener('click', () => {
+          const key = th.dataset.sort;
+          const dir = (rawTable.sort.key === key && rawTable.sort.dir === 'asc') ? 'desc' : 'asc';
+          rawTable.sort = { key, dir };
+          headers.forEach((other) => {
+            if (other === th) {
+              other.dataset.sortDir = dir;
+            } else {
+              delete other.dataset.sortDir;
+            }
+          });
+          applyRawTableView();
+        });
+      });
+
+      applyRawTableView();
+    }
+
     function initializeTables() {
       wrapResponsiveTables();
       document.querySelectorAll('table.table-resizable').forEach((table) => {
@@ -322,6 +925,17 @@ class JavaScriptGenerator:
         note.style.display = 'block';
       }
 
+      // Optional datasets: [payload key, note element, text shown when the run lacks it]
+      [
+        ['rate_sweep', 'rate-sweep-note', 'rate_sweep_missing'],
+        ['timeline', 'timeline-rps-note', 'timeline_missing'],
+        ['timeline', 'timeline-lat-note', 'timeline_missing'],
+      ].forEach(([key, noteId, textKey]) => {
+        const optionalNote = document.getElementById(noteId);
+        optionalNote.textContent = payload[key] ? '' : t[textKey];
+        optionalNote.style.display = payload[key] ? 'none' : 'block';
+      });
+
       document.querySelectorAll('.lang-btn').forEach((btn) => {
         btn.classList.toggle('active', btn.dataset.lang === lang);
       });
@@ -343,6 +957,8 @@ class JavaScriptGenerator:
       }
 
       initializeTables();
+      rawTableLang = lang;
+      updateRawTableCount();
     }
 
     function applyReportView(view) {
@@ -366,6 +982,7 @@ class JavaScriptGenerator:
     }
 
     window.addEventListener('load', () => {
+      initializeRawTable();
       const saved = window.localStorage.getItem('report_lang') || 'en';
       applyLang(saved);
       document.querySelectorAll('.lang-btn').forEach((btn) => {
@@ -1,22 +1,23 @@
 """Main report generator - orchestrates all components."""
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
-from typing import List
+from typing import Dict, List, Optional
 import json
 
-from models.benchmark import BenchmarkRow, Insight, Interpretation, ReportPayload
-from loaders.csv_loader import CSVLoader, CSVFinder
-from processors.data_processor import ChartDataProcessor, HistogramDataProcessor, InsightBuilder, InterpretationBuilder, format_endpoint_label
+from models.benchmark import BenchmarkRow, Insight, Interpretation, RenderedReport
+from loaders.csv_loader import BodySampleLoader, CSVLoader, CSVFinder, ConcurrencySweepLoader, KeepAliveLoader, MixedWorkloadLoader, ParamSweepLoader, RateSweepLoader, ResourceLoader, ServerStatusLoader, TimelineLoader
+from processors.data_processor import ChartDataProcessor, HistogramDataProcessor, InsightBuilder, InterpretationBuilder, CapacityProcessor, ConnectionTimesProcessor, ErrorAccountingProcessor, KeepAliveProcessor, LatencyBreakdownProcessor, MixedWorkloadProcessor, ParamSweepProcessor, WorkerDistributionProcessor, RateSweepProcessor, ResourceProcessor, ServerStatusProcessor, format_endpoint_label
 from generators.html_builder import CSSGenerator, HTMLStructureBuilder
 from generators.javascript_generator import JavaScriptGenerator
-from generators.html_sections import EndpointsSection, FormulasSection, ChartsGridSection, BenchmarkReportSection, InterpretationSection, RawResultsSection, ParametersSection, SummarySection, WarningsSection
+from generators.html_sections import CapacitySection, ConnectionTimesSection, CostModelSection, EfficiencySection, EndpointsSection, ErrorAccountingSection, KeepAliveSection, LatencyBreakdownSection, MixedWorkloadSection, SaturationSection, FormulasSection, ChartsGridSection, BenchmarkReportSection, InterpretationSection, RawResultsSection, ParametersSection, SummarySection, WarningsSection, WorkerDistributionSection
 from i18n.texts import get_text
+from utils.stage_profiler import NullProfiler
 
 
 class ReportGenerator:
     """Main orchestrator for report generation."""
     
-    def __init__(self, results_dir: Path, reports_dir: Path):
+    def __init__(self, results_dir: Path, reports_dir: Path, static_assets: Optional[Dict[str, str]] = None, profiler=None):
         self.results_dir = results_dir
         self.reports_dir = reports_dir
         self.reports_dir.mkdir(parents=True, exist_ok=True)
@@ -24,28 +25,91 @@ class ReportGenerator:
         self.csv_loader = CSVLoader()
         self.csv_finder = CSVFinder(results_dir)
         self.chart_processor = ChartDataProcessor()
+        self._static_assets = static_assets
+        self.profiler = profiler or NullProfiler()
     
     def generate(self) -> Path:
         """Generate the complete report."""
         # Find and load CSV
-        csv_path = self.csv_finder.find_latest()
+        with self.profiler.stage("find"):
+            csv_path = self.csv_finder.find_latest()
         if csv_path is None:
             raise FileNotFoundError("No results.csv found under results/")
         
+        report = self.render(csv_path)
+        
+        filename_timestamp = report.generated_at.strftime("%Y-%m-%d_%H-%M-%S")
+        output_path = self.reports_dir / f"report_{filename_timestamp}.html"
+        with self.profiler.stage("write"):
+            with self.profiler.stage("report"):
+                output_path.write_text(report.html, encoding="utf-8")
+
+            latest_path = self.reports_dir / "report.html"
+            with self.profiler.stage("latest"):
+                latest_path.write_text(report.html, encoding="utf-8")
+
+            with self.profiler.stage("sidecar"):
+                from exporters.report_sidecar import ReportSidecarBuilder
+                sidecar_path = ReportSidecarBuilder.write(report, output_path.with_suffix(".json"))
+                (self.reports_dir / "report.json").write_bytes(sidecar_path.read_bytes())
+                (self.reports_dir / "report.bin").write_bytes(sidecar_path.with_suffix(".bin").read_bytes())
+        
+        return output_path
+    
+    def render(self, csv_path: Path) -> RenderedReport:
+        """Render the report for a single results.csv without writing it."""
         # Load and normalize data
-        rows = self.csv_loader.load_and_normalize(csv_path)
+        with self.profiler.stage("load"):
+            raw_rows = self.csv_loader.load_raw(csv_path)
+        with self.profiler.stage("normalize"):
+            rows = self.csv_loader.normalize(raw_rows)
         
         # Load benchmark configuration
-        config = self._load_config(csv_path.parent)
+        with self.profiler.stage("config"):
+            config = self._load_config(csv_path.parent)
         
+        return self.render_rows(rows, config, csv_path)
+    
+    def render_rows(self, rows: List[BenchmarkRow], config: dict, csv_path: Path) -> RenderedReport:
+        """Render a report from rows that were already loaded (e.g. tailed incrementally)."""
         # Process data
-        charts, endpoints = self.chart_processor.process(rows)
-        hist_requests = HistogramDataProcessor.process(rows, "requests_sec")
-        insights = InsightBuilder.build(rows, endpoints)
-        interpretations = {
-            "en": InterpretationBuilder.build(rows, endpoints, "en"),
-            "zh": InterpretationBuilder.build(rows, endpoints, "zh"),
-        }
+        with self.profiler.stage("charts"):
+            charts, endpoints = self.chart_processor.process(rows)
+            hist_requests = HistogramDataProcessor.process(rows, "requests_sec")
+        # Per-run analyses keyed by their payload name; None when the run did not record one
+        analyses: Dict[str, Optional[dict]] = {}
+        with self.profiler.stage("timeline"):
+            analyses["timeline"] = self.chart_processor.process_timelines(TimelineLoader.load(csv_path.parent))
+        with self.profiler.stage("rate_sweep"):
+            analyses["rate_sweep"] = RateSweepProcessor.process(RateSweepLoader.load(csv_path.parent))
+        with self.profiler.stage("concurrency_sweep"):
+            analyses["concurrency_sweep"] = CapacityProcessor.process(ConcurrencySweepLoader.load(csv_path.parent))
+        with self.profiler.stage("mixed_workload"):
+            analyses["mixed_workload"] = MixedWorkloadProcessor.process(MixedWorkloadLoader.load(csv_path.parent), rows)
+        with self.profiler.stage("keepalive"):
+            analyses["keepalive"] = KeepAliveProcessor.process(KeepAliveLoader.load(csv_path.parent))
+        with self.profiler.stage("param_sweep"):
+            analyses["param_sweep"] = ParamSweepProcessor.process(ParamSweepLoader.load(csv_path.parent))
+        with self.profiler.stage("resources"):
+            analyses["resources"] = ResourceProcessor.process(ResourceLoader.load(csv_path.parent), rows)
+        with self.profiler.stage("server_status"):
+            analyses["server_status"] = ServerStatusProcessor.process(ServerStatusLoader.load(csv_path.parent))
+        with self.profiler.stage("body_samples"):
+            body_samples = BodySampleLoader.load(csv_path.parent)
+        with self.profiler.stage("latency_breakdown"):
+            analyses["latency_breakdown"] = LatencyBreakdownProcessor.process(body_samples)
+        with self.profiler.stage("worker_distribution"):
+            analyses["worker_distribution"] = WorkerDistributionProcessor.process(body_samples)
+        with self.profiler.stage("connection_times"):
+            analyses["connection_times"] = ConnectionTimesProcessor.process(rows)
+        with self.profiler.stage("error_accounting"):
+            analyses["error_accounting"] = ErrorAccountingProcessor.process(rows)
+        with self.profiler.stage("insights"):
+            insights = InsightBuilder.build(rows, endpoints)
+        interpretations = {}
+        for lang in ("en", "zh"):
+            with self.profiler.stage(f"interpretations_{lang}"):
+                interpretations[lang] = InterpretationBuilder.build(rows, endpoints, lang)
         
         # Build payload
         utc_plus_8 = timezone(timedelta(hours=8))
@@ -53,7 +117,30 @@ class ReportGenerator:
         generated_at_str = generated_at_local.strftime("%Y-%m-%d %H:%M:%S")
         source_name = f"results/{csv_path.parent.name}/results.csv"
         
-        payload = {
+        with self.profiler.stage("payload"):
+            payload = self._build_payload(rows, endpoints, charts, hist_requests, insights, interpretations, generated_at_str, source_name,
+                                          analyses)
+        
+        # Generate HTML
+        with self.profiler.stage("html"):
+            html_content = self._build_html(payload, rows, insights, config, analyses)
+        
+        return RenderedReport(
+            html=html_content,
+            payload=payload,
+            rows=rows,
+            insights=insights,
+            config=config,
+            generated_at=generated_at_local,
+            csv_path=csv_path,
+        )
+    
+    def _build_payload(self, rows: List[BenchmarkRow], endpoints: List[str], charts: dict, hist_requests: dict,
+                       insights: List[Insight], interpretations: Dict[str, List[Interpretation]],
+                       generated_at_str: str, source_name: str,
+                       analyses: Optional[Dict[str, Optional[dict]]] = None) -> dict:
+        """Assemble the JSON payload embedded in the report; each analysis is a top-level key."""
+        return {
             "meta": {
                 "generated_at": generated_at_str,
                 "source": source_name,
@@ -68,70 +155,134 @@ class ReportGenerator:
             },
             "has_pctl": self._has_percentiles(rows),
             "rows": [self._row_to_dict(r) for r in rows],
+            "raw_table": RawResultsSection.build_payload(rows) if RawResultsSection.is_virtualized(rows) else None,
+            **(analyses or {}),
         }
-        
-        # Generate HTML
-        html_content = self._build_html(payload, rows, insights, config)
-        filename_timestamp = generated_at_local.strftime("%Y-%m-%d_%H-%M-%S")
-        output_path = self.reports_dir / f"report_{filename_timestamp}.html"
-        output_path.write_text(html_content, encoding="utf-8")
-
-        latest_path = self.reports_dir / "report.html"
-        latest_path.write_text(html_content, encoding="utf-8")
-        
-        return output_path
     
-    def _build_html(self, payload: dict, rows: List[BenchmarkRow], insights: List[Insight], config: dict) -> str:
-        """Build complete HTML document."""
+    @property
+    def static_assets(self) -> Dict[str, str]:
+        """Static report fragments, built once and reused across renders."""
+        if self._static_assets is None:
+            self._static_assets = self.build_static_assets()
+        return self._static_assets
+    
+    @staticmethod
+    def build_static_assets() -> Dict[str, str]:
+        """Build every report fragment that does not depend on run data."""
         texts = {
             "en": get_text("en"),
             "zh": get_text("zh"),
         }
-        
         css = CSSGenerator.generate()
-        header = HTMLStructureBuilder.build_header()
-        footer = HTMLStructureBuilder.build_footer()
-        head = HTMLStructureBuilder.build_head(css)
-        payload_and_texts = JavaScriptGenerator.generate_payload_and_texts(payload, texts)
-        chart_code = JavaScriptGenerator.generate_chart_code()
-        interaction_code = JavaScriptGenerator.generate_interaction_code()
+        return {
+            "head": HTMLStructureBuilder.build_head(css),
+            "header": HTMLStructureBuilder.build_header(),
+            "footer": HTMLStructureBuilder.build_footer(),
+            "texts": JavaScriptGenerator.generate_texts(texts),
+            "chart_code": JavaScriptGenerator.generate_chart_code(),
+            "interaction_code": JavaScriptGenerator.generate_interaction_code(),
+            "endpoints": EndpointsSection.build(),
+            "formulas": FormulasSection.build(),
+            "charts_grid": ChartsGridSection.build(),
+            "interpretation": InterpretationSection.build(),
+        }
+    
+    def _build_html(self, payload: dict, rows: List[BenchmarkRow], insights: List[Insight], config: dict,
+                    analyses: Optional[Dict[str, Optional[dict]]] = None) -> str:
+        """Build complete HTML document."""
+        with self.profiler.stage("static_assets"):
+            static = self.static_assets
+        with self.profiler.stage("js_payload"):
+            # Row dicts are kept for the sidecar; the page only reads raw_table
+            embedded = {key: value for key, value in payload.items() if key != "rows"}
+            payload_and_texts = JavaScriptGenerator.generate_payload(embedded) + "\n" + static["texts"]
         
         # Build main content sections
-        main_content = self._build_main_content(rows, insights, config)
+        main_content = self._build_main_content(rows, insights, config, analyses or {})
         
         # Load the main HTML structure template
         html_template = self._get_html_template()
         
         # Insert generated content
-        html = html_template.format(
-            html_head=head,
-            header=header,
-            main_content=main_content,
-            footer=footer,
-            payload_and_texts=payload_and_texts,
-            chart_code=chart_code,
-            interaction_code=interaction_code,
-        )
+        with self.profiler.stage("template"):
+            html = html_template.format(
+                html_head=static["head"],
+                header=static["header"],
+                main_content=main_content,
+                footer=static["footer"],
+                payload_and_texts=payload_and_texts,
+                chart_code=static["chart_code"],
+                interaction_code=static["interaction_code"],
+            )
         
         return html
     
-    def _build_main_content(self, rows: List[BenchmarkRow], insights: List[Insight], config: dict) -> str:
-        """Build all main content sections."""
-        warnings = self._find_zero_metrics(rows)
-        params_html = ParametersSection.build(config)
-        summary_html = SummarySection.build(config)
-        endpoints_html = EndpointsSection.build()
-        raw_results_html = RawResultsSection.build(rows)
-        warnings_html = WarningsSection.build(warnings, config)
-        formulas_html = FormulasSection.build()
-        charts_html = ChartsGridSection.build()
-        benchmark_report_html = BenchmarkReportSection.build([self._insight_to_dict(i) for i in insights])
-        interpretation_html = InterpretationSection.build()
+    def _build_main_content(self, rows: List[BenchmarkRow], insights: List[Insight], config: dict,
+                            analyses: Dict[str, Optional[dict]]) -> str:
+        """Build all main content sections; sections without their analysis render empty."""
+        static = self.static_assets
+        stage = self.profiler.stage
+        with stage("warnings"):
+            warnings = self._find_zero_metrics(rows)
+        with stage("section_parameters"):
+            params_html = ParametersSection.build(config)
+        with stage("section_summary"):
+            summary_html = SummarySection.build(config)
+        with stage("section_capacity"):
+            capacity_html = CapacitySection.build(analyses.get("concurrency_sweep"))
+        with stage("section_error_accounting"):
+            errors_html = ErrorAccountingSection.build(analyses.get("error_accounting"))
+        with stage("section_mixed_workload"):
+            mixed_html = MixedWorkloadSection.build(analyses.get("mixed_workload"))
+        with stage("section_keepalive"):
+            keepalive_html = KeepAliveSection.build(analyses.get("keepalive"))
+        with stage("section_cost_model"):
+            cost_html = CostModelSection.build(analyses.get("param_sweep"))
+        with stage("section_efficiency"):
+            efficiency_html = EfficiencySection.build(analyses.get("resources"))
+        with stage("section_saturation"):
+            saturation_html = SaturationSection.build(analyses.get("server_status"))
+        with stage("section_latency_breakdown"):
+            breakdown_html = LatencyBreakdownSection.build(analyses.get("latency_breakdown"))
+        with stage("section_connection_times"):
+            connection_html = ConnectionTimesSection.build(analyses.get("connection_times"))
+        with stage("section_worker_distribution"):
+            workers_html = WorkerDistributionSection.build(analyses.get("worker_distribution"))
+        endpoints_html = static["endpoints"]
+        with stage("section_raw_results"):
+            raw_results_html = RawResultsSection.build(rows)
+        with stage("section_warnings"):
+            warnings_html = WarningsSection.build(warnings, config)
+        formulas_html = static["formulas"]
+        charts_html = static["charts_grid"]
+        with stage("section_benchmark_report"):
+            benchmark_report_html = BenchmarkReportSection.build([self._insight_to_dict(i) for i in insights])
+        interpretation_html = static["interpretation"]
         
         return f"""{params_html}
 
     {summary_html}
 
+{capacity_html}
+
+{errors_html}
+
+{mixed_html}
+
+{keepalive_html}
+
+{cost_html}
+
+{efficiency_html}
+
+{saturation_html}
+
+{breakdown_html}
+
+{connection_html}
+
+{workers_html}
+
 {endpoints_html}
 
 {raw_results_html}
@@ -191,8 +342,8 @@ class ReportGenerator:
     
     @staticmethod
     def _row_to_dict(row: BenchmarkRow) -> dict:
-        """Convert BenchmarkRow to dictionary."""
-        return {
+        """Convert BenchmarkRow to dictionary; optional column groups appear only when the row recorded them."""
+        data = {
             "timestamp": row.timestamp,
             "server": row.server,
             "endpoint": row.endpoint,
@@ -210,6 +361,19 @@ class ReportGenerator:
             "latency_p99": row.latency_p99,
             "transfer_sec": row.transfer_sec,
         }
+        ladder = (row.latency_p66_ms, row.latency_p80_ms, row.latency_p95_ms, row.latency_p98_ms, row.latency_p100_ms)
+        if ladder != (None, None, None, None, None):
+            data["latency_p66_ms"], data["latency_p80_ms"], data["latency_p95_ms"], \
+                data["latency_p98_ms"], data["latency_p100_ms"] = ladder
+        if row.connection_times:
+            data["connection_times"] = row.connection_times
+        if row.complete_requests is not None:
+            data["complete_requests"] = row.complete_requests
+            data["failed_requests"] = row.failed_requests
+            data["failed_by_class"] = row.failed_by_class
+            data["non_2xx"] = row.non_2xx
+            data["write_errors"] = row.write_errors
+        return data
     
     @staticmethod
     def _has_percentiles(rows: List[BenchmarkRow]) -> bool:
@@ -221,12 +385,14 @@ class ReportGenerator:
 
     @staticmethod
     def _find_zero_metrics(rows: List[BenchmarkRow]) -> List[dict]:
-        """Identify rows where throughput metrics collapsed to zero."""
+        """Identify rows where throughput collapsed to zero or too many requests failed."""
         findings = []
         for row in rows:
             zero_req = row.requests_sec <= 0
             zero_transfer = row.transfer_kb_sec <= 0
-            if not (zero_req or zero_transfer):
+            accounting = ErrorAccountingProcessor.account(row)
+            high_errors = accounting is not None and accounting["error_rate"] >= ErrorAccountingProcessor.WARN_ERROR_RATE
+            if not (zero_req or zero_transfer or high_errors):
                 continue
 
             findings.append({
@@ -237,9 +403,13 @@ class ReportGenerator:
                 "transfer_zero": zero_transfer,
                 "requests_sec": row.requests_sec,
                 "transfer_kb_sec": row.transfer_kb_sec,
+                "errors_high": high_errors,
+                "error_rate": accounting["error_rate"] if accounting else None,
+                "goodput_rps": accounting["goodput_rps"] if accounting else None,
             })
 
         return findings
+    
     @staticmethod
     def _load_config(results_dir: Path) -> dict:
         """Load benchmark configuration from config.json."""
@@ -0,0 +1,107 @@
+"""Watch mode: refresh the report while a benchmark run is still writing results."""
+import os
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from loaders.csv_tailer import CSVTailer
+from models.benchmark import BenchmarkRow
+from generators.report_generator import ReportGenerator
+
+
+class ReportWatcher:
+    """Polls results/ for the active run and re-renders on every new CSV row.
+
+    Polling costs one directory listing and one stat per interval; new rows
+    are tailed from the last byte offset and normalized only once. If the
+    CSV is truncated or replaced, the rows and config.json are loaded again;
+    rows that are partial or malformed are skipped.
+    """
+
+    def __init__(self, results_dir: Path, reports_dir: Path, interval: float = 0.25):
+        self.results_dir = results_dir
+        self.reports_dir = reports_dir
+        self.interval = interval
+        self.generator = ReportGenerator(results_dir, reports_dir)
+        self.tailer: Optional[CSVTailer] = None
+        self.rows: List[BenchmarkRow] = []
+        self.config: dict = {}
+        self.generation = 0
+
+    def find_active_run(self) -> Optional[Path]:
+        """Return results.csv of the newest run directory (run ids sort by time)."""
+        if not self.results_dir.exists():
+            return None
+        run_dirs = sorted(
+            (entry.name for entry in os.scandir(self.results_dir) if entry.is_dir()),
+            reverse=True,
+        )
+        for run_id in run_dirs:
+            csv_path = self.results_dir / run_id / "results.csv"
+            if csv_path.is_file():
+                return csv_path
+        return None
+
+    def poll(self) -> Optional[Path]:
+        """Check once for new rows; return the refreshed report path if any."""
+        csv_path = self.find_active_run()
+        if csv_path is None:
+            return None
+
+        if self.tailer is None or self.tailer.csv_path != csv_path:
+            self.tailer = CSVTailer(csv_path)
+            self._reset(csv_path)
+
+        if not self.tailer.has_new_data():
+            return None
+
+        new_rows = self.tailer.read_new()
+        if self.tailer.generation != self.generation:
+            # Truncated or replaced: everything read so far belongs to the old file
+            self._reset(csv_path)
+        new_rows = self._normalize(new_rows)
+        if not new_rows:
+            return None
+        self.rows.extend(new_rows)
+
+        report = self.generator.render_rows(self.rows, self.config, csv_path)
+        return self._write_atomic(self.reports_dir / "report.html", report.html)
+
+    def _reset(self, csv_path: Path) -> None:
+        self.rows = []
+        self.config = ReportGenerator._load_config(csv_path.parent)
+        self.generation = self.tailer.generation
+
+    def _normalize(self, raw_rows: List[dict]) -> List[BenchmarkRow]:
+        """Normalize tailed rows, dropping any that are partial or malformed."""
+        loader = self.generator.csv_loader
+        try:
+            return loader.normalize(raw_rows)
+        except (KeyError, TypeError, ValueError):
+            pass
+        rows = []
+        for raw in raw_rows:
+            try:
+                rows.extend(loader.normalize([raw]))
+            except (KeyError, TypeError, ValueError):
+                continue
+        return rows
+
+    def watch(self, max_polls: Optional[int] = None) -> None:
+        """Poll until interrupted (or for max_polls iterations)."""
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            output_path = self.poll()
+            if output_path is not None:
+                print(f"[{time.strftime('%H:%M:%S')}] {self.tailer.csv_path.parent.name}: "
+                      f"{len(self.rows)} rows -> {output_path}", flush=True)
+            polls += 1
+            time.sleep(self.interval)
+
+    @staticmethod
+    def _write_atomic(path: Path, content: str) -> Path:
+        """Write via a temp file so readers never see a half-written report."""
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(content, encoding="utf-8")
+        os.replace(tmp_path, path)
+        return path
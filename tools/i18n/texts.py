@@ -23,6 +23,126 @@ TEXTS = {
         "desc_dist": "Shows the spread of throughput across endpoints and systems. The violin width indicates density; compare central tendency between servers.",
         "chart_delta": "Throughput Comparison",
         "desc_delta": "Two system comparison: XAMPP (orange) and NGINX Multi-core (blue). Compare performance across all test endpoints.",
+        "chart_rate_sweep": "Latency vs Offered Load (open loop)",
+        "desc_rate_sweep": "p99 latency (solid) and p50 (dotted) at each fixed arrival rate. Latency counts from the intended send time, so queueing behind a stalled server is included; the knee of each curve is the sustainable load.",
+        "rate_sweep_missing": "No open-loop sweep in this run. Re-run with LOAD_ENGINE=python RATE_SWEEP=\"100 200 400 ...\" to plot latency against offered load.",
+        "chart_timeline_rps": "Throughput over Time (req/s)",
+        "desc_timeline_rps": "Completed requests in each second of every run. Dips and gaps expose stalls, GC pauses, php-fpm respawns and CPU-quota throttling that the run average hides.",
+        "chart_timeline_lat": "p99 Latency over Time (ms)",
+        "desc_timeline_lat": "Per-second p99 latency of every run. Spikes that line up with throughput dips point at the same stall.",
+        "timeline_missing": "No per-second timeline in this run. Both engines record one per cell; re-run the benchmark to get it.",
+        "capacity_title": "Capacity under p99 SLO",
+        "capacity_intro": "Connection counts were stepped geometrically, then bisected around the knee. A level passes while p99 stays within the SLO and throughput has not fallen off; the highest passing throughput is the number to size clusters with.",
+        "capacity_col_endpoint": "Endpoint",
+        "capacity_col_server": "Stack",
+        "capacity_col_result": "Max sustainable throughput",
+        "capacity_col_connections": "At connections",
+        "capacity_col_p99": "p99 at that level",
+        "efficiency_title": "Resource efficiency",
+        "efficiency_intro": "Server CPU and memory sampled during each run (cgroup v2 or /proc). Dividing throughput by what it consumed gives a fair cost comparison between a capped stack and an uncapped one.",
+        "efficiency_col_endpoint": "Endpoint",
+        "efficiency_col_server": "Stack",
+        "efficiency_col_rps": "Requests/sec",
+        "efficiency_col_cores": "Avg CPU (cores)",
+        "efficiency_col_req_per_cpu": "Requests per CPU-second",
+        "efficiency_col_memory": "Peak memory (MB)",
+        "efficiency_col_rps_per_mb": "Req/s per MB",
+        "efficiency_col_throttled": "CPU throttled",
+        "saturation_title": "nginx / php-fpm saturation",
+        "saturation_intro": "nginx stub_status and the php-fpm status page were polled several times a second during each run. When a stack falls behind, these columns say whether php-fpm ran out of children or requests piled up in its listen queue.",
+        "saturation_col_endpoint": "Endpoint",
+        "saturation_col_server": "Stack",
+        "saturation_col_fpm_active": "Peak active / total children",
+        "saturation_col_fpm_idle": "Min idle children",
+        "saturation_col_listen_queue": "Peak listen queue / backlog",
+        "saturation_col_max_children": "max_children reached",
+        "saturation_col_nginx_active": "Peak nginx connections",
+        "saturation_col_diagnosis": "Diagnosis",
+        "breakdown_title": "PHP time vs queueing and transport",
+        "breakdown_intro": "Every endpoint reports its own elapsed_ms (PHP hrtime around the work). For a sample of responses it is set against the latency the client saw; the rest is time spent in accept and listen queues, the web server to PHP hand-off and the network. A stack with a large overhead share loses on the web server, one with a large PHP share loses in PHP itself.",
+        "breakdown_col_endpoint": "Endpoint",
+        "breakdown_col_server": "Stack",
+        "breakdown_col_samples": "Samples",
+        "breakdown_col_latency": "Client latency (ms)",
+        "breakdown_col_php": "PHP elapsed_ms",
+        "breakdown_col_overhead": "Queueing + transport (ms)",
+        "breakdown_col_share": "PHP share",
+        "breakdown_col_overhead_pctl": "Overhead p50 / p99 (ms)",
+        "workers_title": "Load across workers",
+        "workers_intro": "Every endpoint returns the PID of the Apache child or php-fpm worker that served it. Sampled responses are counted per PID: a Gini coefficient near 0 means requests were spread evenly, higher values mean a few workers took most of them. New workers appearing during the run show process recycling or spawning. Sparse sampling undercounts rarely used workers.",
+        "workers_col_endpoint": "Endpoint",
+        "workers_col_server": "Stack",
+        "workers_col_samples": "Samples",
+        "workers_col_workers": "Workers seen",
+        "workers_col_gini": "Gini",
+        "workers_col_busiest": "Busiest worker share",
+        "workers_col_new": "New workers during run",
+        "mixed_title": "Mixed workload",
+        "mixed_intro": "One run per stack drew cpu.php, json.php and io.php requests at the configured weights over the same connections and worker pool. Each endpoint's p99 in the mix is set against its isolated cell: a large ratio means it waited behind the other workloads (head-of-line blocking or worker contention) that isolated cells cannot show.",
+        "mixed_all": "All (mixed)",
+        "mixed_col_endpoint": "Endpoint",
+        "mixed_col_server": "Stack",
+        "mixed_col_share": "Weight / actual share",
+        "mixed_col_rps": "Req/s",
+        "mixed_col_p50": "p50 (ms)",
+        "mixed_col_p99": "p99 in mix (ms)",
+        "mixed_col_isolated_p99": "p99 isolated (ms)",
+        "mixed_col_ratio": "p99 mix / isolated",
+        "mixed_col_failed": "Failed",
+        "cost_title": "Cost model (work-size sweep)",
+        "cost_intro": "Each endpoint was re-run with its work-size parameter (iterations, items, bytes) swept over several values. A straight line latency = fixed + per-unit × value is fitted per stack: the fixed part is the per-request overhead of the stack (connection, FastCGI hand-off, PHP startup), the per-unit part the PHP work itself. Below the crossover value the fixed overhead dominates, so the stack's architecture matters more than the script; above it both stacks converge on the cost of the PHP code.",
+        "cost_col_endpoint": "Endpoint",
+        "cost_col_values": "Values tested",
+        "cost_col_server": "Stack",
+        "cost_col_fixed": "Fixed overhead (ms)",
+        "cost_col_per_unit": "Cost per 1,000 units (ms)",
+        "cost_col_r2": "R²",
+        "cost_col_crossover": "Fixed cost dominates while",
+        "cost_col_capacity": "Capacity ms/request (fixed + per 1,000)",
+        "cost_col_ratio": "NGINX ÷ XAMPP req/s by value",
+        "cost_chart_title": "Mean latency vs work size",
+        "cost_axis_value": "Parameter value",
+        "keepalive_title": "Keep-alive vs connection per request",
+        "keepalive_intro": "Every cell was run twice: once reusing connections (ab -k, HTTP keep-alive) and once opening a new TCP connection for each request. The speedup is keep-alive req/s over per-request req/s. Production traffic behind a load balancer reuses connections, so a large speedup means the per-request numbers overstate the handshake cost; a speedup below 1 means idle kept-alive connections are holding workers the stack needs.",
+        "keepalive_overall": "Geometric mean speedup:",
+        "keepalive_col_endpoint": "Endpoint",
+        "keepalive_col_server": "Stack",
+        "keepalive_col_close_rps": "Req/s (new connection)",
+        "keepalive_col_keepalive_rps": "Req/s (keep-alive)",
+        "keepalive_col_speedup": "Keep-alive speedup",
+        "keepalive_col_close_latency": "Mean (ms), new connection",
+        "keepalive_col_keepalive_latency": "Mean (ms), keep-alive",
+        "keepalive_col_close_p99": "p99 (ms), new connection",
+        "keepalive_col_keepalive_p99": "p99 (ms), keep-alive",
+        "summary_keepalive": "Connections",
+        "summary_keepalive_on": "Keep-alive",
+        "summary_keepalive_off": "New per request",
+        "conn_title": "Connection times (ab)",
+        "conn_intro": "ab times every request in phases: Connect until the TCP connection is accepted, Waiting from the request being sent to the first response byte, and Receive (Processing minus Waiting) for the rest of the response. A long Connect means requests sat in the listen/accept queue before the server took them; a long Waiting is the web server and PHP working. Means in ms, with median and max in brackets; the ladder below is ab's full percentile table.",
+        "conn_col_endpoint": "Endpoint",
+        "conn_col_server": "Stack",
+        "conn_col_connect": "Connect (median / max)",
+        "conn_col_connect_sd": "Connect ± sd",
+        "conn_col_waiting": "Waiting (median)",
+        "conn_col_receive": "Receive",
+        "conn_col_total": "Total (median)",
+        "conn_col_dominant": "Largest phase",
+        "conn_phase_connect": "Connect (accept queue)",
+        "conn_phase_waiting": "Waiting (server + PHP)",
+        "conn_phase_receive": "Receive (transfer)",
+        "errors_title": "Errors and goodput",
+        "errors_intro": "Raw requests/sec counts every completed request, including error responses. Under overload one stack can answer fast 502s while the other queues requests, so raw throughput favours the one that is failing. Goodput counts only requests that got a usable response: non-2xx responses, write errors and ab's Connect / Receive / Exceptions failures are errors. ab's Length failures are listed but not counted, because ab flags any body whose size differs from the first response, which PHP output does without failing. Error rates of 1% or more are flagged; - means the python engine does not split its failures.",
+        "errors_col_endpoint": "Endpoint",
+        "errors_col_server": "Stack",
+        "errors_col_raw": "Raw req/s",
+        "errors_col_goodput": "Goodput req/s",
+        "errors_col_rate": "Error rate",
+        "errors_col_non_2xx": "Non-2xx",
+        "errors_col_connect": "Connect",
+        "errors_col_receive": "Receive",
+        "errors_col_exceptions": "Exceptions",
+        "errors_col_write": "Write errors",
+        "errors_col_length": "Length (not counted)",
         "insights_title": "Insights",
         "benchmark_report_title": "Benchmark Report",
         "benchmark_report_intro": "Decision-oriented summary for Laravel deployment selection between XAMPP and NGINX.",
@@ -71,6 +191,9 @@ TEXTS = {
         "th_p90": "P90",
         "th_p99": "P99",
         "th_transfer": "Transfer/sec",
+        "raw_filter_all_servers": "All servers",
+        "raw_filter_all_endpoints": "All endpoints",
+        "raw_rows_shown": "rows",
         "th_winner_throughput": "Throughput Winner",
         "th_winner_throughput_improved": "Better Throughput",
         "th_delta": "Delta (%)",
@@ -198,7 +321,7 @@ TEXTS = {
         "summary_endpoints": "Test Endpoints",
         "summary_test_time": "Test Timestamp",
         "warnings_title": "Instability Alerts (Zero Throughput)",
-        "warnings_intro": "Some endpoints returned zero throughput under load; treat this as a sign of hitting the server's capacity ceiling.",
+        "warnings_intro": "Some endpoints returned zero throughput or failed too many requests under load; treat this as a sign of hitting the server's capacity ceiling.",
         "warnings_col_endpoint": "Endpoint",
         "warnings_col_server": "Server",
         "warnings_col_issue": "Impact & Next Action",
@@ -225,6 +348,126 @@ TEXTS = {
         "desc_dist": "比較受壓測系統的吞吐量分佈，寬度代表密度",
         "chart_delta": "吞吐量對比",
         "desc_delta": "比較受壓測系統的各端點效能差異",
+        "chart_rate_sweep": "延遲 vs 施加負載（開迴路）",
+        "desc_rate_sweep": "固定到達率下的 p99（實線）與 p50（虛線）延遲；延遲自預定送出時間起算，含伺服器停頓造成的排隊，曲線轉折處即可承受的負載",
+        "rate_sweep_missing": "本次執行沒有開迴路掃描。請以 LOAD_ENGINE=python RATE_SWEEP=\"100 200 400 ...\" 重新執行以繪製延遲對負載曲線。",
+        "chart_timeline_rps": "每秒吞吐量 (req/s)",
+        "desc_timeline_rps": "每次執行逐秒完成的請求數；下陷或斷層代表停頓、GC、php-fpm 重生或 CPU 配額節流，平均值看不出來",
+        "chart_timeline_lat": "每秒 p99 延遲 (ms)",
+        "desc_timeline_lat": "每次執行逐秒的 p99 延遲；與吞吐下陷同時出現的尖峰通常是同一次停頓",
+        "timeline_missing": "本次執行沒有逐秒時間序列；兩種壓測引擎都會逐格記錄，請重新執行基準測試。",
+        "capacity_title": "p99 SLO 下的容量",
+        "capacity_intro": "連線數先以等比級數遞增，再於轉折處二分搜尋；p99 在 SLO 內且吞吐未下滑即為通過，通過中的最高吞吐即叢集容量規劃的依據",
+        "capacity_col_endpoint": "端點",
+        "capacity_col_server": "架構",
+        "capacity_col_result": "最高可持續吞吐",
+        "capacity_col_connections": "連線數",
+        "capacity_col_p99": "該層 p99",
+        "efficiency_title": "資源效率",
+        "efficiency_intro": "測試期間取樣伺服器的 CPU 與記憶體（cgroup v2 或 /proc）；以吞吐除以實際耗用，才能公平比較有 CPU 上限與無上限的架構",
+        "efficiency_col_endpoint": "端點",
+        "efficiency_col_server": "架構",
+        "efficiency_col_rps": "每秒請求數",
+        "efficiency_col_cores": "平均 CPU（核心）",
+        "efficiency_col_req_per_cpu": "每 CPU 秒請求數",
+        "efficiency_col_memory": "記憶體峰值（MB）",
+        "efficiency_col_rps_per_mb": "每 MB 的 req/s",
+        "efficiency_col_throttled": "CPU 節流時間",
+        "saturation_title": "nginx / php-fpm 飽和度",
+        "saturation_intro": "每次測試期間以次秒間隔輪詢 nginx stub_status 與 php-fpm 狀態頁；架構落後時，可由此判斷是 php-fpm 子進程用盡，還是請求堆積在 listen queue",
+        "saturation_col_endpoint": "端點",
+        "saturation_col_server": "架構",
+        "saturation_col_fpm_active": "忙碌子進程峰值 / 總數",
+        "saturation_col_fpm_idle": "最少閒置子進程",
+        "saturation_col_listen_queue": "listen queue 峰值 / 上限",
+        "saturation_col_max_children": "達到 max_children 次數",
+        "saturation_col_nginx_active": "nginx 連線峰值",
+        "saturation_col_diagnosis": "判讀",
+        "breakdown_title": "PHP 執行時間 vs 排隊與傳輸",
+        "breakdown_intro": "各端點回應中的 elapsed_ms 是 PHP 以 hrtime 量得的執行時間；抽樣回應並與用戶端延遲對照，其餘即為 accept/listen queue 排隊、Web 伺服器轉交 PHP 與網路傳輸的時間。額外開銷占比高代表輸在 Web 伺服器，PHP 占比高則代表輸在 PHP 本身",
+        "breakdown_col_endpoint": "端點",
+        "breakdown_col_server": "架構",
+        "breakdown_col_samples": "樣本數",
+        "breakdown_col_latency": "用戶端延遲 (ms)",
+        "breakdown_col_php": "PHP elapsed_ms",
+        "breakdown_col_overhead": "排隊 + 傳輸 (ms)",
+        "breakdown_col_share": "PHP 占比",
+        "breakdown_col_overhead_pctl": "額外開銷 p50 / p99 (ms)",
+        "workers_title": "各工作進程負載分布",
+        "workers_intro": "各端點會回傳處理該請求的 Apache 子進程或 php-fpm worker 的 PID。依 PID 統計抽樣回應：Gini 係數接近 0 代表請求平均分配，越高代表少數進程承擔大部分請求；測試期間新出現的 worker 代表進程回收或擴充。抽樣過稀時，較少被使用的 worker 會被低估",
+        "workers_col_endpoint": "端點",
+        "workers_col_server": "架構",
+        "workers_col_samples": "樣本數",
+        "workers_col_workers": "觀察到的 worker 數",
+        "workers_col_gini": "Gini 係數",
+        "workers_col_busiest": "最忙 worker 占比",
+        "workers_col_new": "測試期間新增 worker",
+        "mixed_title": "混合負載",
+        "mixed_intro": "每個架構各跑一次混合負載：依設定權重在同一批連線與 worker 上交錯送出 cpu.php、json.php、io.php 請求。各端點在混合負載下的 p99 與其單獨測試結果對照，比值越大代表它被其他工作負載拖慢（隊頭阻塞或 worker 爭用），這是單獨測試看不到的",
+        "mixed_all": "全部（混合）",
+        "mixed_col_endpoint": "端點",
+        "mixed_col_server": "架構",
+        "mixed_col_share": "權重 / 實際占比",
+        "mixed_col_rps": "每秒請求數",
+        "mixed_col_p50": "p50 (ms)",
+        "mixed_col_p99": "混合 p99 (ms)",
+        "mixed_col_isolated_p99": "單獨 p99 (ms)",
+        "mixed_col_ratio": "p99 混合 / 單獨",
+        "mixed_col_failed": "失敗數",
+        "cost_title": "成本模型（工作量掃描）",
+        "cost_intro": "各端點以不同的工作量參數（迭代次數、項目數、位元組數）重跑數次，再依架構擬合直線：延遲 = 固定成本 + 單位成本 × 參數值。固定成本是架構處理每個請求的額外開銷（連線、FastCGI 轉交、PHP 啟動），單位成本則是 PHP 本身的運算。參數低於交叉點時固定開銷佔主導，架構差異比腳本本身更重要；高於交叉點後兩種架構都趨近 PHP 程式碼本身的成本",
+        "cost_col_endpoint": "端點",
+        "cost_col_values": "測試參數值",
+        "cost_col_server": "架構",
+        "cost_col_fixed": "固定成本 (ms)",
+        "cost_col_per_unit": "每 1,000 單位成本 (ms)",
+        "cost_col_r2": "R²",
+        "cost_col_crossover": "固定成本佔主導的範圍",
+        "cost_col_capacity": "每請求容量成本 ms（固定 + 每 1,000）",
+        "cost_col_ratio": "各參數值 NGINX ÷ XAMPP 每秒請求數",
+        "cost_chart_title": "平均延遲與工作量",
+        "cost_axis_value": "參數值",
+        "keepalive_title": "Keep-alive 與每請求新連線",
+        "keepalive_intro": "每個測試組合各跑兩次：一次重用連線（ab -k，HTTP keep-alive），一次每個請求都建立新的 TCP 連線。加速比為 keep-alive 每秒請求數除以每請求新連線的每秒請求數。正式環境經負載平衡器的流量會重用連線，加速比越大代表每請求新連線的數字高估了握手成本；加速比低於 1 代表閒置的 keep-alive 連線佔住了架構需要的 worker",
+        "keepalive_overall": "加速比幾何平均：",
+        "keepalive_col_endpoint": "端點",
+        "keepalive_col_server": "架構",
+        "keepalive_col_close_rps": "每秒請求數（新連線）",
+        "keepalive_col_keepalive_rps": "每秒請求數（keep-alive）",
+        "keepalive_col_speedup": "Keep-alive 加速比",
+        "keepalive_col_close_latency": "平均延遲 (ms)，新連線",
+        "keepalive_col_keepalive_latency": "平均延遲 (ms)，keep-alive",
+        "keepalive_col_close_p99": "p99 (ms)，新連線",
+        "keepalive_col_keepalive_p99": "p99 (ms)，keep-alive",
+        "summary_keepalive": "連線模式",
+        "summary_keepalive_on": "Keep-alive",
+        "summary_keepalive_off": "每請求新連線",
+        "conn_title": "連線時間分段（ab）",
+        "conn_intro": "ab 將每個請求分段計時：Connect 為 TCP 連線被接受前的時間，Waiting 為送出請求到收到第一個回應位元組，Receive（Processing 減 Waiting）為接收其餘回應。Connect 長代表請求卡在 listen/accept 佇列等待伺服器接手；Waiting 長則是 Web 伺服器與 PHP 在處理。數值為平均 ms，括號內為中位數與最大值；下方階梯圖為 ab 完整的百分位表",
+        "conn_col_endpoint": "端點",
+        "conn_col_server": "架構",
+        "conn_col_connect": "Connect（中位數 / 最大）",
+        "conn_col_connect_sd": "Connect 標準差",
+        "conn_col_waiting": "Waiting（中位數）",
+        "conn_col_receive": "Receive",
+        "conn_col_total": "總計（中位數）",
+        "conn_col_dominant": "最大分段",
+        "conn_phase_connect": "Connect（accept 佇列）",
+        "conn_phase_waiting": "Waiting（伺服器 + PHP）",
+        "conn_phase_receive": "Receive（傳輸）",
+        "errors_title": "錯誤與有效吞吐",
+        "errors_intro": "原始 req/s 計入所有完成的請求，包括錯誤回應。過載時某一架構可能快速回傳 502，另一架構則讓請求排隊，原始吞吐因此偏向正在失敗的一方。有效吞吐（goodput）只計入取得可用回應的請求：非 2xx 回應、寫入錯誤，以及 ab 的 Connect / Receive / Exceptions 失敗皆視為錯誤。ab 的 Length 失敗僅列出不計入，因為 ab 會將長度與第一個回應不同的內容都標為失敗，而 PHP 輸出長度本就會變動。錯誤率達 1% 以上會標示；- 表示 python 引擎未細分失敗類別",
+        "errors_col_endpoint": "端點",
+        "errors_col_server": "架構",
+        "errors_col_raw": "原始 req/s",
+        "errors_col_goodput": "有效 req/s",
+        "errors_col_rate": "錯誤率",
+        "errors_col_non_2xx": "非 2xx",
+        "errors_col_connect": "Connect",
+        "errors_col_receive": "Receive",
+        "errors_col_exceptions": "Exceptions",
+        "errors_col_write": "寫入錯誤",
+        "errors_col_length": "Length（不計入）",
         "insights_title": "重點整理",
         "benchmark_report_title": "壓測報告",
         "benchmark_report_intro": "以 Laravel 佈署決策為目標，整合 XAMPP 與 NGINX 的關鍵差異與落地建議。",
@@ -273,6 +516,9 @@ TEXTS = {
         "th_p90": "P90",
         "th_p99": "P99",
         "th_transfer": "傳輸量/sec",
+        "raw_filter_all_servers": "所有服務",
+        "raw_filter_all_endpoints": "所有端點",
+        "raw_rows_shown": "列",
         "th_winner_throughput": "吞吐勝出",
         "th_winner_throughput_improved": "吞吐量較優",
         "th_delta": "差異 (%)",
@@ -400,7 +646,7 @@ TEXTS = {
         "summary_endpoints": "測試端點",
         "summary_test_time": "測試時間戳",
         "warnings_title": "零吞吐與不穩定告警",
-        "warnings_intro": "部分端點在高併發時吞吐降為 0，代表伺服器已觸及軟體極限，需視為容量警訊。",
+        "warnings_intro": "部分端點在高併發時吞吐降為 0 或請求失敗過多，代表伺服器已觸及軟體極限，需視為容量警訊。",
         "warnings_col_endpoint": "端點",
         "warnings_col_server": "伺服器",
         "warnings_col_issue": "異常與處置",
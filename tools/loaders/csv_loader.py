@@ -1,13 +1,38 @@
 """CSV loading and file discovery utilities."""
 import csv
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime, timezone, timedelta
 
-from models.benchmark import BenchmarkRow
+from models.benchmark import BenchmarkRow, BodySampleSeries, CapacityStep, KeepAliveRow, MixedWorkloadRow, ParamSweepPoint, RateSweepPoint, ResourceSeries, ServerStatusSeries, TimelineSeries
 from parsers.data_parsers import LatencyParser, TransferParser
 
 
+# Rows and columns of ab's "Connection Times (ms)" table, as results.csv column prefixes/suffixes
+CONNECTION_PHASES = ("connect", "processing", "waiting", "total")
+CONNECTION_STATS = ("min", "mean", "sd", "median", "max")
+# ab's "Failed requests" classes, as the failed_* columns of results.csv
+FAILURE_CLASSES = ("connect", "receive", "length", "exceptions")
+
+# Optional results.csv column groups; older runs and the python engine lack some of them
+LADDER_COLUMNS = ("latency_p66", "latency_p80", "latency_p95", "latency_p98", "latency_p100")
+CONNECTION_COLUMNS = tuple(
+    (phase, tuple((stat, f"{phase}_{stat}") for stat in CONNECTION_STATS)) for phase in CONNECTION_PHASES
+)
+FAILURE_COLUMNS = tuple((name, f"failed_{name}") for name in FAILURE_CLASSES)
+ACCOUNTING_COLUMNS = ("complete_requests", "failed_requests", "non_2xx", "write_errors")
+
+
+def _optional_ms(value: Optional[str]) -> Optional[float]:
+    """Millisecond column that is blank when nothing completed."""
+    return float(value) if value else None
+
+
+def _optional_int(value: Optional[str]) -> Optional[int]:
+    """Counter column that is blank when its status page could not be read."""
+    return int(value) if value not in (None, "") else None
+
+
 class CSVLoader:
     """Loads and parses CSV files."""
     
@@ -38,10 +63,22 @@ class CSVLoader:
     def load_and_normalize(self, csv_path: Path) -> List[BenchmarkRow]:
         """Load CSV and normalize data."""
         raw_rows = self.load_raw(csv_path)
-        return [self._normalize_row(row) for row in raw_rows]
+        return self.normalize(raw_rows)
+    
+    def normalize(self, raw_rows: List[dict]) -> List[BenchmarkRow]:
+        """Normalize already-parsed CSV rows."""
+        if not raw_rows:
+            return []
+        # Rows of one file share its header, so the optional groups are looked up once
+        columns = raw_rows[0].keys()
+        ladder = any(name in columns for name in LADDER_COLUMNS)
+        connection_times = any(column in columns for _, stats in CONNECTION_COLUMNS for _, column in stats)
+        accounting = any(name in columns for name in ACCOUNTING_COLUMNS)
+        return [self._normalize_row(row, ladder, connection_times, accounting) for row in raw_rows]
     
-    def _normalize_row(self, row: dict) -> BenchmarkRow:
-        """Normalize a single row from CSV."""
+    def _normalize_row(self, row: dict, ladder: bool = True, connection_times: bool = True,
+                       accounting: bool = True) -> BenchmarkRow:
+        """Normalize a single row from CSV; the flags skip optional column groups the file does not have."""
         p50 = row.get("latency_p50", "")
         p75 = row.get("latency_p75", "")
         p90 = row.get("latency_p90", "")
@@ -60,7 +97,7 @@ class CSVLoader:
         except:
             timestamp_display = timestamp_str
         
-        return BenchmarkRow(
+        result = BenchmarkRow(
             timestamp=timestamp_display,
             server=row["server"],
             endpoint=row["endpoint"],
@@ -78,6 +115,286 @@ class CSVLoader:
             latency_p99=p99,
             transfer_sec=row.get("transfer_sec", "0"),
         )
+        
+        if ladder:
+            result.latency_p66_ms = _optional_ms(row.get("latency_p66"))
+            result.latency_p80_ms = _optional_ms(row.get("latency_p80"))
+            result.latency_p95_ms = _optional_ms(row.get("latency_p95"))
+            result.latency_p98_ms = _optional_ms(row.get("latency_p98"))
+            result.latency_p100_ms = _optional_ms(row.get("latency_p100"))
+        
+        if connection_times:
+            for phase, stats in CONNECTION_COLUMNS:
+                values = {stat: row.get(column) for stat, column in stats}
+                if all(values.values()):
+                    result.connection_times[phase] = {stat: float(value) for stat, value in values.items()}
+        
+        if accounting:
+            result.complete_requests = _optional_int(row.get("complete_requests"))
+            result.failed_requests = _optional_int(row.get("failed_requests"))
+            result.non_2xx = _optional_int(row.get("non_2xx"))
+            result.write_errors = _optional_int(row.get("write_errors"))
+            failed_by_class = {name: _optional_int(row.get(column)) for name, column in FAILURE_COLUMNS}
+            if None not in failed_by_class.values():
+                result.failed_by_class = failed_by_class
+        
+        return result
+
+
+class RateSweepLoader:
+    """Loads the open-loop rate_sweep.csv that run_ab.sh writes when RATE_SWEEP is set."""
+    
+    FILENAME = "rate_sweep.csv"
+    
+    @staticmethod
+    def load(run_dir: Path) -> List[RateSweepPoint]:
+        """Sweep points of a run, or an empty list when the run has no sweep."""
+        sweep_path = run_dir / RateSweepLoader.FILENAME
+        if not sweep_path.is_file():
+            return []
+        
+        points = []
+        for row in CSVLoader.load_raw(sweep_path):
+            try:
+                points.append(RateSweepPoint(
+                    timestamp=row["timestamp"],
+                    server=row["server"],
+                    endpoint=row["endpoint"],
+                    offered_rps=float(row["offered_rps"]),
+                    requests_sec=float(row["requests_sec"]),
+                    latency_avg_ms=_optional_ms(row.get("latency_avg")),
+                    latency_p50_ms=_optional_ms(row.get("latency_p50")),
+                    latency_p90_ms=_optional_ms(row.get("latency_p90")),
+                    latency_p99_ms=_optional_ms(row.get("latency_p99")),
+                    latency_p999_ms=_optional_ms(row.get("latency_p999")),
+                    latency_max_ms=_optional_ms(row.get("latency_max")),
+                    failed=int(row.get("failed") or 0),
+                ))
+            except (KeyError, TypeError, ValueError):
+                # A step cut short (e.g. Ctrl-C mid-write) leaves a partial row
+                continue
+        return points
+
+
+class MixedWorkloadLoader:
+    """Loads mixed_workload.csv, written when run_ab.sh runs with MIX_WEIGHTS."""
+    
+    FILENAME = "mixed_workload.csv"
+    
+    @staticmethod
+    def load(run_dir: Path) -> List[MixedWorkloadRow]:
+        """Per-endpoint and aggregate rows of the mixed runs, or an empty list without one."""
+        mix_path = run_dir / MixedWorkloadLoader.FILENAME
+        if not mix_path.is_file():
+            return []
+        
+        rows = []
+        for row in CSVLoader.load_raw(mix_path):
+            try:
+                rows.append(MixedWorkloadRow(
+                    timestamp=row["timestamp"],
+                    server=row["server"],
+                    endpoint=row["endpoint"],
+                    weight=float(row["weight"]),
+                    share=float(row["share"]),
+                    requests_sec=float(row["requests_sec"]),
+                    latency_avg_ms=_optional_ms(row.get("latency_avg")),
+                    latency_p50_ms=_optional_ms(row.get("latency_p50")),
+                    latency_p90_ms=_optional_ms(row.get("latency_p90")),
+                    latency_p99_ms=_optional_ms(row.get("latency_p99")),
+                    latency_max_ms=_optional_ms(row.get("latency_max")),
+                    failed=int(row.get("failed") or 0),
+                ))
+            except (KeyError, TypeError, ValueError):
+                continue
+        return rows
+
+
+class ParamSweepLoader:
+    """Loads param_sweep.csv: results.csv rows prefixed with the swept parameter and its value."""
+    
+    FILENAME = "param_sweep.csv"
+    
+    @staticmethod
+    def load(run_dir: Path) -> List[ParamSweepPoint]:
+        """Sweep points of a run, or an empty list when the run has no parameter sweep."""
+        sweep_path = run_dir / ParamSweepLoader.FILENAME
+        if not sweep_path.is_file():
+            return []
+        
+        loader = CSVLoader()
+        points = []
+        for row in CSVLoader.load_raw(sweep_path):
+            try:
+                points.append(ParamSweepPoint(param=row["param"], value=float(row["value"]),
+                                              row=loader.normalize([row])[0]))
+            except (KeyError, TypeError, ValueError):
+                continue
+        return points
+
+
+class KeepAliveLoader:
+    """Loads keepalive.csv, written when run_ab.sh runs with KEEPALIVE_COMPARE=1."""
+    
+    FILENAME = "keepalive.csv"
+    
+    @staticmethod
+    def load(run_dir: Path) -> List[KeepAliveRow]:
+        """Rows of both connection modes, or an empty list without a comparison."""
+        keepalive_path = run_dir / KeepAliveLoader.FILENAME
+        if not keepalive_path.is_file():
+            return []
+        
+        loader = CSVLoader()
+        rows = []
+        for row in CSVLoader.load_raw(keepalive_path):
+            try:
+                rows.append(KeepAliveRow(keepalive=row["keepalive"].strip() == "1", row=loader.normalize([row])[0]))
+            except (AttributeError, KeyError, TypeError, ValueError):
+                continue
+        return rows
+
+
+class ConcurrencySweepLoader:
+    """Loads concurrency_sweep.csv, written when run_ab.sh runs with CONCURRENCY_SWEEP."""
+    
+    FILENAME = "concurrency_sweep.csv"
+    
+    @staticmethod
+    def load(run_dir: Path) -> List[CapacityStep]:
+        """Measured levels of a run, or an empty list when the run has no concurrency sweep."""
+        sweep_path = run_dir / ConcurrencySweepLoader.FILENAME
+        if not sweep_path.is_file():
+            return []
+        
+        steps = []
+        for row in CSVLoader.load_raw(sweep_path):
+            try:
+                steps.append(CapacityStep(
+                    timestamp=row["timestamp"],
+                    server=row["server"],
+                    endpoint=row["endpoint"],
+                    connections=int(row["connections"]),
+                    requests_sec=float(row["requests_sec"]),
+                    slo_p99_ms=float(row["slo_p99_ms"]),
+                    within_slo=row["within_slo"] == "1",
+                    latency_avg_ms=_optional_ms(row.get("latency_avg")),
+                    latency_p50_ms=_optional_ms(row.get("latency_p50")),
+                    latency_p90_ms=_optional_ms(row.get("latency_p90")),
+                    latency_p99_ms=_optional_ms(row.get("latency_p99")),
+                    latency_max_ms=_optional_ms(row.get("latency_max")),
+                    failed=int(row.get("failed") or 0),
+                ))
+            except (KeyError, TypeError, ValueError):
+                continue
+        return steps
+
+
+class CellSeriesLoader:
+    """Loads per-cell CSVs written under <run>/<DIRNAME>/<server>/<endpoint>.csv.
+
+    Subclasses name the directory, the series type and a row parser that
+    returns {series field: value}; rows it cannot parse are skipped, and
+    cells without a single parsed row are left out.
+    """
+    
+    DIRNAME = ""
+    SERIES = None
+    
+    @staticmethod
+    def parse_row(row: dict) -> Dict[str, Any]:
+        raise NotImplementedError
+    
+    @classmethod
+    def load(cls, run_dir: Path) -> list:
+        """One series per <DIRNAME>/<server>/<endpoint>.csv, sorted by endpoint then server."""
+        cells_dir = run_dir / cls.DIRNAME
+        if not cells_dir.is_dir():
+            return []
+        
+        series = []
+        for path in sorted(cells_dir.glob("*/*.csv"), key=lambda p: (p.stem, p.parent.name)):
+            cell = cls.SERIES(server=path.parent.name, endpoint=path.stem)
+            parsed = 0
+            for row in CSVLoader.load_raw(path):
+                try:
+                    values = cls.parse_row(row)
+                except (KeyError, TypeError, ValueError):
+                    continue
+                for name, value in values.items():
+                    getattr(cell, name).append(value)
+                parsed += 1
+            if parsed:
+                series.append(cell)
+        return series
+
+
+class TimelineLoader(CellSeriesLoader):
+    """Loads the per-second series each benchmark cell writes under timeline/."""
+    
+    DIRNAME = "timeline"
+    SERIES = TimelineSeries
+    
+    @staticmethod
+    def parse_row(row: dict) -> Dict[str, Any]:
+        return {
+            "seconds": int(row["second"]),
+            "completed": int(row["completed"]),
+            "failed": int(row["failed"]),
+            "latency_p50_ms": _optional_ms(row.get("latency_p50")),
+            "latency_p90_ms": _optional_ms(row.get("latency_p90")),
+            "latency_p99_ms": _optional_ms(row.get("latency_p99")),
+            "latency_max_ms": _optional_ms(row.get("latency_max")),
+        }
+
+
+class ResourceLoader(CellSeriesLoader):
+    """Loads the server resource samples sample_server.py --resource-out writes under resources/."""
+    
+    DIRNAME = "resources"
+    SERIES = ResourceSeries
+    
+    @staticmethod
+    def parse_row(row: dict) -> Dict[str, Any]:
+        return {
+            "elapsed_s": float(row["elapsed_s"]),
+            "cpu_s": float(row["cpu_s"]),
+            "cpu_cores": float(row["cpu_cores"]),
+            "throttled_ms": float(row["throttled_ms"]),
+            "memory_mb": float(row["memory_mb"]),
+        }
+
+
+class ServerStatusLoader(CellSeriesLoader):
+    """Loads the nginx/php-fpm status polls sample_server.py --status-out writes under server_status/."""
+    
+    DIRNAME = "server_status"
+    SERIES = ServerStatusSeries
+    COLUMNS = ("nginx_active", "nginx_reading", "nginx_writing", "nginx_waiting", "fpm_active", "fpm_idle",
+               "fpm_total", "fpm_listen_queue", "fpm_listen_queue_len", "fpm_max_children_reached")
+    
+    @staticmethod
+    def parse_row(row: dict) -> Dict[str, Any]:
+        values = {"elapsed_s": float(row["elapsed_s"])}
+        for column in ServerStatusLoader.COLUMNS:
+            values[column] = _optional_int(row.get(column))
+        return values
+
+
+class BodySampleLoader(CellSeriesLoader):
+    """Loads the response-body samples run_loadgen.py --samples-out writes under body_samples/."""
+    
+    DIRNAME = "body_samples"
+    SERIES = BodySampleSeries
+    
+    @staticmethod
+    def parse_row(row: dict) -> Dict[str, Any]:
+        return {
+            "elapsed_s": float(row["elapsed_s"]),
+            "latency_ms": float(row["latency_ms"]),
+            "server_ms": _optional_ms(row.get("server_ms")),
+            "pid": _optional_int(row.get("pid")),
+        }
 
 
 class CSVFinder:
@@ -101,6 +418,16 @@ class CSVFinder:
         with_percentiles = [p for p in candidates if self._has_percentiles(p)]
         return with_percentiles[0] if with_percentiles else candidates[0]
     
+    def find_all(self) -> List[Path]:
+        """Return every run's results.csv, newest run first."""
+        if not self.results_dir.exists():
+            return []
+        
+        return sorted(
+            (p for p in self.results_dir.glob("*/results.csv") if p.is_file()),
+            reverse=True
+        )
+    
     @staticmethod
     def _has_percentiles(csv_path: Path) -> bool:
         """Check if CSV has percentile columns."""
@@ -0,0 +1,70 @@
+"""Incremental reader for a results.csv that is still being appended to."""
+import csv
+from pathlib import Path
+from typing import List, Optional
+
+
+class CSVTailer:
+    """Reads only the complete rows appended since the previous call.
+
+    The byte offset of the last complete line is remembered, so each call
+    costs one stat plus a read of the new bytes rather than re-reading the
+    whole file. A trailing line without a newline is left for the next call.
+    When the file is truncated or replaced by another file, reading starts
+    over from the header and `generation` goes up, so callers holding rows
+    from the old file know to drop them.
+    """
+
+    def __init__(self, csv_path: Path, encoding: str = "utf-8"):
+        self.csv_path = csv_path
+        self.encoding = encoding
+        self.offset = 0
+        self.header: Optional[List[str]] = None
+        self.generation = 0
+        self._identity: Optional[tuple] = None
+
+    def has_new_data(self) -> bool:
+        """Cheap check (one stat) for bytes beyond the current offset."""
+        try:
+            return self.csv_path.stat().st_size != self.offset
+        except OSError:
+            return False
+
+    def read_new(self) -> List[dict]:
+        """Return rows appended since the last call as dictionaries."""
+        try:
+            stat = self.csv_path.stat()
+        except OSError:
+            return []
+        size = stat.st_size
+        identity = (stat.st_dev, stat.st_ino)
+
+        if size < self.offset or (self._identity is not None and identity != self._identity):
+            # File was truncated or replaced: start over
+            self.offset = 0
+            self.header = None
+            self.generation += 1
+        self._identity = identity
+        if size == self.offset:
+            return []
+
+        with self.csv_path.open("rb") as f:
+            f.seek(self.offset)
+            chunk = f.read(size - self.offset)
+
+        end = chunk.rfind(b"\n")
+        if end < 0:
+            return []
+        self.offset += end + 1
+
+        lines = chunk[:end + 1].decode(self.encoding, errors="replace").splitlines()
+        if self.header is None:
+            # utf-8-sig safe: drop a BOM on the header line
+            self.header = next(csv.reader([lines[0].lstrip("\ufeff")]))
+            lines = lines[1:]
+
+        return [
+            dict(zip(self.header, values))
+            for values in csv.reader(lines)
+            if values
+        ]
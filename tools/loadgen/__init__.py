@@ -0,0 +1 @@
+"""Asyncio HTTP load generator (ApacheBench replacement for run_ab.sh)."""
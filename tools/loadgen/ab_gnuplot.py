@@ -0,0 +1,49 @@
+"""Read ApacheBench's `-g` per-request file into a LoadResult timeline.
+
+ab writes one tab-separated line per completed request:
+
+    starttime<TAB>seconds<TAB>ctime<TAB>dtime<TAB>ttime<TAB>wait
+
+where `seconds` is the request's start as whole epoch seconds and `ttime`
+its total time in ms. Requests are bucketed by the second they completed
+in (start + ttime), counted from the first start, like the Python engine's
+timeline. ab only records requests that completed, so the failed column
+stays at zero.
+"""
+from typing import Iterable
+
+from loadgen.histogram import LatencyHistogram
+from loadgen.http_client import LoadResult
+
+
+def read_ab_gnuplot(lines: Iterable[str], url: str = "", concurrency: int = 0,
+                    keepalive: bool = False) -> LoadResult:
+    """Parse `ab -g` output; malformed lines (and the header) are skipped."""
+    requests = []
+    for line in lines:
+        fields = line.rstrip("\n").split("\t")
+        if len(fields) < 6:
+            continue
+        try:
+            requests.append((int(fields[1]), int(fields[4])))
+        except ValueError:
+            continue
+
+    result = LoadResult(url=url, concurrency=concurrency, keepalive=keepalive)
+    if not requests:
+        return result
+    origin_ms = min(start for start, _ in requests) * 1000
+    last_ms = 0
+    for start, ttime in requests:
+        end_ms = start * 1000 - origin_ms + ttime
+        second = end_ms // 1000
+        bucket = result.timeline.get(second)
+        if bucket is None:
+            bucket = result.timeline[second] = LatencyHistogram()
+        latency_ns = ttime * 1_000_000
+        bucket.record(latency_ns)
+        result.histogram.record(latency_ns)
+        last_ms = max(last_ms, end_ms)
+    result.completed = len(requests)
+    result.elapsed_s = last_ms / 1000.0
+    return result
@@ -0,0 +1,93 @@
+"""Concurrency sweep that finds the highest throughput still meeting a p99 SLO."""
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+from loadgen.http_client import LoadResult
+
+
+@dataclass
+class SweepStep:
+    """One measured connection level of a concurrency sweep."""
+    connections: int
+    result: LoadResult
+    within_slo: bool
+
+    @property
+    def requests_sec(self) -> float:
+        return self.result.requests_sec
+
+    @property
+    def p99_ms(self) -> Optional[float]:
+        histogram = self.result.histogram
+        return histogram.percentile_ns(99) / 1_000_000.0 if histogram.count else None
+
+
+def geometric_levels(start: int, maximum: int, factor: float = 2.0) -> List[int]:
+    """start, start*factor, ... up to maximum (always included), each at least one above the last."""
+    if start < 1 or maximum < start:
+        raise ValueError("need 1 <= start <= maximum")
+    if factor <= 1.0:
+        raise ValueError("factor must be > 1")
+    levels = [start]
+    while levels[-1] < maximum:
+        levels.append(min(maximum, max(levels[-1] + 1, int(round(levels[-1] * factor)))))
+    return levels
+
+
+def find_capacity(measure: Callable[[int], LoadResult], start: int, maximum: int, slo_p99_ms: float,
+                  factor: float = 2.0, falloff: float = 0.1, bisect_steps: int = 3,
+                  progress: Optional[Callable[[SweepStep], None]] = None) -> List[SweepStep]:
+    """Step connection counts geometrically, then bisect the knee.
+
+    A level passes when it completed requests, its p99 is within
+    slo_p99_ms and its throughput is no more than `falloff` below the best
+    seen so far. The geometric phase stops at the first failing level;
+    up to `bisect_steps` more levels are then measured between the last
+    pass and that failure. Returns every measured step, ordered by
+    connections.
+    """
+    steps: List[SweepStep] = []
+    best_rps = 0.0
+
+    def run(connections: int) -> bool:
+        nonlocal best_rps
+        result = measure(connections)
+        p99_ns = result.histogram.percentile_ns(99)
+        ok = (result.completed > 0
+              and p99_ns <= slo_p99_ms * 1_000_000
+              and result.requests_sec >= best_rps * (1.0 - falloff))
+        if ok:
+            best_rps = max(best_rps, result.requests_sec)
+        step = SweepStep(connections=connections, result=result, within_slo=ok)
+        steps.append(step)
+        if progress:
+            progress(step)
+        return ok
+
+    last_pass = None
+    first_fail = None
+    for connections in geometric_levels(start, maximum, factor):
+        if run(connections):
+            last_pass = connections
+        else:
+            first_fail = connections
+            break
+
+    if last_pass is not None and first_fail is not None:
+        low, high = last_pass, first_fail
+        for _ in range(bisect_steps):
+            if high - low <= 1:
+                break
+            middle = (low + high) // 2
+            if run(middle):
+                low = middle
+            else:
+                high = middle
+
+    return sorted(steps, key=lambda step: step.connections)
+
+
+def max_rps_within_slo(steps: List[SweepStep]) -> Optional[SweepStep]:
+    """The passing step with the highest throughput, or None if no level met the SLO."""
+    passing = [step for step in steps if step.within_slo]
+    return max(passing, key=lambda step: step.requests_sec) if passing else None
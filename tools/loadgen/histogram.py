@@ -0,0 +1,102 @@
+"""Log-linear latency histogram with nanosecond input and bounded relative error."""
+from typing import Any, Dict, Optional
+
+
+class LatencyHistogram:
+    """Counts nanosecond latencies in log-linear buckets.
+
+    Values below 2 * SUB_BUCKETS ns are stored exactly; above that every power
+    of two is split into SUB_BUCKETS linear buckets, so any reported value is
+    within 1 / SUB_BUCKETS (< 0.8%) of the recorded one. Counts are kept
+    sparse, which keeps histograms cheap to serialize and merge.
+    """
+
+    SUB_BITS = 7
+    SUB_BUCKETS = 1 << SUB_BITS
+
+    def __init__(self):
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns: Optional[int] = None
+        self.max_ns: Optional[int] = None
+
+    @classmethod
+    def bucket_index(cls, value_ns: int) -> int:
+        if value_ns < 2 * cls.SUB_BUCKETS:
+            return value_ns
+        shift = value_ns.bit_length() - cls.SUB_BITS - 1
+        return shift * cls.SUB_BUCKETS + (value_ns >> shift)
+
+    @classmethod
+    def bucket_value(cls, index: int) -> int:
+        """Midpoint of the values that map to index."""
+        if index < 2 * cls.SUB_BUCKETS:
+            return index
+        shift = index // cls.SUB_BUCKETS - 1
+        mantissa = index - shift * cls.SUB_BUCKETS
+        lower = mantissa << shift
+        return lower + ((1 << shift) - 1) // 2
+
+    def record(self, value_ns: int) -> None:
+        if value_ns < 0:
+            value_ns = 0
+        index = self.bucket_index(value_ns)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total_ns += value_ns
+        if self.min_ns is None or value_ns < self.min_ns:
+            self.min_ns = value_ns
+        if self.max_ns is None or value_ns > self.max_ns:
+            self.max_ns = value_ns
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """Add other's samples into this histogram (exact: buckets line up)."""
+        for index, n in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + n
+        self.count += other.count
+        self.total_ns += other.total_ns
+        if other.min_ns is not None and (self.min_ns is None or other.min_ns < self.min_ns):
+            self.min_ns = other.min_ns
+        if other.max_ns is not None and (self.max_ns is None or other.max_ns > self.max_ns):
+            self.max_ns = other.max_ns
+        return self
+
+    def mean_ns(self) -> float:
+        return self.total_ns / self.count if self.count else 0.0
+
+    def percentile_ns(self, percentile: float) -> int:
+        """Smallest recorded value (to bucket precision) with percentile% of samples at or below it."""
+        if not self.count:
+            return 0
+        if percentile >= 100:
+            return self.max_ns
+        rank = max(1, -(-int(percentile * self.count * 1000) // 100000))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(max(self.bucket_value(index), self.min_ns), self.max_ns)
+        return self.max_ns
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "sub_bits": self.SUB_BITS,
+            "count": self.count,
+            "total_ns": self.total_ns,
+            "min_ns": self.min_ns,
+            "max_ns": self.max_ns,
+            "counts": {str(index): n for index, n in sorted(self.counts.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        if data.get("sub_bits", cls.SUB_BITS) != cls.SUB_BITS:
+            raise ValueError(f"Histogram sub_bits {data.get('sub_bits')} != {cls.SUB_BITS}")
+        histogram = cls()
+        histogram.counts = {int(index): int(n) for index, n in data.get("counts", {}).items()}
+        histogram.count = int(data.get("count", 0))
+        histogram.total_ns = int(data.get("total_ns", 0))
+        histogram.min_ns = data.get("min_ns")
+        histogram.max_ns = data.get("max_ns")
+        return histogram
@@ -0,0 +1,345 @@
+"""Asyncio HTTP/1.1 load generator (closed loop, or open loop at a fixed arrival rate)."""
+import asyncio
+import bisect
+import itertools
+import json
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+from loadgen.histogram import LatencyHistogram
+
+
+class ResponseError(Exception):
+    """Malformed or truncated HTTP response."""
+
+
+@dataclass
+class BodySample:
+    """Client latency of one sampled response next to what its JSON body reports."""
+    elapsed_s: float
+    latency_ns: int
+    # `elapsed_ms` (PHP hrtime around the work) and `pid` from the body; None when absent
+    server_ms: Optional[float] = None
+    pid: Optional[int] = None
+
+
+def parse_body_sample(body: bytes, elapsed_s: float, latency_ns: int) -> BodySample:
+    """BodySample from an endpoint's JSON body; fields it lacks stay None."""
+    try:
+        data = json.loads(body)
+    except ValueError:
+        data = None
+    if not isinstance(data, dict):
+        return BodySample(elapsed_s, latency_ns)
+    server_ms = data.get("elapsed_ms")
+    pid = data.get("pid")
+    return BodySample(
+        elapsed_s, latency_ns,
+        server_ms=float(server_ms) if isinstance(server_ms, (int, float)) else None,
+        pid=pid if isinstance(pid, int) else None,
+    )
+
+
+@dataclass
+class EndpointResult:
+    """Counters and latency histogram of one endpoint within a mixed-workload run."""
+    weight: float
+    completed: int = 0
+    failed: int = 0
+    non_2xx: int = 0
+    body_bytes: int = 0
+    histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+
+@dataclass
+class LoadResult:
+    """Counters and latency histogram of one load run."""
+    url: str
+    concurrency: int
+    keepalive: bool
+    elapsed_s: float = 0.0
+    completed: int = 0
+    failed: int = 0
+    non_2xx: int = 0
+    keepalive_requests: int = 0
+    connections_opened: int = 0
+    bytes_received: int = 0
+    body_bytes: int = 0
+    # Open-loop arrival rate in requests/sec; None for closed-loop runs
+    target_rate: Optional[float] = None
+    histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
+    # Second offset from the start of the run -> latencies / failures completed in it
+    timeline: Dict[int, LatencyHistogram] = field(default_factory=dict)
+    failed_timeline: Dict[int, int] = field(default_factory=dict)
+    # Every sample_every-th response body, when body sampling is on
+    samples: List[BodySample] = field(default_factory=list)
+    # Endpoint name -> its share of a mixed-workload run; empty for single-URL runs
+    endpoints: Dict[str, EndpointResult] = field(default_factory=dict)
+
+    @property
+    def requests_sec(self) -> float:
+        return self.completed / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    @property
+    def transfer_kb_sec(self) -> float:
+        return self.bytes_received / 1024.0 / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+
+def parse_url(url: str) -> Tuple[str, int, str, str]:
+    """Split url into (host, port, request target, Host header)."""
+    parts = urlsplit(url)
+    if parts.scheme != "http":
+        raise ValueError(f"Only http:// URLs are supported: {url}")
+    if not parts.hostname:
+        raise ValueError(f"URL has no host: {url}")
+    port = parts.port or 80
+    target = parts.path or "/"
+    if parts.query:
+        target += "?" + parts.query
+    host_header = parts.hostname if port == 80 else f"{parts.hostname}:{port}"
+    return parts.hostname, port, target, host_header
+
+
+async def read_response(reader: asyncio.StreamReader,
+                        body_sink: Optional[bytearray] = None) -> Tuple[int, int, int, bool]:
+    """Read one response; returns (status, total bytes, body bytes, server keeps connection).
+
+    The body is discarded unless body_sink is given, which receives it.
+    """
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError as e:
+        raise ResponseError("connection closed before response headers") from e
+    lines = head.decode("latin-1").split("\r\n")
+    status_parts = lines[0].split(" ", 2)
+    if len(status_parts) < 2 or not status_parts[0].startswith("HTTP/"):
+        raise ResponseError(f"bad status line: {lines[0]!r}")
+    status = int(status_parts[1])
+    headers = {}
+    for line in lines[1:]:
+        name, sep, value = line.partition(":")
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+
+    keep_open = headers.get("connection", "").lower() != "close" and status_parts[0] != "HTTP/1.0"
+    body = 0
+    try:
+        if "content-length" in headers:
+            body = int(headers["content-length"])
+            data = await reader.readexactly(body)
+            if body_sink is not None:
+                body_sink += data
+        elif headers.get("transfer-encoding", "").lower() == "chunked":
+            while True:
+                size_line = await reader.readuntil(b"\r\n")
+                size = int(size_line.split(b";", 1)[0], 16)
+                if size == 0:
+                    # Trailers (normally none) end with an empty line
+                    while (await reader.readuntil(b"\r\n")) != b"\r\n":
+                        pass
+                    break
+                data = await reader.readexactly(size + 2)
+                if body_sink is not None:
+                    body_sink += data[:-2]
+                body += size
+        elif status not in (204, 304) and not 100 <= status < 200:
+            data = await reader.read()
+            if body_sink is not None:
+                body_sink += data
+            body = len(data)
+            keep_open = False
+    except asyncio.IncompleteReadError as e:
+        raise ResponseError("connection closed mid-body") from e
+    return status, len(head) + body, body, keep_open
+
+
+class LoadGenerator:
+    """Drives `concurrency` connections at a URL until a duration or request cap.
+
+    Each worker owns one connection and sends requests back to back. Latency
+    is taken with perf_counter_ns from just before the request is written
+    (including connect when a new connection is needed) until the body has
+    been read, and recorded into a histogram per elapsed second; the run's
+    histogram is the merge of those. Requests still in flight when the
+    duration expires are cancelled and not counted, as ab -t does.
+
+    With `rate` set the run is open loop: request i is due at i / rate
+    seconds after the start, whatever the server is doing, and its latency
+    is measured from that intended send time. A request that has to wait
+    for a free connection because the server stalled is charged the wait,
+    so stalls show up in the tail instead of being coordinated away.
+
+    With `sample_every` = N, the body of every Nth request is kept and its
+    `elapsed_ms` / `pid` fields recorded next to the client latency, so the
+    PHP share of each request can be told apart from queueing and transport.
+
+    With `mix` = [(name, url, weight), ...] every request picks one of the
+    URLs at random in proportion to its weight (from a seeded generator, so
+    runs repeat), all on the same connections; counters and latency are
+    then also kept per name in `LoadResult.endpoints`.
+    """
+
+    def __init__(self, url: str, concurrency: int = 1, duration: Optional[float] = None,
+                 max_requests: Optional[int] = None, keepalive: bool = True, timeout: float = 30.0,
+                 rate: Optional[float] = None, sample_every: int = 0,
+                 mix: Optional[Sequence[Tuple[str, str, float]]] = None, seed: int = 0):
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be > 0")
+        if sample_every < 0:
+            raise ValueError("sample_every must be >= 0")
+        if duration is None and max_requests is None:
+            raise ValueError("set a duration, a request cap, or both")
+        self.url = url
+        self.host, self.port, self.target, host_header = parse_url(url)
+        self.mix = list(mix or [])
+        for name, mix_url, weight in self.mix:
+            if parse_url(mix_url)[:2] != (self.host, self.port):
+                raise ValueError(f"mixed workload URL {mix_url} is not on {self.host}:{self.port}")
+            if weight <= 0:
+                raise ValueError(f"weight of {name} must be > 0")
+        self.concurrency = concurrency
+        self.duration = duration
+        self.max_requests = max_requests
+        self.keepalive = keepalive
+        self.timeout = timeout
+        self.rate = rate
+        self.sample_every = sample_every
+        self._interval_ns = int(1_000_000_000 / rate) if rate else 0
+        self.request_bytes = self._request(self.target, host_header)
+        self._mix_requests = [self._request(parse_url(mix_url)[2], host_header) for _, mix_url, _ in self.mix]
+        self._mix_cumulative = list(itertools.accumulate(weight for _, _, weight in self.mix))
+        self._random = random.Random(seed)
+        self._issued = 0
+        self._origin_ns = 0
+        self._stopping = False
+
+    def _request(self, target: str, host_header: str) -> bytes:
+        return (
+            f"GET {target} HTTP/1.1\r\n"
+            f"Host: {host_header}\r\n"
+            "User-Agent: php-benchmark-loadgen\r\n"
+            "Accept: */*\r\n"
+            f"Connection: {'keep-alive' if self.keepalive else 'close'}\r\n\r\n"
+        ).encode("latin-1")
+
+    def _pick(self) -> int:
+        """Index into the mix, drawn in proportion to the weights."""
+        point = self._random.random() * self._mix_cumulative[-1]
+        return min(bisect.bisect_right(self._mix_cumulative, point), len(self.mix) - 1)
+
+    def _second(self, now_ns: int) -> int:
+        return (now_ns - self._origin_ns) // 1_000_000_000
+
+    def _claim(self) -> Optional[int]:
+        """Index of the next request to send, or None when the run is over."""
+        if self._stopping:
+            return None
+        if self.max_requests is not None and self._issued >= self.max_requests:
+            return None
+        self._issued += 1
+        return self._issued - 1
+
+    async def _worker(self, result: LoadResult) -> None:
+        reader = writer = None
+        reused = False
+        timeline = result.timeline
+        try:
+            while True:
+                index = self._claim()
+                if index is None:
+                    break
+                if self.rate:
+                    start = self._origin_ns + index * self._interval_ns
+                    delay = start - time.perf_counter_ns()
+                    if delay > 0:
+                        await asyncio.sleep(delay / 1e9)
+                else:
+                    start = time.perf_counter_ns()
+                sink = bytearray() if self.sample_every and index % self.sample_every == 0 else None
+                request, endpoint = self.request_bytes, None
+                if self.mix:
+                    choice = self._pick()
+                    request, endpoint = self._mix_requests[choice], result.endpoints[self.mix[choice][0]]
+                try:
+                    if writer is None:
+                        reader, writer = await asyncio.wait_for(
+                            asyncio.open_connection(self.host, self.port), self.timeout)
+                        result.connections_opened += 1
+                        reused = False
+                    writer.write(request)
+                    status, total, body, keep_open = await asyncio.wait_for(read_response(reader, sink),
+                                                                        self.timeout)
+                except (OSError, ResponseError, ValueError, asyncio.TimeoutError):
+                    result.failed += 1
+                    second = self._second(time.perf_counter_ns())
+                    result.failed_timeline[second] = result.failed_timeline.get(second, 0) + 1
+                    if endpoint is not None:
+                        endpoint.failed += 1
+                    if writer is not None:
+                        writer.close()
+                    reader = writer = None
+                    continue
+                end = time.perf_counter_ns()
+                second = self._second(end)
+                bucket = timeline.get(second)
+                if bucket is None:
+                    bucket = timeline[second] = LatencyHistogram()
+                bucket.record(end - start)
+                if sink is not None:
+                    result.samples.append(parse_body_sample(bytes(sink), (end - self._origin_ns) / 1e9, end - start))
+                result.completed += 1
+                result.bytes_received += total
+                result.body_bytes += body
+                if reused:
+                    result.keepalive_requests += 1
+                if not 200 <= status < 300:
+                    result.non_2xx += 1
+                if endpoint is not None:
+                    endpoint.histogram.record(end - start)
+                    endpoint.completed += 1
+                    endpoint.body_bytes += body
+                    if not 200 <= status < 300:
+                        endpoint.non_2xx += 1
+                if self.keepalive and keep_open:
+                    reused = True
+                else:
+                    writer.close()
+                    reader = writer = None
+        finally:
+            if writer is not None:
+                writer.close()
+
+    async def run(self, start_at: Optional[float] = None) -> LoadResult:
+        """Run the load; start_at (time.monotonic) lines up shards in other processes."""
+        result = LoadResult(url=self.url, concurrency=self.concurrency, keepalive=self.keepalive,
+                            target_rate=self.rate)
+        result.endpoints = {name: EndpointResult(weight) for name, _, weight in self.mix}
+        if start_at is not None:
+            await asyncio.sleep(max(0.0, start_at - time.monotonic()))
+        self._issued = 0
+        self._stopping = False
+        self._origin_ns = time.perf_counter_ns()
+        start = time.perf_counter()
+        tasks = [asyncio.ensure_future(self._worker(result)) for _ in range(self.concurrency)]
+        done, pending = await asyncio.wait(tasks, timeout=self.duration)
+        # asyncio.wait_for may swallow a cancel that races a completed read,
+        # so workers also stop claiming requests once the duration is up
+        self._stopping = True
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        result.elapsed_s = time.perf_counter() - start
+        if self.duration is not None and pending:
+            result.elapsed_s = min(result.elapsed_s, self.duration)
+        for second in result.timeline.values():
+            result.histogram.merge(second)
+        for task in done:
+            if not task.cancelled() and task.exception() is not None:
+                raise task.exception()
+        return result
@@ -0,0 +1,223 @@
+"""Render a LoadResult as ApacheBench-style text or as a results.csv row."""
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from loadgen.capacity import SweepStep
+from loadgen.http_client import LoadResult, parse_url
+
+
+CSV_HEADER = "timestamp,server,endpoint,requests_sec,latency_avg,latency_p50,latency_p75,latency_p90,latency_p99,transfer_sec"
+# One row per (server, endpoint, offered rate) of an open-loop sweep; latencies in ms
+SWEEP_HEADER = ("timestamp,server,endpoint,offered_rps,requests_sec,latency_avg,latency_p50,latency_p90,"
+                "latency_p99,latency_p999,latency_max,failed")
+# One row per measured connection level of a concurrency sweep; latencies in ms
+CAPACITY_HEADER = ("timestamp,server,endpoint,connections,requests_sec,latency_avg,latency_p50,latency_p90,"
+                   "latency_p99,latency_max,failed,slo_p99_ms,within_slo")
+# One row per elapsed second of a run; latencies in ms, blank for seconds with no completions
+TIMELINE_HEADER = "second,completed,failed,latency_p50,latency_p90,latency_p99,latency_max"
+# One row per sampled response body: client latency and the body's elapsed_ms / pid (blank if absent)
+SAMPLES_HEADER = "elapsed_s,latency_ms,server_ms,pid"
+# One row per endpoint of a mixed-workload run plus an "all" row; weight is the
+# configured fraction, share the fraction of completed requests; latencies in ms
+MIX_HEADER = ("timestamp,server,endpoint,weight,share,requests_sec,latency_avg,latency_p50,latency_p90,"
+              "latency_p99,latency_max,failed")
+MIX_TOTAL = "all"
+AB_PERCENTILES = (50, 66, 75, 80, 90, 95, 98, 99, 99.9)
+
+
+def _ms(value_ns: float) -> float:
+    return value_ns / 1_000_000.0
+
+
+def format_ab_output(result: LoadResult) -> str:
+    """ApacheBench-compatible summary; lib_ab_parse.sh parses it unchanged.
+
+    Unlike ab, times carry three decimals instead of whole milliseconds and
+    "Time per request (mean)" is the measured mean rather than c * T / n.
+    """
+    host, port, target, _ = parse_url(result.url)
+    histogram = result.histogram
+    lines: List[str] = [
+        "This is php-benchmark loadgen (ApacheBench-compatible output)",
+        "",
+        f"Server Hostname:        {host}",
+        f"Server Port:            {port}",
+        "",
+        f"Document Path:          {target}",
+        f"Document Length:        {result.body_bytes // result.completed if result.completed else 0} bytes",
+        "",
+        f"Concurrency Level:      {result.concurrency}",
+        f"Time taken for tests:   {result.elapsed_s:.3f} seconds",
+        f"Complete requests:      {result.completed}",
+        f"Failed requests:        {result.failed}",
+    ]
+    if result.non_2xx:
+        lines.append(f"Non-2xx responses:      {result.non_2xx}")
+    if result.target_rate is not None:
+        lines.append(f"Target rate:            {result.target_rate:.2f} [#/sec] (open loop)")
+    lines += [
+        f"Keep-Alive requests:    {result.keepalive_requests}",
+        f"Total transferred:      {result.bytes_received} bytes",
+        f"HTML transferred:       {result.body_bytes} bytes",
+        f"Requests per second:    {result.requests_sec:.2f} [#/sec] (mean)",
+        f"Time per request:       {_ms(histogram.mean_ns()):.3f} [ms] (mean)",
+        f"Time per request:       {1000.0 / result.requests_sec if result.requests_sec else 0.0:.3f} [ms] "
+        "(mean, across all concurrent requests)",
+        f"Transfer rate:          {result.transfer_kb_sec:.2f} [Kbytes/sec] received",
+    ]
+    if histogram.count:
+        lines += ["", "Percentage of the requests served within a certain time (ms)"]
+        for percentile in AB_PERCENTILES:
+            label = f"{percentile:g}%"
+            lines.append(f"  {label:<6}{_ms(histogram.percentile_ns(percentile)):.3f}")
+        lines.append(f"  {'100%':<6}{_ms(histogram.max_ns):.3f} (longest request)")
+    if result.endpoints:
+        lines += ["", "Mixed workload (per endpoint)"]
+        for name, endpoint in result.endpoints.items():
+            rps = endpoint.completed / result.elapsed_s if result.elapsed_s > 0 else 0.0
+            p99 = _ms(endpoint.histogram.percentile_ns(99)) if endpoint.histogram.count else 0.0
+            lines.append(f"  {name:<12}{endpoint.completed:>10} requests  {rps:>10.2f} [#/sec]  "
+                         f"p99 {p99:.3f} [ms]  failed {endpoint.failed}")
+    return "\n".join(lines)
+
+
+def format_csv_row(result: LoadResult, server: str, endpoint: str, timestamp: Optional[str] = None) -> str:
+    """One results.csv row (see CSV_HEADER) with sub-millisecond latencies."""
+    histogram = result.histogram
+    timestamp = timestamp or datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    def pct(value: float) -> str:
+        return f"{_ms(histogram.percentile_ns(value)):.3f}" if histogram.count else "0"
+
+    return ",".join([
+        timestamp,
+        server,
+        endpoint,
+        f"{result.requests_sec:.2f}",
+        f"{_ms(histogram.mean_ns()):.3f}ms",
+        pct(50),
+        pct(75),
+        pct(90),
+        pct(99),
+        f"{result.transfer_kb_sec:.2f}",
+    ])
+
+
+def format_sweep_row(result: LoadResult, server: str, endpoint: str, timestamp: Optional[str] = None) -> str:
+    """One rate_sweep.csv row (see SWEEP_HEADER) for an open-loop run."""
+    histogram = result.histogram
+    timestamp = timestamp or datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    def ms(value_ns: float) -> str:
+        return f"{_ms(value_ns):.3f}" if histogram.count else ""
+
+    return ",".join([
+        timestamp,
+        server,
+        endpoint,
+        f"{result.target_rate or 0.0:.2f}",
+        f"{result.requests_sec:.2f}",
+        ms(histogram.mean_ns()),
+        ms(histogram.percentile_ns(50)),
+        ms(histogram.percentile_ns(90)),
+        ms(histogram.percentile_ns(99)),
+        ms(histogram.percentile_ns(99.9)),
+        ms(histogram.max_ns or 0),
+        str(result.failed),
+    ])
+
+
+def format_timeline(result: LoadResult) -> str:
+    """Per-second CSV (see TIMELINE_HEADER) covering every second of the run.
+
+    Seconds in which nothing completed are kept as zero rows, so a stall
+    shows up as a gap rather than disappearing from the series.
+    """
+    seconds = set(result.timeline) | set(result.failed_timeline)
+    last = max(max(seconds, default=0), int(result.elapsed_s + 0.999) - 1)
+    lines = [TIMELINE_HEADER]
+    for second in range(last + 1):
+        histogram = result.timeline.get(second)
+        failed = result.failed_timeline.get(second, 0)
+        if histogram is None or not histogram.count:
+            lines.append(f"{second},0,{failed},,,,")
+            continue
+        lines.append(",".join([
+            str(second),
+            str(histogram.count),
+            str(failed),
+            f"{_ms(histogram.percentile_ns(50)):.3f}",
+            f"{_ms(histogram.percentile_ns(90)):.3f}",
+            f"{_ms(histogram.percentile_ns(99)):.3f}",
+            f"{_ms(histogram.max_ns):.3f}",
+        ]))
+    return "\n".join(lines) + "\n"
+
+
+def format_capacity_row(step: SweepStep, slo_p99_ms: float, server: str, endpoint: str,
+                        timestamp: Optional[str] = None) -> str:
+    """One concurrency_sweep.csv row (see CAPACITY_HEADER)."""
+    result = step.result
+    histogram = result.histogram
+    timestamp = timestamp or datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    def ms(value_ns: float) -> str:
+        return f"{_ms(value_ns):.3f}" if histogram.count else ""
+
+    return ",".join([
+        timestamp,
+        server,
+        endpoint,
+        str(step.connections),
+        f"{result.requests_sec:.2f}",
+        ms(histogram.mean_ns()),
+        ms(histogram.percentile_ns(50)),
+        ms(histogram.percentile_ns(90)),
+        ms(histogram.percentile_ns(99)),
+        ms(histogram.max_ns or 0),
+        str(result.failed),
+        f"{slo_p99_ms:g}",
+        "1" if step.within_slo else "0",
+    ])
+
+
+def format_samples(result: LoadResult) -> str:
+    """CSV (see SAMPLES_HEADER) of the sampled response bodies, in completion order."""
+    lines = [SAMPLES_HEADER]
+    for sample in result.samples:
+        lines.append(",".join([
+            f"{sample.elapsed_s:.3f}",
+            f"{_ms(sample.latency_ns):.3f}",
+            f"{sample.server_ms:.3f}" if sample.server_ms is not None else "",
+            str(sample.pid) if sample.pid is not None else "",
+        ]))
+    return "\n".join(lines) + "\n"
+
+
+def format_mix_rows(result: LoadResult, server: str, timestamp: Optional[str] = None) -> List[str]:
+    """mixed_workload.csv rows (see MIX_HEADER): one per endpoint of the mix, then the aggregate."""
+    timestamp = timestamp or datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    total_weight = sum(endpoint.weight for endpoint in result.endpoints.values())
+
+    def row(name, weight, completed, failed, histogram) -> str:
+        def ms(value_ns: float) -> str:
+            return f"{_ms(value_ns):.3f}" if histogram.count else ""
+        return ",".join([
+            timestamp,
+            server,
+            name,
+            f"{weight:.4f}",
+            f"{completed / result.completed if result.completed else 0.0:.4f}",
+            f"{completed / result.elapsed_s if result.elapsed_s > 0 else 0.0:.2f}",
+            ms(histogram.mean_ns()),
+            ms(histogram.percentile_ns(50)),
+            ms(histogram.percentile_ns(90)),
+            ms(histogram.percentile_ns(99)),
+            ms(histogram.max_ns or 0),
+            str(failed),
+        ])
+
+    rows = [row(name, endpoint.weight / total_weight, endpoint.completed, endpoint.failed, endpoint.histogram)
+            for name, endpoint in result.endpoints.items()]
+    rows.append(row(MIX_TOTAL, 1.0, result.completed, result.failed, result.histogram))
+    return rows
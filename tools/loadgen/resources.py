@@ -0,0 +1,183 @@
+"""Sample a server's CPU time, throttling and memory while a cell runs.
+
+Sources are cgroup v2 directories (a container's cpu.stat / memory.current)
+or local processes found in /proc by name. Counters are cumulative from the
+first sample, so each interval's CPU use is the difference of two reads.
+"""
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+# One row per sampling interval; cpu_s / throttled_ms are used within the interval
+RESOURCE_HEADER = "elapsed_s,cpu_s,cpu_cores,throttled_ms,nr_throttled,memory_mb"
+CGROUP_ROOT = Path("/sys/fs/cgroup")
+
+
+@dataclass
+class ResourceSample:
+    """Cumulative counters at one instant, relative to the first sample."""
+    elapsed_s: float
+    cpu_usec: int
+    throttled_usec: int
+    nr_throttled: int
+    memory_bytes: int
+
+
+class CgroupSource:
+    """A cgroup v2 directory: cpu.stat usage/throttling and memory.current."""
+
+    def __init__(self, path: Path):
+        if not (path / "cpu.stat").is_file():
+            raise ValueError(f"not a cgroup v2 directory (no cpu.stat): {path}")
+        self.path = path
+
+    def read(self) -> Tuple[int, int, int, int]:
+        """(cpu usec, throttled usec, throttled periods, memory bytes) since the cgroup started."""
+        stat = {}
+        for line in (self.path / "cpu.stat").read_text().splitlines():
+            name, _, value = line.partition(" ")
+            stat[name] = int(value or 0)
+        memory_file = self.path / "memory.current"
+        memory = int(memory_file.read_text()) if memory_file.is_file() else 0
+        return stat.get("usage_usec", 0), stat.get("throttled_usec", 0), stat.get("nr_throttled", 0), memory
+
+
+class ProcSource:
+    """Local processes whose name (/proc/PID/comm) matches a regex, e.g. "nginx|php-fpm".
+
+    Processes come and go (php-fpm recycles children), so CPU time is
+    accumulated per PID: a PID seen before adds its growth since the last
+    read, a new one its whole CPU time. There is no throttling outside a
+    cgroup quota, so those counters stay zero.
+    """
+
+    def __init__(self, pattern: str, proc: Path = Path("/proc")):
+        self.pattern = re.compile(pattern)
+        self.proc = proc
+        self._ticks_per_sec = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+        self._last: Optional[Dict[int, int]] = None
+        self._cpu_ticks = 0
+
+    def _matching(self):
+        for entry in self.proc.iterdir():
+            if not entry.name.isdigit():
+                continue
+            try:
+                if self.pattern.search((entry / "comm").read_text().strip()):
+                    yield int(entry.name), entry
+            except OSError:
+                continue
+
+    def read(self) -> Tuple[int, int, int, int]:
+        """(cpu usec, 0, 0, summed RSS bytes) of the matching processes."""
+        ticks: Dict[int, int] = {}
+        rss = 0
+        for pid, entry in self._matching():
+            try:
+                # Fields after the parenthesised comm; utime and stime are the 12th and 13th
+                fields = (entry / "stat").read_text().rsplit(")", 1)[1].split()
+                status = (entry / "status").read_text()
+            except (OSError, IndexError):
+                continue
+            ticks[pid] = int(fields[11]) + int(fields[12])
+            match = re.search(r"^VmRSS:\s+(\d+) kB", status, re.MULTILINE)
+            if match:
+                rss += int(match.group(1)) * 1024
+        if self._last is not None:
+            self._cpu_ticks += sum(max(0, used - self._last.get(pid, 0)) for pid, used in ticks.items())
+        self._last = ticks
+        return self._cpu_ticks * 1_000_000 // self._ticks_per_sec, 0, 0, rss
+
+
+def find_container_cgroup(container_id: str, root: Path = CGROUP_ROOT) -> Path:
+    """cgroup v2 directory of a Docker container (systemd or cgroupfs driver)."""
+    for pattern in (f"system.slice/docker-{container_id}*.scope", f"docker/{container_id}*"):
+        matches = sorted(root.glob(pattern))
+        if matches:
+            return matches[0]
+    raise ValueError(f"no cgroup found for container {container_id} under {root}")
+
+
+def open_source(spec: str, cgroup_root: Path = CGROUP_ROOT):
+    """Resolve cgroup:PATH, docker:CONTAINER_ID or proc:REGEX to a source."""
+    kind, sep, value = spec.partition(":")
+    if not sep or not value:
+        raise ValueError(f"expected cgroup:PATH, docker:ID or proc:REGEX, got {spec!r}")
+    if kind == "cgroup":
+        return CgroupSource(Path(value))
+    if kind == "docker":
+        return CgroupSource(find_container_cgroup(value, cgroup_root))
+    if kind == "proc":
+        return ProcSource(value)
+    raise ValueError(f"unknown resource source {kind!r} in {spec!r}")
+
+
+class ResourceSampler:
+    """Reads a source every `interval` seconds on a background thread."""
+
+    def __init__(self, source, interval: float = 1.0):
+        if interval <= 0:
+            raise ValueError("interval must be > 0")
+        self.source = source
+        self.interval = interval
+        self.samples: List[ResourceSample] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._origin = 0.0
+        self._base = (0, 0, 0)
+
+    def _sample(self) -> None:
+        cpu, throttled, periods, memory = self.source.read()
+        now = time.monotonic()
+        if not self.samples:
+            self._origin = now
+            self._base = (cpu, throttled, periods)
+        self.samples.append(ResourceSample(
+            elapsed_s=now - self._origin,
+            cpu_usec=cpu - self._base[0],
+            throttled_usec=throttled - self._base[1],
+            nr_throttled=periods - self._base[2],
+            memory_bytes=memory,
+        ))
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def start(self) -> "ResourceSampler":
+        self._sample()
+        self._thread = threading.Thread(target=self._loop, name="resource-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> List[ResourceSample]:
+        """Stop sampling, take a final sample and return the series."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._sample()
+        return self.samples
+
+
+def format_resources(samples: List[ResourceSample]) -> str:
+    """CSV (see RESOURCE_HEADER) with one row per interval between consecutive samples."""
+    lines = [RESOURCE_HEADER]
+    for before, after in zip(samples, samples[1:]):
+        span = after.elapsed_s - before.elapsed_s
+        if span <= 0:
+            continue
+        cpu_s = (after.cpu_usec - before.cpu_usec) / 1e6
+        lines.append(",".join([
+            f"{after.elapsed_s:.3f}",
+            f"{cpu_s:.6f}",
+            f"{cpu_s / span:.3f}",
+            f"{(after.throttled_usec - before.throttled_usec) / 1000.0:.3f}",
+            str(after.nr_throttled - before.nr_throttled),
+            f"{after.memory_bytes / 1048576.0:.2f}",
+        ]))
+    return "\n".join(lines) + "\n"
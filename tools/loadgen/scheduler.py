@@ -0,0 +1,157 @@
+"""Pack benchmark cells (server x endpoint runs) onto disjoint cores in waves.
+
+A cell needs cores for its server container and for its load generator. The
+server's share comes from the compose `cpus` limit (rounded up; a service
+without one gets a fixed budget, UNLIMITED_SERVER_CORES by default), the
+client's from the loadgen worker count. Cells of one wave run at the same
+time on non-overlapping cores; waves run one after another. Cells of one
+server in the same wave share its container, which is pinned to the union
+of their server cores with its `cpus` limit scaled by the number of cells
+(see server_pins), so each cell keeps the share it would have alone.
+"""
+import math
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Server cores budgeted per cell for a service without a compose `cpus` limit
+UNLIMITED_SERVER_CORES = 2
+
+
+@dataclass(frozen=True)
+class Cell:
+    """One server/endpoint run of the matrix."""
+    server: str
+    endpoint: str
+    duration: float
+    # Compose `cpus` limit of the server container; None = unlimited
+    server_cpus: Optional[float] = None
+    client_cpus: int = 1
+
+    def cores_needed(self, unlimited_cores: int = UNLIMITED_SERVER_CORES) -> int:
+        client = max(1, self.client_cpus)
+        if self.server_cpus is None:
+            return max(1, unlimited_cores) + client
+        return max(1, math.ceil(self.server_cpus)) + client
+
+
+@dataclass
+class Placement:
+    """A cell with the wave it runs in and the cores it owns there."""
+    cell: Cell
+    wave: int
+    server_cores: List[int]
+    client_cores: List[int]
+
+    @property
+    def oversubscribed(self) -> bool:
+        """True when the cell needs more cores than the machine has and shares them."""
+        return bool(set(self.server_cores) & set(self.client_cores))
+
+
+def service_name(server: str) -> str:
+    """Compose service of a results.csv server id (nginx_multi -> nginx-multi)."""
+    return server.replace("_", "-")
+
+
+def parse_compose_cpus(text: str) -> Dict[str, Optional[float]]:
+    """`cpus` limit of every service in a docker-compose file (None where unset).
+
+    Reads the plain block layout used by this repo's compose file without a
+    YAML dependency: service names two spaces in under `services:`, their
+    keys four spaces in.
+    """
+    limits: Dict[str, Optional[float]] = {}
+    in_services = False
+    service = None
+    for line in text.splitlines():
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        indent = len(line) - len(line.lstrip(" "))
+        if indent == 0:
+            in_services = line.rstrip() == "services:"
+            service = None
+            continue
+        if not in_services:
+            continue
+        match = re.match(r"\s*([\w.-]+):\s*(.*?)\s*$", line)
+        if indent == 2 and match:
+            service = match.group(1)
+            limits[service] = None
+        elif indent == 4 and match and service and match.group(1) == "cpus":
+            limits[service] = float(match.group(2).strip("'\""))
+    return limits
+
+
+def parse_server_cpus(value: str) -> Dict[str, Optional[float]]:
+    """Parse `xampp=1.0,nginx_multi=` (blank = unlimited) into per-server limits."""
+    limits: Dict[str, Optional[float]] = {}
+    for part in re.split(r"[,\s]+", value.strip()):
+        if not part:
+            continue
+        name, sep, cpus = part.partition("=")
+        if not sep or not name:
+            raise ValueError(f"expected SERVER=CPUS, got {part!r}")
+        limits[name] = float(cpus) if cpus else None
+    return limits
+
+
+def plan_waves(cells: Sequence[Cell], cpus: Sequence[int],
+               unlimited_cores: int = UNLIMITED_SERVER_CORES) -> List[List[Placement]]:
+    """First-fit-decreasing packing of cells into waves of disjoint core sets.
+
+    Cells are taken longest first, so cells of similar length share a wave
+    and little time is lost waiting for the slowest cell in each. A cell
+    joins the first wave that has enough unclaimed cores; otherwise it opens
+    a new wave. A cell too big for the machine runs alone and its server and
+    client share every core.
+    """
+    if not cpus:
+        raise ValueError("no CPUs to schedule on")
+    cpus = sorted(cpus)
+    total = len(cpus)
+    waves: List[List[Placement]] = []
+    free: List[List[int]] = []
+    for cell in sorted(cells, key=lambda c: (-c.duration, -c.cores_needed(unlimited_cores))):
+        need = cell.cores_needed(unlimited_cores)
+        client = max(1, cell.client_cpus)
+        for index in range(len(waves)):
+            if need <= len(free[index]):
+                break
+        else:
+            index = len(waves)
+            waves.append([])
+            free.append(list(cpus))
+        available = free[index]
+        if need <= len(available):
+            cores, free[index] = available[:need], available[need:]
+            server_cores, client_cores = cores[:need - client], cores[need - client:]
+        else:
+            free[index] = []
+            client_cores = cpus[-min(client, total):]
+            server_cores = cpus[:max(1, total - client)] if total > client else list(cpus)
+        waves[index].append(Placement(cell, index, server_cores, client_cores))
+    return waves
+
+
+def server_pins(wave: List[Placement]) -> Dict[str, Tuple[List[int], Optional[float]]]:
+    """Cores and `cpus` limit to give each server container for one wave.
+
+    A container running several cells of the wave gets the union of their
+    server cores and the sum of their limits (None stays unlimited).
+    """
+    pins: Dict[str, Tuple[List[int], Optional[float]]] = {}
+    for p in wave:
+        cores, limit = pins.get(p.cell.server, ([], 0.0))
+        cores = sorted(set(cores) | set(p.server_cores))
+        if limit is None or p.cell.server_cpus is None:
+            limit = None
+        else:
+            limit += p.cell.server_cpus
+        pins[p.cell.server] = (cores, limit)
+    return pins
+
+
+def wall_time(waves: List[List[Placement]]) -> float:
+    """Expected wall time of the plan: each wave lasts as long as its longest cell."""
+    return sum(max(p.cell.duration for p in wave) for wave in waves if wave)
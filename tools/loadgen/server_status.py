@@ -0,0 +1,131 @@
+"""Poll nginx stub_status and the php-fpm status page while a cell runs.
+
+Both pages are cheap counters, so they can be read several times a second
+without disturbing the run. The php-fpm page is requested as JSON
+(`?json`); its listen queue and active/idle process counts show whether
+PHP ran out of children, and stub_status shows how many connections nginx
+was reading, writing or keeping idle at the same moment.
+"""
+import json
+import re
+import threading
+import time
+import urllib.request
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+
+STATUS_HEADER = ("elapsed_s,nginx_active,nginx_reading,nginx_writing,nginx_waiting,nginx_requests,"
+                 "fpm_active,fpm_idle,fpm_total,fpm_listen_queue,fpm_listen_queue_len,fpm_max_children_reached")
+NGINX_FIELDS = ("active", "reading", "writing", "waiting", "requests")
+FPM_FIELDS = ("active", "idle", "total", "listen_queue", "listen_queue_len", "max_children_reached")
+
+
+def parse_stub_status(text: str) -> Dict[str, int]:
+    """Counters of an nginx stub_status page."""
+    active = re.search(r"Active connections:\s*(\d+)", text)
+    totals = re.search(r"^\s*(\d+)\s+(\d+)\s+(\d+)\s*$", text, re.MULTILINE)
+    states = re.search(r"Reading:\s*(\d+)\s+Writing:\s*(\d+)\s+Waiting:\s*(\d+)", text)
+    if not (active and totals and states):
+        raise ValueError("not an nginx stub_status page")
+    return {
+        "active": int(active.group(1)),
+        "accepts": int(totals.group(1)),
+        "handled": int(totals.group(2)),
+        "requests": int(totals.group(3)),
+        "reading": int(states.group(1)),
+        "writing": int(states.group(2)),
+        "waiting": int(states.group(3)),
+    }
+
+
+def parse_fpm_status(text: str) -> Dict[str, int]:
+    """Pool counters of a php-fpm status page fetched with ?json."""
+    try:
+        data = json.loads(text)
+        return {
+            "active": int(data["active processes"]),
+            "idle": int(data["idle processes"]),
+            "total": int(data["total processes"]),
+            "listen_queue": int(data["listen queue"]),
+            "listen_queue_len": int(data["listen queue len"]),
+            # Cumulative since php-fpm started
+            "max_children_reached": int(data["max children reached"]),
+            "accepted_conn": int(data["accepted conn"]),
+        }
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"not a php-fpm JSON status page: {e}") from e
+
+
+@dataclass
+class StatusSample:
+    """Both pages at one instant; a page that could not be read is None."""
+    elapsed_s: float
+    nginx: Optional[Dict[str, int]] = None
+    fpm: Optional[Dict[str, int]] = None
+
+
+class StatusPoller:
+    """Reads the status URLs every `interval` seconds on a background thread."""
+
+    def __init__(self, nginx_url: Optional[str] = None, fpm_url: Optional[str] = None,
+                 interval: float = 0.25, timeout: float = 2.0):
+        if not (nginx_url or fpm_url):
+            raise ValueError("give an nginx stub_status URL, a php-fpm status URL, or both")
+        if interval <= 0:
+            raise ValueError("interval must be > 0")
+        self.nginx_url = nginx_url
+        self.fpm_url = fpm_url
+        self.interval = interval
+        self.timeout = timeout
+        self.samples: List[StatusSample] = []
+        self.errors = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._origin = 0.0
+
+    def _fetch(self, url: Optional[str], parse) -> Optional[Dict[str, int]]:
+        if not url:
+            return None
+        try:
+            with urllib.request.urlopen(url, timeout=self.timeout) as response:
+                return parse(response.read().decode("utf-8", "replace"))
+        except (OSError, ValueError):
+            self.errors += 1
+            return None
+
+    def _sample(self) -> None:
+        elapsed = time.monotonic() - self._origin
+        nginx = self._fetch(self.nginx_url, parse_stub_status)
+        fpm = self._fetch(self.fpm_url, parse_fpm_status)
+        if nginx is not None or fpm is not None:
+            self.samples.append(StatusSample(elapsed, nginx, fpm))
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def start(self) -> "StatusPoller":
+        self._origin = time.monotonic()
+        self._sample()
+        self._thread = threading.Thread(target=self._loop, name="status-poller", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> List[StatusSample]:
+        """Stop polling and return the samples taken."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        return self.samples
+
+
+def format_status(samples: List[StatusSample]) -> str:
+    """CSV (see STATUS_HEADER), one row per poll; columns of an unreadable page are blank."""
+    lines = [STATUS_HEADER]
+    for sample in samples:
+        values = [f"{sample.elapsed_s:.3f}"]
+        values += [str(sample.nginx[name]) if sample.nginx else "" for name in NGINX_FIELDS]
+        values += [str(sample.fpm[name]) if sample.fpm else "" for name in FPM_FIELDS]
+        lines.append(",".join(values))
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,131 @@
+"""Shard one load run across CPU-pinned worker processes and merge the results."""
+import asyncio
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+
+from loadgen.histogram import LatencyHistogram
+from loadgen.http_client import EndpointResult, LoadGenerator, LoadResult
+
+
+# Seconds granted to worker processes to start up before the common start time
+START_DELAY = 0.5
+
+
+def available_cpus() -> List[int]:
+    """CPUs this process may run on (all CPUs where affinity is unsupported)."""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def parse_cpu_list(value: str) -> List[int]:
+    """Parse a taskset-style CPU list such as "0,2-3" into sorted CPU numbers."""
+    cpus = set()
+    for part in value.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        low, sep, high = part.partition("-")
+        if not low.isdigit() or (sep and not high.isdigit()):
+            raise ValueError(f"bad CPU list: {value!r}")
+        cpus.update(range(int(low), int(high if sep else low) + 1))
+    if not cpus:
+        raise ValueError(f"empty CPU list: {value!r}")
+    return sorted(cpus)
+
+
+def format_cpu_list(cpus: List[int]) -> str:
+    """Inverse of parse_cpu_list, e.g. [0, 2, 3] -> "0,2-3"."""
+    parts: List[str] = []
+    last = None
+    for cpu in sorted(cpus):
+        if last is not None and cpu == last + 1:
+            parts[-1] = f"{parts[-1].split('-')[0]}-{cpu}"
+        else:
+            parts.append(str(cpu))
+        last = cpu
+    return ",".join(parts)
+
+
+def split_evenly(total: int, parts: int) -> List[int]:
+    """Split total into `parts` integers that differ by at most one."""
+    base, extra = divmod(total, parts)
+    return [base + (1 if i < extra else 0) for i in range(parts)]
+
+
+def _run_shard(url: str, concurrency: int, duration: Optional[float], max_requests: Optional[int],
+               keepalive: bool, timeout: float, rate: Optional[float], cpu: Optional[int],
+               start_at: float, sample_every: int = 0,
+               mix: Optional[Sequence[Tuple[str, str, float]]] = None, seed: int = 0) -> LoadResult:
+    if cpu is not None and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, {cpu})
+    generator = LoadGenerator(url, concurrency=concurrency, duration=duration,
+                              max_requests=max_requests, keepalive=keepalive, timeout=timeout, rate=rate,
+                              sample_every=sample_every, mix=mix, seed=seed)
+    return asyncio.run(generator.run(start_at=start_at))
+
+
+def merge_results(results: List[LoadResult]) -> LoadResult:
+    """Combine shard results into one; histograms and per-second buckets merge exactly."""
+    merged = LoadResult(url=results[0].url, concurrency=0, keepalive=results[0].keepalive)
+    for result in results:
+        if result.target_rate is not None:
+            merged.target_rate = (merged.target_rate or 0.0) + result.target_rate
+        merged.concurrency += result.concurrency
+        merged.elapsed_s = max(merged.elapsed_s, result.elapsed_s)
+        merged.completed += result.completed
+        merged.failed += result.failed
+        merged.non_2xx += result.non_2xx
+        merged.keepalive_requests += result.keepalive_requests
+        merged.connections_opened += result.connections_opened
+        merged.bytes_received += result.bytes_received
+        merged.body_bytes += result.body_bytes
+        merged.histogram.merge(result.histogram)
+        for second, histogram in result.timeline.items():
+            merged.timeline.setdefault(second, LatencyHistogram()).merge(histogram)
+        for second, failed in result.failed_timeline.items():
+            merged.failed_timeline[second] = merged.failed_timeline.get(second, 0) + failed
+        merged.samples.extend(result.samples)
+        for name, endpoint in result.endpoints.items():
+            target = merged.endpoints.setdefault(name, EndpointResult(endpoint.weight))
+            target.completed += endpoint.completed
+            target.failed += endpoint.failed
+            target.non_2xx += endpoint.non_2xx
+            target.body_bytes += endpoint.body_bytes
+            target.histogram.merge(endpoint.histogram)
+    merged.samples.sort(key=lambda sample: sample.elapsed_s)
+    return merged
+
+
+def run_sharded(url: str, concurrency: int, workers: int, duration: Optional[float] = None,
+                max_requests: Optional[int] = None, keepalive: bool = True, timeout: float = 30.0,
+                pin: bool = True, rate: Optional[float] = None, sample_every: int = 0,
+                mix: Optional[Sequence[Tuple[str, str, float]]] = None) -> LoadResult:
+    """Run the load from `workers` processes, each with its share of connections and requests.
+
+    Worker i is pinned to the i-th available CPU (wrapping when there are
+    more workers than CPUs). All shards start at the same monotonic instant
+    so their per-second buckets line up when merged.
+
+    An open-loop `rate` is split evenly too, so each process sends
+    rate / workers requests per second on its own schedule. With a `mix`,
+    worker i draws its endpoints from a generator seeded with i, so the
+    shards do not send the same sequence in lockstep.
+    """
+    workers = max(1, min(workers, concurrency))
+    cpus = available_cpus()
+    connections = split_evenly(concurrency, workers)
+    requests = split_evenly(max_requests, workers) if max_requests is not None else [None] * workers
+    start_at = time.monotonic() + START_DELAY
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_run_shard, url, connections[i], duration, requests[i], keepalive, timeout,
+                        rate / workers if rate else None, cpus[i % len(cpus)] if pin else None, start_at,
+                        sample_every, mix, i)
+            for i in range(workers)
+        ]
+        results = [future.result() for future in futures]
+    return merge_results(results)
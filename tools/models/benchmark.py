@@ -1,5 +1,7 @@
 """Data models for benchmark results."""
 from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
 from typing import Optional, List, Dict, Any
 
 
@@ -22,6 +24,151 @@ class BenchmarkRow:
     latency_p90: str = ""
     latency_p99: str = ""
     transfer_sec: str = ""
+    # Rest of ab's percentile ladder; None for the python engine
+    latency_p66_ms: Optional[float] = None
+    latency_p80_ms: Optional[float] = None
+    latency_p95_ms: Optional[float] = None
+    latency_p98_ms: Optional[float] = None
+    latency_p100_ms: Optional[float] = None
+    # ab's "Connection Times (ms)": connect/processing/waiting/total -> min/mean/sd/median/max
+    connection_times: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    # Request accounting; None for rows written before it was recorded
+    complete_requests: Optional[int] = None
+    failed_requests: Optional[int] = None
+    # ab's split of failed_requests: connect/receive/length/exceptions; empty for the python engine
+    failed_by_class: Dict[str, int] = field(default_factory=dict)
+    non_2xx: Optional[int] = None
+    write_errors: Optional[int] = None
+
+
+@dataclass
+class RateSweepPoint:
+    """One open-loop step of a rate sweep (rate_sweep.csv row); latencies in ms."""
+    timestamp: str
+    server: str
+    endpoint: str
+    offered_rps: float
+    requests_sec: float
+    latency_avg_ms: Optional[float] = None
+    latency_p50_ms: Optional[float] = None
+    latency_p90_ms: Optional[float] = None
+    latency_p99_ms: Optional[float] = None
+    latency_p999_ms: Optional[float] = None
+    latency_max_ms: Optional[float] = None
+    failed: int = 0
+
+
+@dataclass
+class MixedWorkloadRow:
+    """One endpoint (or the "all" aggregate) of a mixed-workload run (mixed_workload.csv row); latencies in ms."""
+    timestamp: str
+    server: str
+    endpoint: str
+    weight: float
+    share: float
+    requests_sec: float
+    latency_avg_ms: Optional[float] = None
+    latency_p50_ms: Optional[float] = None
+    latency_p90_ms: Optional[float] = None
+    latency_p99_ms: Optional[float] = None
+    latency_max_ms: Optional[float] = None
+    failed: int = 0
+
+
+@dataclass
+class ParamSweepPoint:
+    """One work-size setting of a parameter sweep (param_sweep.csv row), e.g. json.php with n=20000."""
+    param: str
+    value: float
+    row: BenchmarkRow
+
+
+@dataclass
+class KeepAliveRow:
+    """One cell of keepalive.csv: a results.csv row and whether its connections were reused."""
+    keepalive: bool
+    row: BenchmarkRow
+
+
+@dataclass
+class CapacityStep:
+    """One connection level of a concurrency sweep (concurrency_sweep.csv row); latencies in ms."""
+    timestamp: str
+    server: str
+    endpoint: str
+    connections: int
+    requests_sec: float
+    slo_p99_ms: float
+    within_slo: bool
+    latency_avg_ms: Optional[float] = None
+    latency_p50_ms: Optional[float] = None
+    latency_p90_ms: Optional[float] = None
+    latency_p99_ms: Optional[float] = None
+    latency_max_ms: Optional[float] = None
+    failed: int = 0
+
+
+@dataclass
+class TimelineSeries:
+    """Per-second samples of one server/endpoint cell (timeline/<server>/<endpoint>.csv)."""
+    server: str
+    endpoint: str
+    seconds: List[int] = field(default_factory=list)
+    completed: List[int] = field(default_factory=list)
+    failed: List[int] = field(default_factory=list)
+    latency_p50_ms: List[Optional[float]] = field(default_factory=list)
+    latency_p90_ms: List[Optional[float]] = field(default_factory=list)
+    latency_p99_ms: List[Optional[float]] = field(default_factory=list)
+    latency_max_ms: List[Optional[float]] = field(default_factory=list)
+
+
+@dataclass
+class ResourceSeries:
+    """Server CPU/memory samples of one server/endpoint cell (resources/<server>/<endpoint>.csv)."""
+    server: str
+    endpoint: str
+    elapsed_s: List[float] = field(default_factory=list)
+    cpu_s: List[float] = field(default_factory=list)
+    cpu_cores: List[float] = field(default_factory=list)
+    throttled_ms: List[float] = field(default_factory=list)
+    memory_mb: List[float] = field(default_factory=list)
+
+
+@dataclass
+class ServerStatusSeries:
+    """nginx stub_status / php-fpm status polls of one cell (server_status/<server>/<endpoint>.csv).
+
+    Values are None where a page could not be read at that poll.
+    fpm_max_children_reached is php-fpm's counter since it started.
+    """
+    server: str
+    endpoint: str
+    elapsed_s: List[float] = field(default_factory=list)
+    nginx_active: List[Optional[int]] = field(default_factory=list)
+    nginx_reading: List[Optional[int]] = field(default_factory=list)
+    nginx_writing: List[Optional[int]] = field(default_factory=list)
+    nginx_waiting: List[Optional[int]] = field(default_factory=list)
+    fpm_active: List[Optional[int]] = field(default_factory=list)
+    fpm_idle: List[Optional[int]] = field(default_factory=list)
+    fpm_total: List[Optional[int]] = field(default_factory=list)
+    fpm_listen_queue: List[Optional[int]] = field(default_factory=list)
+    fpm_listen_queue_len: List[Optional[int]] = field(default_factory=list)
+    fpm_max_children_reached: List[Optional[int]] = field(default_factory=list)
+
+
+@dataclass
+class BodySampleSeries:
+    """Sampled response bodies of one cell (body_samples/<server>/<endpoint>.csv).
+
+    server_ms is the endpoint's own `elapsed_ms` (PHP hrtime around the
+    work) and pid its `getmypid()`; both are None where the body lacked them.
+    """
+    server: str
+    endpoint: str
+    elapsed_s: List[float] = field(default_factory=list)
+    latency_ms: List[float] = field(default_factory=list)
+    server_ms: List[Optional[float]] = field(default_factory=list)
+    pid: List[Optional[int]] = field(default_factory=list)
 
 
 @dataclass
@@ -70,3 +217,15 @@ class ReportPayload:
     interpretations: Dict[str, List[Interpretation]]
     has_pctl: bool
     rows: List[BenchmarkRow]
+
+
+@dataclass
+class RenderedReport:
+    """A rendered report together with the data it was built from."""
+    html: str
+    payload: Dict[str, Any]
+    rows: List[BenchmarkRow]
+    insights: List[Insight]
+    config: Dict[str, Any]
+    generated_at: datetime
+    csv_path: Path
@@ -0,0 +1,5 @@
+"""Default benchmark matrix, importable without loading the report pipeline."""
+
+# 10^6 rows needs several GB under tracemalloc; pass --sizes 1000000 (with --no-memory) to include it
+DEFAULT_SIZES = [100, 1_000, 10_000, 100_000]
+DEFAULT_SERVERS = [2, 10]
@@ -0,0 +1,64 @@
+"""Synthetic results.csv / config.json fixtures for pipeline benchmarks."""
+import csv
+import json
+import random
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import List
+
+
+CSV_FIELDS = [
+    "timestamp", "server", "endpoint", "requests_sec", "latency_avg",
+    "latency_p50", "latency_p75", "latency_p90", "latency_p99", "transfer_sec",
+]
+DEFAULT_ENDPOINTS = ["cpu.php", "json.php", "io.php"]
+BASE_SERVERS = ["xampp", "nginx_multi"]
+
+
+def server_names(count: int) -> List[str]:
+    """The two real servers first, then synthetic ones (server_3, server_4, ...)."""
+    if count < 1:
+        raise ValueError("server count must be >= 1")
+    return (BASE_SERVERS + [f"server_{i}" for i in range(3, count + 1)])[:count]
+
+
+def write_fixture(run_dir: Path, rows: int, servers: int, endpoints: List[str] = None, seed: int = 0) -> Path:
+    """Write a run directory with `rows` CSV rows spread over `servers` servers.
+
+    Rows cycle server-fastest, then endpoint, one simulated second per full
+    cycle, so every (server, endpoint) pair gets roughly rows / (S * E) samples.
+    Returns the path of the written results.csv.
+    """
+    endpoints = endpoints or DEFAULT_ENDPOINTS
+    names = server_names(servers)
+    rng = random.Random(seed)
+    base_rps = {name: rng.uniform(400.0, 4000.0) for name in names}
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    cycle = len(names) * len(endpoints)
+
+    run_dir.mkdir(parents=True, exist_ok=True)
+    csv_path = run_dir / "results.csv"
+    with csv_path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_FIELDS)
+        for i in range(rows):
+            server = names[i % len(names)]
+            endpoint = endpoints[(i // len(names)) % len(endpoints)]
+            timestamp = (start + timedelta(seconds=i // cycle)).strftime("%Y-%m-%dT%H:%M:%SZ")
+            rps = max(1.0, rng.gauss(base_rps[server], base_rps[server] * 0.05))
+            latency = 50000.0 / rps
+            writer.writerow([
+                timestamp, server, endpoint, f"{rps:.2f}", f"{latency:.2f}ms",
+                f"{latency * 0.9:.0f}", f"{latency * 1.1:.0f}", f"{latency * 1.4:.0f}", f"{latency * 2.5:.0f}",
+                f"{rps * 0.8:.2f}",
+            ])
+
+    config = {
+        "test_time": start.strftime("%Y-%m-%d %H:%M:%S"),
+        "duration": max(1, rows // cycle),
+        "connections": 50,
+        "endpoints": endpoints,
+        "endpoint_schedule": "sequential",
+    }
+    (run_dir / "config.json").write_text(json.dumps(config, indent=2), encoding="utf-8")
+    return csv_path
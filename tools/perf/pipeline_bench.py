@@ -0,0 +1,168 @@
+"""Stage timings and peak memory of the report pipeline over synthetic fixtures."""
+import json
+import platform
+import subprocess
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from generators.report_generator import ReportGenerator
+from exporters import binary_codec
+from exporters.report_sidecar import SIDECAR_SCHEMA_VERSION, ReportSidecarBuilder
+from perf.defaults import DEFAULT_SERVERS, DEFAULT_SIZES
+from perf.fixtures import write_fixture
+from utils.stage_profiler import StageProfiler
+
+
+BASELINE_VERSION = 1
+
+
+def case_key(rows: int, servers: int) -> str:
+    return f"rows={rows},servers={servers}"
+
+
+def _profile_once(generator: ReportGenerator, csv_path: Path, trace_memory: bool) -> Dict[str, Dict[str, float]]:
+    profiler = StageProfiler(trace_memory=trace_memory)
+    generator.profiler = profiler
+    profiler.start()
+    try:
+        with profiler.stage("render"):
+            report = generator.render(csv_path)
+        with profiler.stage("sidecar"):
+            text = json.dumps(ReportSidecarBuilder.build(report), default=str)
+            binary_codec.encode(json.loads(text), SIDECAR_SCHEMA_VERSION)
+    finally:
+        profiler.stop()
+    return {s["stage"]: s for s in profiler.to_dict()["stages"]}
+
+
+def run_case(rows: int, servers: int, work_dir: Path, repeat: int = 1, trace_memory: bool = True) -> Dict[str, Any]:
+    """Benchmark one fixture size.
+
+    Timings are the minimum over `repeat` untraced runs; peak memory comes
+    from one extra run under tracemalloc so tracing does not skew timings.
+    """
+    run_dir = work_dir / "results" / f"{rows}_{servers}"
+    csv_path = write_fixture(run_dir, rows, servers)
+    generator = ReportGenerator(work_dir / "results", work_dir / "reports")
+
+    stages: Dict[str, Dict[str, float]] = {}
+    for _ in range(max(1, repeat)):
+        for name, s in _profile_once(generator, csv_path, trace_memory=False).items():
+            best = stages.setdefault(name, {"wall_ms": s["wall_ms"], "cpu_ms": s["cpu_ms"]})
+            best["wall_ms"] = min(best["wall_ms"], s["wall_ms"])
+            best["cpu_ms"] = min(best["cpu_ms"], s["cpu_ms"])
+
+    if trace_memory:
+        for name, s in _profile_once(generator, csv_path, trace_memory=True).items():
+            if name in stages and "peak_kb" in s:
+                stages[name]["peak_kb"] = s["peak_kb"]
+
+    return {
+        "rows": rows,
+        "servers": servers,
+        "csv_kb": round(csv_path.stat().st_size / 1024.0, 1),
+        "stages": stages,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=Path(__file__).resolve().parent, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def run_suite(sizes: List[int], server_counts: List[int], repeat: int = 1, trace_memory: bool = True,
+              progress=None) -> Dict[str, Any]:
+    """Run every (rows, servers) combination and return the baseline document."""
+    cases = {}
+    with tempfile.TemporaryDirectory(prefix="report-perf-") as tmp:
+        for servers in server_counts:
+            for rows in sizes:
+                result = run_case(rows, servers, Path(tmp), repeat=repeat, trace_memory=trace_memory)
+                cases[case_key(rows, servers)] = result
+                if progress:
+                    progress(result)
+    return {
+        "version": BASELINE_VERSION,
+        "meta": {
+            "created_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": repeat,
+            "trace_memory": trace_memory,
+        },
+        "cases": cases,
+    }
+
+
+def load_baseline(path: Path) -> Dict[str, Any]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if data.get("version") != BASELINE_VERSION:
+        raise ValueError(f"Unsupported baseline version {data.get('version')} in {path}")
+    return data
+
+
+def save_baseline(data: Dict[str, Any], path: Path) -> Path:
+    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+    return path
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float = 0.2,
+            min_delta_ms: float = 5.0) -> List[Dict[str, Any]]:
+    """Stages that got slower (or hungrier) than baseline by more than threshold.
+
+    Cases or stages missing from either side are skipped; tiny absolute
+    changes (< min_delta_ms, or < 64 KB of peak) are ignored as noise.
+    """
+    regressions = []
+    for key, case in current["cases"].items():
+        base_case = baseline["cases"].get(key)
+        if not base_case:
+            continue
+        for stage, now in case["stages"].items():
+            before = base_case["stages"].get(stage)
+            if not before:
+                continue
+            checks = [("wall_ms", min_delta_ms), ("peak_kb", 64.0)]
+            for metric, min_delta in checks:
+                if metric not in now or metric not in before:
+                    continue
+                delta = now[metric] - before[metric]
+                if delta > min_delta and now[metric] > before[metric] * (1.0 + threshold):
+                    regressions.append({
+                        "case": key,
+                        "stage": stage,
+                        "metric": metric,
+                        "baseline": before[metric],
+                        "current": now[metric],
+                        "ratio": round(now[metric] / before[metric], 3) if before[metric] else None,
+                    })
+    return regressions
+
+
+def format_case(result: Dict[str, Any]) -> str:
+    """One summary line per case: total render time plus the slowest top-level stages."""
+    stages = result["stages"]
+    render = stages.get("render", {})
+    top = sorted(((name, s["wall_ms"]) for name, s in stages.items() if name.count(".") == 1),
+                 key=lambda item: item[1], reverse=True)[:3]
+    slowest = ", ".join(f"{name.split('.', 1)[1]} {ms:.1f}" for name, ms in top)
+    peak = f"  peak {render['peak_kb'] / 1024.0:.1f} MB" if "peak_kb" in render else ""
+    return (f"{case_key(result['rows'], result['servers']):<28} render {render.get('wall_ms', 0.0):>10.1f} ms"
+            f"{peak}  [{slowest}]")
+
+
+def format_regressions(regressions: List[Dict[str, Any]]) -> str:
+    if not regressions:
+        return "No regressions against baseline."
+    lines = [f"{len(regressions)} regression(s) against baseline:"]
+    for r in regressions:
+        lines.append(f"  {r['case']:<28} {r['stage']:<32} {r['metric']:<8} "
+                     f"{r['baseline']:>10.1f} -> {r['current']:>10.1f} (x{r['ratio']})")
+    return "\n".join(lines)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Plan which benchmark cells (server x endpoint runs) can run side by side.
+
+Each cell needs cores for its server (the compose `cpus` limit, or
+--unlimited-cores when the service has none) plus one per load generator
+worker. Cells are packed into waves of disjoint core sets; everything else
+is serialized. run_ab.sh uses this for ENDPOINT_SCHEDULE=packed.
+
+Output (default) is one line per cell for the shell:
+  WAVE SERVER ENDPOINT CLIENT_CORES SERVER_CORES SERVICE SERVER_CPUS
+where SERVER_CORES and SERVER_CPUS are what the service's container is
+pinned to for the wave: the union of the cores of all its cells in that
+wave and the sum of their cpus limits ("-" = unlimited).
+
+Usage:
+  python tools/plan_cells.py --compose docker-compose.yml \
+      --cell xampp:cpu.php:30 --cell nginx_multi:cpu.php:30 --cell xampp:io.php:10
+  python tools/plan_cells.py --server-cpus "xampp=1.0 nginx_multi=2" --client-cpus 2 \
+      --cpus 0-7 --format text --cell xampp:cpu.php:30 --cell nginx_multi:cpu.php:30
+"""
+
+from pathlib import Path
+import argparse
+import sys
+from typing import Tuple
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+
+def parse_cell(value: str) -> Tuple[str, str, float]:
+    """Parse SERVER:ENDPOINT:DURATION for --cell."""
+    try:
+        server, endpoint, duration = value.split(":")
+        return server, endpoint, float(duration)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected SERVER:ENDPOINT:DURATION, got {value!r}")
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Pack benchmark cells onto disjoint cores.")
+    parser.add_argument("--cell", dest="cells", type=parse_cell, action="append", required=True,
+                        metavar="SERVER:ENDPOINT:DURATION", help="one server/endpoint run (repeatable)")
+    parser.add_argument("--compose", type=Path, default=None,
+                        help="docker-compose file to read the services' cpus limits from")
+    parser.add_argument("--server-cpus", default="", metavar="SERVER=CPUS,...",
+                        help="cpus limit per server, overriding --compose; blank value = unlimited")
+    parser.add_argument("--client-cpus", type=int, default=1,
+                        help="cores per load generator, i.e. its worker count (default: 1)")
+    parser.add_argument("--unlimited-cores", type=int, default=None,
+                        help="server cores per cell for a service without a cpus limit (default: 2)")
+    parser.add_argument("--cpus", default=None, metavar="LIST",
+                        help="cores to schedule on, e.g. 0-7 (default: every core this process may use)")
+    parser.add_argument("--format", choices=("plan", "text"), default="plan",
+                        help="machine-readable plan lines (default) or a human summary")
+    args = parser.parse_args(argv)
+    if args.client_cpus < 1:
+        parser.error("--client-cpus must be >= 1")
+    if args.unlimited_cores is not None and args.unlimited_cores < 1:
+        parser.error("--unlimited-cores must be >= 1")
+    return args
+
+
+def main(argv=None):
+    """Main entry point for the cell planner."""
+    args = parse_args(argv)
+    from loadgen.scheduler import (UNLIMITED_SERVER_CORES, Cell, parse_compose_cpus, parse_server_cpus,
+                                   plan_waves, server_pins, service_name, wall_time)
+    from loadgen.sharding import available_cpus, format_cpu_list, parse_cpu_list
+
+    try:
+        limits = {}
+        if args.compose:
+            limits = parse_compose_cpus(args.compose.read_text(encoding="utf-8"))
+        overrides = parse_server_cpus(args.server_cpus)
+        cpus = parse_cpu_list(args.cpus) if args.cpus else available_cpus()
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    cells = []
+    for server, endpoint, duration in args.cells:
+        cpus_limit = overrides[server] if server in overrides else limits.get(service_name(server))
+        cells.append(Cell(server, endpoint, duration, server_cpus=cpus_limit, client_cpus=args.client_cpus))
+    unlimited_cores = args.unlimited_cores or UNLIMITED_SERVER_CORES
+    waves = plan_waves(cells, cpus, unlimited_cores)
+
+    if args.format == "plan":
+        for wave in waves:
+            pins = server_pins(wave)
+            for p in wave:
+                cores, limit = pins[p.cell.server]
+                quota = "-" if limit is None else f"{limit:g}"
+                print(f"{p.wave} {p.cell.server} {p.cell.endpoint} {format_cpu_list(p.client_cores)} "
+                      f"{format_cpu_list(cores)} {service_name(p.cell.server)} {quota}")
+        return 0
+
+    serial = sum(cell.duration for cell in cells)
+    print(f"{len(cells)} cells on {len(cpus)} cores ({format_cpu_list(cpus)}) in {len(waves)} waves")
+    for wave in waves:
+        print(f"wave {wave[0].wave}: ~{max(p.cell.duration for p in wave):g}s")
+        for p in wave:
+            limit = f"unlimited ({unlimited_cores})" if p.cell.server_cpus is None else f"{p.cell.server_cpus:g}"
+            note = "  (oversubscribed: needs more cores than available)" if p.oversubscribed else ""
+            print(f"  {p.cell.server:<14} {p.cell.endpoint:<10} {p.cell.duration:>6g}s  "
+                  f"server cpus={limit:<9} on {format_cpu_list(p.server_cores):<8} "
+                  f"client on {format_cpu_list(p.client_cores)}{note}")
+    print(f"expected wall time ~{wall_time(waves):g}s (one cell at a time: {serial:g}s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,9 @@
 """Data processors for benchmark analysis."""
+import math
 from collections import defaultdict
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
 
-from models.benchmark import BenchmarkRow, ChartData, PercentileData, Insight, Interpretation
+from models.benchmark import BenchmarkRow, BodySampleSeries, CapacityStep, ChartData, PercentileData, Insight, Interpretation, KeepAliveRow, MixedWorkloadRow, ParamSweepPoint, RateSweepPoint, ResourceSeries, ServerStatusSeries, TimelineSeries
 from i18n.texts import get_text
 
 
@@ -46,6 +47,34 @@ class ChartDataProcessor:
         
         return charts, endpoints
     
+    @staticmethod
+    def process_timelines(timelines: List[TimelineSeries]) -> Optional[Dict[str, Any]]:
+        """
+        Per-second throughput and latency series, one per server/endpoint cell.
+        
+        Returns:
+            {"series": [{server, endpoint, label, t, requests, failed, p50, p99, max}]},
+            or None when the run recorded no timelines.
+        """
+        if not timelines:
+            return None
+        return {
+            "series": [
+                {
+                    "server": cell.server,
+                    "endpoint": cell.endpoint,
+                    "label": format_endpoint_label(cell.endpoint),
+                    "t": cell.seconds,
+                    "requests": cell.completed,
+                    "failed": cell.failed,
+                    "p50": cell.latency_p50_ms,
+                    "p99": cell.latency_p99_ms,
+                    "max": cell.latency_max_ms,
+                }
+                for cell in timelines
+            ]
+        }
+    
     @staticmethod
     def _build_chart_data(by_endpoint, endpoints, accessor) -> ChartData:
         """Build a single chart dataset."""
@@ -113,6 +142,679 @@ class ChartDataProcessor:
         return {"labels": labels, "values": values}
 
 
+class RateSweepProcessor:
+    """Turns open-loop sweep points into latency-versus-offered-load series."""
+    
+    @staticmethod
+    def process(points: List[RateSweepPoint]) -> Optional[Dict[str, Any]]:
+        """
+        One series per (server, endpoint), ordered by offered rate.
+        
+        Returns:
+            {"series": [{server, endpoint, label, offered, achieved, p50, p90, p99, p999, failed}]},
+            or None when the run has no sweep.
+        """
+        if not points:
+            return None
+        
+        by_key = defaultdict(dict)
+        for point in points:
+            # A repeated rate (e.g. a re-run sweep) keeps the latest measurement
+            by_key[(point.server, point.endpoint)][point.offered_rps] = point
+        
+        series = []
+        for (server, endpoint), by_rate in sorted(by_key.items(), key=lambda item: (item[0][1], item[0][0])):
+            ordered = [by_rate[rate] for rate in sorted(by_rate)]
+            series.append({
+                "server": server,
+                "endpoint": endpoint,
+                "label": format_endpoint_label(endpoint),
+                "offered": [p.offered_rps for p in ordered],
+                "achieved": [p.requests_sec for p in ordered],
+                "p50": [p.latency_p50_ms for p in ordered],
+                "p90": [p.latency_p90_ms for p in ordered],
+                "p99": [p.latency_p99_ms for p in ordered],
+                "p999": [p.latency_p999_ms for p in ordered],
+                "failed": [p.failed for p in ordered],
+            })
+        return {"series": series}
+
+
+class CapacityProcessor:
+    """Summarizes concurrency sweeps as throughput curves and max RPS within the p99 SLO."""
+    
+    @staticmethod
+    def process(steps: List[CapacityStep]) -> Optional[Dict[str, Any]]:
+        """
+        One curve and one capacity figure per (server, endpoint).
+        
+        Returns:
+            {"series": [{server, endpoint, label, slo_p99_ms, connections, requests_sec, p99, within_slo,
+                         max_rps, max_rps_connections, max_rps_p99}]},
+            or None when the run has no concurrency sweep. max_rps is None when
+            no level met the SLO.
+        """
+        if not steps:
+            return None
+        
+        by_key = defaultdict(dict)
+        for step in steps:
+            by_key[(step.server, step.endpoint)][step.connections] = step
+        
+        series = []
+        for (server, endpoint), by_level in sorted(by_key.items(), key=lambda item: (item[0][1], item[0][0])):
+            ordered = [by_level[level] for level in sorted(by_level)]
+            passing = [step for step in ordered if step.within_slo]
+            best = max(passing, key=lambda step: step.requests_sec) if passing else None
+            series.append({
+                "server": server,
+                "endpoint": endpoint,
+                "label": format_endpoint_label(endpoint),
+                "slo_p99_ms": ordered[-1].slo_p99_ms,
+                "connections": [step.connections for step in ordered],
+                "requests_sec": [step.requests_sec for step in ordered],
+                "p99": [step.latency_p99_ms for step in ordered],
+                "within_slo": [step.within_slo for step in ordered],
+                "max_rps": best.requests_sec if best else None,
+                "max_rps_connections": best.connections if best else None,
+                "max_rps_p99": best.latency_p99_ms if best else None,
+            })
+        return {"series": series}
+
+
+class KeepAliveProcessor:
+    """Compares each cell run with reused connections against one connection per request."""
+    
+    @staticmethod
+    def process(rows: List[KeepAliveRow]) -> Optional[Dict[str, Any]]:
+        """
+        Keep-alive speedup per server and endpoint.
+        
+        Returns:
+            {"cells": [{server, endpoint, label, close_rps, keepalive_rps, speedup,
+                        close_latency_ms, keepalive_latency_ms, close_p99, keepalive_p99, latency_saved_ms}],
+             "servers": [{server, speedup, endpoints}]},
+            or None when no cell ran in both modes. speedup is keep-alive req/s
+            over close req/s; a server's speedup is the geometric mean over its
+            endpoints.
+        """
+        by_cell = defaultdict(dict)
+        for r in rows:
+            # A repeated cell keeps the latest measurement
+            by_cell[(r.row.endpoint, r.row.server)][r.keepalive] = r.row
+        
+        cells = []
+        for (endpoint, server), modes in sorted(by_cell.items()):
+            close, reused = modes.get(False), modes.get(True)
+            if close is None or reused is None or close.requests_sec <= 0:
+                continue
+            cells.append({
+                "server": server,
+                "endpoint": endpoint,
+                "label": format_endpoint_label(endpoint),
+                "close_rps": close.requests_sec,
+                "keepalive_rps": reused.requests_sec,
+                "speedup": reused.requests_sec / close.requests_sec,
+                "close_latency_ms": close.latency_ms,
+                "keepalive_latency_ms": reused.latency_ms,
+                "close_p99": close.latency_p99_ms,
+                "keepalive_p99": reused.latency_p99_ms,
+                "latency_saved_ms": close.latency_ms - reused.latency_ms,
+            })
+        if not cells:
+            return None
+        
+        speedups = defaultdict(list)
+        for c in cells:
+            if c["speedup"] > 0:
+                speedups[c["server"]].append(c["speedup"])
+        servers = [
+            {"server": server, "speedup": math.exp(sum(math.log(s) for s in values) / len(values)),
+             "endpoints": len(values)}
+            for server, values in sorted(speedups.items())
+        ]
+        return {"cells": cells, "servers": servers}
+
+
+class ParamSweepProcessor:
+    """Fits a linear cost model (fixed per-request overhead + cost per unit of work) to parameter sweeps."""
+    
+    @staticmethod
+    def fit_linear(xs: List[float], ys: List[float]) -> Optional[Dict[str, float]]:
+        """Least-squares y = fixed + per_unit * x; None with fewer than two distinct x."""
+        n = len(xs)
+        if n < 2 or len(set(xs)) < 2:
+            return None
+        mean_x = sum(xs) / n
+        mean_y = sum(ys) / n
+        sxx = sum((x - mean_x) ** 2 for x in xs)
+        sxy = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+        per_unit = sxy / sxx
+        fixed = mean_y - per_unit * mean_x
+        ss_total = sum((y - mean_y) ** 2 for y in ys)
+        ss_residual = sum((y - fixed - per_unit * x) ** 2 for x, y in zip(xs, ys))
+        return {"fixed": fixed, "per_unit": per_unit, "r2": 1.0 - ss_residual / ss_total if ss_total > 0 else 1.0}
+    
+    @staticmethod
+    def process(points: List[ParamSweepPoint]) -> Optional[Dict[str, Any]]:
+        """
+        Cost curves per (server, endpoint, parameter) and the stacks compared at each value.
+        
+        Two models are fitted against the parameter value: mean latency in ms,
+        and capacity cost per request (1000 / req/s, the ms of server capacity
+        each request takes at the sweep's connection count). crossover is the
+        value where the per-unit cost catches up with the fixed overhead:
+        below it the fixed per-request overhead dominates latency.
+        
+        Returns:
+            {"series": [{server, endpoint, label, param, values, requests_sec, latency_ms, p99,
+                         latency_fit, cost_fit, crossover}],
+             "comparison": [{endpoint, label, param, values, rps_ratio}]},
+            or None without a sweep. Fits are {fixed, per_unit, r2} or None;
+            rps_ratio is nginx_multi req/s over xampp req/s at each value both ran.
+        """
+        if not points:
+            return None
+        
+        by_key = defaultdict(dict)
+        for point in points:
+            # A repeated value keeps the latest measurement
+            by_key[(point.row.endpoint, point.param, point.row.server)][point.value] = point.row
+        
+        series = []
+        for (endpoint, param, server), by_value in sorted(by_key.items()):
+            values = sorted(by_value)
+            ordered = [by_value[value] for value in values]
+            latency_fit = ParamSweepProcessor.fit_linear(values, [row.latency_ms for row in ordered])
+            measured = [(value, 1000.0 / row.requests_sec) for value, row in zip(values, ordered) if row.requests_sec > 0]
+            cost_fit = ParamSweepProcessor.fit_linear([x for x, _ in measured], [y for _, y in measured])
+            crossover = None
+            if latency_fit and latency_fit["per_unit"] > 0 and latency_fit["fixed"] > 0:
+                crossover = latency_fit["fixed"] / latency_fit["per_unit"]
+            series.append({
+                "server": server,
+                "endpoint": endpoint,
+                "label": format_endpoint_label(endpoint),
+                "param": param,
+                "values": values,
+                "requests_sec": [row.requests_sec for row in ordered],
+                "latency_ms": [row.latency_ms for row in ordered],
+                "p99": [row.latency_p99_ms for row in ordered],
+                "latency_fit": latency_fit,
+                "cost_fit": cost_fit,
+                "crossover": crossover,
+            })
+        
+        comparison = []
+        for endpoint, param in sorted({(endpoint, param) for endpoint, param, _ in by_key}):
+            xampp = by_key.get((endpoint, param, "xampp"), {})
+            nginx = by_key.get((endpoint, param, "nginx_multi"), {})
+            values = sorted(value for value in set(xampp) & set(nginx) if xampp[value].requests_sec > 0)
+            if values:
+                comparison.append({
+                    "endpoint": endpoint,
+                    "label": format_endpoint_label(endpoint),
+                    "param": param,
+                    "values": values,
+                    "rps_ratio": [nginx[value].requests_sec / xampp[value].requests_sec for value in values],
+                })
+        return {"series": series, "comparison": comparison}
+
+
+class MixedWorkloadProcessor:
+    """Compares each endpoint inside a weighted mix with the same endpoint run on its own."""
+    
+    # Endpoint name of the aggregate row in mixed_workload.csv
+    TOTAL = "all"
+    
+    @staticmethod
+    def process(mixed: List[MixedWorkloadRow], rows: List[BenchmarkRow]) -> Optional[Dict[str, Any]]:
+        """
+        Per-endpoint and aggregate figures of the mixed runs, next to the isolated cells.
+        
+        An endpoint whose p99 grows in the mix is waiting behind the others
+        (head-of-line blocking on connections, or contention for the same
+        Apache children / php-fpm workers).
+        
+        Returns:
+            {"aggregate": [{server, requests_sec, p50, p99, failed}],
+             "endpoints": [{server, endpoint, label, weight, share, requests_sec, p50, p99,
+                            isolated_p99, p99_ratio, failed}]},
+            or None when the run has no mixed workload. isolated_p99 and
+            p99_ratio (mixed / isolated) are None without a matching cell.
+        """
+        if not mixed:
+            return None
+        
+        latest = {}
+        for row in mixed:
+            # A repeated mixed run keeps the latest measurement
+            latest[(row.server, row.endpoint)] = row
+        isolated = {(row.server, row.endpoint): row.latency_p99_ms for row in rows}
+        
+        aggregate = []
+        endpoints = []
+        for (server, endpoint), row in sorted(latest.items(), key=lambda item: (item[0][1], item[0][0])):
+            if endpoint == MixedWorkloadProcessor.TOTAL:
+                aggregate.append({
+                    "server": server,
+                    "requests_sec": row.requests_sec,
+                    "p50": row.latency_p50_ms,
+                    "p99": row.latency_p99_ms,
+                    "failed": row.failed,
+                })
+                continue
+            alone = isolated.get((server, endpoint))
+            endpoints.append({
+                "server": server,
+                "endpoint": endpoint,
+                "label": format_endpoint_label(endpoint),
+                "weight": row.weight,
+                "share": row.share,
+                "requests_sec": row.requests_sec,
+                "p50": row.latency_p50_ms,
+                "p99": row.latency_p99_ms,
+                "isolated_p99": alone,
+                "p99_ratio": row.latency_p99_ms / alone if alone and row.latency_p99_ms is not None else None,
+                "failed": row.failed,
+            })
+        return {"aggregate": aggregate, "endpoints": endpoints}
+
+
+class ResourceProcessor:
+    """Relates each cell's server CPU and memory use to the throughput it delivered."""
+    
+    @staticmethod
+    def process(series: List[ResourceSeries], rows: List[BenchmarkRow]) -> Optional[Dict[str, Any]]:
+        """
+        Resource timelines plus efficiency figures per (server, endpoint).
+        
+        Returns:
+            {"series": [{server, endpoint, label, t, cpu_cores, memory_mb, throttled_ms}],
+             "efficiency": [{server, endpoint, label, requests_sec, cpu_s, avg_cores, req_per_cpu_s,
+                             peak_memory_mb, rps_per_mb, throttled_ms}]},
+            or None when no resources were sampled. Ratios are None when the
+            cell has no results row or used no measurable CPU/memory.
+        """
+        if not series:
+            return None
+        
+        requests = {(row.server, row.endpoint): row.requests_sec for row in rows}
+        timelines = []
+        efficiency = []
+        for cell in series:
+            label = format_endpoint_label(cell.endpoint)
+            timelines.append({
+                "server": cell.server,
+                "endpoint": cell.endpoint,
+                "label": label,
+                "t": cell.elapsed_s,
+                "cpu_cores": cell.cpu_cores,
+                "memory_mb": cell.memory_mb,
+                "throttled_ms": cell.throttled_ms,
+            })
+            cpu_s = sum(cell.cpu_s)
+            span = cell.elapsed_s[-1]
+            avg_cores = cpu_s / span if span > 0 else 0.0
+            peak_memory = max(cell.memory_mb)
+            rps = requests.get((cell.server, cell.endpoint))
+            efficiency.append({
+                "server": cell.server,
+                "endpoint": cell.endpoint,
+                "label": label,
+                "requests_sec": rps,
+                "cpu_s": cpu_s,
+                "avg_cores": avg_cores,
+                # requests/sec per core busy = requests served per CPU-second
+                "req_per_cpu_s": rps / avg_cores if rps is not None and avg_cores > 0 else None,
+                "peak_memory_mb": peak_memory,
+                "rps_per_mb": rps / peak_memory if rps is not None and peak_memory > 0 else None,
+                "throttled_ms": sum(cell.throttled_ms),
+            })
+        return {"series": timelines, "efficiency": efficiency}
+
+
+class ServerStatusProcessor:
+    """Turns nginx/php-fpm status polls into saturation series and a per-cell diagnosis."""
+    
+    @staticmethod
+    def process(series: List[ServerStatusSeries]) -> Optional[Dict[str, Any]]:
+        """
+        Status timelines plus peak values and saturation causes per (server, endpoint).
+        
+        Returns:
+            {"series": [{server, endpoint, label, t, nginx_active, nginx_writing, nginx_waiting,
+                         fpm_active, fpm_idle, fpm_listen_queue}],
+             "summary": [{server, endpoint, label, peak_nginx_active, peak_fpm_active, fpm_total,
+                          min_fpm_idle, peak_listen_queue, listen_queue_len, max_children_reached,
+                          causes}]},
+            or None when nothing was polled. causes lists "max_children" (php-fpm
+            hit pm.max_children during the cell), "listen_queue" (requests waited
+            for a free child) and "no_idle" (every child was busy at some poll).
+        """
+        if not series:
+            return None
+        
+        def peak(values):
+            present = [v for v in values if v is not None]
+            return max(present) if present else None
+        
+        def lowest(values):
+            present = [v for v in values if v is not None]
+            return min(present) if present else None
+        
+        timelines = []
+        summary = []
+        for cell in series:
+            label = format_endpoint_label(cell.endpoint)
+            timelines.append({
+                "server": cell.server,
+                "endpoint": cell.endpoint,
+                "label": label,
+                "t": cell.elapsed_s,
+                "nginx_active": cell.nginx_active,
+                "nginx_writing": cell.nginx_writing,
+                "nginx_waiting": cell.nginx_waiting,
+                "fpm_active": cell.fpm_active,
+                "fpm_idle": cell.fpm_idle,
+                "fpm_listen_queue": cell.fpm_listen_queue,
+            })
+            reached = [v for v in cell.fpm_max_children_reached if v is not None]
+            # The counter is cumulative since php-fpm started; only growth during the cell counts
+            max_children = reached[-1] - reached[0] if reached else None
+            peak_queue = peak(cell.fpm_listen_queue)
+            min_idle = lowest(cell.fpm_idle)
+            causes = []
+            if max_children:
+                causes.append("max_children")
+            if peak_queue:
+                causes.append("listen_queue")
+            if min_idle == 0 and not max_children:
+                causes.append("no_idle")
+            summary.append({
+                "server": cell.server,
+                "endpoint": cell.endpoint,
+                "label": label,
+                "peak_nginx_active": peak(cell.nginx_active),
+                "peak_fpm_active": peak(cell.fpm_active),
+                "fpm_total": peak(cell.fpm_total),
+                "min_fpm_idle": min_idle,
+                "peak_listen_queue": peak_queue,
+                "listen_queue_len": peak(cell.fpm_listen_queue_len),
+                "max_children_reached": max_children,
+                "causes": causes,
+            })
+        return {"series": timelines, "summary": summary}
+
+
+class LatencyBreakdownProcessor:
+    """Splits client latency into PHP execution and everything around it, from sampled bodies."""
+    
+    @staticmethod
+    def process(series: List[BodySampleSeries]) -> Optional[Dict[str, Any]]:
+        """
+        Pair each sampled body's elapsed_ms with the client latency of the same request.
+        
+        Whatever the client waited beyond PHP's own timer is overhead: accept and
+        listen queues, web server to php-fpm hand-off, and network transport.
+        
+        Returns:
+            {"cells": [{server, endpoint, label, samples, latency_ms, server_ms, overhead_ms,
+                        server_share, latency_p99_ms, overhead_p50_ms, overhead_p99_ms}]},
+            or None when no sample carried elapsed_ms. Times are means in ms
+            unless suffixed with a percentile; server_share is the PHP share of
+            mean latency in percent.
+        """
+        def percentile(values: List[float], pct: float) -> float:
+            # Nearest rank on the sorted samples
+            return values[max(0, math.ceil(pct / 100.0 * len(values)) - 1)]
+        
+        cells = []
+        for cell in series:
+            pairs = [(latency, server_ms) for latency, server_ms in zip(cell.latency_ms, cell.server_ms)
+                     if server_ms is not None]
+            if not pairs:
+                continue
+            latencies = sorted(latency for latency, _ in pairs)
+            overheads = sorted(max(0.0, latency - server_ms) for latency, server_ms in pairs)
+            latency_ms = sum(latencies) / len(latencies)
+            server_ms = sum(server_ms for _, server_ms in pairs) / len(pairs)
+            cells.append({
+                "server": cell.server,
+                "endpoint": cell.endpoint,
+                "label": format_endpoint_label(cell.endpoint),
+                "samples": len(pairs),
+                "latency_ms": latency_ms,
+                "server_ms": server_ms,
+                "overhead_ms": sum(overheads) / len(overheads),
+                "server_share": min(100.0, server_ms / latency_ms * 100.0) if latency_ms > 0 else None,
+                "latency_p99_ms": percentile(latencies, 99),
+                "overhead_p50_ms": percentile(overheads, 50),
+                "overhead_p99_ms": percentile(overheads, 99),
+            })
+        return {"cells": cells} if cells else None
+
+
+class ConnectionTimesProcessor:
+    """Splits ab's per-request time into connect, waiting and receive, and collects its percentile ladder."""
+    
+    PHASES = ("connect", "waiting", "receive")
+    
+    @staticmethod
+    def process(rows: List[BenchmarkRow]) -> Optional[Dict[str, Any]]:
+        """
+        Connection phases and the full percentile ladder per (server, endpoint).
+        
+        ab's Processing time runs from the request being written to the last
+        byte read and contains Waiting (to the first byte), so receive is
+        Processing - Waiting. A long connect means requests sat in the accept
+        queue; a long wait is the web server and PHP producing the response.
+        
+        Returns:
+            {"cells": [{server, endpoint, label, connect_ms, waiting_ms, receive_ms, total_ms,
+                        connect_median_ms, connect_sd_ms, connect_max_ms, waiting_median_ms,
+                        total_median_ms, dominant}],
+             "ladder": [{server, endpoint, label, percentiles, latency_ms}]},
+            or None when no row has either. Phase times are ab's means; dominant
+            is the phase with the largest mean. The last row of a cell wins.
+        """
+        latest = {}
+        for row in rows:
+            latest[(row.endpoint, row.server)] = row
+        
+        cells = []
+        ladder = []
+        for (endpoint, server), row in sorted(latest.items()):
+            times = row.connection_times
+            if all(phase in times for phase in ("connect", "processing", "waiting", "total")):
+                means = {
+                    "connect": times["connect"]["mean"],
+                    "waiting": times["waiting"]["mean"],
+                    "receive": max(0.0, times["processing"]["mean"] - times["waiting"]["mean"]),
+                }
+                cells.append({
+                    "server": server,
+                    "endpoint": endpoint,
+                    "label": format_endpoint_label(endpoint),
+                    "connect_ms": means["connect"],
+                    "waiting_ms": means["waiting"],
+                    "receive_ms": means["receive"],
+                    "total_ms": times["total"]["mean"],
+                    "connect_median_ms": times["connect"]["median"],
+                    "connect_sd_ms": times["connect"]["sd"],
+                    "connect_max_ms": times["connect"]["max"],
+                    "waiting_median_ms": times["waiting"]["median"],
+                    "total_median_ms": times["total"]["median"],
+                    "dominant": max(ConnectionTimesProcessor.PHASES, key=lambda phase: means[phase]),
+                })
+            
+            rungs = [(50, row.latency_p50_ms), (66, row.latency_p66_ms), (75, row.latency_p75_ms),
+                     (80, row.latency_p80_ms), (90, row.latency_p90_ms), (95, row.latency_p95_ms),
+                     (98, row.latency_p98_ms), (99, row.latency_p99_ms), (100, row.latency_p100_ms)]
+            # Rows recorded before the ladder columns only have the four percentiles charted elsewhere
+            if any(value is not None for pct, value in rungs if pct in (66, 80, 95, 98, 100)):
+                measured = [(pct, value) for pct, value in rungs if value is not None]
+                ladder.append({
+                    "server": server,
+                    "endpoint": endpoint,
+                    "label": format_endpoint_label(endpoint),
+                    "percentiles": [pct for pct, _ in measured],
+                    "latency_ms": [value for _, value in measured],
+                })
+        if not (cells or ladder):
+            return None
+        return {"cells": cells, "ladder": ladder}
+
+
+class ErrorAccountingProcessor:
+    """Counts failed requests by class and discounts raw throughput to goodput."""
+    
+    # Share of attempted requests that failed before a cell is reported as a warning
+    WARN_ERROR_RATE = 0.01
+    
+    @staticmethod
+    def account(row: BenchmarkRow) -> Optional[Dict[str, Any]]:
+        """
+        Errors, error rate and goodput of one results row.
+        
+        Errors are non-2xx responses, write errors and failed requests, except
+        ab's Length class: ab compares every body with the first one's length,
+        so PHP output that varies in size fails there without anything going
+        wrong. ab counts connect failures before a request exists and the
+        python engine (which does not split its failures) never completes a
+        failed request, so those are added to the completed count to get the
+        attempts; ab's other classes are already part of it.
+        
+        Returns:
+            {attempted, errors, error_rate, goodput_rps}, or None when the row
+            has no request accounting. goodput_rps is successful requests/sec.
+        """
+        if row.complete_requests is None or row.failed_requests is None:
+            return None
+        failures = row.failed_by_class
+        if failures:
+            failed = failures["connect"] + failures["receive"] + failures["exceptions"]
+            outside = failures["connect"]
+        else:
+            failed = outside = row.failed_requests
+        errors = failed + (row.non_2xx or 0) + (row.write_errors or 0)
+        attempted = row.complete_requests + outside
+        successful = max(0, attempted - errors)
+        return {
+            "attempted": attempted,
+            "errors": errors,
+            "error_rate": errors / attempted if attempted else 0.0,
+            # requests_sec is completed requests over the run, so scale it by the successful share
+            "goodput_rps": row.requests_sec * successful / row.complete_requests if row.complete_requests else 0.0,
+        }
+    
+    @staticmethod
+    def process(rows: List[BenchmarkRow]) -> Optional[Dict[str, Any]]:
+        """
+        Error classes and goodput per (server, endpoint).
+        
+        Under overload one stack may answer fast 502s while the other queues
+        requests, so raw requests/sec favours the one that is failing;
+        goodput counts only the requests that got a usable response.
+        
+        Returns:
+            {"cells": [{server, endpoint, label, requests_sec, goodput_rps, attempted,
+                        errors, error_rate, non_2xx, write_errors, failed_connect,
+                        failed_receive, failed_length, failed_exceptions}]},
+            or None when no row has request accounting. The failed_* classes
+            are None for the python engine. The last row of a cell wins.
+        """
+        latest = {}
+        for row in rows:
+            latest[(row.endpoint, row.server)] = row
+        
+        cells = []
+        for (endpoint, server), row in sorted(latest.items()):
+            accounting = ErrorAccountingProcessor.account(row)
+            if accounting is None:
+                continue
+            cell = {
+                "server": server,
+                "endpoint": endpoint,
+                "label": format_endpoint_label(endpoint),
+                "requests_sec": row.requests_sec,
+                **accounting,
+                "non_2xx": row.non_2xx,
+                "write_errors": row.write_errors,
+            }
+            for name in ("connect", "receive", "length", "exceptions"):
+                cell[f"failed_{name}"] = row.failed_by_class.get(name)
+            cells.append(cell)
+        if not cells:
+            return None
+        return {"cells": cells}
+
+
+class WorkerDistributionProcessor:
+    """Spreads sampled responses over the PIDs that served them (Apache children, php-fpm workers)."""
+    
+    @staticmethod
+    def gini(counts: List[int]) -> float:
+        """Gini coefficient of requests per worker: 0 = perfectly even, towards 1 = one worker does it all."""
+        total = sum(counts)
+        if not counts or total == 0:
+            return 0.0
+        ordered = sorted(counts)
+        n = len(ordered)
+        weighted = sum((i + 1) * value for i, value in enumerate(ordered))
+        return 2.0 * weighted / (n * total) - (n + 1.0) / n
+    
+    @staticmethod
+    def process(series: List[BodySampleSeries]) -> Optional[Dict[str, Any]]:
+        """
+        Requests per worker, their Gini coefficient and worker churn per (server, endpoint).
+        
+        Only sampled responses are seen, so a worker that served few requests
+        may show up late or not at all; churn is meaningful at a sampling
+        rate of at least a few samples per worker per second.
+        
+        Returns:
+            {"cells": [{server, endpoint, label, samples, workers, gini, busiest_share,
+                        requests_per_worker (descending), new_workers, t, active_workers,
+                        new_per_second}]},
+            or None when no sample carried a pid. busiest_share is the busiest
+            worker's share of samples in percent; new_workers counts PIDs first
+            seen after the first second of the run.
+        """
+        cells = []
+        for cell in series:
+            seen = [(int(elapsed), pid) for elapsed, pid in zip(cell.elapsed_s, cell.pid) if pid is not None]
+            if not seen:
+                continue
+            counts: Dict[int, int] = defaultdict(int)
+            first_second: Dict[int, int] = {}
+            per_second: Dict[int, set] = defaultdict(set)
+            for second, pid in seen:
+                counts[pid] += 1
+                first_second.setdefault(pid, second)
+                per_second[second].add(pid)
+            start = min(first_second.values())
+            seconds = list(range(start, max(per_second) + 1))
+            new_per_second = [sum(1 for first in first_second.values() if first == second and second > start)
+                              for second in seconds]
+            requests_per_worker = sorted(counts.values(), reverse=True)
+            cells.append({
+                "server": cell.server,
+                "endpoint": cell.endpoint,
+                "label": format_endpoint_label(cell.endpoint),
+                "samples": len(seen),
+                "workers": len(counts),
+                "gini": WorkerDistributionProcessor.gini(requests_per_worker),
+                "busiest_share": requests_per_worker[0] / len(seen) * 100.0,
+                "requests_per_worker": requests_per_worker,
+                "new_workers": sum(new_per_second),
+                "t": seconds,
+                "active_workers": [len(per_second.get(second, ())) for second in seconds],
+                "new_per_second": new_per_second,
+            })
+        return {"cells": cells} if cells else None
+
+
 class HistogramDataProcessor:
     """Processes data into histogram format."""
     
@@ -292,3 +994,36 @@ class InterpretationBuilder:
         
         return notes
 
+
+
+class RunSummaryBuilder:
+    """Builds headline metrics for a single run (used by the run index)."""
+    
+    SERVERS = ("xampp", "nginx_multi")
+    
+    @staticmethod
+    def build(rows: List[BenchmarkRow], config: Dict[str, Any]) -> Dict[str, Any]:
+        """Summarize average throughput, latency and the overall winner per run."""
+        servers = {}
+        for server in RunSummaryBuilder.SERVERS:
+            server_rows = [r for r in rows if r.server == server]
+            if not server_rows:
+                continue
+            servers[server] = {
+                "requests_sec": sum(r.requests_sec for r in server_rows) / len(server_rows),
+                "latency_ms": sum(r.latency_ms for r in server_rows) / len(server_rows),
+            }
+        
+        winner = "N/A"
+        if servers:
+            winner = max(servers, key=lambda name: servers[name]["requests_sec"])
+        
+        return {
+            "test_time": config.get("test_time", "N/A"),
+            "duration": config.get("duration", "N/A"),
+            "connections": config.get("connections", "N/A"),
+            "endpoints": sorted({r.endpoint for r in rows}),
+            "row_count": len(rows),
+            "servers": servers,
+            "winner": winner,
+        }
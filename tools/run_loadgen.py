@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+Asyncio HTTP load generator with ApacheBench-compatible flags and output.
+
+Drop-in for `ab` in benchmark/run_ab.sh (LOAD_ENGINE=python): keep-alive
+connections by default, nanosecond per-request timing into a histogram, and
+results either as ab-style text (parseable by lib_ab_parse.sh) or directly
+as a results.csv row.
+
+--rate switches to open loop: requests go out on a fixed schedule and
+latency counts from the intended send time, so server stalls are not hidden
+by the client backing off (coordinated omission). --rate-sweep repeats the
+open-loop run at each listed rate and appends rate_sweep.csv rows.
+
+--concurrency-sweep steps the connection count geometrically, then bisects
+the knee, and reports the highest throughput whose p99 stays within
+--slo-p99; rows go to concurrency_sweep.csv.
+
+Server resources and the nginx/php-fpm status pages are sampled by
+sample_server.py, which run_ab.sh starts around each cell for either engine.
+
+--sample-bodies N keeps every Nth response body and records its PHP
+`elapsed_ms` and `pid` next to the client latency (--samples-out), so the
+report can split each request into PHP execution and queueing/transport.
+
+--mix WEIGHT:PATH (repeatable, PATH relative to URL) turns one run into a
+weighted mix of endpoints sharing the same connections and server workers;
+--mix-out appends per-endpoint and aggregate rows to mixed_workload.csv.
+
+Usage:
+  python tools/run_loadgen.py -l -t 10 -n 1000000 -c 50 -q http://localhost:8083/cpu.php?n=10000
+  python tools/run_loadgen.py -t 10 -c 50 --no-keepalive URL
+  python tools/run_loadgen.py -t 10 -c 800 --workers 0 URL     # one pinned process per core
+  python tools/run_loadgen.py -t 10 -c 200 --workers 2 --cpus 2-3 URL   # stay on cores 2 and 3
+  python tools/run_loadgen.py -t 10 -c 50 --format csv --server nginx_multi --endpoint cpu.php URL
+  python tools/run_loadgen.py -t 10 -c 50 --csv-out row.csv --server xampp --endpoint cpu.php URL
+  python tools/run_loadgen.py -t 10 -c 200 --rate 500 URL      # open loop at 500 req/s
+  python tools/run_loadgen.py -t 60 -c 50 --timeline-out timeline.csv URL   # per-second series
+  python tools/run_loadgen.py -t 10 -c 200 --rate-sweep 100,200,400,800 \
+      --sweep-out results/RUN/rate_sweep.csv --server xampp --endpoint cpu.php URL
+  python tools/run_loadgen.py -t 10 --concurrency-sweep 1:1024 --slo-p99 100 URL
+  python tools/run_loadgen.py -t 30 -c 50 --sample-bodies 100 --samples-out samples.csv URL
+  python tools/run_loadgen.py -t 30 -c 50 --mix "3:cpu.php?n=10000" --mix "1:json.php?n=2000" \
+      --mix "1:io.php?size=8192&iter=20" --mix-out mixed_workload.csv --server xampp http://localhost:8081/
+"""
+
+from pathlib import Path
+import argparse
+import sys
+from typing import List, Tuple
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+
+def parse_rates(value: str) -> List[float]:
+    """Parse a comma-separated list of positive request rates."""
+    try:
+        rates = [float(part) for part in value.split(",") if part.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a list of rates: {value!r}")
+    if not rates or any(rate <= 0 for rate in rates):
+        raise argparse.ArgumentTypeError(f"rates must be positive: {value!r}")
+    return rates
+
+
+def parse_levels(value: str) -> Tuple[int, int]:
+    """Parse START:MAX connection counts for --concurrency-sweep."""
+    try:
+        start, maximum = (int(part) for part in value.split(":"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected START:MAX, got {value!r}")
+    if not 1 <= start <= maximum:
+        raise argparse.ArgumentTypeError(f"need 1 <= START <= MAX: {value!r}")
+    return start, maximum
+
+
+def parse_mix_entry(value: str) -> Tuple[float, str]:
+    """Parse WEIGHT:PATH for --mix."""
+    weight, sep, path = value.partition(":")
+    try:
+        weight = float(weight)
+    except ValueError:
+        weight = 0.0
+    if not sep or not path or weight <= 0:
+        raise argparse.ArgumentTypeError(f"expected WEIGHT:PATH with WEIGHT > 0, got {value!r}")
+    return weight, path
+
+
+def mix_targets(url: str, entries: List[Tuple[float, str]]) -> List[Tuple[str, str, float]]:
+    """(endpoint name, absolute URL, weight) for each --mix entry; names are the script file names."""
+    from urllib.parse import urljoin, urlsplit
+
+    targets = []
+    for weight, path in entries:
+        absolute = urljoin(url, path)
+        name = urlsplit(absolute).path.rsplit("/", 1)[-1] or "/"
+        if any(name == existing for existing, _, _ in targets):
+            raise ValueError(f"endpoint {name} appears twice in --mix")
+        targets.append((name, absolute, weight))
+    return targets
+
+
+def parse_cpus(value: str) -> List[int]:
+    """Parse a taskset-style CPU list for --cpus."""
+    from loadgen.sharding import parse_cpu_list
+    try:
+        return parse_cpu_list(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line arguments (ab-style short flags)."""
+    parser = argparse.ArgumentParser(description="Asyncio HTTP load generator (ab-compatible).")
+    parser.add_argument("url", help="http:// URL to load")
+    parser.add_argument("-t", dest="timelimit", type=float, default=None,
+                        help="seconds to run (like ab -t)")
+    parser.add_argument("-n", dest="requests", type=int, default=None,
+                        help="maximum number of requests (like ab -n)")
+    parser.add_argument("-c", dest="concurrency", type=int, default=1,
+                        help="concurrent connections (like ab -c)")
+    parser.add_argument("-s", dest="timeout", type=float, default=30.0,
+                        help="per-request timeout in seconds (like ab -s, default: 30)")
+    parser.add_argument("-k", dest="keepalive", action="store_true", default=True,
+                        help="use HTTP keep-alive (default; accepted for ab compatibility)")
+    parser.add_argument("--no-keepalive", dest="keepalive", action="store_false",
+                        help="open a new connection for every request")
+    parser.add_argument("-l", dest="variable_length", action="store_true",
+                        help="accepted for ab compatibility; response lengths are never checked")
+    parser.add_argument("-q", dest="quiet", action="store_true",
+                        help="accepted for ab compatibility; no progress output is printed")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="client processes, each pinned to its own core; 0 = one per available core (default: 1)")
+    parser.add_argument("--no-pin", dest="pin", action="store_false",
+                        help="do not pin --workers processes to cores")
+    parser.add_argument("--cpus", type=parse_cpus, default=None, metavar="LIST",
+                        help="run only on these cores, e.g. 2,3 or 4-7 (workers are pinned within them)")
+    parser.add_argument("--rate", type=float, default=None,
+                        help="open loop: send this many requests/sec on a fixed schedule")
+    parser.add_argument("--rate-sweep", type=parse_rates, default=None, metavar="R1,R2,...",
+                        help="open-loop run of -t seconds at each rate, lowest first")
+    parser.add_argument("--concurrency-sweep", type=parse_levels, default=None, metavar="START:MAX",
+                        help="closed-loop runs of -t seconds at growing connection counts up to the p99 knee")
+    parser.add_argument("--slo-p99", type=float, default=None, metavar="MS",
+                        help="p99 latency objective for --concurrency-sweep")
+    parser.add_argument("--sweep-factor", type=float, default=2.0,
+                        help="connection growth factor between sweep levels (default: 2)")
+    parser.add_argument("--bisect-steps", type=int, default=3,
+                        help="extra levels measured between the last pass and first failure (default: 3)")
+    parser.add_argument("--falloff", type=float, default=0.1,
+                        help="a level also fails when throughput drops this fraction below the best (default: 0.1)")
+    parser.add_argument("--sweep-out", type=Path, default=None,
+                        help="append one row per sweep step (rate or concurrency sweep) to this file")
+    parser.add_argument("--format", choices=("ab", "csv"), default="ab",
+                        help="stdout format: ab-style summary (default) or a results.csv row")
+    parser.add_argument("--csv-out", type=Path, default=None,
+                        help="also write the results.csv row to this file")
+    parser.add_argument("--timeline-out", type=Path, default=None,
+                        help="write per-second completed/failed/latency percentiles to this CSV")
+    parser.add_argument("--sample-bodies", type=int, default=0, metavar="N",
+                        help="keep every Nth response body for its elapsed_ms/pid (default: 0 = off)")
+    parser.add_argument("--samples-out", type=Path, default=None,
+                        help="write the --sample-bodies samples to this CSV")
+    parser.add_argument("--mix", type=parse_mix_entry, action="append", default=None, metavar="WEIGHT:PATH",
+                        help="weighted mixed workload: PATH (relative to URL) gets WEIGHT of the requests (repeatable)")
+    parser.add_argument("--mix-out", type=Path, default=None,
+                        help="append per-endpoint and aggregate rows of the --mix run to this CSV")
+    parser.add_argument("--server", default="", help="server column for CSV output")
+    parser.add_argument("--endpoint", default="", help="endpoint column for CSV output")
+    args = parser.parse_args(argv)
+    if args.timelimit is None and args.requests is None:
+        parser.error("give -t and/or -n")
+    if (args.format == "csv" or args.csv_out or args.sweep_out) and not (args.server and args.endpoint):
+        parser.error("--server and --endpoint are required for CSV output")
+    if args.rate is not None and args.rate <= 0:
+        parser.error("--rate must be positive")
+    if (args.rate_sweep or args.concurrency_sweep) and args.timelimit is None:
+        parser.error("sweeps need -t for the length of each step")
+    if args.rate_sweep and args.rate is not None:
+        parser.error("--rate and --rate-sweep are mutually exclusive")
+    if args.concurrency_sweep and (args.rate_sweep or args.rate is not None):
+        parser.error("--concurrency-sweep is closed loop; drop --rate/--rate-sweep")
+    if args.concurrency_sweep and args.slo_p99 is None:
+        parser.error("--concurrency-sweep needs --slo-p99")
+    if args.sample_bodies < 0:
+        parser.error("--sample-bodies must be >= 0")
+    if bool(args.sample_bodies) != bool(args.samples_out):
+        parser.error("--sample-bodies and --samples-out go together")
+    if args.sample_bodies and (args.rate_sweep or args.concurrency_sweep):
+        parser.error("--sample-bodies covers single runs, not sweeps")
+    if args.mix_out and not (args.mix and args.server):
+        parser.error("--mix-out needs --mix and --server")
+    if args.mix and (args.rate_sweep or args.concurrency_sweep):
+        parser.error("--mix covers single runs, not sweeps")
+    if args.mix:
+        try:
+            args.mix = mix_targets(args.url, args.mix)
+        except ValueError as e:
+            parser.error(str(e))
+    return args
+
+
+def run_once(args: argparse.Namespace, rate=None, concurrency=None):
+    """One load run with the CLI settings; sharded when --workers asks for it."""
+    import asyncio
+    from loadgen.http_client import LoadGenerator
+    from loadgen.sharding import available_cpus, run_sharded
+
+    concurrency = concurrency or args.concurrency
+    workers = args.workers or len(available_cpus())
+    if workers > 1:
+        return run_sharded(args.url, concurrency, workers, duration=args.timelimit,
+                           max_requests=args.requests, keepalive=args.keepalive,
+                           timeout=args.timeout, pin=args.pin, rate=rate, sample_every=args.sample_bodies,
+                           mix=args.mix)
+    generator = LoadGenerator(args.url, concurrency=concurrency, duration=args.timelimit,
+                              max_requests=args.requests, keepalive=args.keepalive, timeout=args.timeout,
+                              rate=rate, sample_every=args.sample_bodies, mix=args.mix)
+    return asyncio.run(generator.run())
+
+
+def run_sweep(args: argparse.Namespace) -> int:
+    """Open-loop run at every --rate-sweep rate; prints and appends one sweep row per step."""
+    from loadgen.output import SWEEP_HEADER, format_sweep_row
+
+    rows = []
+    for rate in sorted(args.rate_sweep):
+        result = run_once(args, rate=rate)
+        rows.append(format_sweep_row(result, args.server or "-", args.endpoint or "-"))
+        print(rows[-1] if args.format == "csv" else
+              f"offered {rate:>10.2f} req/s  achieved {result.requests_sec:>10.2f} req/s  "
+              f"p99 {result.histogram.percentile_ns(99) / 1e6:>10.3f} ms  failed {result.failed}",
+              flush=True)
+
+    if args.sweep_out:
+        append_rows(args.sweep_out, SWEEP_HEADER, rows)
+    return 0
+
+
+def run_capacity(args: argparse.Namespace) -> int:
+    """Concurrency sweep; prints each level and the max throughput within the p99 SLO."""
+    from loadgen.capacity import find_capacity, max_rps_within_slo
+    from loadgen.output import CAPACITY_HEADER, format_capacity_row
+
+    def report(step):
+        p99 = step.p99_ms
+        print(f"c={step.connections:<6} {step.requests_sec:>10.2f} req/s  "
+              f"p99 {p99 if p99 is not None else float('nan'):>10.3f} ms  failed {step.result.failed:<6} "
+              f"{'ok' if step.within_slo else 'over SLO / falloff'}", flush=True)
+
+    start, maximum = args.concurrency_sweep
+    steps = find_capacity(lambda connections: run_once(args, concurrency=connections), start, maximum,
+                          args.slo_p99, factor=args.sweep_factor, falloff=args.falloff,
+                          bisect_steps=args.bisect_steps, progress=report)
+    best = max_rps_within_slo(steps)
+    if best is None:
+        print(f"No connection level met p99 <= {args.slo_p99:g} ms")
+    else:
+        print(f"max RPS at p99 <= {args.slo_p99:g} ms: {best.requests_sec:.2f} req/s "
+              f"at {best.connections} connections (p99 {best.p99_ms:.3f} ms)")
+
+    if args.sweep_out:
+        append_rows(args.sweep_out, CAPACITY_HEADER,
+                    [format_capacity_row(step, args.slo_p99, args.server or "-", args.endpoint or "-")
+                     for step in steps])
+    return 0 if best is not None else 1
+
+
+def restrict_cpus(cpus: List[int]) -> None:
+    """Confine this process (and the worker processes it forks) to cpus."""
+    import os
+    if not hasattr(os, "sched_setaffinity"):
+        print("Warning: --cpus ignored, CPU affinity is not supported on this platform", file=sys.stderr)
+        return
+    try:
+        os.sched_setaffinity(0, cpus)
+    except OSError as e:
+        raise ValueError(f"cannot run on CPUs {cpus}: {e}")
+
+
+def append_rows(path: Path, header: str, rows: List[str]) -> None:
+    """Append CSV rows to path, writing the header first if the file is new or empty."""
+    new_file = not path.exists() or path.stat().st_size == 0
+    with path.open("a", encoding="utf-8") as f:
+        if new_file:
+            f.write(header + "\n")
+        f.write("\n".join(rows) + "\n")
+
+
+def main(argv=None):
+    """Main entry point for the load generator."""
+    args = parse_args(argv)
+    from loadgen.output import format_ab_output, format_csv_row, format_samples, format_timeline
+
+    try:
+        if args.cpus:
+            restrict_cpus(args.cpus)
+        if args.rate_sweep:
+            return run_sweep(args)
+        if args.concurrency_sweep:
+            return run_capacity(args)
+        result = run_once(args, rate=args.rate)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    except KeyboardInterrupt:
+        return 130
+
+    if args.timeline_out:
+        args.timeline_out.parent.mkdir(parents=True, exist_ok=True)
+        args.timeline_out.write_text(format_timeline(result), encoding="utf-8")
+    if args.samples_out:
+        args.samples_out.parent.mkdir(parents=True, exist_ok=True)
+        args.samples_out.write_text(format_samples(result), encoding="utf-8")
+    if args.mix_out:
+        from loadgen.output import MIX_HEADER, format_mix_rows
+        append_rows(args.mix_out, MIX_HEADER, format_mix_rows(result, args.server))
+    if args.csv_out or args.format == "csv":
+        row = format_csv_row(result, args.server, args.endpoint)
+        if args.csv_out:
+            args.csv_out.write_text(row + "\n", encoding="utf-8")
+    print(row if args.format == "csv" else format_ab_output(result))
+    return 0 if result.completed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Sample the server under test in the background until told to stop.
+
+run_ab.sh starts this next to each benchmark cell and stops it with
+SIGTERM when the cell is done, so ab and the Python engine get the same
+per-cell series. --resource reads a container's cgroup v2 files or local
+processes from /proc every --resource-interval seconds; --nginx-status /
+--fpm-status poll stub_status and the php-fpm status page every
+--status-interval seconds.
+
+The output CSVs are created (header only) once the first samples are
+taken, so a caller can wait for them before starting the load; the samples
+are written when SIGTERM or SIGINT arrives.
+
+Usage:
+  python tools/sample_server.py --resource docker:3f2a9c --resource-out res.csv &
+  python tools/sample_server.py --resource "proc:nginx|php-fpm" --resource-out res.csv &
+  python tools/sample_server.py --nginx-status http://localhost:8083/nginx_status \
+      --fpm-status "http://localhost:8083/php-fpm-status?json" --status-out status.csv &
+  kill $!   # stop and write the CSVs
+"""
+
+from pathlib import Path
+import argparse
+import signal
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Sample server resources and status pages until SIGTERM.")
+    parser.add_argument("--resource", default=None, metavar="SOURCE",
+                        help="what to sample: cgroup:PATH, docker:CONTAINER_ID or proc:REGEX")
+    parser.add_argument("--resource-out", type=Path, default=None,
+                        help="write the --resource samples (CPU, throttling, memory per interval) to this CSV")
+    parser.add_argument("--resource-interval", type=float, default=1.0,
+                        help="seconds between --resource samples (default: 1)")
+    parser.add_argument("--cgroup-root", type=Path, default=Path("/sys/fs/cgroup"),
+                        help="cgroup v2 mount searched for docker:CONTAINER_ID (default: /sys/fs/cgroup)")
+    parser.add_argument("--nginx-status", default=None, metavar="URL",
+                        help="poll this nginx stub_status page")
+    parser.add_argument("--fpm-status", default=None, metavar="URL",
+                        help="poll this php-fpm status page (JSON, e.g. .../php-fpm-status?json)")
+    parser.add_argument("--status-out", type=Path, default=None,
+                        help="write the --nginx-status/--fpm-status samples to this CSV")
+    parser.add_argument("--status-interval", type=float, default=0.25,
+                        help="seconds between status polls (default: 0.25)")
+    args = parser.parse_args(argv)
+    if bool(args.resource) != bool(args.resource_out):
+        parser.error("--resource and --resource-out go together")
+    if bool(args.nginx_status or args.fpm_status) != bool(args.status_out):
+        parser.error("--status-out goes with --nginx-status and/or --fpm-status")
+    if not (args.resource or args.status_out):
+        parser.error("give --resource and/or --nginx-status/--fpm-status")
+    return args
+
+
+def main(argv=None):
+    """Main entry point for the server sampler."""
+    args = parse_args(argv)
+    from loadgen.resources import RESOURCE_HEADER, ResourceSampler, format_resources, open_source
+    from loadgen.server_status import STATUS_HEADER, StatusPoller, format_status
+
+    stop_signals = {signal.SIGINT, signal.SIGTERM}
+    # Blocked before the sampling threads start so they inherit the mask and
+    # sigwait below is the only place the signals are taken
+    signal.pthread_sigmask(signal.SIG_BLOCK, stop_signals)
+    sampler = poller = None
+    try:
+        if args.resource:
+            sampler = ResourceSampler(open_source(args.resource, args.cgroup_root), args.resource_interval).start()
+        if args.status_out:
+            poller = StatusPoller(args.nginx_status, args.fpm_status, args.status_interval).start()
+        for out, header in ((args.resource_out, RESOURCE_HEADER), (args.status_out, STATUS_HEADER)):
+            if out:
+                out.parent.mkdir(parents=True, exist_ok=True)
+                out.write_text(header + "\n", encoding="utf-8")
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    signal.sigwait(stop_signals)
+    if poller:
+        samples = poller.stop()
+        if poller.errors:
+            print(f"Warning: {poller.errors} status poll(s) failed", file=sys.stderr)
+        args.status_out.write_text(format_status(samples), encoding="utf-8")
+    if sampler:
+        args.resource_out.write_text(format_resources(sampler.stop()), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Serve benchmark reports over HTTP, rendering each run on first request.
+
+Usage:
+  python tools/serve_reports.py [--host 127.0.0.1] [--port 8000] [--cache-size 32] [--workers N]
+
+Open http://127.0.0.1:8000/ for the run index; reports are served from
+/runs/<run_id>.html without pre-generating anything under reports/.
+"""
+
+from pathlib import Path
+import argparse
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from config.settings import RESULTS_DIR, REPORTS_DIR
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Serve benchmark reports rendered on demand.")
+    parser.add_argument("--host", default="127.0.0.1", help="address to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8000, help="port to bind (default: 8000)")
+    parser.add_argument("--cache-size", type=int, default=32,
+                        help="rendered reports kept in memory (default: 32)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="render worker processes (default: CPU count)")
+    return parser.parse_args(argv)
+
+
+async def serve(args: argparse.Namespace) -> None:
+    """Run the report server until cancelled."""
+    from server.report_server import ReportServer
+
+    report_server = ReportServer(RESULTS_DIR, REPORTS_DIR, cache_size=args.cache_size, workers=args.workers)
+    server = await report_server.serve(args.host, args.port)
+    print(f"Serving reports on http://{args.host}:{args.port}/")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        report_server.close()
+
+
+def main(argv=None):
+    """Main entry point for the report server."""
+    args = parse_args(argv)
+    import asyncio
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Report HTTP server module."""
@@ -0,0 +1,284 @@
+"""Asyncio HTTP server that renders run reports on demand.
+
+Routes:
+  GET /                     run index (same layout as reports/index.html)
+  GET /runs/<run_id>.html   report for results/<run_id>/results.csv
+
+Rendered bodies are kept in a bounded LRU together with a gzip copy and a
+strong ETag, so repeat requests are answered with 304 or precompressed bytes.
+Concurrent requests for a run that is still rendering share one render, which
+runs as its own task so a requester that disconnects does not strand the rest.
+A request that fails to render is answered with 500.
+"""
+import asyncio
+import gzip
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from generators.report_generator import ReportGenerator
+from generators.index_builder import RunIndexBuilder
+from loaders.csv_loader import CSVFinder
+from processors.data_processor import RunSummaryBuilder
+
+
+# Per-process generator, created once by the executor initializer
+_worker_generator: Optional[ReportGenerator] = None
+
+
+def _init_worker(results_dir: Path, reports_dir: Path, static_assets: Dict[str, str]) -> None:
+    """Create one ReportGenerator per worker, sharing precomputed static assets."""
+    global _worker_generator
+    _worker_generator = ReportGenerator(results_dir, reports_dir, static_assets=static_assets)
+
+
+def _render_report(csv_path: Path) -> Tuple[bytes, bytes]:
+    """Render one run's report and return (body, gzip body)."""
+    body = _worker_generator.render(csv_path).html.encode("utf-8")
+    return body, gzip.compress(body, compresslevel=6)
+
+
+def _summarize_run(csv_path: Path) -> Dict[str, Any]:
+    """Load one run and return its index summary."""
+    run_id = csv_path.parent.name
+    try:
+        rows = _worker_generator.csv_loader.load_and_normalize(csv_path)
+        config = ReportGenerator._load_config(csv_path.parent)
+        summary = RunSummaryBuilder.build(rows, config)
+    except Exception as e:
+        return {"run_id": run_id, "error": f"{type(e).__name__}: {e}"}
+
+    summary["run_id"] = run_id
+    summary["report"] = f"runs/{run_id}.html"
+    return summary
+
+
+@dataclass
+class CachedResponse:
+    """A rendered body with its precompressed variant and validator."""
+    body: bytes
+    gzip_body: bytes
+    etag: str
+    content_type: str = "text/html; charset=utf-8"
+
+    @classmethod
+    def from_bodies(cls, body: bytes, gzip_body: bytes) -> "CachedResponse":
+        return cls(body=body, gzip_body=gzip_body, etag=f'"{hashlib.sha1(body).hexdigest()}"')
+
+
+class LRUCache:
+    """Bounded least-recently-used mapping."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = max(1, maxsize)
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Any:
+        if key not in self._data:
+            return None
+        self._data.move_to_end(key)
+        return self._data[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+@dataclass
+class HTTPResponse:
+    """Minimal HTTP/1.1 response."""
+    status: int
+    reason: str
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+
+    def encode(self, include_body: bool = True) -> bytes:
+        headers = dict(self.headers)
+        headers["Content-Length"] = str(len(self.body))
+        head = f"HTTP/1.1 {self.status} {self.reason}\r\n"
+        head += "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+        return (head + "\r\n").encode("latin-1") + (self.body if include_body else b"")
+
+
+class ReportServer:
+    """Serves the run index and on-demand rendered reports."""
+
+    def __init__(self, results_dir: Path, reports_dir: Path, cache_size: int = 32,
+                 executor: Optional[Executor] = None, workers: Optional[int] = None,
+                 summary_cache_size: int = 1024):
+        self.results_dir = results_dir
+        self.csv_finder = CSVFinder(results_dir)
+        self.cache = LRUCache(cache_size)
+        self.render_count = 0
+        self._inflight: Dict[Hashable, "asyncio.Task"] = {}
+        # Index summaries keyed by full run signature; much cheaper than reports, so kept in larger numbers
+        self._summaries = LRUCache(summary_cache_size)
+        self._index: Optional[Tuple[Hashable, CachedResponse]] = None
+
+        static_assets = ReportGenerator.build_static_assets()
+        self.executor = executor or ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(results_dir, reports_dir, static_assets),
+        )
+        if executor is not None:
+            # Caller-provided executors (e.g. threads in tests) share this process
+            _init_worker(results_dir, reports_dir, static_assets)
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8000) -> asyncio.AbstractServer:
+        """Start listening and return the asyncio server."""
+        return await asyncio.start_server(self._handle_connection, host, port)
+
+    def close(self) -> None:
+        """Release the render executor."""
+        self.executor.shutdown(wait=False)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, version = request_line.decode("latin-1").split()
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    response = await self.handle_request(method, target.split("?", 1)[0], headers)
+                except Exception as e:
+                    response = self._server_error(e)
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                if not keep_alive:
+                    response.headers["Connection"] = "close"
+                writer.write(response.encode(include_body=method != "HEAD"))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def handle_request(self, method: str, path: str, headers: Dict[str, str]) -> HTTPResponse:
+        """Route a request and build its response."""
+        if method not in ("GET", "HEAD"):
+            return HTTPResponse(405, "Method Not Allowed", {"Allow": "GET, HEAD"})
+
+        if path in ("/", "/index.html"):
+            cached = await self._get_index()
+        elif path.startswith("/runs/") and path.endswith(".html"):
+            csv_path = self._resolve_run(path[len("/runs/"):-len(".html")])
+            if csv_path is None:
+                return self._not_found()
+            cached = await self._get_report(csv_path)
+        else:
+            return self._not_found()
+
+        return self._cached_response(cached, headers)
+
+    @staticmethod
+    def _not_found() -> HTTPResponse:
+        return HTTPResponse(404, "Not Found", {"Content-Type": "text/plain; charset=utf-8"}, b"Not Found")
+
+    @staticmethod
+    def _server_error(error: Exception) -> HTTPResponse:
+        body = f"Internal Server Error\n{type(error).__name__}: {error}\n".encode("utf-8", "replace")
+        return HTTPResponse(500, "Internal Server Error", {"Content-Type": "text/plain; charset=utf-8"}, body)
+
+    @staticmethod
+    def _cached_response(cached: CachedResponse, headers: Dict[str, str]) -> HTTPResponse:
+        common = {"ETag": cached.etag, "Vary": "Accept-Encoding", "Cache-Control": "no-cache"}
+        if_none_match = headers.get("if-none-match", "")
+        if cached.etag in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*":
+            return HTTPResponse(304, "Not Modified", common)
+
+        response_headers = {"Content-Type": cached.content_type, **common}
+        if "gzip" in headers.get("accept-encoding", ""):
+            response_headers["Content-Encoding"] = "gzip"
+            return HTTPResponse(200, "OK", response_headers, cached.gzip_body)
+        return HTTPResponse(200, "OK", response_headers, cached.body)
+
+    def _resolve_run(self, run_id: str) -> Optional[Path]:
+        """Map a run id to its results.csv, rejecting anything outside results/."""
+        if not run_id or "/" in run_id or "\\" in run_id or run_id.startswith("."):
+            return None
+        csv_path = self.results_dir / run_id / "results.csv"
+        return csv_path if csv_path.is_file() else None
+
+    @staticmethod
+    def _run_signature(csv_path: Path) -> Tuple[str, int, int, int]:
+        """Cache key that changes whenever the run's CSV or config changes."""
+        stat = csv_path.stat()
+        config_path = csv_path.parent / "config.json"
+        config_mtime = config_path.stat().st_mtime_ns if config_path.exists() else 0
+        return (csv_path.parent.name, stat.st_mtime_ns, stat.st_size, config_mtime)
+
+    async def _get_report(self, csv_path: Path) -> CachedResponse:
+        key = self._run_signature(csv_path)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Coalesce concurrent requests for the same run into one render. The render is
+        # its own task and every requester awaits it shielded, so cancelling any of
+        # them (a client hanging up) neither cancels the render nor strands the others.
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._render(key, csv_path))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._render_done(key, done))
+        return await asyncio.shield(task)
+
+    async def _render(self, key: Hashable, csv_path: Path) -> CachedResponse:
+        self.render_count += 1
+        loop = asyncio.get_running_loop()
+        body, gzip_body = await loop.run_in_executor(self.executor, _render_report, csv_path)
+        cached = CachedResponse.from_bodies(body, gzip_body)
+        self.cache.put(key, cached)
+        return cached
+
+    def _render_done(self, key: Hashable, task: "asyncio.Task") -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark retrieved so failures nobody waited for don't log "never retrieved"
+            task.exception()
+
+    async def _get_index(self) -> CachedResponse:
+        csv_paths = self.csv_finder.find_all()
+        signatures = [self._run_signature(p) for p in csv_paths]
+        index_key = tuple(signatures)
+        if self._index is not None and self._index[0] == index_key:
+            return self._index[1]
+
+        loop = asyncio.get_running_loop()
+        entries = [self._summaries.get(sig) for sig in signatures]
+        missing = [(i, sig, p) for i, (sig, p) in enumerate(zip(signatures, csv_paths)) if entries[i] is None]
+        summaries = await asyncio.gather(
+            *(loop.run_in_executor(self.executor, _summarize_run, p) for _, _, p in missing)
+        )
+        for (i, sig, _), summary in zip(missing, summaries):
+            self._summaries.put(sig, summary)
+            entries[i] = summary
+
+        utc_plus_8 = timezone(timedelta(hours=8))
+        generated_at = datetime.now(timezone.utc).astimezone(utc_plus_8).strftime("%Y-%m-%d %H:%M:%S")
+        body = RunIndexBuilder.build(entries, generated_at).encode("utf-8")
+        cached = CachedResponse.from_bodies(body, gzip.compress(body, compresslevel=6))
+        self._index = (index_key, cached)
+        return cached
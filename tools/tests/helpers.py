@@ -0,0 +1,20 @@
+"""Shared test data: the original results.csv header and a run directory writer."""
+from pathlib import Path
+
+
+CSV_COLUMNS = "timestamp,server,endpoint,requests_sec,latency_avg,latency_p50,latency_p75,latency_p90,latency_p99,transfer_sec"
+CSV_HEADER = CSV_COLUMNS + "\n"
+
+
+def write_run(results_dir: Path, run_id: str, rows: str, header: str = CSV_HEADER) -> Path:
+    """Write results_dir/run_id/results.csv from header and rows (newline-terminated) and return the run dir."""
+    run_dir = results_dir / run_id
+    run_dir.mkdir(parents=True)
+    (run_dir / "results.csv").write_text(header + rows, encoding="utf-8")
+    return run_dir
+
+
+def server_rows(xampp_rps: float = 100.0, nginx_rps: float = 200.0) -> str:
+    """One cpu.php row per server; nginx_multi at half xampp's latency."""
+    return (f"2026-01-01T00:00:00Z,xampp,cpu.php,{xampp_rps},20.0ms,18,20,25,40,100.0\n"
+            f"2026-01-01T00:00:00Z,nginx_multi,cpu.php,{nginx_rps},10.0ms,9,10,12,20,200.0\n")
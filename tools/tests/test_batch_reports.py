@@ -0,0 +1,54 @@
+import sys
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from generators.batch_generator import BatchReportGenerator
+from helpers import server_rows, write_run
+from loaders.csv_loader import CSVFinder
+
+
+def test_find_all_returns_newest_first(tmp_path: Path):
+    write_run(tmp_path, "20260101_000000", server_rows(100, 200))
+    write_run(tmp_path, "20260102_000000", server_rows(100, 200))
+
+    found = CSVFinder(tmp_path).find_all()
+
+    assert [p.parent.name for p in found] == ["20260102_000000", "20260101_000000"]
+
+
+def test_batch_renders_every_run_and_index(tmp_path: Path):
+    results_dir = tmp_path / "results"
+    reports_dir = tmp_path / "reports"
+    write_run(results_dir, "20260101_000000", server_rows(300, 200))
+    write_run(results_dir, "20260102_000000", server_rows(100, 200))
+    write_run(results_dir, "20260103_000000", server_rows(150, 250))
+
+    index_path = BatchReportGenerator(results_dir, reports_dir, workers=2).generate_all()
+
+    assert index_path == reports_dir / "index.html"
+    for run_id in ("20260101_000000", "20260102_000000", "20260103_000000"):
+        report = reports_dir / "runs" / f"{run_id}.html"
+        assert report.exists()
+        assert f"results/{run_id}/results.csv" in report.read_text(encoding="utf-8")
+
+    index_html = index_path.read_text(encoding="utf-8")
+    assert 'href="runs/20260101_000000.html"' in index_html
+    assert "300.00" in index_html
+    assert "3 runs" in index_html
+
+
+def test_batch_index_records_broken_runs(tmp_path: Path):
+    results_dir = tmp_path / "results"
+    write_run(results_dir, "20260101_000000", server_rows(300, 200))
+    broken = results_dir / "20260102_000000"
+    broken.mkdir()
+    (broken / "results.csv").write_text("timestamp,server\nx,xampp\n", encoding="utf-8")
+
+    index_path = BatchReportGenerator(results_dir, tmp_path / "reports", workers=1).generate_all()
+
+    index_html = index_path.read_text(encoding="utf-8")
+    assert "KeyError" in index_html
+    assert 'href="runs/20260101_000000.html"' in index_html
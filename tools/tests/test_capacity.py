@@ -0,0 +1,73 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from generators.report_generator import ReportGenerator
+from helpers import write_run
+from loaders.csv_loader import ConcurrencySweepLoader
+from loadgen.capacity import find_capacity, geometric_levels, max_rps_within_slo
+from loadgen.http_client import LoadResult
+from loadgen.output import CAPACITY_HEADER, format_capacity_row
+from processors.data_processor import CapacityProcessor
+
+
+def _synthetic(connections: int) -> LoadResult:
+    """Throughput saturates at 1000 req/s; latency then grows with queue depth (Little's law)."""
+    rps = min(100.0 * connections, 1000.0)
+    latency_ns = int(connections / rps * 1e9)
+    result = LoadResult(url="http://127.0.0.1/", concurrency=connections, keepalive=True,
+                        elapsed_s=1.0, completed=int(rps))
+    for _ in range(result.completed):
+        result.histogram.record(latency_ns)
+    return result
+
+
+def test_geometric_levels_end_at_maximum():
+    assert geometric_levels(1, 40) == [1, 2, 4, 8, 16, 32, 40]
+    assert geometric_levels(3, 10, factor=1.1) == [3, 4, 5, 6, 7, 8, 9, 10]
+    with pytest.raises(ValueError):
+        geometric_levels(0, 10)
+
+
+def test_find_capacity_stops_at_knee_and_bisects():
+    measured = []
+
+    def measure(connections):
+        measured.append(connections)
+        return _synthetic(connections)
+
+    # p99 = c / rps: 10 ms up to c=10, then 20 ms at c=20 and 40 ms at c=40
+    steps = find_capacity(measure, 1, 1024, slo_p99_ms=25.0, bisect_steps=3)
+
+    assert measured[:7] == [1, 2, 4, 8, 16, 32, 24]
+    assert 64 not in measured
+    assert [s.connections for s in steps] == sorted(measured)
+    best = max_rps_within_slo(steps)
+    assert best.requests_sec == 1000.0
+    assert best.p99_ms <= 25.0
+    assert not next(s for s in steps if s.connections == 32).within_slo
+
+
+def test_report_states_max_rps_per_stack(tmp_path: Path):
+    run_dir = write_run(tmp_path / "results", "20260101_000000",
+                        "2026-01-01T00:00:00Z,xampp,cpu.php,100.0,20.0ms,18,20,25,40,100.0\n")
+    steps = find_capacity(_synthetic, 1, 64, slo_p99_ms=25.0)
+    rows = [format_capacity_row(step, 25.0, "nginx_multi", "cpu.php") for step in steps]
+    rows += [format_capacity_row(step, 5.0, "xampp", "cpu.php") for step in find_capacity(_synthetic, 1, 64, slo_p99_ms=5.0)]
+    (run_dir / "concurrency_sweep.csv").write_text(CAPACITY_HEADER + "\n" + "\n".join(rows) + "\n", encoding="utf-8")
+
+    capacity = CapacityProcessor.process(ConcurrencySweepLoader.load(run_dir))
+    report = ReportGenerator(tmp_path / "results", tmp_path / "reports").render(run_dir / "results.csv")
+
+    by_server = {s["server"]: s for s in capacity["series"]}
+    assert by_server["nginx_multi"]["max_rps"] == 1000.0
+    assert by_server["xampp"]["max_rps"] is None
+    assert report.payload["concurrency_sweep"] == capacity
+    assert "max RPS at p99 ≤ 25 ms: <strong>1,000 req/s</strong>" in report.html
+    assert "No connection level met p99 ≤ 5 ms" in report.html
+    assert 'id="chart-concurrency-sweep"' in report.html
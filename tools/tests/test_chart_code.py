@@ -0,0 +1,37 @@
+import sys
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from generators.javascript_generator import JavaScriptGenerator
+
+
+CHART_IDS = ["chart-req", "chart-lat", "chart-xfer", "chart-pctl", "chart-hist", "chart-delta", "chart-rate-sweep",
+             "chart-timeline-rps", "chart-timeline-lat", "chart-concurrency-sweep"]
+
+
+def test_every_chart_is_registered_for_lazy_rendering():
+    code = JavaScriptGenerator.generate_chart_code()
+
+    for chart_id in CHART_IDS:
+        assert f"registerChart('{chart_id}'" in code
+    # No chart is drawn eagerly by id at load time
+    assert "Plotly.newPlot('chart-" not in code
+    assert "IntersectionObserver" in code
+    assert code.rstrip().endswith("initializeLazyCharts();")
+
+
+def test_large_line_series_switch_to_webgl():
+    code = JavaScriptGenerator.generate_chart_code()
+
+    assert "scattergl" in code
+    assert "type: lineTraceType(" in code
+
+
+def test_theme_update_only_touches_rendered_charts():
+    code = JavaScriptGenerator.generate_interaction_code()
+
+    assert "renderedCharts.forEach" in code
+    assert "chartFontColor = fontColor" in code
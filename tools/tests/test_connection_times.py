@@ -0,0 +1,76 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from generators.report_generator import ReportGenerator
+from helpers import CSV_COLUMNS
+from loaders.csv_loader import CSVLoader
+from processors.data_processor import ConnectionTimesProcessor
+
+
+CSV_HEADER = (CSV_COLUMNS + ","
+              "latency_p66,latency_p80,latency_p95,latency_p98,latency_p100,"
+              "connect_min,connect_mean,connect_sd,connect_median,connect_max,"
+              "processing_min,processing_mean,processing_sd,processing_median,processing_max,"
+              "waiting_min,waiting_mean,waiting_sd,waiting_median,waiting_max,"
+              "total_min,total_mean,total_sd,total_median,total_max\n")
+AB_ROWS = (
+    # xampp: most of the time waiting to be accepted
+    "2026-01-01T00:00:00Z,xampp,cpu.php,1538.13,130.028ms,101,121,150,1060,403.97,"
+    "112,128,180,1020,1187,0,80,112.4,1,1031,4,49,41.7,45,612,3,40,41.6,38,611,5,129,121.9,101,1187\n"
+    "2026-01-01T00:00:00Z,nginx_multi,cpu.php,2500.0,20.0ms,18,20,25,40,600.0,"
+    "19,22,30,35,90,0,1,0.5,1,5,10,19,4.0,17,80,9,15,3.9,14,78,10,20,4.1,18,90\n"
+)
+# Python engine row: the extra columns are blank
+PYTHON_ROW = "2026-01-01T00:00:00Z,xampp,json.php,3000.0,2.0ms,2,2,3,4,300.0" + "," * 25 + "\n"
+
+
+def test_loader_reads_ladder_and_connection_times(tmp_path: Path):
+    csv_path = tmp_path / "results.csv"
+    csv_path.write_text(CSV_HEADER + AB_ROWS + PYTHON_ROW, encoding="utf-8")
+    xampp, nginx, python_row = CSVLoader().load_and_normalize(csv_path)
+
+    assert xampp.latency_p66_ms == 112.0 and xampp.latency_p100_ms == 1187.0
+    assert xampp.connection_times["connect"] == {"min": 0.0, "mean": 80.0, "sd": 112.4, "median": 1.0, "max": 1031.0}
+    assert set(nginx.connection_times) == {"connect", "processing", "waiting", "total"}
+    assert python_row.latency_p66_ms is None
+    assert python_row.connection_times == {}
+    assert python_row.latency_p99_ms == 4.0
+
+
+def test_processor_splits_phases_and_builds_ladder(tmp_path: Path):
+    csv_path = tmp_path / "results.csv"
+    csv_path.write_text(CSV_HEADER + AB_ROWS + PYTHON_ROW, encoding="utf-8")
+    result = ConnectionTimesProcessor.process(CSVLoader().load_and_normalize(csv_path))
+
+    cells = {c["server"]: c for c in result["cells"]}
+    assert set(cells) == {"xampp", "nginx_multi"}
+    assert cells["xampp"]["receive_ms"] == pytest.approx(9.0)
+    assert cells["xampp"]["dominant"] == "connect"
+    assert cells["nginx_multi"]["dominant"] == "waiting"
+
+    ladder = {s["server"]: s for s in result["ladder"]}
+    assert set(ladder) == {"xampp", "nginx_multi"}
+    assert ladder["xampp"]["percentiles"] == [50, 66, 75, 80, 90, 95, 98, 99, 100]
+    assert ladder["xampp"]["latency_ms"][-1] == 1187.0
+    # The python engine row alone has neither
+    assert ConnectionTimesProcessor.process(CSVLoader().load_and_normalize(csv_path)[2:]) is None
+
+
+def test_report_shows_connection_times(tmp_path: Path):
+    run_dir = tmp_path / "results" / "20260101_000000"
+    run_dir.mkdir(parents=True)
+    (run_dir / "results.csv").write_text(CSV_HEADER + AB_ROWS, encoding="utf-8")
+
+    report = ReportGenerator(tmp_path / "results", tmp_path / "reports").render(run_dir / "results.csv")
+    assert len(report.payload["connection_times"]["cells"]) == 2
+    assert report.payload["rows"][0]["connection_times"]["waiting"]["mean"] == 40.0
+    assert 'data-i18n="conn_title"' in report.html
+    assert 'id="chart-connection-times"' in report.html
+    assert 'id="chart-percentile-ladder"' in report.html
+    assert '<span class="metric-chip metric-warning" data-i18n="conn_phase_connect"></span>' in report.html
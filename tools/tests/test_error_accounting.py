@@ -0,0 +1,83 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from generators.report_generator import ReportGenerator
+from helpers import CSV_COLUMNS
+from loaders.csv_loader import CSVLoader
+from processors.data_processor import ErrorAccountingProcessor
+
+
+CSV_HEADER = (CSV_COLUMNS + ","
+              "complete_requests,failed_requests,failed_connect,failed_receive,failed_length,failed_exceptions,non_2xx,write_errors\n")
+ROWS = (
+    # nginx answers fast 502s for a fifth of the load; the Length failures are varying PHP output
+    "2026-01-01T00:00:00Z,nginx_multi,cpu.php,5000.0,40.0ms,30,40,50,90,600.0,150000,1500,0,0,1500,0,30000,0\n"
+    # xampp queues instead: slower but nothing fails
+    "2026-01-01T00:00:00Z,xampp,cpu.php,4500.0,44.0ms,40,44,48,60,540.0,135000,0,0,0,0,0,0,0\n"
+    # python engine: 100 transport failures outside the completed count, no split, 90 non-2xx among the completed
+    "2026-01-01T00:00:00Z,xampp,json.php,900.0,2.0ms,2,2,3,4,300.0,900,100,,,,,90,0\n"
+)
+# Written before request accounting was recorded
+LEGACY_ROW = "2026-01-01T00:00:00Z,nginx_multi,json.php,3000.0,2.0ms,2,2,3,4,300.0,,,,,,,,\n"
+
+
+def _rows(tmp_path: Path, text: str):
+    csv_path = tmp_path / "results.csv"
+    csv_path.write_text(CSV_HEADER + text, encoding="utf-8")
+    return CSVLoader().load_and_normalize(csv_path)
+
+
+def test_loader_and_goodput_exclude_length_failures(tmp_path: Path):
+    nginx, xampp, python_row, legacy = _rows(tmp_path, ROWS + LEGACY_ROW)
+
+    assert nginx.failed_by_class == {"connect": 0, "receive": 0, "length": 1500, "exceptions": 0}
+    assert nginx.non_2xx == 30000
+    assert python_row.failed_requests == 100 and python_row.failed_by_class == {}
+    assert legacy.complete_requests is None and ErrorAccountingProcessor.account(legacy) is None
+
+    accounting = ErrorAccountingProcessor.account(nginx)
+    assert accounting["errors"] == 30000
+    assert accounting["error_rate"] == pytest.approx(0.2)
+    assert accounting["goodput_rps"] == pytest.approx(4000.0)
+    # Raw req/s favours nginx; goodput does not
+    assert ErrorAccountingProcessor.account(xampp)["goodput_rps"] == pytest.approx(4500.0)
+
+    accounting = ErrorAccountingProcessor.account(python_row)
+    assert accounting["attempted"] == 1000
+    assert accounting["error_rate"] == pytest.approx(0.19)
+    # The failures never completed, so only the non-2xx come off the completed rate
+    assert accounting["goodput_rps"] == pytest.approx(810.0)
+
+
+def test_processor_and_warnings_use_error_rate(tmp_path: Path):
+    rows = _rows(tmp_path, ROWS + LEGACY_ROW)
+    result = ErrorAccountingProcessor.process(rows)
+    cells = {(c["server"], c["endpoint"]): c for c in result["cells"]}
+    assert set(cells) == {("nginx_multi", "cpu.php"), ("xampp", "cpu.php"), ("xampp", "json.php")}
+    assert cells[("xampp", "json.php")]["failed_connect"] is None
+    assert ErrorAccountingProcessor.process(rows[3:]) is None
+
+    findings = {(f["server"], f["endpoint"]): f for f in ReportGenerator._find_zero_metrics(rows)}
+    assert set(findings) == {("nginx_multi", "CPU"), ("xampp", "JSON")}
+    assert findings[("nginx_multi", "CPU")]["errors_high"] is True
+    assert findings[("nginx_multi", "CPU")]["requests_zero"] is False
+
+
+def test_report_shows_goodput(tmp_path: Path):
+    run_dir = tmp_path / "results" / "20260101_000000"
+    run_dir.mkdir(parents=True)
+    (run_dir / "results.csv").write_text(CSV_HEADER + ROWS, encoding="utf-8")
+
+    report = ReportGenerator(tmp_path / "results", tmp_path / "reports").render(run_dir / "results.csv")
+    assert len(report.payload["error_accounting"]["cells"]) == 3
+    assert report.payload["rows"][0]["failed_by_class"]["length"] == 1500
+    assert 'data-i18n="errors_title"' in report.html
+    assert 'id="chart-goodput"' in report.html
+    assert '<span class="metric-chip metric-warning">20.00%</span>' in report.html
+    assert "Errors = 20.0%" in report.html
@@ -0,0 +1,66 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from generators.report_generator import ReportGenerator
+from helpers import CSV_HEADER, write_run
+from loaders.csv_loader import KeepAliveLoader
+from processors.data_processor import KeepAliveProcessor
+
+
+KEEPALIVE_HEADER = "keepalive," + CSV_HEADER
+
+
+def _write_keepalive(run_dir: Path) -> None:
+    (run_dir / "keepalive.csv").write_text(KEEPALIVE_HEADER + "".join([
+        "0,2026-01-01T00:00:00Z,xampp,cpu.php,1000.0,10.0ms,9,10,12,20,100.0\n",
+        "1,2026-01-01T00:00:00Z,xampp,cpu.php,1600.0,6.0ms,5,6,8,12,160.0\n",
+        "0,2026-01-01T00:00:00Z,xampp,json.php,2000.0,5.0ms,4,5,6,9,200.0\n",
+        "1,2026-01-01T00:00:00Z,xampp,json.php,2500.0,4.0ms,3,4,5,7,250.0\n",
+        "0,2026-01-01T00:00:00Z,nginx_multi,cpu.php,1200.0,8.0ms,7,8,9,15,120.0\n",
+        "1,2026-01-01T00:00:00Z,nginx_multi,cpu.php,1100.0,9.0ms,8,9,10,16,110.0\n",
+        # Only one mode: not compared
+        "0,2026-01-01T00:00:00Z,nginx_multi,io.php,500.0,20.0ms,18,20,25,40,50.0\n",
+        "x,2026-01-01T00:00:00Z,nginx_multi,io.php,bad,1ms,1,1,1,1,1\n",
+    ]), encoding="utf-8")
+
+
+def test_processor_pairs_modes_per_cell(tmp_path: Path):
+    _write_keepalive(tmp_path)
+    rows = KeepAliveLoader.load(tmp_path)
+    assert [r.keepalive for r in rows[:2]] == [False, True]
+
+    result = KeepAliveProcessor.process(rows)
+    cells = {(c["server"], c["endpoint"]): c for c in result["cells"]}
+    assert set(cells) == {("xampp", "cpu.php"), ("xampp", "json.php"), ("nginx_multi", "cpu.php")}
+    assert cells[("xampp", "cpu.php")]["speedup"] == pytest.approx(1.6)
+    assert cells[("xampp", "cpu.php")]["latency_saved_ms"] == pytest.approx(4.0)
+    assert cells[("xampp", "cpu.php")]["keepalive_p99"] == 12.0
+
+    servers = {s["server"]: s for s in result["servers"]}
+    assert servers["xampp"]["speedup"] == pytest.approx((1.6 * 1.25) ** 0.5)
+    assert servers["xampp"]["endpoints"] == 2
+    assert servers["nginx_multi"]["speedup"] == pytest.approx(1100.0 / 1200.0)
+    assert KeepAliveProcessor.process([]) is None
+
+
+def test_report_shows_speedup_and_connection_mode(tmp_path: Path):
+    run_dir = write_run(tmp_path / "results", "20260101_000000",
+                        "2026-01-01T00:00:00Z,xampp,cpu.php,1000.0,10.0ms,9,10,12,20,100.0\n")
+    (run_dir / "config.json").write_text(json.dumps({"keepalive": False}), encoding="utf-8")
+    _write_keepalive(run_dir)
+
+    report = ReportGenerator(tmp_path / "results", tmp_path / "reports").render(run_dir / "results.csv")
+    assert len(report.payload["keepalive"]["cells"]) == 3
+    assert 'data-i18n="keepalive_title"' in report.html
+    assert 'id="chart-keepalive"' in report.html
+    assert 'data-i18n="summary_keepalive_off"' in report.html
+    # nginx_multi lost throughput with keep-alive
+    assert '<span class="metric-chip metric-warning">0.92x</span>' in report.html
+    assert "<strong>1.60x</strong>" in report.html
@@ -0,0 +1,90 @@
+import asyncio
+import sys
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from generators.report_generator import ReportGenerator
+from helpers import write_run
+from loaders.csv_loader import BodySampleLoader
+from loadgen.http_client import BodySample, LoadGenerator, LoadResult, parse_body_sample
+from loadgen.output import SAMPLES_HEADER, format_samples
+from loadgen.sharding import merge_results
+from processors.data_processor import LatencyBreakdownProcessor
+
+
+CPU_BODY = b'{"workload":"cpu","n":10,"sum":22.47,"elapsed_ms":0.125,"pid":4242}'
+
+
+def _sampled_run(body: bytes, chunked: bool, max_requests: int, sample_every: int) -> LoadResult:
+    async def handle(reader, writer):
+        try:
+            while True:
+                await reader.readuntil(b"\r\n\r\n")
+                if chunked:
+                    half = len(body) // 2
+                    writer.write(b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"
+                                 b"%x\r\n%s\r\n%x\r\n%s\r\n0\r\n\r\n" % (half, body[:half], len(body) - half, body[half:]))
+                else:
+                    writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: %d\r\n\r\n%s" % (len(body), body))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def scenario():
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        async with server:
+            port = server.sockets[0].getsockname()[1]
+            generator = LoadGenerator(f"http://127.0.0.1:{port}/cpu.php", concurrency=2,
+                                      max_requests=max_requests, sample_every=sample_every)
+            return await generator.run()
+    return asyncio.run(scenario())
+
+
+def test_every_nth_body_is_sampled_with_its_server_time():
+    for chunked in (False, True):
+        result = _sampled_run(CPU_BODY, chunked, max_requests=20, sample_every=5)
+        assert result.completed == 20 and result.body_bytes == 20 * len(CPU_BODY)
+        assert len(result.samples) == 4
+        assert all(s.server_ms == 0.125 and s.pid == 4242 and s.latency_ns > 0 for s in result.samples)
+
+    unsampled = _sampled_run(CPU_BODY, False, max_requests=10, sample_every=0)
+    assert unsampled.samples == []
+
+
+def test_bodies_without_timing_keep_blank_fields():
+    assert parse_body_sample(b"<html>502</html>", 1.0, 5_000_000) == BodySample(1.0, 5_000_000)
+    assert parse_body_sample(b'{"elapsed_ms":"x","pid":7}', 1.0, 5).server_ms is None
+
+    shard = LoadResult(url="http://127.0.0.1/cpu.php", concurrency=1, keepalive=True)
+    shard.samples = [BodySample(0.5, 2_500_000, 1.25, 17), BodySample(0.25, 1_000_000)]
+    merged = merge_results([shard, LoadResult(url=shard.url, concurrency=1, keepalive=True)])
+    assert format_samples(merged).splitlines() == [SAMPLES_HEADER, "0.250,1.000,,", "0.500,2.500,1.250,17"]
+
+
+def test_report_splits_latency_into_php_and_overhead(tmp_path: Path):
+    run_dir = write_run(tmp_path / "results", "20260101_000000",
+                        "2026-01-01T00:00:00Z,xampp,cpu.php,900.0,20.0ms,18,20,25,40,100.0\n"
+                        "2026-01-01T00:00:00Z,nginx_multi,cpu.php,1500.0,12.0ms,10,12,15,30,150.0\n")
+    for server, rows in (("xampp", ["0.1,20.0,4.0,11", "0.2,30.0,4.0,12", "0.3,9.0,,"]),
+                         ("nginx_multi", ["0.1,5.0,4.0,21", "0.2,7.0,4.5,22"])):
+        (run_dir / "body_samples" / server).mkdir(parents=True)
+        (run_dir / "body_samples" / server / "cpu.php.csv").write_text(
+            SAMPLES_HEADER + "\n" + "\n".join(rows) + "\n", encoding="utf-8")
+
+    breakdown = LatencyBreakdownProcessor.process(BodySampleLoader.load(run_dir))
+    nginx, xampp = breakdown["cells"]
+    assert (xampp["server"], xampp["samples"]) == ("xampp", 2)
+    assert (xampp["latency_ms"], xampp["server_ms"], xampp["overhead_ms"]) == (25.0, 4.0, 21.0)
+    assert round(xampp["server_share"]) == 16 and xampp["overhead_p99_ms"] == 26.0
+    assert (nginx["overhead_ms"], nginx["overhead_p50_ms"]) == (1.75, 1.0)
+
+    report = ReportGenerator(tmp_path / "results", tmp_path / "reports").render(run_dir / "results.csv")
+    assert report.payload["latency_breakdown"] == breakdown
+    assert 'data-i18n="breakdown_title"' in report.html
+    assert 'id="chart-latency-breakdown"' in report.html
+    assert "<td><strong>21.000</strong></td><td>16%</td>" in report.html
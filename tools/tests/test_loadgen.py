@@ -0,0 +1,238 @@
+import asyncio
+import os
+import random
+import sys
+import threading
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from loaders.csv_loader import CSVLoader
+from loadgen.histogram import LatencyHistogram
+from loadgen.http_client import LoadGenerator, LoadResult
+from loadgen.output import CSV_HEADER, TIMELINE_HEADER, format_ab_output, format_csv_row, format_timeline
+from loadgen.sharding import available_cpus, merge_results, run_sharded, split_evenly
+import run_loadgen
+
+
+async def _serve(handler_body: bytes, chunked: bool = False):
+    """Tiny HTTP/1.1 keep-alive server; returns (server, port, connection counter)."""
+    connections = []
+
+    async def handle(reader, writer):
+        connections.append(1)
+        try:
+            while True:
+                request = await reader.readuntil(b"\r\n\r\n")
+                close = b"connection: close" in request.lower()
+                if chunked:
+                    body = b"%x\r\n%s\r\n0\r\n\r\n" % (len(handler_body), handler_body)
+                    head = b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n"
+                else:
+                    body = handler_body
+                    head = b"HTTP/1.1 200 OK\r\nContent-Length: %d\r\n" % len(body)
+                head += b"Connection: close\r\n\r\n" if close else b"\r\n"
+                writer.write(head + body)
+                await writer.drain()
+                if close:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1], connections
+
+
+def _run(max_requests, concurrency, keepalive=True, chunked=False, duration=None):
+    async def scenario():
+        server, port, connections = await _serve(b'{"ok":true}', chunked=chunked)
+        async with server:
+            generator = LoadGenerator(f"http://127.0.0.1:{port}/cpu.php?n=10", concurrency=concurrency,
+                                      max_requests=max_requests, keepalive=keepalive, duration=duration)
+            return await generator.run(), len(connections)
+    return asyncio.run(scenario())
+
+
+def _serve_in_thread():
+    """Run _serve on a background loop so worker processes can reach it; returns (port, stop)."""
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+    state = {}
+
+    async def start():
+        state["server"], state["port"], _ = await _serve(b"ok")
+        started.set()
+
+    thread = threading.Thread(target=lambda: (loop.run_until_complete(start()), loop.run_forever()), daemon=True)
+    thread.start()
+    started.wait(5)
+
+    def stop():
+        loop.call_soon_threadsafe(state["server"].close)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(5)
+
+    return state["port"], stop
+
+
+def test_histogram_percentiles_within_bucket_error():
+    rng = random.Random(1)
+    values = sorted(rng.randint(200_000, 80_000_000) for _ in range(20_000))
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.record(value)
+
+    for percentile in (50, 90, 99, 99.9):
+        exact = values[-(-int(percentile * len(values)) // 100) - 1]
+        assert abs(histogram.percentile_ns(percentile) - exact) <= exact / LatencyHistogram.SUB_BUCKETS
+    assert histogram.percentile_ns(100) == values[-1]
+
+
+def test_histogram_merge_is_exact():
+    left, right, combined = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for value in range(1, 5000, 3):
+        (left if value % 2 else right).record(value * 1000)
+        combined.record(value * 1000)
+
+    merged = LatencyHistogram.from_dict(left.to_dict()).merge(right)
+
+    assert merged.counts == combined.counts
+    assert (merged.count, merged.total_ns, merged.min_ns, merged.max_ns) == \
+        (combined.count, combined.total_ns, combined.min_ns, combined.max_ns)
+
+
+def test_keepalive_reuses_one_connection_per_worker():
+    result, connections = _run(max_requests=200, concurrency=4)
+
+    assert result.completed == 200
+    assert result.failed == 0
+    assert connections == 4
+    assert result.keepalive_requests == 196
+    assert result.histogram.count == 200
+
+
+def test_no_keepalive_and_chunked_bodies():
+    result, connections = _run(max_requests=30, concurrency=3, keepalive=False, chunked=True)
+
+    assert result.completed == 30
+    assert connections == 30
+    assert result.body_bytes == 30 * len(b'{"ok":true}')
+
+
+def test_outputs_match_ab_parser_and_csv_schema():
+    result, _ = _run(max_requests=50, concurrency=2)
+
+    text = format_ab_output(result)
+    assert "Complete requests:      50" in text
+    assert "Requests per second:" in text and "(mean)" in text
+    assert "  99%   " in text
+
+    row = format_csv_row(result, "nginx_multi", "cpu.php", timestamp="2026-01-01T00:00:00Z")
+    assert len(row.split(",")) == len(CSV_HEADER.split(","))
+    parsed = CSVLoader().normalize([dict(zip(CSV_HEADER.split(","), row.split(",")))])[0]
+    assert parsed.server == "nginx_multi"
+    assert parsed.latency_p99_ms >= parsed.latency_p50_ms > 0
+
+
+def test_duration_run_stops_and_buckets_per_second():
+    result, _ = _run(max_requests=None, concurrency=3, duration=0.3)
+
+    assert result.completed > 0
+    assert result.elapsed_s <= 0.3
+    assert set(result.timeline) == {0}
+    assert result.histogram.count == result.timeline[0].count == result.completed
+
+
+def test_split_evenly():
+    assert split_evenly(10, 3) == [4, 3, 3]
+    assert split_evenly(2, 4) == [1, 1, 0, 0]
+    assert sum(split_evenly(1_000_003, 8)) == 1_000_003
+
+
+def test_merge_results_is_exact():
+    first, _ = _run(max_requests=40, concurrency=2)
+    second, _ = _run(max_requests=60, concurrency=3)
+
+    merged = merge_results([first, second])
+
+    combined = LatencyHistogram().merge(first.histogram).merge(second.histogram)
+    assert merged.histogram.counts == combined.counts
+    assert (merged.completed, merged.concurrency, merged.connections_opened) == (100, 5, 5)
+    assert sum(h.count for h in merged.timeline.values()) == 100
+
+
+def test_run_sharded_splits_requests_and_connections():
+    port, stop = _serve_in_thread()
+    try:
+        result = run_sharded(f"http://127.0.0.1:{port}/", concurrency=4, workers=2, max_requests=90, pin=False)
+    finally:
+        stop()
+
+    assert result.completed == 90
+    assert result.failed == 0
+    assert result.concurrency == 4
+    assert result.connections_opened == 4
+    assert result.histogram.count == 90
+
+
+def test_cpus_flag_confines_the_run(capsys):
+    port, stop = _serve_in_thread()
+    before = available_cpus()
+    try:
+        assert run_loadgen.main(["--cpus", str(before[-1]), "-n", "10", "-c", "2", f"http://127.0.0.1:{port}/"]) == 0
+        assert available_cpus() == [before[-1]]
+    finally:
+        if hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(0, before)
+        stop()
+    assert "Complete requests:      10" in capsys.readouterr().out
+
+
+def test_open_loop_charges_stalls_to_queued_requests():
+    async def scenario():
+        served = []
+
+        async def handle(reader, writer):
+            try:
+                while True:
+                    await reader.readuntil(b"\r\n\r\n")
+                    served.append(1)
+                    if len(served) == 10:
+                        await asyncio.sleep(0.3)
+                    writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+                    await writer.drain()
+            except (asyncio.IncompleteReadError, ConnectionError):
+                pass
+            finally:
+                writer.close()
+
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        async with server:
+            url = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}/"
+            return await LoadGenerator(url, concurrency=1, max_requests=100, rate=100.0).run()
+
+    result = asyncio.run(scenario())
+
+    assert result.completed == 100
+    assert result.target_rate == 100.0
+    # ~30 requests were due while the one connection was stalled; each waited
+    assert result.histogram.percentile_ns(80) > 50_000_000
+    assert "Target rate:            100.00 [#/sec] (open loop)" in format_ab_output(result)
+
+
+def test_timeline_keeps_stalled_seconds_as_zero_rows():
+    result = LoadResult(url="http://127.0.0.1/", concurrency=1, keepalive=True, elapsed_s=4.0)
+    for second, latency_ms in ((0, 2), (0, 4), (3, 9)):
+        result.timeline.setdefault(second, LatencyHistogram()).record(latency_ms * 1_000_000)
+    result.failed_timeline[2] = 5
+
+    lines = format_timeline(result).splitlines()
+
+    assert lines[0] == TIMELINE_HEADER
+    assert lines[1].startswith("0,2,0,") and lines[1].endswith(",4.000")
+    assert lines[2:4] == ["1,0,0,,,,", "2,0,5,,,,"]
+    assert lines[4] == "3,1,0,9.000,9.000,9.000,9.000"
@@ -0,0 +1,112 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from helpers import write_run
+import run_loadgen
+from generators.report_generator import ReportGenerator
+from loaders.csv_loader import MixedWorkloadLoader
+from loadgen.http_client import LoadGenerator
+from loadgen.output import MIX_HEADER, format_mix_rows
+from loadgen.sharding import merge_results
+from processors.data_processor import MixedWorkloadProcessor
+
+
+def _mixed_run(mix, max_requests, seed=0):
+    """Run a mix against a server that answers with the requested path; returns (result, paths served)."""
+    served = []
+
+    async def handle(reader, writer):
+        try:
+            while True:
+                request = await reader.readuntil(b"\r\n\r\n")
+                path = request.split(b" ", 2)[1]
+                served.append(path.decode())
+                status = b"500 Internal Server Error" if path.startswith(b"/io.php") else b"200 OK"
+                writer.write(b"HTTP/1.1 %s\r\nContent-Length: %d\r\n\r\n%s" % (status, len(path), path))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def scenario():
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        async with server:
+            base = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}/"
+            targets = run_loadgen.mix_targets(base, mix)
+            generator = LoadGenerator(base, concurrency=4, max_requests=max_requests, mix=targets, seed=seed)
+            return await generator.run()
+    return asyncio.run(scenario()), served
+
+
+def test_requests_follow_the_weights_and_are_counted_per_endpoint():
+    result, served = _mixed_run([(3, "cpu.php?n=10"), (1, "json.php?n=5"), (1, "io.php?size=1")], 2000)
+    assert result.completed == 2000 and len(served) == 2000
+    assert set(served) == {"/cpu.php?n=10", "/json.php?n=5", "/io.php?size=1"}
+    assert list(result.endpoints) == ["cpu.php", "json.php", "io.php"]
+    cpu, json_, io = (result.endpoints[name] for name in ("cpu.php", "json.php", "io.php"))
+    assert cpu.completed == served.count("/cpu.php?n=10")
+    assert 0.55 < cpu.completed / 2000 < 0.65 and 0.15 < json_.completed / 2000 < 0.25
+    assert io.non_2xx == io.completed and result.non_2xx == io.completed
+    assert sum(e.histogram.count for e in result.endpoints.values()) == result.histogram.count
+
+    again, served_again = _mixed_run([(3, "cpu.php?n=10"), (1, "json.php?n=5"), (1, "io.php?size=1")], 2000)
+    assert again.endpoints["cpu.php"].completed == cpu.completed
+
+
+def test_mix_rows_per_endpoint_and_aggregate():
+    first, _ = _mixed_run([(1, "cpu.php"), (1, "json.php")], 200, seed=1)
+    second, _ = _mixed_run([(1, "cpu.php"), (1, "json.php")], 200, seed=2)
+    merged = merge_results([first, second])
+    assert merged.endpoints["cpu.php"].completed == first.endpoints["cpu.php"].completed + second.endpoints["cpu.php"].completed
+
+    rows = [row.split(",") for row in format_mix_rows(merged, "xampp", timestamp="T")]
+    assert [row[2] for row in rows] == ["cpu.php", "json.php", "all"]
+    assert all(len(row) == len(MIX_HEADER.split(",")) for row in rows)
+    assert [row[3] for row in rows] == ["0.5000", "0.5000", "1.0000"]
+    assert abs(float(rows[0][4]) + float(rows[1][4]) - 1.0) < 1e-3
+
+
+def test_mix_flags_are_validated(capsys):
+    args = run_loadgen.parse_args(["-t", "1", "--mix", "2:cpu.php?n=5", "--mix", "1:/json.php",
+                                   "--mix-out", "m.csv", "--server", "xampp", "http://127.0.0.1:8081/"])
+    assert args.mix == [("cpu.php", "http://127.0.0.1:8081/cpu.php?n=5", 2.0),
+                        ("json.php", "http://127.0.0.1:8081/json.php", 1.0)]
+    for argv in (["--mix", "0:cpu.php"], ["--mix", "cpu.php"], ["--mix", "1:cpu.php", "--mix", "1:cpu.php?n=2"],
+                 ["--mix-out", "m.csv", "--server", "xampp"], ["--mix", "1:cpu.php", "--rate-sweep", "10"]):
+        with pytest.raises(SystemExit):
+            run_loadgen.parse_args(["-t", "1", *argv, "http://127.0.0.1:8081/"])
+    with pytest.raises(ValueError):
+        LoadGenerator("http://127.0.0.1:8081/", max_requests=1, mix=[("cpu.php", "http://10.0.0.1/cpu.php", 1.0)])
+    capsys.readouterr()
+
+
+def test_report_compares_mixed_and_isolated_p99(tmp_path: Path):
+    run_dir = write_run(tmp_path / "results", "20260101_000000",
+                        "2026-01-01T00:00:00Z,xampp,cpu.php,900.0,20.0ms,18,20,25,40,100.0\n"
+                        "2026-01-01T00:00:00Z,xampp,json.php,3000.0,2.0ms,2,2,3,4,300.0\n")
+    (run_dir / "mixed_workload.csv").write_text(MIX_HEADER + "\n" + "\n".join([
+        "2026-01-01T00:00:00Z,xampp,cpu.php,0.7500,0.7400,600.00,25.0,22.0,40.0,60.000,90.0,0",
+        "2026-01-01T00:00:00Z,xampp,json.php,0.2500,0.2600,210.00,9.0,6.0,20.0,30.000,45.0,2",
+        "2026-01-01T00:00:00Z,xampp,all,1.0000,1.0000,810.00,20.0,18.0,38.0,55.000,90.0,2",
+    ]) + "\n", encoding="utf-8")
+
+    mixed = MixedWorkloadProcessor.process(MixedWorkloadLoader.load(run_dir), [])
+    assert mixed["aggregate"] == [{"server": "xampp", "requests_sec": 810.0, "p50": 18.0, "p99": 55.0, "failed": 2}]
+    assert mixed["endpoints"][0]["isolated_p99"] is None
+
+    report = ReportGenerator(tmp_path / "results", tmp_path / "reports").render(run_dir / "results.csv")
+    by_endpoint = {e["endpoint"]: e for e in report.payload["mixed_workload"]["endpoints"]}
+    assert by_endpoint["cpu.php"]["p99_ratio"] == 1.5
+    assert by_endpoint["json.php"]["p99_ratio"] == 7.5
+    assert 'data-i18n="mixed_title"' in report.html
+    assert 'id="chart-mixed-workload"' in report.html
+    assert '<span class="metric-chip metric-warning">7.50x</span>' in report.html
+    assert "<td>1.50x</td>" in report.html
@@ -0,0 +1,80 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from generators.report_generator import ReportGenerator
+from helpers import CSV_HEADER, write_run
+from loaders.csv_loader import ParamSweepLoader
+from processors.data_processor import ParamSweepProcessor
+
+
+PARAM_HEADER = "param,value," + CSV_HEADER
+
+
+def _sweep_row(param, value, server, endpoint, rps, latency_ms):
+    return f"{param},{value},2026-01-01T00:00:00Z,{server},{endpoint},{rps},{latency_ms}ms,1,1,1,{latency_ms * 2},10.0\n"
+
+
+def test_fit_linear_recovers_fixed_and_per_unit_cost():
+    fit = ParamSweepProcessor.fit_linear([1000, 10000, 100000], [2.5 + 0.001 * x for x in (1000, 10000, 100000)])
+    assert fit["fixed"] == pytest.approx(2.5)
+    assert fit["per_unit"] == pytest.approx(0.001)
+    assert fit["r2"] == pytest.approx(1.0)
+    assert ParamSweepProcessor.fit_linear([5, 5], [1.0, 2.0]) is None
+    assert ParamSweepProcessor.fit_linear([5], [1.0]) is None
+
+
+def test_processor_fits_each_stack_and_compares_throughput(tmp_path: Path):
+    (tmp_path / "param_sweep.csv").write_text(PARAM_HEADER + "".join([
+        # xampp: 4 ms fixed + 0.0001 ms per iteration; nginx: 1 ms fixed, same PHP cost
+        _sweep_row("n", 1000, "xampp", "cpu.php", 2000.0, 4.1),
+        _sweep_row("n", 10000, "xampp", "cpu.php", 1000.0, 5.0),
+        _sweep_row("n", 100000, "xampp", "cpu.php", 250.0, 14.0),
+        _sweep_row("n", 1000, "nginx_multi", "cpu.php", 6000.0, 1.1),
+        _sweep_row("n", 10000, "nginx_multi", "cpu.php", 2000.0, 2.0),
+        _sweep_row("n", 100000, "nginx_multi", "cpu.php", 300.0, 11.0),
+        "n,bad,2026-01-01T00:00:00Z,xampp,cpu.php,1,1ms,1,1,1,1,1\n",
+    ]), encoding="utf-8")
+    points = ParamSweepLoader.load(tmp_path)
+    assert len(points) == 6 and points[0].row.latency_ms == 4.1
+
+    result = ParamSweepProcessor.process(points)
+    by_server = {s["server"]: s for s in result["series"]}
+    assert [s["server"] for s in result["series"]] == ["nginx_multi", "xampp"]
+    xampp = by_server["xampp"]
+    assert xampp["values"] == [1000.0, 10000.0, 100000.0]
+    assert xampp["latency_fit"]["fixed"] == pytest.approx(4.0)
+    assert xampp["latency_fit"]["per_unit"] == pytest.approx(0.0001)
+    assert xampp["crossover"] == pytest.approx(40000.0)
+    assert by_server["nginx_multi"]["crossover"] == pytest.approx(10000.0)
+    assert xampp["cost_fit"]["per_unit"] > 0
+
+    assert result["comparison"] == [{
+        "endpoint": "cpu.php", "label": "CPU", "param": "n", "values": [1000.0, 10000.0, 100000.0],
+        "rps_ratio": [3.0, 2.0, 1.2],
+    }]
+    assert ParamSweepProcessor.process([]) is None
+
+
+def test_report_includes_cost_model(tmp_path: Path):
+    run_dir = write_run(tmp_path / "results", "20260101_000000",
+                        "2026-01-01T00:00:00Z,xampp,json.php,3000.0,2.0ms,2,2,3,4,300.0\n")
+    (run_dir / "param_sweep.csv").write_text(PARAM_HEADER + "".join([
+        _sweep_row("n", 200, "xampp", "json.php", 3000.0, 2.0),
+        _sweep_row("n", 2000, "xampp", "json.php", 1500.0, 9.0),
+        _sweep_row("n", 20000, "xampp", "json.php", 100.0, 3.0),
+    ]), encoding="utf-8")
+
+    report = ReportGenerator(tmp_path / "results", tmp_path / "reports").render(run_dir / "results.csv")
+    series = report.payload["param_sweep"]["series"]
+    assert len(series) == 1 and series[0]["param"] == "n"
+    assert report.payload["param_sweep"]["comparison"] == []
+    assert 'data-i18n="cost_title"' in report.html
+    assert 'id="chart-cost-model"' in report.html
+    # A poor straight-line fit is flagged
+    assert '<span class="metric-chip metric-warning">' in report.html
@@ -0,0 +1,51 @@
+import csv
+import json
+import sys
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from perf.fixtures import server_names, write_fixture
+from perf.pipeline_bench import case_key, compare, run_case
+
+
+def test_fixture_spreads_rows_over_servers_and_endpoints(tmp_path: Path):
+    csv_path = write_fixture(tmp_path / "run", rows=120, servers=4)
+
+    with csv_path.open(newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 120
+    assert {r["server"] for r in rows} == {"xampp", "nginx_multi", "server_3", "server_4"}
+    assert {r["endpoint"] for r in rows} == {"cpu.php", "json.php", "io.php"}
+    assert rows[0]["latency_avg"].endswith("ms")
+    config = json.loads((tmp_path / "run" / "config.json").read_text(encoding="utf-8"))
+    assert config["endpoints"] == ["cpu.php", "json.php", "io.php"]
+    assert server_names(1) == ["xampp"]
+
+
+def test_run_case_records_stage_timings_and_peaks(tmp_path: Path):
+    result = run_case(100, 2, tmp_path)
+
+    stages = result["stages"]
+    for name in ("render", "render.load", "render.normalize", "render.html", "sidecar"):
+        assert stages[name]["wall_ms"] >= 0
+    assert stages["render"]["peak_kb"] > 0
+
+
+def test_compare_flags_only_meaningful_slowdowns():
+    key = case_key(1000, 2)
+    baseline = {"cases": {key: {"stages": {
+        "render": {"wall_ms": 100.0, "peak_kb": 1000.0},
+        "render.load": {"wall_ms": 2.0},
+    }}}}
+    current = {"cases": {key: {"stages": {
+        "render": {"wall_ms": 130.0, "peak_kb": 1010.0},
+        "render.load": {"wall_ms": 4.0},
+    }}}}
+
+    regressions = compare(current, baseline, threshold=0.2)
+
+    assert [(r["stage"], r["metric"]) for r in regressions] == [("render", "wall_ms")]
+    assert compare(current, baseline, threshold=0.5) == []
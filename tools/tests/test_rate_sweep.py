@@ -0,0 +1,64 @@
+import sys
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from generators.report_generator import ReportGenerator
+from helpers import server_rows, write_run
+from loaders.csv_loader import RateSweepLoader
+from loadgen.output import SWEEP_HEADER
+from processors.data_processor import RateSweepProcessor
+
+
+def _write_run(results_dir: Path, run_id: str, sweep_rows=None) -> Path:
+    run_dir = write_run(results_dir, run_id, server_rows())
+    if sweep_rows is not None:
+        (run_dir / "rate_sweep.csv").write_text(SWEEP_HEADER + "\n" + "".join(r + "\n" for r in sweep_rows),
+                                                encoding="utf-8")
+    return run_dir / "results.csv"
+
+
+def test_sweep_series_are_ordered_by_offered_rate(tmp_path: Path):
+    csv_path = _write_run(tmp_path, "run", [
+        "2026-01-01T00:00:02Z,xampp,cpu.php,400.00,380.00,9.0,6.0,15.0,80.0,120.0,150.0,3",
+        "2026-01-01T00:00:01Z,xampp,cpu.php,100.00,100.00,2.0,1.5,3.0,5.0,6.0,7.0,0",
+        "2026-01-01T00:00:03Z,nginx_multi,cpu.php,100.00,100.00,1.0,0.8,1.2,2.0,,2.5,0",
+        "2026-01-01T00:00:04Z,nginx_multi,cpu.php,200.00",
+    ])
+
+    points = RateSweepLoader.load(csv_path.parent)
+    sweep = RateSweepProcessor.process(points)
+
+    assert len(points) == 3
+    by_server = {s["server"]: s for s in sweep["series"]}
+    assert by_server["xampp"]["offered"] == [100.0, 400.0]
+    assert by_server["xampp"]["p99"] == [5.0, 80.0]
+    assert by_server["xampp"]["failed"] == [0, 3]
+    assert by_server["nginx_multi"]["p999"] == [None]
+    assert by_server["nginx_multi"]["label"] == "CPU"
+
+
+def test_report_payload_carries_rate_sweep(tmp_path: Path):
+    results_dir = tmp_path / "results"
+    csv_path = _write_run(results_dir, "20260101_000000", [
+        "2026-01-01T00:00:01Z,xampp,cpu.php,100.00,100.00,2.0,1.5,3.0,5.0,6.0,7.0,0",
+    ])
+    generator = ReportGenerator(results_dir, tmp_path / "reports")
+
+    report = generator.render(csv_path)
+
+    assert report.payload["rate_sweep"]["series"][0]["offered"] == [100.0]
+    assert 'id="chart-rate-sweep"' in report.html
+
+
+def test_runs_without_sweep_render_a_note_instead(tmp_path: Path):
+    results_dir = tmp_path / "results"
+    csv_path = _write_run(results_dir, "20260101_000000")
+
+    report = ReportGenerator(results_dir, tmp_path / "reports").render(csv_path)
+
+    assert RateSweepLoader.load(csv_path.parent) == []
+    assert report.payload["rate_sweep"] is None
+    assert 'id="rate-sweep-note"' in report.html
@@ -0,0 +1,65 @@
+import json
+import re
+import sys
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from generators.html_sections import RawResultsSection
+from generators.report_generator import ReportGenerator
+from models.benchmark import BenchmarkRow
+from perf.fixtures import write_fixture
+
+
+def _rows(count: int):
+    servers = ["xampp", "nginx_multi"]
+    return [
+        BenchmarkRow(
+            timestamp=f"t{i}",
+            server=servers[i % 2],
+            endpoint="cpu.php" if i % 4 < 2 else "json.php",
+            requests_sec=float(i),
+            latency_ms=1.5,
+            transfer_kb_sec=2.0,
+        )
+        for i in range(count)
+    ]
+
+
+def test_small_runs_keep_static_tables():
+    rows = _rows(RawResultsSection.VIRTUAL_ROW_THRESHOLD)
+
+    html = RawResultsSection.build(rows)
+
+    assert html.count("<tr><td>") == len(rows)
+    assert "raw-table-viewport" not in html
+
+
+def test_large_runs_render_virtual_shell_and_compact_columns():
+    rows = _rows(RawResultsSection.VIRTUAL_ROW_THRESHOLD + 1)
+
+    html = RawResultsSection.build(rows)
+    table = RawResultsSection.build_payload(rows)
+
+    assert "<tr><td>" not in html
+    assert 'id="raw-table-body"></tbody>' in html
+    assert '<option value="NGINX">NGINX</option>' in html
+    assert table["servers"] == ["XAMPP", "NGINX"]
+    assert table["endpoints"] == ["CPU", "JSON"]
+    assert table["columns"]["server"][:4] == [0, 1, 0, 1]
+    assert table["columns"]["endpoint"][:4] == [0, 0, 1, 1]
+    assert table["columns"]["requests_sec"][0] == 0.0
+
+
+def test_report_embeds_raw_table_instead_of_row_dicts(tmp_path: Path):
+    csv_path = write_fixture(tmp_path / "results" / "run", rows=2000, servers=3)
+
+    report = ReportGenerator(tmp_path / "results", tmp_path / "reports").render(csv_path)
+
+    embedded = json.loads(re.search(r"const payload = (\{.*?\});\n", report.html).group(1))
+    assert "rows" not in embedded
+    assert len(embedded["raw_table"]["columns"]["server"]) == 2000
+    assert len(report.payload["rows"]) == 2000
+    assert report.html.count("<tr") < 100
@@ -0,0 +1,201 @@
+import asyncio
+import gzip
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from helpers import server_rows, write_run
+from server import report_server
+from server.report_server import LRUCache, ReportServer
+
+
+def make_server(tmp_path: Path) -> ReportServer:
+    results_dir = tmp_path / "results"
+    write_run(results_dir, "20260101_000000", server_rows())
+    write_run(results_dir, "20260102_000000", server_rows())
+    return ReportServer(results_dir, tmp_path / "reports", cache_size=4, executor=ThreadPoolExecutor(2))
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert len(cache) == 2
+
+
+def test_report_etag_and_gzip(tmp_path: Path):
+    server = make_server(tmp_path)
+
+    async def scenario():
+        first = await server.handle_request("GET", "/runs/20260101_000000.html", {"accept-encoding": "gzip"})
+        repeat = await server.handle_request("GET", "/runs/20260101_000000.html", {"if-none-match": first.headers["ETag"]})
+        plain = await server.handle_request("GET", "/runs/20260101_000000.html", {})
+        return first, repeat, plain
+
+    first, repeat, plain = asyncio.run(scenario())
+    server.close()
+
+    assert first.status == 200
+    assert first.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(first.body) == plain.body
+    assert b"results/20260101_000000/results.csv" in plain.body
+    assert repeat.status == 304
+    assert repeat.body == b""
+    assert server.render_count == 1
+
+
+def test_concurrent_requests_share_one_render(tmp_path: Path, monkeypatch):
+    server = make_server(tmp_path)
+    calls = []
+    original = report_server._render_report
+
+    def counting_render(csv_path):
+        calls.append(csv_path)
+        return original(csv_path)
+
+    monkeypatch.setattr(report_server, "_render_report", counting_render)
+
+    async def scenario():
+        return await asyncio.gather(*(
+            server.handle_request("GET", "/runs/20260102_000000.html", {}) for _ in range(5)
+        ))
+
+    responses = asyncio.run(scenario())
+    server.close()
+
+    assert len(calls) == 1
+    assert {r.status for r in responses} == {200}
+    assert len({r.headers["ETag"] for r in responses}) == 1
+
+
+def test_index_and_unknown_runs(tmp_path: Path):
+    server = make_server(tmp_path)
+
+    async def scenario():
+        index = await server.handle_request("GET", "/", {})
+        missing = await server.handle_request("GET", "/runs/19990101_000000.html", {})
+        traversal = await server.handle_request("GET", "/runs/..%2F..html", {})
+        post = await server.handle_request("POST", "/", {})
+        return index, missing, traversal, post
+
+    index, missing, traversal, post = asyncio.run(scenario())
+    server.close()
+
+    assert index.status == 200
+    assert b'href="runs/20260101_000000.html"' in index.body
+    assert b'href="runs/20260102_000000.html"' in index.body
+    assert missing.status == 404
+    assert traversal.status == 404
+    assert post.status == 405
+
+
+def test_serves_over_tcp(tmp_path: Path):
+    server = make_server(tmp_path)
+
+    async def scenario():
+        tcp_server = await server.serve("127.0.0.1", 0)
+        port = tcp_server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"GET / HTTP/1.1\r\nHost: x\r\nConnection: close\r\n\r\n")
+        await writer.drain()
+        data = await reader.read()
+        writer.close()
+        tcp_server.close()
+        await tcp_server.wait_closed()
+        return data
+
+    data = asyncio.run(scenario())
+    server.close()
+
+    assert data.startswith(b"HTTP/1.1 200 OK\r\n")
+    assert b"ETag: " in data
+    assert b"PHP Benchmark Runs" in data
+
+
+def test_render_failure_returns_500_over_tcp(tmp_path: Path):
+    server = make_server(tmp_path)
+    broken = tmp_path / "results" / "20260103_000000"
+    broken.mkdir()
+    # No endpoint column: rendering raises KeyError
+    (broken / "results.csv").write_text("timestamp,server,requests_sec\n2026-01-01T00:00:00Z,xampp,1.0\n", encoding="utf-8")
+
+    async def scenario():
+        tcp_server = await server.serve("127.0.0.1", 0)
+        port = tcp_server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"GET /runs/20260103_000000.html HTTP/1.1\r\nHost: x\r\nConnection: close\r\n\r\n")
+        await writer.drain()
+        data = await reader.read()
+        writer.close()
+        tcp_server.close()
+        await tcp_server.wait_closed()
+        return data
+
+    data = asyncio.run(scenario())
+    server.close()
+
+    assert data.startswith(b"HTTP/1.1 500 Internal Server Error\r\n")
+    assert b"KeyError" in data
+
+
+def test_cancelled_requester_does_not_strand_waiters(tmp_path: Path, monkeypatch):
+    server = make_server(tmp_path)
+    original = report_server._render_report
+    release = threading.Event()
+
+    def slow_render(csv_path):
+        release.wait(5)
+        return original(csv_path)
+
+    monkeypatch.setattr(report_server, "_render_report", slow_render)
+
+    async def scenario():
+        first = asyncio.ensure_future(server.handle_request("GET", "/runs/20260101_000000.html", {}))
+        await asyncio.sleep(0.05)
+        waiter = asyncio.ensure_future(server.handle_request("GET", "/runs/20260101_000000.html", {}))
+        await asyncio.sleep(0.05)
+        first.cancel()
+        await asyncio.sleep(0.05)
+        release.set()
+        return await asyncio.wait_for(waiter, 5)
+
+    response = asyncio.run(scenario())
+    server.close()
+
+    assert response.status == 200
+    assert server.render_count == 1
+    assert not server._inflight
+
+
+def test_index_summaries_follow_full_signature_and_stay_bounded(tmp_path: Path):
+    results_dir = tmp_path / "results"
+    write_run(results_dir, "20260101_000000", server_rows())
+    write_run(results_dir, "20260102_000000", server_rows())
+    server = ReportServer(results_dir, tmp_path / "reports", executor=ThreadPoolExecutor(2), summary_cache_size=1)
+
+    async def scenario():
+        before = await server.handle_request("GET", "/", {})
+        (results_dir / "20260101_000000" / "config.json").write_text('{"connections": 7}', encoding="utf-8")
+        after = await server.handle_request("GET", "/", {})
+        return before, after
+
+    before, after = asyncio.run(scenario())
+    server.close()
+
+    assert before.status == after.status == 200
+    # config.json is part of the signature, so the run is summarized again
+    assert b"<td>7</td>" not in before.body
+    assert b"<td>7</td>" in after.body
+    assert b'href="runs/20260101_000000.html"' in after.body
+    assert b'href="runs/20260102_000000.html"' in after.body
+    assert len(server._summaries) == 1
@@ -0,0 +1,83 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from exporters import binary_codec
+from exporters.report_sidecar import SIDECAR_SCHEMA_VERSION, ReportSidecarBuilder, check_schema_version
+from generators.report_generator import ReportGenerator
+from helpers import server_rows, write_run
+
+
+def test_peak_client_concurrency_follows_schedule():
+    config = {
+        "connections": 50,
+        "endpoints": ["cpu.php", "json.php", "io.php"],
+        "endpoint_params": {
+            "cpu": {"connections": 100},
+            "json": {"connections": 300},
+            "io": {},
+        },
+    }
+
+    assert ReportSidecarBuilder.peak_client_concurrency({**config, "endpoint_schedule": "sequential"}) == 600
+    assert ReportSidecarBuilder.peak_client_concurrency({**config, "endpoint_schedule": "parallel"}) == 900
+    assert ReportSidecarBuilder.peak_client_concurrency({"connections": 40}) == 80
+
+
+def test_generate_writes_sidecar_with_metrics_cube(tmp_path: Path):
+    write_run(tmp_path / "results", "20260101_000000", server_rows())
+    reports_dir = tmp_path / "reports"
+
+    output_path = ReportGenerator(tmp_path / "results", reports_dir).generate()
+
+    sidecar = json.loads(output_path.with_suffix(".json").read_text(encoding="utf-8"))
+    assert sidecar == json.loads((reports_dir / "report.json").read_text(encoding="utf-8"))
+    assert sidecar["meta"]["run_id"] == "20260101_000000"
+    assert sidecar["metrics"]["nginx_multi"]["cpu.php"]["requests_sec"] == 200.0
+    assert sidecar["metrics"]["xampp"]["cpu.php"]["latency_p99_ms"] == 40.0
+    assert sidecar["insights"][0]["req_winner"] == "nginx_multi"
+    assert sidecar["peak_client_concurrency"] == 100
+
+
+def test_sidecar_carries_full_payload_and_binary_roundtrip(tmp_path: Path):
+    write_run(tmp_path / "results", "20260101_000000",
+              "2026-01-01T00:00:00Z,xampp,cpu.php,100.0,20.0ms,18,20,25,40,100.0\n"
+              "2026-01-01T00:00:00Z,nginx_multi,json.php,250.5,4.0ms,,,,,80.0\n")
+    reports_dir = tmp_path / "reports"
+
+    output_path = ReportGenerator(tmp_path / "results", reports_dir).generate()
+
+    sidecar = json.loads(output_path.with_suffix(".json").read_text(encoding="utf-8"))
+    assert sidecar["schema_version"] == SIDECAR_SCHEMA_VERSION
+    for key in ("charts", "hist_requests", "interpretations", "has_pctl", "rows"):
+        assert key in sidecar
+    assert sidecar["charts"]["requests_sec"]["labels"]
+    assert sidecar["interpretations"]["zh"]
+
+    version, decoded = binary_codec.read(reports_dir / "report.bin")
+    assert version == SIDECAR_SCHEMA_VERSION
+    assert decoded == sidecar
+    assert (reports_dir / "report.bin").stat().st_size < (reports_dir / "report.json").stat().st_size
+    check_schema_version(version)
+    with pytest.raises(ValueError, match="regenerate"):
+        check_schema_version(SIDECAR_SCHEMA_VERSION + 1)
+
+
+def test_binary_codec_packs_numeric_lists_as_typed_arrays():
+    value = {"floats": [1.5, 2.25], "ints": [1, 2, 3], "mixed": [1, 2.5, None], "empty": [], "flag": True}
+    data = binary_codec.encode(value, 7)
+
+    assert b"D\x02\x00\x00\x00" in data
+    assert b"Q\x03\x00\x00\x00" in data
+    assert binary_codec.decode(data) == (7, value)
+
+    with pytest.raises(binary_codec.BinaryCodecError):
+        binary_codec.decode(b"XXXX" + data[4:])
+    with pytest.raises(binary_codec.BinaryCodecError):
+        binary_codec.decode(data[:-3])
@@ -0,0 +1,112 @@
+import sys
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from generators.report_watcher import ReportWatcher
+from helpers import CSV_HEADER
+from loaders.csv_tailer import CSVTailer
+
+
+XAMPP_ROW = "2026-01-01T00:00:00Z,xampp,cpu.php,100.0,20.0ms,18,20,25,40,100.0\n"
+NGINX_ROW = "2026-01-01T00:00:01Z,nginx_multi,cpu.php,200.0,10.0ms,9,10,12,20,200.0\n"
+
+
+def append(path: Path, text: str) -> None:
+    with path.open("a", encoding="utf-8") as f:
+        f.write(text)
+
+
+def test_tailer_reads_only_complete_new_lines(tmp_path: Path):
+    csv_path = tmp_path / "results.csv"
+    csv_path.write_text(CSV_HEADER, encoding="utf-8")
+    tailer = CSVTailer(csv_path)
+
+    assert tailer.read_new() == []
+
+    append(csv_path, XAMPP_ROW + NGINX_ROW[:20])
+    rows = tailer.read_new()
+    assert [r["server"] for r in rows] == ["xampp"]
+
+    append(csv_path, NGINX_ROW[20:])
+    rows = tailer.read_new()
+    assert [r["server"] for r in rows] == ["nginx_multi"]
+    assert rows[0]["requests_sec"] == "200.0"
+    assert tailer.offset == csv_path.stat().st_size
+    assert not tailer.has_new_data()
+
+
+def test_tailer_restarts_after_truncation(tmp_path: Path):
+    csv_path = tmp_path / "results.csv"
+    csv_path.write_text(CSV_HEADER + XAMPP_ROW + NGINX_ROW, encoding="utf-8")
+    tailer = CSVTailer(csv_path)
+    assert len(tailer.read_new()) == 2
+
+    csv_path.write_text(CSV_HEADER + XAMPP_ROW, encoding="utf-8")
+
+    assert [r["server"] for r in tailer.read_new()] == ["xampp"]
+
+
+def test_watcher_refreshes_report_per_new_row(tmp_path: Path):
+    results_dir = tmp_path / "results"
+    reports_dir = tmp_path / "reports"
+    old_run = results_dir / "20260101_000000"
+    old_run.mkdir(parents=True)
+    (old_run / "results.csv").write_text(CSV_HEADER + XAMPP_ROW, encoding="utf-8")
+    active_run = results_dir / "20260102_000000"
+    active_run.mkdir()
+    csv_path = active_run / "results.csv"
+    csv_path.write_text(CSV_HEADER, encoding="utf-8")
+
+    watcher = ReportWatcher(results_dir, reports_dir)
+    assert watcher.poll() is None
+
+    append(csv_path, XAMPP_ROW)
+    report_path = watcher.poll()
+    assert report_path == reports_dir / "report.html"
+    assert "results/20260102_000000/results.csv" in report_path.read_text(encoding="utf-8")
+    assert len(watcher.rows) == 1
+
+    assert watcher.poll() is None
+
+    append(csv_path, NGINX_ROW)
+    assert watcher.poll() == report_path
+    assert [r.server for r in watcher.rows] == ["xampp", "nginx_multi"]
+
+
+def test_tailer_restarts_when_file_is_replaced(tmp_path: Path):
+    csv_path = tmp_path / "results.csv"
+    csv_path.write_text(CSV_HEADER + XAMPP_ROW, encoding="utf-8")
+    tailer = CSVTailer(csv_path)
+    assert len(tailer.read_new()) == 1 and tailer.generation == 0
+
+    # A larger file moved into place: the offset alone would not notice
+    replacement = tmp_path / "results.csv.new"
+    replacement.write_text(CSV_HEADER + NGINX_ROW + XAMPP_ROW, encoding="utf-8")
+    replacement.replace(csv_path)
+
+    assert [r["server"] for r in tailer.read_new()] == ["nginx_multi", "xampp"]
+    assert tailer.generation == 1
+
+
+def test_watcher_drops_old_rows_after_truncation_and_skips_bad_rows(tmp_path: Path):
+    run_dir = tmp_path / "results" / "20260102_000000"
+    run_dir.mkdir(parents=True)
+    csv_path = run_dir / "results.csv"
+    csv_path.write_text(CSV_HEADER + XAMPP_ROW + NGINX_ROW, encoding="utf-8")
+    watcher = ReportWatcher(tmp_path / "results", tmp_path / "reports", interval=0)
+    assert watcher.poll() is not None
+    assert len(watcher.rows) == 2
+
+    (run_dir / "config.json").write_text('{"connections": 7}', encoding="utf-8")
+    csv_path.write_text(CSV_HEADER + NGINX_ROW, encoding="utf-8")
+    assert watcher.poll() is not None
+    assert [r.server for r in watcher.rows] == ["nginx_multi"]
+    assert watcher.config["connections"] == 7
+
+    # A row cut short and a row with a non-numeric value are skipped, not fatal
+    append(csv_path, "2026-01-01T00:00:02Z,xampp\n" + XAMPP_ROW.replace("100.0,20.0ms", "n/a,20.0ms") + XAMPP_ROW)
+    watcher.watch(max_polls=1)
+    assert [r.server for r in watcher.rows] == ["nginx_multi", "xampp"]
@@ -0,0 +1,145 @@
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+import sample_server
+from generators.report_generator import ReportGenerator
+from helpers import write_run
+from loaders.csv_loader import ResourceLoader
+from loadgen.resources import (RESOURCE_HEADER, CgroupSource, ProcSource, ResourceSample, ResourceSampler,
+                               find_container_cgroup, format_resources, open_source)
+from processors.data_processor import ResourceProcessor
+
+
+def _cgroup(path: Path, usage: int, throttled: int, memory: int) -> Path:
+    path.mkdir(parents=True, exist_ok=True)
+    (path / "cpu.stat").write_text(f"usage_usec {usage}\nuser_usec {usage}\nsystem_usec 0\n"
+                                   f"nr_periods 10\nnr_throttled 2\nthrottled_usec {throttled}\n")
+    (path / "memory.current").write_text(f"{memory}\n")
+    return path
+
+
+def _process(proc: Path, pid: int, comm: str, ticks: int, rss_kb: int) -> None:
+    entry = proc / str(pid)
+    entry.mkdir(parents=True, exist_ok=True)
+    (entry / "comm").write_text(comm + "\n")
+    # pid (comm) state ppid ... utime is field 14, stime field 15
+    (entry / "stat").write_text(f"{pid} ({comm}) S 1 1 1 0 -1 0 0 0 0 0 {ticks} 0 0 0 20 0 1 0\n")
+    (entry / "status").write_text(f"Name:\t{comm}\nVmRSS:\t  {rss_kb} kB\n")
+
+
+def test_cgroup_source_and_docker_lookup(tmp_path: Path):
+    scope = _cgroup(tmp_path / "system.slice" / "docker-3f2a9c0d.scope", 5_000_000, 250_000, 64 * 1048576)
+    assert find_container_cgroup("3f2a9c", tmp_path) == scope
+    assert open_source("docker:3f2a9c", tmp_path).read() == (5_000_000, 250_000, 2, 64 * 1048576)
+    with pytest.raises(ValueError):
+        find_container_cgroup("ffff", tmp_path)
+    with pytest.raises(ValueError):
+        CgroupSource(tmp_path)
+    with pytest.raises(ValueError):
+        open_source("pid:1")
+
+
+def test_proc_source_accumulates_across_process_churn(tmp_path: Path):
+    proc = tmp_path / "proc"
+    _process(proc, 10, "php-fpm", ticks=100, rss_kb=1000)
+    _process(proc, 11, "php-fpm", ticks=50, rss_kb=2000)
+    _process(proc, 12, "bash", ticks=999, rss_kb=5000)
+    source = ProcSource("php-fpm", proc=proc)
+    source._ticks_per_sec = 100
+
+    assert source.read() == (0, 0, 0, 3000 * 1024)
+    # pid 11 exits, pid 10 uses 20 more ticks, pid 13 starts having used 5
+    for child in (proc / "11").iterdir():
+        child.unlink()
+    (proc / "11").rmdir()
+    _process(proc, 10, "php-fpm", ticks=120, rss_kb=1000)
+    _process(proc, 13, "php-fpm", ticks=5, rss_kb=500)
+    assert source.read() == (250_000, 0, 0, 1500 * 1024)
+
+
+def test_sampler_reports_per_interval_usage():
+    reads = iter([(1_000_000, 0, 0, 10 * 1048576), (1_500_000, 2_000, 1, 12 * 1048576),
+                  (2_500_000, 2_000, 1, 11 * 1048576)])
+
+    class Scripted:
+        def read(self):
+            return next(reads)
+
+    sampler = ResourceSampler(Scripted(), interval=60)
+    sampler._sample()
+    sampler._sample()
+    samples = sampler.stop()
+    assert [s.cpu_usec for s in samples] == [0, 500_000, 1_500_000]
+
+    fixed = [ResourceSample(0.0, 0, 0, 0, 10 * 1048576), ResourceSample(0.5, 500_000, 2_000, 1, 12 * 1048576),
+             ResourceSample(1.5, 1_500_000, 2_000, 1, 11 * 1048576)]
+    assert format_resources(fixed).splitlines() == [
+        RESOURCE_HEADER,
+        "0.500,0.500000,1.000,2.000,1,12.00",
+        "1.500,1.000000,1.000,0.000,0,11.00",
+    ]
+
+
+def test_resource_flags_are_validated(capsys):
+    with pytest.raises(SystemExit):
+        sample_server.parse_args(["--resource", "proc:nginx"])
+    with pytest.raises(SystemExit):
+        sample_server.parse_args(["--resource-out", "r.csv"])
+    args = sample_server.parse_args(["--resource", "proc:nginx", "--resource-out", "r.csv"])
+    assert args.status_out is None and args.resource_interval == 1.0
+    capsys.readouterr()
+
+
+def test_sample_server_writes_samples_on_sigterm(tmp_path: Path):
+    scope = _cgroup(tmp_path / "cgroup", 1_000_000, 0, 32 * 1048576)
+    out = tmp_path / "resources" / "xampp" / "cpu.php.csv"
+    sampler = subprocess.Popen([sys.executable, str(TOOLS_DIR / "sample_server.py"), "--resource", f"cgroup:{scope}",
+                                "--resource-out", str(out), "--resource-interval", "60"])
+    try:
+        deadline = time.monotonic() + 10
+        while not out.exists():
+            assert sampler.poll() is None and time.monotonic() < deadline
+            time.sleep(0.05)
+        # Created with just the header once sampling is under way
+        assert out.read_text(encoding="utf-8") == RESOURCE_HEADER + "\n"
+        _cgroup(scope, 1_500_000, 0, 40 * 1048576)
+        sampler.send_signal(signal.SIGTERM)
+        assert sampler.wait(timeout=10) == 0
+    finally:
+        sampler.kill()
+    header, row = out.read_text(encoding="utf-8").splitlines()
+    assert header == RESOURCE_HEADER
+    assert row.split(",")[1] == "0.500000" and row.endswith(",40.00")
+
+
+def test_report_shows_efficiency_next_to_throughput(tmp_path: Path):
+    run_dir = write_run(tmp_path / "results", "20260101_000000",
+                        "2026-01-01T00:00:00Z,xampp,cpu.php,900.0,20.0ms,18,20,25,40,100.0\n"
+                        "2026-01-01T00:00:00Z,nginx_multi,cpu.php,3000.0,5.0ms,4,5,6,9,300.0\n")
+    for server, cores, memory, throttled in (("xampp", 1.0, 300.0, 150.0), ("nginx_multi", 4.0, 150.0, 0.0)):
+        path = run_dir / "resources" / server / "cpu.php.csv"
+        path.parent.mkdir(parents=True)
+        path.write_text(RESOURCE_HEADER + "\n" + "".join(
+            f"{t}.000,{cores:.6f},{cores:.3f},{throttled:.3f},1,{memory:.2f}\n" for t in (1, 2)), encoding="utf-8")
+
+    resources = ResourceProcessor.process(ResourceLoader.load(run_dir), [])
+    assert all(e["req_per_cpu_s"] is None for e in resources["efficiency"])
+
+    report = ReportGenerator(tmp_path / "results", tmp_path / "reports").render(run_dir / "results.csv")
+    efficiency = {e["server"]: e for e in report.payload["resources"]["efficiency"]}
+    assert efficiency["xampp"]["req_per_cpu_s"] == pytest.approx(900.0)
+    assert efficiency["nginx_multi"]["req_per_cpu_s"] == pytest.approx(750.0)
+    assert efficiency["nginx_multi"]["rps_per_mb"] == pytest.approx(20.0)
+    assert efficiency["xampp"]["throttled_ms"] == pytest.approx(300.0)
+    assert 'data-i18n="efficiency_title"' in report.html
+    assert "<strong>750</strong>" in report.html
+    assert 'id="chart-resource-cpu"' in report.html
@@ -0,0 +1,112 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+import plan_cells
+from loadgen.scheduler import Cell, parse_compose_cpus, parse_server_cpus, plan_waves, server_pins, wall_time
+from loadgen.sharding import format_cpu_list, parse_cpu_list
+
+
+COMPOSE = """services:
+  xampp:
+    build:
+      context: .
+    cpus: "1.0"
+    mem_limit: 512m
+
+  nginx-multi:
+    ports:
+      - "8083:80"
+    # no cpus limit
+
+  benchmark:
+    environment:
+      cpus: "9"
+"""
+
+
+def _cores(waves):
+    return [sorted(c for p in wave for c in p.server_cores + p.client_cores) for wave in waves]
+
+
+def test_parse_compose_cpus_reads_service_limits_only():
+    assert parse_compose_cpus(COMPOSE) == {"xampp": 1.0, "nginx-multi": None, "benchmark": None}
+
+
+def test_parse_server_cpus_and_cpu_lists():
+    assert parse_server_cpus("xampp=1.5, nginx_multi=") == {"xampp": 1.5, "nginx_multi": None}
+    with pytest.raises(ValueError):
+        parse_server_cpus("xampp")
+    assert parse_cpu_list("0,2-4,7") == [0, 2, 3, 4, 7]
+    assert format_cpu_list([7, 0, 2, 3, 4]) == "0,2-4,7"
+    with pytest.raises(ValueError):
+        parse_cpu_list("1-")
+
+
+def test_cells_share_a_wave_on_disjoint_cores():
+    cells = [Cell("xampp", e, 10, server_cpus=1.0) for e in ("cpu.php", "io.php")]
+    cells += [Cell("nginx", e, 10, server_cpus=1.0) for e in ("cpu.php", "io.php")]
+    waves = plan_waves(cells, range(8))
+    assert len(waves) == 1
+    cores = _cores(waves)[0]
+    assert len(cores) == len(set(cores)) == 8
+    assert wall_time(waves) == 10
+
+
+def test_unlimited_server_gets_a_fixed_budget_and_long_cells_go_first():
+    cells = [Cell("xampp", "io.php", 5, server_cpus=1.0), Cell("nginx_multi", "cpu.php", 30),
+             Cell("xampp", "cpu.php", 30, server_cpus=1.0, client_cpus=2)]
+    waves = plan_waves(cells, range(6), unlimited_cores=2)
+    assert [[p.cell.server for p in wave] for wave in waves] == [["nginx_multi", "xampp"], ["xampp"]]
+    multi = waves[0][0]
+    assert (multi.server_cores, multi.client_cores) == ([0, 1], [2])
+    assert waves[0][1].client_cores == [4, 5]
+    assert wall_time(waves) == 35
+
+
+def test_packed_default_matrix_beats_sequential_pairs():
+    # run_ab.sh's sequential schedule runs each endpoint's xampp/nginx_multi pair together
+    endpoints = ("cpu.php", "json.php", "io.php")
+    cells = [Cell(server, e, 10, server_cpus=cpus) for e in endpoints
+             for server, cpus in (("xampp", 1.0), ("nginx_multi", None))]
+    sequential_pairs = sum(10 for _ in endpoints)
+    waves = plan_waves(cells, range(8))
+    assert wall_time(waves) < sequential_pairs
+    for wave, cores in zip(waves, _cores(waves)):
+        assert len(cores) == len(set(cores))
+        assert not any(p.oversubscribed for p in wave)
+
+
+def test_server_pins_union_cores_and_scale_limits():
+    cells = [Cell("xampp", e, 10, server_cpus=1.0) for e in ("cpu.php", "io.php")]
+    cells += [Cell("nginx_multi", "cpu.php", 10)]
+    wave = plan_waves(cells, range(8))[0]
+    pins = server_pins(wave)
+    assert pins["nginx_multi"] == ([0, 1], None)
+    xampp_cores = sorted(c for p in wave if p.cell.server == "xampp" for c in p.server_cores)
+    assert pins["xampp"] == (xampp_cores, 2.0)
+
+
+def test_cell_larger_than_machine_is_serialized_and_oversubscribed():
+    waves = plan_waves([Cell("xampp", "cpu.php", 3, server_cpus=1.0), Cell("nginx", "cpu.php", 3, server_cpus=1.0)],
+                       [0])
+    assert len(waves) == 2
+    assert all(wave[0].oversubscribed for wave in waves)
+    with pytest.raises(ValueError):
+        plan_waves([Cell("xampp", "cpu.php", 3)], [])
+
+
+def test_plan_cells_cli_prints_shell_plan(tmp_path, capsys):
+    compose = tmp_path / "docker-compose.yml"
+    compose.write_text(COMPOSE, encoding="utf-8")
+    assert plan_cells.main(["--compose", str(compose), "--server-cpus", "nginx_multi=2", "--cpus", "0-7",
+                            "--cell", "nginx_multi:cpu.php:30", "--cell", "xampp:cpu.php:30"]) == 0
+    assert capsys.readouterr().out.splitlines() == [
+        "0 nginx_multi cpu.php 2 0-1 nginx-multi 2",
+        "0 xampp cpu.php 4 3 xampp 1",
+    ]
@@ -0,0 +1,131 @@
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+import sample_server
+from generators.report_generator import ReportGenerator
+from helpers import write_run
+from loaders.csv_loader import ServerStatusLoader
+from loadgen.server_status import (STATUS_HEADER, StatusPoller, StatusSample, format_status, parse_fpm_status,
+                                   parse_stub_status)
+from processors.data_processor import ServerStatusProcessor
+
+
+STUB_STATUS = """Active connections: 291 
+server accepts handled requests
+ 16630948 16630948 31070465 
+Reading: 6 Writing: 179 Waiting: 106 
+"""
+FPM_STATUS = {
+    "pool": "www", "process manager": "dynamic", "start time": 1700000000, "start since": 120,
+    "accepted conn": 5000, "listen queue": 7, "max listen queue": 40, "listen queue len": 511,
+    "idle processes": 0, "active processes": 240, "total processes": 240, "max active processes": 240,
+    "max children reached": 3, "slow requests": 0,
+}
+
+
+def test_parse_status_pages():
+    assert parse_stub_status(STUB_STATUS) == {"active": 291, "accepts": 16630948, "handled": 16630948,
+                                              "requests": 31070465, "reading": 6, "writing": 179, "waiting": 106}
+    fpm = parse_fpm_status(json.dumps(FPM_STATUS))
+    assert (fpm["active"], fpm["idle"], fpm["listen_queue"], fpm["max_children_reached"]) == (240, 0, 7, 3)
+    with pytest.raises(ValueError):
+        parse_stub_status("<html>404</html>")
+    with pytest.raises(ValueError):
+        parse_fpm_status("pool: www")
+
+
+def test_poller_reads_both_pages_and_counts_failures():
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == "/nginx_status":
+                body = STUB_STATUS.encode()
+            elif self.path == "/php-fpm-status?json":
+                body = json.dumps(FPM_STATUS).encode()
+            else:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        poller = StatusPoller(f"{base}/nginx_status", f"{base}/php-fpm-status?json", interval=0.05).start()
+        poller._stop.wait(0.2)
+        samples = poller.stop()
+        broken = StatusPoller(fpm_url=f"{base}/missing", interval=60).start()
+        assert broken.stop() == [] and broken.errors == 1
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert len(samples) >= 2
+    assert samples[0].nginx["writing"] == 179 and samples[0].fpm["listen_queue"] == 7
+    with pytest.raises(ValueError):
+        StatusPoller()
+
+
+def test_format_status_leaves_unread_pages_blank():
+    fpm = parse_fpm_status(json.dumps(FPM_STATUS))
+    text = format_status([StatusSample(0.25, parse_stub_status(STUB_STATUS), None), StatusSample(0.5, None, fpm)])
+    assert text.splitlines() == [
+        STATUS_HEADER,
+        "0.250,291,6,179,106,31070465,,,,,,",
+        "0.500,,,,,,240,0,240,7,511,3",
+    ]
+
+
+def test_status_flags_are_validated(capsys):
+    with pytest.raises(SystemExit):
+        sample_server.parse_args(["--status-out", "s.csv"])
+    with pytest.raises(SystemExit):
+        sample_server.parse_args(["--fpm-status", "http://127.0.0.1/php-fpm-status?json"])
+    with pytest.raises(SystemExit):
+        sample_server.parse_args([])
+    args = sample_server.parse_args(["--nginx-status", "http://127.0.0.1/nginx_status", "--status-out", "s.csv"])
+    assert args.resource is None and args.status_interval == 0.25
+    capsys.readouterr()
+
+
+def test_report_names_the_saturation_cause(tmp_path: Path):
+    run_dir = write_run(tmp_path / "results", "20260101_000000",
+                        "2026-01-01T00:00:00Z,nginx_multi,cpu.php,900.0,20.0ms,18,20,25,40,100.0\n"
+                        "2026-01-01T00:00:00Z,nginx_multi,json.php,3000.0,5.0ms,4,5,6,9,300.0\n")
+    status_dir = run_dir / "server_status" / "nginx_multi"
+    status_dir.mkdir(parents=True)
+    (status_dir / "cpu.php.csv").write_text(STATUS_HEADER + "\n"
+                                            "0.000,50,0,40,10,100,40,20,60,0,511,5\n"
+                                            "0.250,,,,,,,,,,,\n"
+                                            "0.500,260,0,240,20,900,240,0,240,12,511,8\n", encoding="utf-8")
+    (status_dir / "json.php.csv").write_text(STATUS_HEADER + "\n"
+                                             "0.000,20,0,5,15,100,5,35,40,0,511,8\n"
+                                             "0.250,22,0,6,16,300,6,34,40,0,511,8\n", encoding="utf-8")
+
+    status = ServerStatusProcessor.process(ServerStatusLoader.load(run_dir))
+    by_endpoint = {s["endpoint"]: s for s in status["summary"]}
+    assert by_endpoint["cpu.php"]["max_children_reached"] == 3
+    assert by_endpoint["cpu.php"]["causes"] == ["max_children", "listen_queue"]
+    assert by_endpoint["cpu.php"]["peak_fpm_active"] == 240
+    assert by_endpoint["json.php"]["causes"] == []
+    assert status["series"][0]["fpm_active"] == [40, None, 240]
+
+    report = ReportGenerator(tmp_path / "results", tmp_path / "reports").render(run_dir / "results.csv")
+    assert report.payload["server_status"] == status
+    assert "php-fpm hit pm.max_children; new requests had to queue" in report.html
+    assert "no php-fpm saturation seen" in report.html
+    assert 'id="chart-server-status"' in report.html
@@ -0,0 +1,47 @@
+import json
+import sys
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from generators.report_generator import ReportGenerator
+from helpers import write_run
+from utils.stage_profiler import StageProfiler
+
+
+def test_nested_stage_peak_covers_children():
+    profiler = StageProfiler()
+    profiler.start()
+    try:
+        with profiler.stage("outer"):
+            with profiler.stage("inner"):
+                blob = bytearray(512 * 1024)
+            del blob
+    finally:
+        profiler.stop()
+
+    stages = {s["stage"]: s for s in profiler.to_dict()["stages"]}
+    assert list(stages) == ["outer", "outer.inner"]
+    assert stages["outer.inner"]["depth"] == 1
+    assert stages["outer.inner"]["peak_kb"] >= 512
+    assert stages["outer"]["peak_kb"] >= stages["outer.inner"]["peak_kb"]
+
+
+def test_report_generation_records_pipeline_stages(tmp_path: Path):
+    write_run(tmp_path / "results", "20260101_000000",
+              "2026-01-01T00:00:00Z,xampp,cpu.php,100.0,20.0ms,18,20,25,40,100.0\n")
+    profiler = StageProfiler(trace_memory=False)
+
+    ReportGenerator(tmp_path / "results", tmp_path / "reports", profiler=profiler).generate()
+
+    names = [s["stage"] for s in profiler.to_dict()["stages"]]
+    for expected in ("find", "load", "normalize", "charts", "insights", "interpretations_en",
+                     "interpretations_zh", "html.js_payload", "html.section_raw_results", "write.report", "write.latest"):
+        assert expected in names
+    table = profiler.format_table()
+    assert "section_benchmark_report" in table
+
+    profile_path = profiler.write_json(tmp_path / "profile.json")
+    assert json.loads(profile_path.read_text(encoding="utf-8"))["stages"][0]["stage"] == "find"
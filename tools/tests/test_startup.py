@@ -0,0 +1,58 @@
+import importlib
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+
+# Cumulative import time (microseconds) allowed for `<entry point> --help`.
+# Generous enough for slow CI hosts; the point is to catch an entry point that
+# starts loading the rendering pipeline, asyncio or python-docx before argv.
+IMPORT_BUDGET_US = 150_000
+
+ENTRY_POINTS = {
+    "benchmark_pipeline.py": ("perf.pipeline_bench", "generators.report_generator"),
+    "generate_report.py": ("generators.report_generator", "generators.batch_generator", "utils.stage_profiler"),
+    "serve_reports.py": ("server.report_server", "asyncio.base_events", "generators.report_generator"),
+    "generate_word_report.py": ("docx", "concurrent.futures.process"),
+}
+
+
+def _import_times(script: str):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", str(TOOLS_DIR / script), "--help"],
+        capture_output=True, text=True, cwd=TOOLS_DIR, timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = (len(name) - len(name.lstrip()), int(cumulative_us))
+    return modules
+
+
+@pytest.mark.parametrize("script", sorted(ENTRY_POINTS))
+def test_entry_point_help_stays_within_import_budget(script):
+    modules = _import_times(script)
+
+    for heavy in ENTRY_POINTS[script]:
+        assert heavy not in modules, f"{script} --help imported {heavy}"
+    top_level_us = sum(us for indent, us in modules.values() if indent == 1)
+    assert top_level_us < IMPORT_BUDGET_US, f"{script} --help spent {top_level_us} us importing"
+
+
+def test_settings_import_has_no_filesystem_side_effects(monkeypatch):
+    calls = []
+    monkeypatch.setattr(Path, "mkdir", lambda self, *args, **kwargs: calls.append(self))
+    import config.settings
+
+    importlib.reload(config.settings)
+
+    assert calls == []
@@ -0,0 +1,70 @@
+import sys
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from generators.report_generator import ReportGenerator
+from helpers import write_run
+from loaders.csv_loader import TimelineLoader
+import ab_timeline
+from loadgen.output import TIMELINE_HEADER
+
+
+def _write_timeline(run_dir: Path, server: str, endpoint: str, rows) -> None:
+    path = run_dir / "timeline" / server / f"{endpoint}.csv"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(TIMELINE_HEADER + "\n" + "".join(r + "\n" for r in rows), encoding="utf-8")
+
+
+def test_loader_reads_cells_and_keeps_stalled_seconds(tmp_path: Path):
+    _write_timeline(tmp_path, "nginx_multi", "cpu.php", ["0,900,0,1.0,2.0,3.0,4.0", "1,0,2,,,,"])
+    _write_timeline(tmp_path, "xampp", "cpu.php", ["0,400,0,2.0,3.0,9.5,12.0", "1,410,0,2.0,3.0,8.0,11.0"])
+    _write_timeline(tmp_path, "xampp", "io.php", ["0,300,0,1.0,1.0,1.0,1.0", "garbage"])
+
+    series = TimelineLoader.load(tmp_path)
+
+    assert [(s.server, s.endpoint) for s in series] == [("nginx_multi", "cpu.php"), ("xampp", "cpu.php"), ("xampp", "io.php")]
+    assert series[0].completed == [900, 0]
+    assert series[0].failed == [0, 2]
+    assert series[0].latency_p99_ms == [3.0, None]
+    assert series[2].seconds == [0]
+    assert TimelineLoader.load(tmp_path / "missing") == []
+
+
+def test_report_payload_carries_timeline(tmp_path: Path):
+    run_dir = write_run(tmp_path / "results", "20260101_000000",
+                        "2026-01-01T00:00:00Z,xampp,cpu.php,100.0,20.0ms,18,20,25,40,100.0\n")
+    _write_timeline(run_dir, "xampp", "cpu.php", ["0,100,0,18.0,25.0,40.0,55.0", "1,0,0,,,,"])
+
+    report = ReportGenerator(tmp_path / "results", tmp_path / "reports").render(run_dir / "results.csv")
+
+    series = report.payload["timeline"]["series"]
+    assert series[0]["label"] == "CPU"
+    assert series[0]["t"] == [0, 1]
+    assert series[0]["requests"] == [100, 0]
+    assert series[0]["p99"] == [40.0, None]
+    assert 'id="chart-timeline-rps"' in report.html and 'id="chart-timeline-lat"' in report.html
+
+
+def test_ab_gnuplot_converts_to_timeline(tmp_path: Path):
+    gnuplot = tmp_path / "cpu.php.tsv"
+    gnuplot.write_text(
+        "starttime\tseconds\tctime\tdtime\tttime\twait\n"
+        "Thu Jan  1 00:00:00 2026\t1767225600\t0\t10\t10\t10\n"
+        "Thu Jan  1 00:00:00 2026\t1767225600\t0\t30\t30\t30\n"
+        # Started in second 0, completed in second 3: the stall shows as empty seconds 1 and 2
+        "Thu Jan  1 00:00:00 2026\t1767225600\t0\t3200\t3200\t3200\n"
+        "truncated line\n",
+        encoding="utf-8")
+    out = tmp_path / "timeline" / "xampp" / "cpu.php.csv"
+
+    assert ab_timeline.main([str(gnuplot), "--out", str(out)]) == 0
+    header, *rows = out.read_text(encoding="utf-8").splitlines()
+    assert header == TIMELINE_HEADER
+    # Percentiles are histogram bucket midpoints (< 0.8% off); the max is exact
+    assert rows[0].startswith("0,2,0,10.000,") and rows[0].endswith(",30.000")
+    assert rows[1:3] == ["1,0,0,,,,", "2,0,0,,,,"]
+    assert rows[3].startswith("3,1,0,") and rows[3].endswith(",3200.000")
+    assert TimelineLoader.load(tmp_path)[0].completed == [2, 0, 0, 1]
@@ -0,0 +1,25 @@
+import sys
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+import generate_word_report
+
+
+def test_generate_one_returns_error_for_bad_sidecar(tmp_path: Path):
+    sidecar = tmp_path / "report_bad.json"
+    sidecar.write_text("{not json", encoding="utf-8")
+    result = generate_word_report.generate_one(sidecar)
+    assert result["source"] == str(sidecar)
+    assert result["error"].startswith("JSONDecodeError: ")
+    assert "output" not in result
+
+
+def test_main_reports_missing_sidecar_without_traceback(tmp_path: Path, capsys):
+    missing = tmp_path / "report_missing.html"
+    assert generate_word_report.main([str(missing)]) == 1
+    err = capsys.readouterr().err
+    assert f"Error: {missing}: FileNotFoundError: No sidecar found" in err
+    assert "Traceback" not in err
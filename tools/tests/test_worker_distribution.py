@@ -0,0 +1,48 @@
+import sys
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from generators.report_generator import ReportGenerator
+from helpers import write_run
+from loaders.csv_loader import BodySampleLoader
+from loadgen.output import SAMPLES_HEADER
+from processors.data_processor import WorkerDistributionProcessor
+
+
+def test_gini_of_requests_per_worker():
+    assert WorkerDistributionProcessor.gini([25, 25, 25, 25]) == 0.0
+    assert WorkerDistributionProcessor.gini([0, 0, 0, 40]) == 0.75
+    assert abs(WorkerDistributionProcessor.gini([1, 2, 3, 4]) - 0.25) < 1e-9
+    assert WorkerDistributionProcessor.gini([]) == 0.0
+
+
+def test_report_shows_uneven_dispatch_and_churn(tmp_path: Path):
+    run_dir = write_run(tmp_path / "results", "20260101_000000",
+                        "2026-01-01T00:00:00Z,xampp,cpu.php,900.0,20.0ms,18,20,25,40,100.0\n"
+                        "2026-01-01T00:00:00Z,nginx_multi,cpu.php,1500.0,12.0ms,10,12,15,30,150.0\n")
+    # xampp: one child takes most requests and a recycled child (PID 13) appears in second 2
+    xampp = ["0.1,5,1,11", "0.4,5,1,11", "0.7,5,1,11", "0.9,5,1,12", "1.2,5,1,11", "1.6,5,1,11",
+             "2.1,5,1,13", "2.5,5,1,11"]
+    # nginx: two php-fpm workers share the load evenly; one sample has no pid
+    nginx = ["0.1,5,1,21", "0.6,5,1,22", "1.1,5,1,21", "1.5,5,1,22", "1.8,5,,"]
+    for server, rows in (("xampp", xampp), ("nginx_multi", nginx)):
+        (run_dir / "body_samples" / server).mkdir(parents=True)
+        (run_dir / "body_samples" / server / "cpu.php.csv").write_text(
+            SAMPLES_HEADER + "\n" + "\n".join(rows) + "\n", encoding="utf-8")
+
+    distribution = WorkerDistributionProcessor.process(BodySampleLoader.load(run_dir))
+    by_server = {c["server"]: c for c in distribution["cells"]}
+    x, n = by_server["xampp"], by_server["nginx_multi"]
+    assert (x["samples"], x["workers"], x["requests_per_worker"]) == (8, 3, [6, 1, 1])
+    assert x["busiest_share"] == 75.0 and round(x["gini"], 3) == 0.417
+    assert (x["t"], x["active_workers"], x["new_per_second"], x["new_workers"]) == ([0, 1, 2], [2, 1, 2], [0, 0, 1], 1)
+    assert (n["samples"], n["workers"], n["gini"], n["new_workers"]) == (4, 2, 0.0, 0)
+
+    report = ReportGenerator(tmp_path / "results", tmp_path / "reports").render(run_dir / "results.csv")
+    assert report.payload["worker_distribution"] == distribution
+    assert 'data-i18n="workers_title"' in report.html
+    assert 'id="chart-worker-churn"' in report.html
+    assert '<span class="metric-chip metric-warning">0.42</span>' in report.html
@@ -0,0 +1,107 @@
+"""Opt-in stage timing for the report pipeline (wall, CPU and peak allocations)."""
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, Dict, List
+
+
+class NullProfiler:
+    """Default profiler: every stage is a no-op context."""
+
+    enabled = False
+
+    def stage(self, name: str):
+        return nullcontext()
+
+
+class StageProfiler:
+    """Records wall time, CPU time and tracemalloc peak for named stages.
+
+    Stages may nest; nested names are joined with '.' (e.g. 'html.section.raw_results').
+    Each stage's peak is the highest traced allocation reached while it ran,
+    including its children.
+    """
+
+    enabled = True
+
+    def __init__(self, trace_memory: bool = True):
+        self.trace_memory = trace_memory
+        self.stages: List[Dict[str, Any]] = []
+        self._stack: List[Dict[str, Any]] = []
+        self._started_tracing = False
+
+    def start(self) -> None:
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def stop(self) -> None:
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    @contextmanager
+    def stage(self, name: str):
+        full_name = ".".join([s["name"] for s in self._stack] + [name])
+        record = {"name": name, "stage": full_name, "depth": len(self._stack), "peak": 0}
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+
+        if tracing:
+            current, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                self._stack[-1]["peak"] = max(self._stack[-1]["peak"], peak)
+            tracemalloc.reset_peak()
+            record["mem_start"] = current
+
+        self._stack.append(record)
+        self.stages.append(record)
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            record["wall_ms"] = (time.perf_counter() - wall_start) * 1000.0
+            record["cpu_ms"] = (time.process_time() - cpu_start) * 1000.0
+            self._stack.pop()
+            if tracing:
+                current, peak = tracemalloc.get_traced_memory()
+                record["peak"] = max(record["peak"], peak)
+                record["alloc_delta"] = current - record.pop("mem_start")
+                if self._stack:
+                    self._stack[-1]["peak"] = max(self._stack[-1]["peak"], record["peak"])
+                tracemalloc.reset_peak()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Profile as a JSON-serializable dictionary."""
+        stages = []
+        for record in self.stages:
+            item = {
+                "stage": record["stage"],
+                "depth": record["depth"],
+                "wall_ms": round(record.get("wall_ms", 0.0), 3),
+                "cpu_ms": round(record.get("cpu_ms", 0.0), 3),
+            }
+            if "alloc_delta" in record:
+                item["peak_kb"] = round(record["peak"] / 1024.0, 1)
+                item["alloc_delta_kb"] = round(record["alloc_delta"] / 1024.0, 1)
+            stages.append(item)
+        return {"trace_memory": self.trace_memory, "stages": stages}
+
+    def write_json(self, path: Path) -> Path:
+        path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+        return path
+
+    def format_table(self) -> str:
+        """Human-readable summary table, children indented under parents."""
+        data = self.to_dict()["stages"]
+        width = max([len("Stage")] + [len(s["stage"].rsplit(".", 1)[-1]) + 2 * s["depth"] for s in data])
+        lines = [f"{'Stage':<{width}}  {'Wall ms':>10}  {'CPU ms':>10}  {'Peak KB':>10}  {'Δ KB':>10}"]
+        lines.append("-" * len(lines[0]))
+        for s in data:
+            label = "  " * s["depth"] + s["stage"].rsplit(".", 1)[-1]
+            peak = f"{s['peak_kb']:>10.1f}" if "peak_kb" in s else f"{'-':>10}"
+            delta = f"{s['alloc_delta_kb']:>10.1f}" if "alloc_delta_kb" in s else f"{'-':>10}"
+            lines.append(f"{label:<{width}}  {s['wall_ms']:>10.2f}  {s['cpu_ms']:>10.2f}  {peak}  {delta}")
+        return "\n".join(lines)